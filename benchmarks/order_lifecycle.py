@@ -0,0 +1,446 @@
+"""
+Latency benchmark for the order lifecycle.
+
+Drives the real FastAPI ``app`` in-process against a throwaway SQLite database (migrated with Alembic) and local
+stub stock/payment services, through create → add items per category → advance → place → webhook → prepare →
+ready → complete. Reports throughput and p50/p95/p99 per endpoint; ``--output`` saves the report as JSON and
+``--baseline`` compares the run against a previously saved one.
+
+Usage:
+    python -m benchmarks.order_lifecycle --orders 200 --output bench.json
+    python -m benchmarks.order_lifecycle --orders 200 --baseline bench.json
+"""
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import json
+import math
+import os
+from operator import attrgetter
+from pathlib import Path
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+import uuid
+
+# O benchmark não depende de .env: valores padrão para as variáveis exigidas na importação da aplicação
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("ORDER_MICROSERVICE_X_API_KEY", "benchmark")
+
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from dependency_injector import providers  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+import httpx  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.pool import NullPool  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from src.adapters.driven.repositories.models.order_status_model import OrderStatusModel  # noqa: E402
+from src.app import app  # noqa: E402
+from src.constants.order_status import OrderStatusEnum  # noqa: E402
+from src.constants.payment_status import PaymentStatusEnum  # noqa: E402
+from src.constants.permissions import OrderPermissions  # noqa: E402
+from src.constants.product_category import ProductCategoryEnum  # noqa: E402
+from src.core.auth.verified_token_cache import verified_token_cache  # noqa: E402
+from src.core.domain.dtos.payment.create_payment_dto import CreatePaymentDTO  # noqa: E402
+from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway  # noqa: E402
+from src.core.shared.database_session_scope import DatabaseSessionScope  # noqa: E402
+from src.core.utils.jwt_util import JWTUtil  # noqa: E402
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+API_PREFIX = "/api/v1"
+
+CATEGORY_SEQUENCE = (
+    ProductCategoryEnum.BURGERS,
+    ProductCategoryEnum.SIDES,
+    ProductCategoryEnum.DRINKS,
+    ProductCategoryEnum.DESSERTS,
+)
+
+# Endpoint de cada etapa do ciclo de vida (ordem do relatório)
+LIFECYCLE_STEPS = {
+    "create": "POST /orders",
+    "add_item": "POST /orders/{order_id}/items",
+    "advance": "POST /orders/{order_id}/advance",
+    "place": "POST /orders/{order_id}/advance (ORDER_PLACED)",
+    "webhook": "POST /webhooks/payment_notification",
+    "prepare": "POST /orders/{order_id}/advance (ORDER_PREPARING)",
+    "ready": "POST /orders/{order_id}/advance (ORDER_READY)",
+    "complete": "POST /orders/{order_id}/advance (ORDER_COMPLETED)",
+}
+
+
+class StubStockService:
+    """
+    In-process stand-in for the Stock Microservice, served through an ``httpx.MockTransport`` so the pooled client,
+    ``StockMicroserviceGateway`` and the cache decorator stay on the measured path.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+        self.products: Dict[str, Dict[str, Any]] = {}
+        for index, category in enumerate(CATEGORY_SEQUENCE, start=1):
+            self.products[str(index)] = {
+                "id": str(index),
+                "name": f"Produto {category.name}",
+                "description": category.description,
+                "sku": f"SKU-{index:04d}",
+                "price": 10.0 * index,
+                "category": {"id": str(index), "name": category.name, "description": category.description},
+            }
+
+    def product_for(self, category: ProductCategoryEnum) -> Dict[str, Any]:
+        return next(product for product in self.products.values() if product["category"]["name"] == category.name)
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        parts = request.url.path.rstrip("/").split("/")
+        if len(parts) >= 3 and parts[-3] == "products" and parts[-1] == "id":
+            product = self.products.get(parts[-2])
+            if product is None:
+                return httpx.Response(404, json={"detail": "Product not found"})
+            return httpx.Response(200, json=product)
+
+        if len(parts) >= 3 and parts[-3] == "categories" and parts[-1] == "products":
+            return httpx.Response(
+                200, json=[product for product in self.products.values() if product["category"]["name"] == parts[-2]]
+            )
+
+        return httpx.Response(404, json={"detail": "Not found"})
+
+
+class StubPaymentGateway(IPaymentProviderGateway):
+    """Stand-in for the payment service: answers immediately (or after ``latency`` seconds) with a new payment."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.payments: Dict[str, Dict[str, Any]] = {}
+
+    def create_payment(self, payment_data: CreatePaymentDTO) -> Dict[str, Any]:
+        if self.latency:
+            time.sleep(self.latency)
+
+        payment_id = str(uuid.uuid4())
+        payment = {
+            "payment_id": payment_id,
+            "qr_code": f"https://payments.local/qr/{payment_id}",
+            "transaction_id": f"txn-{payment_id}",
+            "amount": payment_data.total_amount,
+        }
+        self.payments[payment_id] = payment
+        return {key: payment[key] for key in ("payment_id", "qr_code", "transaction_id")}
+
+    def get_payment(self, payment_id: str) -> Dict[str, Any]:
+        return self.payments[payment_id]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples`` (already sorted)."""
+    if not samples:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(samples)))
+    return samples[rank - 1]
+
+
+@dataclass
+class StepStats:
+    endpoint: str
+    durations: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self) -> Dict[str, Any]:
+        samples = sorted(self.durations)
+        total = sum(samples)
+        return {
+            "endpoint": self.endpoint,
+            "count": len(samples),
+            "errors": self.errors,
+            "mean_ms": total / len(samples) * 1000 if samples else 0.0,
+            "p50_ms": percentile(samples, 50) * 1000,
+            "p95_ms": percentile(samples, 95) * 1000,
+            "p99_ms": percentile(samples, 99) * 1000,
+            "max_ms": samples[-1] * 1000 if samples else 0.0,
+        }
+
+
+@dataclass
+class BenchmarkReport:
+    orders: int
+    completed_orders: int
+    elapsed: float
+    steps: Dict[str, StepStats]
+    stock_calls: int = 0
+
+    @property
+    def requests(self) -> int:
+        return sum(len(stats.durations) for stats in self.steps.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "orders": self.orders,
+            "completed_orders": self.completed_orders,
+            "elapsed_s": self.elapsed,
+            "requests": self.requests,
+            "requests_per_s": self.requests / self.elapsed if self.elapsed else 0.0,
+            "orders_per_s": self.completed_orders / self.elapsed if self.elapsed else 0.0,
+            "stock_calls": self.stock_calls,
+            "steps": {name: stats.summary() for name, stats in self.steps.items()},
+        }
+
+
+class OrderLifecycleBenchmark:
+    """Runs the full order lifecycle ``orders`` times against the application and records each request latency."""
+
+    def __init__(self, client: TestClient, stock: StubStockService, steps: Optional[Dict[str, StepStats]] = None):
+        self.client = client
+        self.stock = stock
+        self.steps = steps if steps is not None else self._new_steps()
+        self.webhook_api_key = os.getenv("ORDER_MICROSERVICE_X_API_KEY")
+        self.employee_headers = self._auth_headers("employee", "employee-1")
+
+    @staticmethod
+    def _new_steps() -> Dict[str, StepStats]:
+        return {name: StepStats(endpoint=endpoint) for name, endpoint in LIFECYCLE_STEPS.items()}
+
+    @staticmethod
+    def _auth_headers(profile_name: str, person_id: str) -> Dict[str, str]:
+        token = JWTUtil.create_token({
+            "profile": {"name": profile_name, "permissions": OrderPermissions.values()},
+            "person": {"id": person_id, "name": f"Benchmark {profile_name}", "email": f"{person_id}@benchmark.local"},
+        })
+        return {"Authorization": f"Bearer {token}"}
+
+    def run(self, orders: int) -> int:
+        """Runs ``orders`` lifecycles and returns how many reached ``ORDER_COMPLETED``."""
+        completed = 0
+        for index in range(orders):
+            if self.run_lifecycle(index):
+                completed += 1
+        return completed
+
+    def run_lifecycle(self, index: int) -> bool:
+        customer_headers = self._auth_headers("customer", f"customer-{index}")
+
+        response = self._request("create", "post", f"{API_PREFIX}/orders", 201, headers=customer_headers)
+        if response is None:
+            return False
+        order_id = response.json()["id"]
+        advance_url = f"{API_PREFIX}/orders/{order_id}/advance"
+
+        # PENDING → WAITING_BURGERS → ... → WAITING_DESSERTS → READY_TO_PLACE, um item por categoria
+        if self._request("advance", "post", advance_url, 200, headers=customer_headers) is None:
+            return False
+        for category in CATEGORY_SEQUENCE:
+            product = self.stock.product_for(category)
+            item = {"product_id": product["id"], "quantity": 1, "observation": ""}
+            if self._request(
+                "add_item", "post", f"{API_PREFIX}/orders/{order_id}/items", 201, headers=customer_headers, json=item
+            ) is None:
+                return False
+            if self._request("advance", "post", advance_url, 200, headers=customer_headers) is None:
+                return False
+
+        response = self._request("place", "post", advance_url, 200, headers=customer_headers)
+        if response is None:
+            return False
+        payment = response.json()
+
+        notification = {
+            "event": "payment.completed",
+            "payment_id": payment["payment_id"],
+            "external_reference": f"order-{order_id}",
+            "amount": 0.0,
+            "status": PaymentStatusEnum.PAYMENT_COMPLETED.status,
+            "transaction_id": payment["transaction_id"],
+            "timestamp": "2025-01-01T00:00:00Z",
+        }
+        if self._request(
+            "webhook", "post", f"{API_PREFIX}/webhooks/payment_notification?api_key={self.webhook_api_key}", 200,
+            json=notification,
+        ) is None:
+            return False
+
+        for step in ("prepare", "ready", "complete"):
+            response = self._request(step, "post", advance_url, 200, headers=self.employee_headers)
+            if response is None:
+                return False
+
+        return response.json()["order_status"]["status"] == OrderStatusEnum.ORDER_COMPLETED.status
+
+    def _request(self, step: str, method: str, url: str, expected_status: int, **kwargs) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        response = getattr(self.client, method)(url, **kwargs)
+        elapsed = time.perf_counter() - started
+
+        stats = self.steps[step]
+        stats.durations.append(elapsed)
+        if response.status_code != expected_status:
+            stats.errors += 1
+            print(f"[{step}] {method.upper()} {url} → {response.status_code}: {response.text}", file=sys.stderr)
+            return None
+        return response
+
+
+def migrate_database(db_url: str) -> None:
+    alembic_cfg = Config(str(ROOT_DIR / "alembic.ini"))
+    alembic_cfg.set_main_option("script_location", str(ROOT_DIR / "migrations"))
+    alembic_cfg.set_main_option("sqlalchemy.url", db_url)
+    command.upgrade(alembic_cfg, "head")
+
+
+def seed_order_statuses(session_factory: sessionmaker) -> None:
+    """Inserts the order statuses the seed migration skips when ``ENVIRONMENT=testing``."""
+    with session_factory() as session:
+        existing = {status for (status,) in session.query(OrderStatusModel.status)}
+        session.add_all(
+            OrderStatusModel(status=order_status.status, description=order_status.description)
+            for order_status in OrderStatusEnum
+            if order_status.status not in existing
+        )
+        session.commit()
+
+
+def run_benchmark(
+    orders: int = 100,
+    warmup: int = 5,
+    stock_latency: float = 0.0,
+    payment_latency: float = 0.0,
+    db_path: Optional[str] = None,
+) -> BenchmarkReport:
+    """
+    Runs the order lifecycle benchmark and returns its report.
+
+    Args:
+        orders: Number of measured lifecycles.
+        warmup: Lifecycles run before measuring (not reported).
+        stock_latency: Simulated latency of each stock service call, in seconds.
+        payment_latency: Simulated latency of each payment creation, in seconds.
+        db_path: SQLite file to use; a temporary one is created (and removed) when omitted.
+    """
+    with tempfile.TemporaryDirectory(prefix="order-benchmark-") as tmp_dir:
+        db_url = f"sqlite:///{db_path or os.path.join(tmp_dir, 'benchmark.sqlite')}"
+        migrate_database(db_url)
+
+        engine = create_engine(db_url, connect_args={"check_same_thread": False})
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        # Rotas assíncronas: aiosqlite no mesmo arquivo, uma conexão por requisição
+        async_engine = create_async_engine(db_url.replace("sqlite://", "sqlite+aiosqlite://", 1), poolclass=NullPool)
+        async_session_factory = async_sessionmaker(autoflush=False, bind=async_engine)
+        seed_order_statuses(session_factory)
+        stock = StubStockService(latency=stock_latency)
+
+        container = app.container
+        # Uma sessão por requisição, como na aplicação, só que no banco do benchmark
+        db_session_scope = providers.ContextLocalSingleton(
+            DatabaseSessionScope, session_factory=providers.Object(session_factory)
+        )
+        # Singletons criados com os serviços reais (ou de outra execução) são descartados
+        container.stock_provider_gateway.reset()
+        container.resilient_stock_gateway.reset()
+        container.stock_microservice_gateway.reset()
+        container.stock_http_client.reset()
+        container.order_status_registry().invalidate()
+        verified_token_cache.clear()
+
+        try:
+            # db_session volta a ler do escopo mesmo que outro chamador (ex.: testes) o tenha sobrescrito
+            with container.db_session_scope.override(db_session_scope), \
+                    container.db_session.override(
+                        providers.Callable(attrgetter("session"), container.db_session_scope)
+                    ), \
+                    container.async_session_factory.override(providers.Object(async_session_factory)), \
+                    container.stock_http_client.override(
+                        providers.Singleton(httpx.AsyncClient, transport=stock.transport())
+                    ), \
+                    container.payment_provider_gateway.override(
+                        providers.Singleton(StubPaymentGateway, latency=payment_latency)
+                    ), \
+                    TestClient(app) as client:
+                if warmup:
+                    OrderLifecycleBenchmark(client, stock).run(warmup)
+
+                benchmark = OrderLifecycleBenchmark(client, stock)
+                stock_calls = stock.calls
+                started = time.perf_counter()
+                completed = benchmark.run(orders)
+                elapsed = time.perf_counter() - started
+        finally:
+            container.order_status_registry().invalidate()
+            engine.dispose()
+
+        return BenchmarkReport(
+            orders=orders,
+            completed_orders=completed,
+            elapsed=elapsed,
+            steps=benchmark.steps,
+            stock_calls=stock.calls - stock_calls,
+        )
+
+
+def format_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    lines = [
+        f"orders: {report['completed_orders']}/{report['orders']} completed in {report['elapsed_s']:.2f}s",
+        f"throughput: {report['requests_per_s']:.1f} req/s, {report['orders_per_s']:.2f} orders/s "
+        f"({report['requests']} requests, {report['stock_calls']} stock calls)",
+        "",
+        f"{'step':<10} {'endpoint':<50} {'count':>6} {'err':>4} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}",
+    ]
+    for name, step in report["steps"].items():
+        line = (
+            f"{name:<10} {step['endpoint']:<50} {step['count']:>6} {step['errors']:>4} "
+            f"{step['p50_ms']:>9.2f} {step['p95_ms']:>9.2f} {step['p99_ms']:>9.2f}"
+        )
+        base_step = (baseline or {}).get("steps", {}).get(name)
+        if base_step and base_step["p95_ms"]:
+            line += f"   p95 {(step['p95_ms'] / base_step['p95_ms'] - 1) * 100:+.1f}% vs baseline"
+        lines.append(line)
+
+    if baseline and baseline.get("requests_per_s"):
+        delta = (report["requests_per_s"] / baseline["requests_per_s"] - 1) * 100
+        lines.extend(["", f"throughput {delta:+.1f}% vs baseline ({baseline['requests_per_s']:.1f} req/s)"])
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Order lifecycle latency benchmark.")
+    parser.add_argument("--orders", type=int, default=100, help="Measured lifecycles (default: 100).")
+    parser.add_argument("--warmup", type=int, default=5, help="Lifecycles run before measuring (default: 5).")
+    parser.add_argument("--stock-latency-ms", type=float, default=0.0, help="Simulated stock service latency.")
+    parser.add_argument("--payment-latency-ms", type=float, default=0.0, help="Simulated payment service latency.")
+    parser.add_argument("--db-path", help="SQLite file to use instead of a temporary one.")
+    parser.add_argument("--output", help="Writes the report as JSON to this file.")
+    parser.add_argument("--baseline", help="JSON report of a previous run to compare against.")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        orders=args.orders,
+        warmup=args.warmup,
+        stock_latency=args.stock_latency_ms / 1000,
+        payment_latency=args.payment_latency_ms / 1000,
+        db_path=args.db_path,
+    ).to_dict()
+
+    baseline = None
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+
+    print(format_report(report, baseline))
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+    return 0 if report["completed_orders"] == report["orders"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
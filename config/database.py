@@ -1,8 +1,11 @@
-from typing import Generator
-from sqlalchemy import create_engine
+from typing import Generator, List
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 import os
 
+from src.core.shared.replica_routing import ReplicaRouter, RoutingSession
+
 # Obter configurações do banco de dados diretamente das variáveis de ambiente
 DATABASE = {
     "drivername": "mysql+pymysql",
@@ -19,20 +22,92 @@ DATABASE_URL = (
     f"{DATABASE['host']}:{DATABASE['port']}/{DATABASE['name']}"
 )
 
+# Réplicas de leitura: "host[:porta]" separados por vírgula, com o mesmo usuário, senha e banco do primário
+DB_REPLICA_HOSTS: List[str] = [host.strip() for host in os.getenv("DB_REPLICA_HOSTS", "").split(",") if host.strip()]
+# Após uma escrita, as leituras do mesmo cliente ficam no primário por este tempo (read-your-writes, via cookie)
+DB_REPLICA_STICKY_SECONDS = float(os.getenv("DB_REPLICA_STICKY_SECONDS", 5.0))
+
+
+def replica_url(replica_host: str) -> str:
+    host, _, port = replica_host.partition(":")
+    return (
+        f"{DATABASE['drivername']}://{DATABASE['user']}:{DATABASE['password']}@"
+        f"{host}:{port or DATABASE['port']}/{DATABASE['name']}"
+    )
+
+
+def async_url(url: str) -> str:
+    # Mesmo banco, driver aiomysql
+    return url.replace(DATABASE["drivername"], "mysql+aiomysql", 1)
+
+
+# URL assíncrona do primário
+ASYNC_DATABASE_URL = async_url(DATABASE_URL)
+
 DELETE_MODE = os.getenv("DELETE_MODE", "soft")
 
-# Criar o motor do SQLAlchemy
-engine = create_engine(DATABASE_URL, echo=True, pool_pre_ping=True, pool_recycle=3600)
+# Pool de conexões (por processo e por motor: síncrono, assíncrono e réplicas)
+DATABASE_POOL = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", 10)),
+    "max_overflow": int(os.getenv("DB_POOL_MAX_OVERFLOW", 10)),
+    "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", 10.0)),
+    # Abaixo do wait_timeout do MySQL: conexões antigas são recicladas antes que o servidor as derrube
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+    # "false" (padrão) evita um round trip a cada checkout: conexões derrubadas são descartadas no primeiro erro
+    # de desconexão, que invalida o pool; "true" testa cada conexão antes de entregá-la
+    "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "false").lower() in ("true", "1"),
+    # LIFO reaproveita as conexões mais recentes e deixa as ociosas expirarem
+    "pool_use_lifo": True,
+}
+# Conexões abertas na subida da aplicação (limitado a pool_size)
+DB_POOL_WARMUP = int(os.getenv("DB_POOL_WARMUP", 2))
+
+# Criar o motor do SQLAlchemy (SQL é registrado pelo QueryLogger, com amostragem, e não pelo echo)
+engine = create_engine(DATABASE_URL, **DATABASE_POOL)
+
+replica_engines = [create_engine(replica_url(host), **DATABASE_POOL) for host in DB_REPLICA_HOSTS]
+replica_router = ReplicaRouter(replica_engines, sticky_seconds=DB_REPLICA_STICKY_SECONDS)
 
-# Configurar a sessão
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Configurar a sessão: casos de uso somente leitura (ver read_only) consultam as réplicas, quando houver
+SessionLocal = sessionmaker(class_=RoutingSession, router=replica_router, autocommit=False, autoflush=False, bind=engine)
+
+# Motores e sessão assíncronos (não bloqueiam o event loop), com o mesmo roteamento para as réplicas
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **DATABASE_POOL)
+
+async_replica_engines = [create_async_engine(async_url(replica_url(host)), **DATABASE_POOL) for host in DB_REPLICA_HOSTS]
+async_replica_router = ReplicaRouter(
+    [replica_engine.sync_engine for replica_engine in async_replica_engines],
+    sticky_seconds=DB_REPLICA_STICKY_SECONDS
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    sync_session_class=RoutingSession, router=async_replica_router, autoflush=False, bind=async_engine
+)
 
 # Classe base para os modelos
 Base = declarative_base()
 
+def warm_up_pool(engine: Engine, connections: int = DB_POOL_WARMUP) -> int:
+    """
+    Opens up to ``connections`` connections (never more than the pool size) and returns them to the pool, so the
+    first requests do not pay for the connection handshake. Returns how many were opened.
+    """
+    pool_size = engine.pool.size() if hasattr(engine.pool, "size") else 0
+    opened = []
+    try:
+        # Conexões retidas ao mesmo tempo: cada checkout abre uma conexão nova
+        for _ in range(min(connections, pool_size)):
+            opened.append(engine.connect())
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
+
+
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
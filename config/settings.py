@@ -29,3 +29,93 @@ MERCADO_PAGO_USER_ID = os.getenv('MERCADO_PAGO_USER_ID')
 MERCADO_PAGO_POS_ID = os.getenv('MERCADO_PAGO_POS_ID')
 
 WEBHOOK_URL = os.getenv('WEBHOOK_URL')
+
+# Configurações do cliente HTTP do microsserviço de estoque (pool compartilhado)
+STOCK_HTTP_CONNECT_TIMEOUT = float(os.getenv("STOCK_HTTP_CONNECT_TIMEOUT", 2.0))
+STOCK_HTTP_READ_TIMEOUT = float(os.getenv("STOCK_HTTP_READ_TIMEOUT", 5.0))
+STOCK_HTTP_POOL_TIMEOUT = float(os.getenv("STOCK_HTTP_POOL_TIMEOUT", 2.0))
+STOCK_HTTP_MAX_CONNECTIONS = int(os.getenv("STOCK_HTTP_MAX_CONNECTIONS", 100))
+STOCK_HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("STOCK_HTTP_MAX_KEEPALIVE_CONNECTIONS", 20))
+STOCK_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("STOCK_HTTP_KEEPALIVE_EXPIRY", 30.0))
+
+# Cache local de produtos/categorias do microsserviço de estoque
+STOCK_CACHE_TTL = float(os.getenv("STOCK_CACHE_TTL", 300))
+STOCK_CACHE_STALE_TTL = float(os.getenv("STOCK_CACHE_STALE_TTL", 600))
+STOCK_CACHE_NEGATIVE_TTL = float(os.getenv("STOCK_CACHE_NEGATIVE_TTL", 30))
+STOCK_CACHE_MAX_ENTRIES = int(os.getenv("STOCK_CACHE_MAX_ENTRIES", 1024))
+# Último valor conhecido, servido por até N segundos quando o estoque está indisponível (0 desativa)
+STOCK_CACHE_STALE_IF_ERROR_TTL = float(os.getenv("STOCK_CACHE_STALE_IF_ERROR_TTL", 3600))
+
+# Resiliência das chamadas externas: limite de concorrência (bulkhead), circuit breaker e orçamento de retentativas
+STOCK_BULKHEAD_MAX_CONCURRENT = int(os.getenv("STOCK_BULKHEAD_MAX_CONCURRENT", 50))
+STOCK_BREAKER_FAILURE_THRESHOLD = int(os.getenv("STOCK_BREAKER_FAILURE_THRESHOLD", 5))
+STOCK_BREAKER_RECOVERY_TIMEOUT = float(os.getenv("STOCK_BREAKER_RECOVERY_TIMEOUT", 30.0))
+STOCK_BREAKER_HALF_OPEN_MAX_CALLS = int(os.getenv("STOCK_BREAKER_HALF_OPEN_MAX_CALLS", 1))
+STOCK_MAX_RETRIES = int(os.getenv("STOCK_MAX_RETRIES", 2))
+STOCK_RETRY_BUDGET_RATIO = float(os.getenv("STOCK_RETRY_BUDGET_RATIO", 0.2))
+PAYMENT_HTTP_CONNECT_TIMEOUT = float(os.getenv("PAYMENT_HTTP_CONNECT_TIMEOUT", 2.0))
+PAYMENT_HTTP_READ_TIMEOUT = float(os.getenv("PAYMENT_HTTP_READ_TIMEOUT", 10.0))
+PAYMENT_BULKHEAD_MAX_CONCURRENT = int(os.getenv("PAYMENT_BULKHEAD_MAX_CONCURRENT", 20))
+PAYMENT_BREAKER_FAILURE_THRESHOLD = int(os.getenv("PAYMENT_BREAKER_FAILURE_THRESHOLD", 5))
+PAYMENT_BREAKER_RECOVERY_TIMEOUT = float(os.getenv("PAYMENT_BREAKER_RECOVERY_TIMEOUT", 30.0))
+PAYMENT_BREAKER_HALF_OPEN_MAX_CALLS = int(os.getenv("PAYMENT_BREAKER_HALF_OPEN_MAX_CALLS", 1))
+# Backoff das retentativas (segundos, com jitter) e retentativas mínimas por segundo quando o tráfego é baixo
+GATEWAY_RETRY_BACKOFF_BASE = float(os.getenv("GATEWAY_RETRY_BACKOFF_BASE", 0.05))
+GATEWAY_RETRY_BACKOFF_MAX = float(os.getenv("GATEWAY_RETRY_BACKOFF_MAX", 1.0))
+GATEWAY_RETRY_BUDGET_MIN_PER_SECOND = float(os.getenv("GATEWAY_RETRY_BUDGET_MIN_PER_SECOND", 1.0))
+
+# Log das consultas SQL (substitui o echo do SQLAlchemy): nível ("OFF" desativa) e fração das consultas registradas
+DB_QUERY_LOG_LEVEL = os.getenv("DB_QUERY_LOG_LEVEL", "DEBUG").upper()
+DB_QUERY_LOG_SAMPLE_RATE = float(os.getenv("DB_QUERY_LOG_SAMPLE_RATE", 0.01))
+# Registro de consultas lentas por fingerprint (GET /api/v1/admin/slow-queries e logger "sql.slow")
+SLOW_QUERY_LOG_ENABLED = os.getenv("SLOW_QUERY_LOG_ENABLED", "true").lower() in ("true", "1")
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", 200))
+# Captura o EXPLAIN do primeiro SELECT de cada fingerprint acima deste tempo (0 desativa)
+SLOW_QUERY_EXPLAIN_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_EXPLAIN_THRESHOLD_MS", 0))
+SLOW_QUERY_MAX_FINGERPRINTS = int(os.getenv("SLOW_QUERY_MAX_FINGERPRINTS", 500))
+SLOW_QUERY_SAMPLE_SIZE = int(os.getenv("SLOW_QUERY_SAMPLE_SIZE", 256))
+
+# Paginação da listagem de pedidos (GET /orders)
+ORDERS_PAGE_MAX_LIMIT = int(os.getenv("ORDERS_PAGE_MAX_LIMIT", 100))
+# Página devolvida sem "limit"; a listagem completa só sai com stream=true
+ORDERS_PAGE_DEFAULT_LIMIT = min(int(os.getenv("ORDERS_PAGE_DEFAULT_LIMIT", 50)), ORDERS_PAGE_MAX_LIMIT)
+ORDERS_STREAM_PAGE_SIZE = int(os.getenv("ORDERS_STREAM_PAGE_SIZE", 200))
+
+# Cache de tokens JWT já verificados (chave: hash do token; nunca além do exp)
+JWT_CACHE_MAX_ENTRIES = int(os.getenv("JWT_CACHE_MAX_ENTRIES", 4096))
+JWT_CACHE_TTL = float(os.getenv("JWT_CACHE_TTL", 300))
+
+# Métricas Prometheus (GET /metrics)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("true", "1")
+
+# Idempotência do webhook de pagamento (chave: payment_id + transaction_id + event)
+WEBHOOK_IDEMPOTENCY_TTL = float(os.getenv("WEBHOOK_IDEMPOTENCY_TTL", 86400))
+WEBHOOK_IDEMPOTENCY_CACHE_MAX_ENTRIES = int(os.getenv("WEBHOOK_IDEMPOTENCY_CACHE_MAX_ENTRIES", 10000))
+# Probabilidade de remover as chaves expiradas a cada novo registro (mantém a tabela limitada)
+WEBHOOK_IDEMPOTENCY_PURGE_PROBABILITY = float(os.getenv("WEBHOOK_IDEMPOTENCY_PURGE_PROBABILITY", 0.01))
+
+# Ingestão do webhook de pagamento: "inline" processa na requisição; "queued" grava na caixa de entrada
+# (payment_webhook_inbox), responde 202 e um worker em segundo plano aplica os eventos em lotes
+WEBHOOK_INGEST_MODE = os.getenv("WEBHOOK_INGEST_MODE", "inline").lower()
+WEBHOOK_INBOX_BATCH_SIZE = int(os.getenv("WEBHOOK_INBOX_BATCH_SIZE", 100))
+WEBHOOK_INBOX_POLL_INTERVAL = float(os.getenv("WEBHOOK_INBOX_POLL_INTERVAL", 1.0))
+WEBHOOK_INBOX_MAX_ATTEMPTS = int(os.getenv("WEBHOOK_INBOX_MAX_ATTEMPTS", 5))
+
+# Criação do pagamento ao fechar o pedido: "inline" chama o microsserviço de pagamento na requisição; "outbox"
+# grava a solicitação na tabela payment_outbox, na mesma transação do pedido, e um despachante a envia depois
+PAYMENT_CREATION_MODE = os.getenv("PAYMENT_CREATION_MODE", "inline").lower()
+PAYMENT_OUTBOX_BATCH_SIZE = int(os.getenv("PAYMENT_OUTBOX_BATCH_SIZE", 20))
+PAYMENT_OUTBOX_POLL_INTERVAL = float(os.getenv("PAYMENT_OUTBOX_POLL_INTERVAL", 1.0))
+PAYMENT_OUTBOX_MAX_ATTEMPTS = int(os.getenv("PAYMENT_OUTBOX_MAX_ATTEMPTS", 8))
+# Backoff exponencial (segundos) entre as tentativas, com jitter
+PAYMENT_OUTBOX_BACKOFF_BASE = float(os.getenv("PAYMENT_OUTBOX_BACKOFF_BASE", 1.0))
+PAYMENT_OUTBOX_BACKOFF_MAX = float(os.getenv("PAYMENT_OUTBOX_BACKOFF_MAX", 300.0))
+# Tempo (segundos) em que uma solicitação reservada por um despachante fica invisível para os demais
+PAYMENT_OUTBOX_LEASE = float(os.getenv("PAYMENT_OUTBOX_LEASE", 60.0))
+# Long polling do QR code: espera máxima e intervalo entre as consultas (segundos)
+PAYMENT_QR_CODE_MAX_WAIT = float(os.getenv("PAYMENT_QR_CODE_MAX_WAIT", 20.0))
+PAYMENT_QR_CODE_POLL_INTERVAL = float(os.getenv("PAYMENT_QR_CODE_POLL_INTERVAL", 0.25))
+
+# Controle de concorrência otimista dos pedidos: número máximo de execuções de um caso de uso quando a gravação
+# encontra o pedido alterado por outra requisição (o pedido é recarregado a cada nova tentativa)
+ORDER_UPDATE_MAX_ATTEMPTS = int(os.getenv("ORDER_UPDATE_MAX_ATTEMPTS", 3))
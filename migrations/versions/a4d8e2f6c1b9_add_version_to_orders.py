@@ -0,0 +1,28 @@
+"""Add version column to orders
+
+Revision ID: a4d8e2f6c1b9
+Revises: f3c9a1e7b5d2
+Create Date: 2026-10-18 21:37:05.284613
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d8e2f6c1b9'
+down_revision: Union[str, None] = 'f3c9a1e7b5d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Controle de concorrência otimista: os pedidos existentes começam na versão 1
+    op.add_column('orders', sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('orders') as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,58 @@
+"""Add indexes for the order lookup columns
+
+Revision ID: c3e8d1a4b7f2
+Revises: f2b67da5636f47
+Create Date: 2026-10-18 10:12:41.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e8d1a4b7f2'
+down_revision: Union[str, None] = 'f2b67da5636f47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # OrderRepository.get_all: filtro por status + ordenação por created_at
+    op.create_index('ix_orders_id_order_status_created_at', 'orders', ['id_order_status', 'created_at'], unique=False)
+    # CreateOrderUseCase / get_by_customer_id: pedidos ativos do cliente
+    op.create_index('ix_orders_id_customer_inactivated_at', 'orders', ['id_customer', 'inactivated_at'], unique=False)
+    # Webhook de pagamento: get_by_payment_id
+    op.create_index('ix_orders_payment_id', 'orders', ['payment_id'], unique=False)
+    # Carregamento dos itens e do histórico (selectinload ... WHERE order_id IN (...))
+    op.create_index('ix_order_items_order_id', 'order_items', ['order_id'], unique=False)
+    op.create_index('ix_order_status_movements_id_order', 'order_status_movements', ['id_order'], unique=False)
+
+
+def drop_foreign_key_index(index_name: str, table_name: str, column: str) -> None:
+    # No MySQL o índice criado acima passou a sustentar a FK da coluna (o InnoDB descarta o índice implícito dela),
+    # e removê-lo falha com o erro 1553: a FK é removida antes e recriada depois, com um novo índice implícito
+    bind = op.get_bind()
+    foreign_keys = []
+    if bind.dialect.name == 'mysql':
+        foreign_keys = [
+            foreign_key for foreign_key in sa.inspect(bind).get_foreign_keys(table_name)
+            if foreign_key['constrained_columns'] == [column]
+        ]
+    for foreign_key in foreign_keys:
+        op.drop_constraint(foreign_key['name'], table_name, type_='foreignkey')
+    op.drop_index(index_name, table_name=table_name)
+    for foreign_key in foreign_keys:
+        op.create_foreign_key(
+            foreign_key['name'], table_name, foreign_key['referred_table'],
+            foreign_key['constrained_columns'], foreign_key['referred_columns']
+        )
+
+
+def downgrade() -> None:
+    drop_foreign_key_index('ix_order_status_movements_id_order', 'order_status_movements', 'id_order')
+    drop_foreign_key_index('ix_order_items_order_id', 'order_items', 'order_id')
+    op.drop_index('ix_orders_payment_id', table_name='orders')
+    op.drop_index('ix_orders_id_customer_inactivated_at', table_name='orders')
+    op.drop_index('ix_orders_id_order_status_created_at', table_name='orders')
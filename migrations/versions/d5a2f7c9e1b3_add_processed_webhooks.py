@@ -0,0 +1,40 @@
+"""Add processed_webhooks idempotency table
+
+Revision ID: d5a2f7c9e1b3
+Revises: c3e8d1a4b7f2
+Create Date: 2026-10-18 14:03:27.184530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a2f7c9e1b3'
+down_revision: Union[str, None] = 'c3e8d1a4b7f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('processed_webhooks',
+    sa.Column('payment_id', sa.String(length=100), nullable=False),
+    sa.Column('transaction_id', sa.String(length=100), nullable=False),
+    sa.Column('event', sa.String(length=100), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('inactivated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('payment_id', 'transaction_id', 'event', name='uq_processed_webhooks_key')
+    )
+    # Limpeza das chaves expiradas
+    op.create_index('ix_processed_webhooks_expires_at', 'processed_webhooks', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_processed_webhooks_expires_at', table_name='processed_webhooks')
+    op.drop_table('processed_webhooks')
@@ -0,0 +1,43 @@
+"""Add payment_webhook_inbox table
+
+Revision ID: e8b4c6d2a9f1
+Revises: d5a2f7c9e1b3
+Create Date: 2026-10-18 15:21:09.604213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b4c6d2a9f1'
+down_revision: Union[str, None] = 'd5a2f7c9e1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('payment_webhook_inbox',
+    sa.Column('payment_id', sa.String(length=100), nullable=False),
+    sa.Column('transaction_id', sa.String(length=100), nullable=False),
+    sa.Column('event', sa.String(length=100), nullable=False),
+    sa.Column('payment_status', sa.String(length=100), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('processed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_error', sa.String(length=500), nullable=True),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('inactivated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('payment_id', 'transaction_id', 'event', name='uq_payment_webhook_inbox_key')
+    )
+    # Fila: eventos pendentes em ordem de chegada
+    op.create_index('ix_payment_webhook_inbox_processed_at_id', 'payment_webhook_inbox', ['processed_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_payment_webhook_inbox_processed_at_id', table_name='payment_webhook_inbox')
+    op.drop_table('payment_webhook_inbox')
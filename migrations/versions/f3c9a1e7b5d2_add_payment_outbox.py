@@ -0,0 +1,48 @@
+"""Add payment_outbox table
+
+Revision ID: f3c9a1e7b5d2
+Revises: e8b4c6d2a9f1
+Create Date: 2026-10-18 16:02:47.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c9a1e7b5d2'
+down_revision: Union[str, None] = 'e8b4c6d2a9f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('payment_outbox',
+    sa.Column('id_order', sa.Integer(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('payment_id', sa.String(length=100), nullable=True),
+    sa.Column('qr_code', sa.String(length=2000), nullable=True),
+    sa.Column('transaction_id', sa.String(length=100), nullable=True),
+    sa.Column('last_error', sa.String(length=500), nullable=True),
+    sa.Column('dispatched_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('inactivated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['id_order'], ['orders.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # Despachante: solicitações pendentes cuja próxima tentativa já venceu
+    op.create_index('ix_payment_outbox_status_next_attempt_at', 'payment_outbox', ['status', 'next_attempt_at'], unique=False)
+    op.create_index('ix_payment_outbox_id_order', 'payment_outbox', ['id_order'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_payment_outbox_id_order', table_name='payment_outbox')
+    op.drop_index('ix_payment_outbox_status_next_attempt_at', table_name='payment_outbox')
+    op.drop_table('payment_outbox')
@@ -1,6 +1,8 @@
 from typing import Any, Dict
+from config.settings import PAYMENT_HTTP_CONNECT_TIMEOUT, PAYMENT_HTTP_READ_TIMEOUT
 from src.core.domain.dtos.payment.create_payment_dto import CreatePaymentDTO
 from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway
+from src.core.shared.metrics import observe_gateway_call
 import os
 import requests
 
@@ -16,6 +18,7 @@ class PaymentProviderGateway(IPaymentProviderGateway):
             "Content-Type": "application/json",
             "x-api-key": os.getenv("PAYMENT_SERVICE_API_KEY", "")
         }
+        self._timeout = (PAYMENT_HTTP_CONNECT_TIMEOUT, PAYMENT_HTTP_READ_TIMEOUT)
         
     @property
     def base_url(self) -> str:
@@ -27,6 +30,7 @@ class PaymentProviderGateway(IPaymentProviderGateway):
             url = f"http://{url}"
         self._base_url = url
     
+    @observe_gateway_call("payment")
     def create_payment(self, payment_data: CreatePaymentDTO) -> Dict[str, Any]:
         """
         Creates a new payment by sending payment data to the external payment service.
@@ -41,10 +45,14 @@ class PaymentProviderGateway(IPaymentProviderGateway):
             ValueError: If the response does not contain a 'payment_id'.
         """
 
+        headers = self._headers
+        if payment_data.idempotency_key:
+            headers = {**headers, "Idempotency-Key": payment_data.idempotency_key}
         response = requests.post(
             f"{self.base_url}/payment",
-            headers=self._headers,
-            json=payment_data.model_dump(mode='json'),
+            headers=headers,
+            json=payment_data.model_dump(mode='json', exclude={"idempotency_key"}),
+            timeout=self._timeout,
         )
         response.raise_for_status()
         
@@ -58,6 +66,7 @@ class PaymentProviderGateway(IPaymentProviderGateway):
             "transaction_id": response.get("transaction_id"),
         }
 
+    @observe_gateway_call("payment")
     def get_payment(self, payment_id: str) -> Dict[str, Any]:
         """
         Retrieves the details of a specific payment by its ID.
@@ -72,7 +81,9 @@ class PaymentProviderGateway(IPaymentProviderGateway):
             requests.HTTPError: If the HTTP request to the payment service fails.
             ValueError: If the response does not contain payment details.
         """
-        response = requests.get(f"{self.base_url}/payment/id/{payment_id}", headers=self._headers)
+        response = requests.get(
+            f"{self.base_url}/payment/id/{payment_id}", headers=self._headers, timeout=self._timeout
+        )
         response.raise_for_status()
         
         payment_details = response.json()
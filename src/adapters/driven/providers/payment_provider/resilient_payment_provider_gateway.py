@@ -0,0 +1,62 @@
+from typing import Any, Dict
+
+import requests
+
+from config.settings import (
+    PAYMENT_BREAKER_FAILURE_THRESHOLD,
+    PAYMENT_BREAKER_HALF_OPEN_MAX_CALLS,
+    PAYMENT_BREAKER_RECOVERY_TIMEOUT,
+    PAYMENT_BULKHEAD_MAX_CONCURRENT,
+)
+from src.core.domain.dtos.payment.create_payment_dto import CreatePaymentDTO
+from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway
+from src.core.shared.resilience import Bulkhead, CircuitBreaker, ResiliencePolicy, RetryBudget
+
+
+def is_payment_failure(exc: BaseException) -> bool:
+    """Timeouts, connection errors and 5xx/429 answers count as failures of the payment service."""
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return exc.response.status_code >= 500 or exc.response.status_code == 429
+    return False
+
+
+def create_payment_resilience_policy() -> ResiliencePolicy:
+    # Sem retentativas: a chamada é síncrona (requests) e nunca dorme em backoff segurando a thread do request
+    return ResiliencePolicy(
+        "payment",
+        breaker=CircuitBreaker(
+            "payment",
+            failure_threshold=PAYMENT_BREAKER_FAILURE_THRESHOLD,
+            recovery_timeout=PAYMENT_BREAKER_RECOVERY_TIMEOUT,
+            half_open_max_calls=PAYMENT_BREAKER_HALF_OPEN_MAX_CALLS,
+        ),
+        bulkhead=Bulkhead("payment", PAYMENT_BULKHEAD_MAX_CONCURRENT),
+        retry_budget=RetryBudget(),
+        is_failure=is_payment_failure,
+        max_retries=0,
+    )
+
+
+class ResilientPaymentProviderGateway(IPaymentProviderGateway):
+    """
+    Resilience decorator for an ``IPaymentProviderGateway``.
+
+    Calls are guarded by the bulkhead and the breaker but never retried here: ``create_payment`` is not idempotent
+    (a retried POST could create two payments) and the payment outbox retries it with its own backoff. The wrapped
+    gateway is synchronous, so it is only called from worker threads (sync routes, ``asyncio.to_thread``).
+    """
+
+    def __init__(self, gateway: IPaymentProviderGateway, policy: ResiliencePolicy):
+        self._gateway = gateway
+        self._policy = policy
+
+    def create_payment(self, payment_data: CreatePaymentDTO) -> Dict[str, Any]:
+        return self._policy.call(lambda: self._gateway.create_payment(payment_data), retry=False)
+
+    def get_payment(self, payment_id: str) -> Dict[str, Any]:
+        return self._policy.call(lambda: self._gateway.get_payment(payment_id), retry=False)
+
+
+__all__ = ["ResilientPaymentProviderGateway", "create_payment_resilience_policy", "is_payment_failure"]
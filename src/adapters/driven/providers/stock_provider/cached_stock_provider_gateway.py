@@ -0,0 +1,158 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set
+
+from config.settings import (
+    STOCK_CACHE_MAX_ENTRIES,
+    STOCK_CACHE_NEGATIVE_TTL,
+    STOCK_CACHE_STALE_IF_ERROR_TTL,
+    STOCK_CACHE_STALE_TTL,
+    STOCK_CACHE_TTL,
+)
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.exceptions.service_unavailable_exception import ServiceUnavailableException
+from src.core.ports.stock.i_stock_provider_gateway import IStockProviderGateway
+from src.core.shared.metrics import GATEWAY_STALE_FALLBACKS
+from src.core.shared.single_flight import SingleFlight
+from src.core.shared.ttl_cache import TTLCache
+
+
+class _NotFound:
+    """Negative cache entry: remembers the 404 raised by the stock service."""
+
+    def __init__(self, exception: EntityNotFoundException):
+        self.exception = exception
+
+
+class CachedStockProviderGateway(IStockProviderGateway):
+    """
+    Caching decorator for an ``IStockProviderGateway``.
+
+    - Fresh entries (younger than ``ttl``) are served from memory; the least recently used ones are evicted
+      beyond ``max_entries``.
+    - Expired entries are still served for ``stale_ttl`` seconds while a single background task revalidates them.
+    - ``EntityNotFoundException`` (404) is cached for ``negative_ttl`` seconds and raised again on lookup; it is
+      never served stale.
+    - While the stock service is unavailable (``ServiceUnavailableException``: failing, circuit open or at its
+      concurrency limit), the last known value of a key is served for up to ``stale_if_error_ttl`` seconds.
+    - Concurrent loads of the same key (misses and revalidations) share a single upstream call.
+    """
+
+    def __init__(
+        self,
+        gateway: IStockProviderGateway,
+        cache: Optional[TTLCache] = None,
+        negative_ttl: float = STOCK_CACHE_NEGATIVE_TTL,
+        stale_if_error_ttl: float = STOCK_CACHE_STALE_IF_ERROR_TTL,
+    ):
+        self._gateway = gateway
+        if cache is None:
+            cache = TTLCache(max_entries=STOCK_CACHE_MAX_ENTRIES, ttl=STOCK_CACHE_TTL, stale_ttl=STOCK_CACHE_STALE_TTL)
+        self._cache = cache
+        self._negative_ttl = negative_ttl
+        # Último valor conhecido de cada chave, guardado além da janela stale para o caso de indisponibilidade
+        self._last_known = (
+            TTLCache(max_entries=self._cache.max_entries, ttl=stale_if_error_ttl) if stale_if_error_ttl > 0 else None
+        )
+        self._single_flight = SingleFlight("stock")
+        self._refreshing: Set[Hashable] = set()
+        self._background_tasks: Set[asyncio.Task] = set()
+        self.negative_hits = 0
+
+    async def get_product_by_id(self, product_id: str) -> Dict[str, Any]:
+        """Retrieve a product by its ID."""
+        return await self._cached(("product_by_id", product_id), lambda: self._gateway.get_product_by_id(product_id))
+
+    async def get_products_by_category_name(self, category_name: str) -> List[Dict[str, Any]]:
+        """Retrieve products by their category."""
+        return await self._cached(
+            ("products_by_category_name", category_name),
+            lambda: self._gateway.get_products_by_category_name(category_name)
+        )
+
+    async def get_product_by_name(self, name: str) -> Dict[str, Any]:
+        """Retrieve a product by its name."""
+        return await self._cached(("product_by_name", name), lambda: self._gateway.get_product_by_name(name))
+
+    async def get_categories(self) -> List[Dict[str, Any]]:
+        """Retrieve all available categories."""
+        return await self._cached(("categories",), self._gateway.get_categories)
+
+    async def get_category_by_id(self, category_id: str) -> Dict[str, Any]:
+        """Retrieve a category by its ID."""
+        return await self._cached(("category_by_id", category_id), lambda: self._gateway.get_category_by_id(category_id))
+
+    async def get_category_by_name(self, category_name: str) -> Dict[str, Any]:
+        """Retrieve a category by its name."""
+        return await self._cached(
+            ("category_by_name", category_name),
+            lambda: self._gateway.get_category_by_name(category_name)
+        )
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            **self._cache.stats(),
+            "negative_hits": self.negative_hits,
+            "shared_loads": self._single_flight.shared,
+        }
+
+    def clear(self) -> None:
+        self._cache.clear()
+        if self._last_known is not None:
+            self._last_known.clear()
+
+    async def _cached(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._cache.get_entry(key)
+        if entry is None or (entry.stale and isinstance(entry.value, _NotFound)):
+            # 404s expirados não são servidos como stale: o produto pode ter sido cadastrado
+            value = await self._load(key, loader)
+        else:
+            if entry.stale:
+                self._schedule_refresh(key, loader)
+            value = entry.value
+            if isinstance(value, _NotFound):
+                self.negative_hits += 1
+
+        if isinstance(value, _NotFound):
+            raise value.exception.with_traceback(None)
+        return value
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await self._single_flight.do(key, loader)
+        except EntityNotFoundException as exc:
+            value = _NotFound(exc)
+            self._cache.set(key, value, ttl=self._negative_ttl)
+            return value
+        except ServiceUnavailableException:
+            last_known = self._last_known.get_entry(key) if self._last_known is not None else None
+            if last_known is None:
+                raise
+            GATEWAY_STALE_FALLBACKS.labels("stock").inc()
+            return last_known.value
+
+        self._cache.set(key, value)
+        if self._last_known is not None:
+            self._last_known.set(key, value)
+        return value
+
+    def _schedule_refresh(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> None:
+        if key in self._refreshing:
+            return
+
+        self._refreshing.add(key)
+        task = asyncio.create_task(self._refresh(key, loader))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _refresh(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            await self._load(key, loader)
+        except Exception as exc:
+            # Mantém o valor antigo até a próxima tentativa de revalidação
+            logging.warning(f"Falha ao revalidar cache do estoque para {key}: {exc}")
+        finally:
+            self._refreshing.discard(key)
+
+
+__all__ = ["CachedStockProviderGateway"]
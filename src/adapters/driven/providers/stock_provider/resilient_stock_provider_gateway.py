@@ -0,0 +1,82 @@
+from typing import Any, Dict, List
+
+import httpx
+
+from config.settings import (
+    GATEWAY_RETRY_BACKOFF_BASE,
+    GATEWAY_RETRY_BACKOFF_MAX,
+    GATEWAY_RETRY_BUDGET_MIN_PER_SECOND,
+    STOCK_BREAKER_FAILURE_THRESHOLD,
+    STOCK_BREAKER_HALF_OPEN_MAX_CALLS,
+    STOCK_BREAKER_RECOVERY_TIMEOUT,
+    STOCK_BULKHEAD_MAX_CONCURRENT,
+    STOCK_MAX_RETRIES,
+    STOCK_RETRY_BUDGET_RATIO,
+)
+from src.core.ports.stock.i_stock_provider_gateway import IStockProviderGateway
+from src.core.shared.resilience import Bulkhead, CircuitBreaker, ResiliencePolicy, RetryBudget
+
+
+def is_stock_failure(exc: BaseException) -> bool:
+    """Timeouts, connection errors and 5xx/429 answers count as failures of the stock service."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500 or exc.response.status_code == 429
+    return False
+
+
+def create_stock_resilience_policy() -> ResiliencePolicy:
+    return ResiliencePolicy(
+        "stock",
+        breaker=CircuitBreaker(
+            "stock",
+            failure_threshold=STOCK_BREAKER_FAILURE_THRESHOLD,
+            recovery_timeout=STOCK_BREAKER_RECOVERY_TIMEOUT,
+            half_open_max_calls=STOCK_BREAKER_HALF_OPEN_MAX_CALLS,
+        ),
+        bulkhead=Bulkhead("stock", STOCK_BULKHEAD_MAX_CONCURRENT),
+        retry_budget=RetryBudget(ratio=STOCK_RETRY_BUDGET_RATIO, min_per_second=GATEWAY_RETRY_BUDGET_MIN_PER_SECOND),
+        is_failure=is_stock_failure,
+        max_retries=STOCK_MAX_RETRIES,
+        backoff_base=GATEWAY_RETRY_BACKOFF_BASE,
+        backoff_max=GATEWAY_RETRY_BACKOFF_MAX,
+    )
+
+
+class ResilientStockProviderGateway(IStockProviderGateway):
+    """
+    Resilience decorator for an ``IStockProviderGateway``: every lookup goes through the stock ``ResiliencePolicy``
+    (bulkhead, circuit breaker, budgeted retries). Lookups are idempotent, so they are all retried.
+    """
+
+    def __init__(self, gateway: IStockProviderGateway, policy: ResiliencePolicy):
+        self._gateway = gateway
+        self._policy = policy
+
+    async def get_product_by_id(self, product_id: str) -> Dict[str, Any]:
+        """Retrieve a product by its ID."""
+        return await self._policy.call_async(lambda: self._gateway.get_product_by_id(product_id))
+
+    async def get_products_by_category_name(self, category_name: str) -> List[Dict[str, Any]]:
+        """Retrieve products by their category."""
+        return await self._policy.call_async(lambda: self._gateway.get_products_by_category_name(category_name))
+
+    async def get_product_by_name(self, name: str) -> Dict[str, Any]:
+        """Retrieve a product by its name."""
+        return await self._policy.call_async(lambda: self._gateway.get_product_by_name(name))
+
+    async def get_categories(self) -> List[Dict[str, Any]]:
+        """Retrieve all available categories."""
+        return await self._policy.call_async(self._gateway.get_categories)
+
+    async def get_category_by_id(self, category_id: str) -> Dict[str, Any]:
+        """Retrieve a category by its ID."""
+        return await self._policy.call_async(lambda: self._gateway.get_category_by_id(category_id))
+
+    async def get_category_by_name(self, category_name: str) -> Dict[str, Any]:
+        """Retrieve a category by its name."""
+        return await self._policy.call_async(lambda: self._gateway.get_category_by_name(category_name))
+
+
+__all__ = ["ResilientStockProviderGateway", "create_stock_resilience_policy", "is_stock_failure"]
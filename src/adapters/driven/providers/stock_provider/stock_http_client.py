@@ -0,0 +1,36 @@
+from importlib.util import find_spec
+
+import httpx
+
+from config.settings import (
+    STOCK_HTTP_CONNECT_TIMEOUT,
+    STOCK_HTTP_KEEPALIVE_EXPIRY,
+    STOCK_HTTP_MAX_CONNECTIONS,
+    STOCK_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    STOCK_HTTP_POOL_TIMEOUT,
+    STOCK_HTTP_READ_TIMEOUT,
+)
+
+
+def create_stock_http_client() -> httpx.AsyncClient:
+    """
+    Creates the pooled client shared by every call to the Stock Microservice.
+
+    Connections are kept alive between calls; HTTP/2 is negotiated when the ``h2`` package is installed.
+    """
+    return httpx.AsyncClient(
+        http2=find_spec("h2") is not None,
+        timeout=httpx.Timeout(
+            STOCK_HTTP_READ_TIMEOUT,
+            connect=STOCK_HTTP_CONNECT_TIMEOUT,
+            pool=STOCK_HTTP_POOL_TIMEOUT,
+        ),
+        limits=httpx.Limits(
+            max_connections=STOCK_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=STOCK_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=STOCK_HTTP_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+__all__ = ["create_stock_http_client"]
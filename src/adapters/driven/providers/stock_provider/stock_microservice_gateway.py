@@ -1,22 +1,30 @@
 from src.constants.messages import CATEGORY_NOT_FOUND, PRODUCT_NOT_FOUND
 from src.core.ports.stock.i_stock_provider_gateway import IStockProviderGateway
 from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.shared.metrics import observe_gateway_call
 
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from http import HTTPStatus
-import requests
+import httpx
+
+from src.adapters.driven.providers.stock_provider.stock_http_client import create_stock_http_client
 
 
 class StockMicroserviceGateway(IStockProviderGateway):
-    """Gateway for interacting with the Stock Microservice."""
+    """
+    Gateway for interacting with the Stock Microservice.
+
+    Calls go through a shared, pooled ``httpx.AsyncClient`` (see ``create_stock_http_client``), which the
+    application opens at startup and closes at shutdown.
+    """
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        self._http_client = http_client or create_stock_http_client()
         self.base_url = os.getenv("STOCK_MICROSERVICE_URL", "http://localhost:8003/api/v1")
-        self._headers = {
-            "Content-Type": "application/json",
-            "x-api-key": os.getenv("STOCK_MICROSERVICE_X_API_KEY")
-        }
+        self._headers = {"Content-Type": "application/json"}
+        if api_key := os.getenv("STOCK_MICROSERVICE_X_API_KEY"):
+            self._headers["x-api-key"] = api_key
         
     @property
     def base_url(self) -> str:
@@ -29,18 +37,21 @@ class StockMicroserviceGateway(IStockProviderGateway):
 
         self._base_url = url
 
-    def get_product_by_id(self, product_id: str) -> Dict[str, Any]:
+    @observe_gateway_call("stock")
+    async def get_product_by_id(self, product_id: str) -> Dict[str, Any]:
         """Retrieve a product by its ID."""
-        response = requests.get(f"{self.base_url}/products/{product_id}/id", headers=self._headers)
+        response = await self._http_client.get(f"{self.base_url}/products/{product_id}/id", headers=self._headers)
 
-        if response.status_code != HTTPStatus.OK:
+        if response.status_code == HTTPStatus.NOT_FOUND:
             raise EntityNotFoundException(message=PRODUCT_NOT_FOUND, id=product_id)
+        response.raise_for_status()
         
         return response.json()
     
-    def get_products_by_category_name(self, category_name: str) -> List[Dict[str, Any]]:
+    @observe_gateway_call("stock")
+    async def get_products_by_category_name(self, category_name: str) -> List[Dict[str, Any]]:
         """Retrieve products by their category."""
-        response = requests.get(f"{self.base_url}/categories/{category_name}/products", headers=self._headers)
+        response = await self._http_client.get(f"{self.base_url}/categories/{category_name}/products", headers=self._headers)
         
         if response.status_code == HTTPStatus.NOT_FOUND:
             return []
@@ -48,10 +59,11 @@ class StockMicroserviceGateway(IStockProviderGateway):
 
         return response.json()
 
-    def get_product_by_name(self, name: str) -> Dict[str, Any]:
+    @observe_gateway_call("stock")
+    async def get_product_by_name(self, name: str) -> Dict[str, Any]:
         """Retrieve a product by its name."""
         # Assuming the endpoint returns a list and we want the first match.
-        response = requests.get(f"{self.base_url}/products/{name}/name", headers=self._headers)
+        response = await self._http_client.get(f"{self.base_url}/products/{name}/name", headers=self._headers)
 
         if response.status_code == HTTPStatus.NOT_FOUND:
             raise EntityNotFoundException(message=PRODUCT_NOT_FOUND, id=name)
@@ -63,9 +75,10 @@ class StockMicroserviceGateway(IStockProviderGateway):
         
         return results[0] # Returning the first result
     
-    def get_categories(self) -> List[Dict[str, Any]]:
+    @observe_gateway_call("stock")
+    async def get_categories(self) -> List[Dict[str, Any]]:
         """Retrieve all available categories."""
-        response = requests.get(f"{self.base_url}/categories", headers=self._headers)
+        response = await self._http_client.get(f"{self.base_url}/categories", headers=self._headers)
 
         if response.status_code == HTTPStatus.NOT_FOUND:
             return []
@@ -73,9 +86,10 @@ class StockMicroserviceGateway(IStockProviderGateway):
 
         return response.json()
 
-    def get_category_by_id(self, category_id: str) -> Dict[str, Any]:
+    @observe_gateway_call("stock")
+    async def get_category_by_id(self, category_id: str) -> Dict[str, Any]:
         """Retrieve a category by its ID."""
-        response = requests.get(f"{self.base_url}/categories/{category_id}/id", headers=self._headers)
+        response = await self._http_client.get(f"{self.base_url}/categories/{category_id}/id", headers=self._headers)
 
         if response.status_code == HTTPStatus.NOT_FOUND:
             raise EntityNotFoundException(message=CATEGORY_NOT_FOUND, id=category_id)
@@ -83,9 +97,10 @@ class StockMicroserviceGateway(IStockProviderGateway):
 
         return response.json()
 
-    def get_category_by_name(self, category_name: str) -> Dict[str, Any]:
+    @observe_gateway_call("stock")
+    async def get_category_by_name(self, category_name: str) -> Dict[str, Any]:
         """Retrieve a category by its name."""
-        response = requests.get(f"{self.base_url}/categories/{category_name}/name", headers=self._headers)
+        response = await self._http_client.get(f"{self.base_url}/categories/{category_name}/name", headers=self._headers)
 
         if response.status_code == HTTPStatus.NOT_FOUND:
             raise EntityNotFoundException(message=CATEGORY_NOT_FOUND, id=category_name)
@@ -0,0 +1,39 @@
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.adapters.driven.repositories.order_item_repository import OrderItemRepository
+from src.core.domain.entities.order_item import OrderItem
+from src.core.ports.order_item.i_async_order_item_repository import IAsyncOrderItemRepository
+
+
+class AsyncOrderItemRepository(IAsyncOrderItemRepository):
+    """
+    Versão assíncrona do OrderItemRepository, executada via ``AsyncSession.run_sync``.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def create(self, order_item: OrderItem) -> OrderItem:
+        return await self.db_session.run_sync(lambda session: OrderItemRepository(session).create(order_item))
+
+    async def get_by_order_id(self, order_id: int, include_deleted: bool = False) -> List[OrderItem]:
+        return await self.db_session.run_sync(
+            lambda session: OrderItemRepository(session).get_by_order_id(order_id, include_deleted)
+        )
+
+    async def get_by_product_name(self, order_id: int, product_name: str) -> OrderItem:
+        return await self.db_session.run_sync(
+            lambda session: OrderItemRepository(session).get_by_product_name(order_id, product_name)
+        )
+
+    async def get_by_id(self, order_item_id: int) -> OrderItem:
+        return await self.db_session.run_sync(lambda session: OrderItemRepository(session).get_by_id(order_item_id))
+
+    async def get_all(self, include_deleted: bool = False) -> List[OrderItem]:
+        return await self.db_session.run_sync(lambda session: OrderItemRepository(session).get_all(include_deleted))
+
+    async def update(self, order_item: OrderItem) -> OrderItem:
+        return await self.db_session.run_sync(lambda session: OrderItemRepository(session).update(order_item))
+
+    async def delete(self, order_item: OrderItem) -> None:
+        return await self.db_session.run_sync(lambda session: OrderItemRepository(session).delete(order_item))
@@ -0,0 +1,76 @@
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.adapters.driven.repositories.order_repository import OrderRepository
+from src.constants.order_load_profile import OrderLoadProfileEnum
+from src.core.domain.entities.order import Order
+from src.core.shared.order_page_cursor import OrderPageCursor
+from src.core.domain.entities.order_status_movement import OrderStatusMovement
+from src.core.ports.order.i_async_order_repository import IAsyncOrderRepository
+
+
+class AsyncOrderRepository(IAsyncOrderRepository):
+    """
+    Versão assíncrona do OrderRepository.
+
+    As consultas são executadas pelo driver assíncrono através de ``AsyncSession.run_sync``,
+    reaproveitando o mapeamento do repositório síncrono (inclusive os lazy loads do ``to_entity``)
+    sem bloquear o event loop.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def create(self, order: Order) -> Order:
+        return await self.db_session.run_sync(lambda session: OrderRepository(session).create(order))
+
+    async def get_by_customer_id(self, id_customer: int, profile: OrderLoadProfileEnum = OrderLoadProfileEnum.WITH_ITEMS) -> List[Order]:
+        return await self.db_session.run_sync(
+            lambda session: OrderRepository(session).get_by_customer_id(id_customer, profile)
+        )
+
+    async def get_by_employee_id(self, id_employee: int) -> List[Order]:
+        return await self.db_session.run_sync(lambda session: OrderRepository(session).get_by_employee_id(id_employee))
+
+    async def get_by_payment_id(self, id_payment: int, profile: OrderLoadProfileEnum = OrderLoadProfileEnum.FULL_HISTORY) -> Order:
+        return await self.db_session.run_sync(
+            lambda session: OrderRepository(session).get_by_payment_id(id_payment, profile)
+        )
+
+    async def get_by_payment_ids(self, payment_ids: List[str], profile: OrderLoadProfileEnum = OrderLoadProfileEnum.WITH_ITEMS) -> List[Order]:
+        return await self.db_session.run_sync(
+            lambda session: OrderRepository(session).get_by_payment_ids(payment_ids, profile)
+        )
+
+    async def get_by_id(self, order_id: int, profile: OrderLoadProfileEnum = OrderLoadProfileEnum.FULL_HISTORY) -> Order:
+        return await self.db_session.run_sync(lambda session: OrderRepository(session).get_by_id(order_id, profile))
+
+    async def get_all(
+        self,
+        status: Optional[List[str]] = None,
+        customer_id: Optional[int] = None,
+        include_deleted: Optional[bool] = False,
+        profile: OrderLoadProfileEnum = OrderLoadProfileEnum.WITH_ITEMS,
+        limit: Optional[int] = None,
+        after: Optional[OrderPageCursor] = None,
+    ) -> List[Order]:
+        return await self.db_session.run_sync(
+            lambda session: OrderRepository(session).get_all(status, customer_id, include_deleted, profile, limit, after)
+        )
+
+    async def get_status_history(self, order_id: int, limit: int = 20, after_id: Optional[int] = None) -> List[OrderStatusMovement]:
+        return await self.db_session.run_sync(
+            lambda session: OrderRepository(session).get_status_history(order_id, limit, after_id)
+        )
+
+    async def update(self, order: Order) -> Order:
+        return await self.db_session.run_sync(lambda session: OrderRepository(session).update(order))
+
+    async def update_many(self, orders: List[Order]) -> List[Order]:
+        return await self.db_session.run_sync(lambda session: OrderRepository(session).update_many(orders))
+
+    async def delete(self, order: Order) -> None:
+        return await self.db_session.run_sync(lambda session: OrderRepository(session).delete(order))
+
+    async def release(self) -> None:
+        # A sessão continua utilizável: a próxima consulta obtém outra conexão do pool
+        await self.db_session.close()
@@ -0,0 +1,40 @@
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.adapters.driven.repositories.order_status_repository import OrderStatusRepository
+from src.core.domain.entities.order_status import OrderStatus
+from src.core.shared.order_status_registry import OrderStatusRegistry
+from src.core.ports.order_status.i_async_order_status_repository import IAsyncOrderStatusRepository
+
+
+class AsyncOrderStatusRepository(IAsyncOrderStatusRepository):
+    """
+    Versão assíncrona do OrderStatusRepository, executada via ``AsyncSession.run_sync``.
+    """
+
+    def __init__(self, db_session: AsyncSession, registry: Optional[OrderStatusRegistry] = None):
+        self.db_session = db_session
+        self.registry = registry
+
+    def _repository(self, session) -> OrderStatusRepository:
+        return OrderStatusRepository(session, self.registry)
+
+    async def create(self, order_status: OrderStatus) -> OrderStatus:
+        return await self.db_session.run_sync(lambda session: self._repository(session).create(order_status))
+
+    async def exists_by_status(self, status: str) -> bool:
+        return await self.db_session.run_sync(lambda session: self._repository(session).exists_by_status(status))
+
+    async def get_by_status(self, status: str) -> OrderStatus:
+        return await self.db_session.run_sync(lambda session: self._repository(session).get_by_status(status))
+
+    async def get_by_id(self, order_status_id: int) -> OrderStatus:
+        return await self.db_session.run_sync(lambda session: self._repository(session).get_by_id(order_status_id))
+
+    async def get_all(self, include_deleted: bool = False) -> List[OrderStatus]:
+        return await self.db_session.run_sync(lambda session: self._repository(session).get_all(include_deleted))
+
+    async def update(self, order_status: OrderStatus) -> OrderStatus:
+        return await self.db_session.run_sync(lambda session: self._repository(session).update(order_status))
+
+    async def delete(self, order_status: OrderStatus) -> None:
+        return await self.db_session.run_sync(lambda session: self._repository(session).delete(order_status))
@@ -3,6 +3,9 @@ from src.adapters.driven.repositories.models.order_item_model import OrderItemMo
 from src.adapters.driven.repositories.models.order_model import OrderModel
 from src.adapters.driven.repositories.models.order_status_model import OrderStatusModel
 from src.adapters.driven.repositories.models.order_status_movement_model import OrderStatusMovementModel
+from src.adapters.driven.repositories.models.payment_outbox_model import PaymentOutboxModel
+from src.adapters.driven.repositories.models.payment_webhook_inbox_model import PaymentWebhookInboxModel
+from src.adapters.driven.repositories.models.processed_webhook_model import ProcessedWebhookModel
 
 __all__ = [
     "BaseModel",
@@ -10,4 +13,7 @@ __all__ = [
     "OrderModel",
     "OrderStatusModel",
     "OrderStatusMovementModel",
+    "PaymentOutboxModel",
+    "PaymentWebhookInboxModel",
+    "ProcessedWebhookModel",
 ]
\ No newline at end of file
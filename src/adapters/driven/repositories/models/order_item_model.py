@@ -9,7 +9,7 @@ from src.adapters.driven.repositories.models.base_model import BaseModel
 class OrderItemModel(BaseModel):
     __tablename__ = "order_items"
 
-    order_id = Column(ForeignKey("orders.id"), nullable=False)
+    order_id = Column(ForeignKey("orders.id"), nullable=False, index=True)
     order = relationship("OrderModel", back_populates="order_items")
 
     product_id = Column(Integer, nullable=False)
@@ -1,8 +1,9 @@
-from typing import List
-from sqlalchemy import Column, ForeignKey, Integer, String
+from typing import List, Optional, Set
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from src.adapters.driven.repositories.models.base_model import BaseModel
+from src.constants.order_load_profile import OrderLoadProfileEnum
 from src.adapters.driven.repositories.models.order_item_model import OrderItemModel
 from src.adapters.driven.repositories.models.order_status_movement_model import OrderStatusMovementModel
 from src.core.domain.entities.order import Order
@@ -12,6 +13,11 @@ from src.core.shared.identity_map import IdentityMap
 
 class OrderModel(BaseModel):
     __tablename__ = 'orders'
+    __table_args__ = (
+        Index('ix_orders_id_order_status_created_at', 'id_order_status', 'created_at'),
+        Index('ix_orders_id_customer_inactivated_at', 'id_customer', 'inactivated_at'),
+        Index('ix_orders_payment_id', 'payment_id'),
+    )
 
     id_customer = Column(String(100), nullable=False)
 
@@ -22,14 +28,18 @@ class OrderModel(BaseModel):
 
     order_items = relationship('OrderItemModel', back_populates='order', cascade='all, delete-orphan')
 
+    # Histórico append-only: as movimentações são inseridas explicitamente pelo repositório, uma única vez,
+    # e nunca reconciliadas pela sessão
     status_history = relationship(
         'OrderStatusMovementModel',
-        back_populates='order',
-        cascade='all, delete-orphan',
+        viewonly=True,
         order_by='OrderStatusMovementModel.changed_at',
     )
 
     payment_id = Column(String(100), nullable=True)
+
+    # Controle de concorrência otimista: incrementada a cada gravação do agregado (pedido, itens e histórico)
+    version = Column(Integer, nullable=False, default=1, server_default='1')
     
     @classmethod
     def from_entity(cls, order: Order) -> 'OrderModel':
@@ -43,17 +53,27 @@ class OrderModel(BaseModel):
             id_order_status=id_order_status,
             id_employee=id_employee,
             payment_id=payment_id,
+            version=order.version,
             order_items=[OrderItemModel.from_entity(order_item) for order_item in order.order_items],
-            status_history=[OrderStatusMovementModel.from_entity(movement) for movement in order.status_history],
             id=order.id,
             created_at=order.created_at,
             updated_at=order.updated_at,
             inactivated_at=order.inactivated_at,
         )
         
-    def to_entity(self) -> Order:
+    def to_entity(self, profile: Optional[OrderLoadProfileEnum] = None) -> Order:
+        """
+        Maps the model to the domain entity.
+
+        Args:
+            profile (OrderLoadProfileEnum, optional): Load profile used by the query. Relationships the profile
+                did not load are left out of the entity (and mapped later, if a richer profile loads the same order
+                in this identity map) instead of being lazily loaded one order at a time. ``None`` maps everything.
+        """
         identity_map: IdentityMap = IdentityMap.get_instance()
+        relations = self._relations_for(profile)
         if existing_order := identity_map.get(Order, self.id):
+            self._map_unloaded_relations(existing_order, identity_map, relations)
             return existing_order
 
         order = Order(id=self.id)
@@ -62,14 +82,37 @@ class OrderModel(BaseModel):
         order.id_customer = self.id_customer
         order.order_status = self._get_order_status(identity_map)
         order.id_employee = self.id_employee
-        order.order_items = self._get_order_items(identity_map)
-        order.status_history = self._get_status_history(identity_map)
+        order.order_items = self._get_order_items(identity_map) if 'order_items' in relations else []
+        order.status_history = self._get_status_history(identity_map) if 'status_history' in relations else []
         order.created_at = self.created_at
         order.updated_at = self.updated_at
         order.inactivated_at = self.inactivated_at
         order.payment_id = self.payment_id
+        order.version = self.version
+        order.mark_clean(relations)
 
         return order
+
+    @staticmethod
+    def _relations_for(profile: Optional[OrderLoadProfileEnum]) -> Set[str]:
+        if profile is None:
+            return {'order_items', 'status_history'}
+
+        relations = set()
+        if profile.loads_items:
+            relations.add('order_items')
+        if profile.loads_history:
+            relations.add('status_history')
+        return relations
+
+    def _map_unloaded_relations(self, order: Order, identity_map: IdentityMap, relations: Set[str]) -> None:
+        mapped = order.unloaded_relations & relations
+        if 'order_items' in mapped:
+            order.order_items = self._get_order_items(identity_map)
+        if 'status_history' in mapped:
+            order.status_history = self._get_status_history(identity_map)
+        if mapped:
+            order.mark_clean(mapped, fields=False)
         
     def _get_order_items(self, identity_map: IdentityMap) -> List[OrderItem]:
         from src.core.domain.entities.order_item import OrderItem
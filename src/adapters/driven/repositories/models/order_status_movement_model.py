@@ -10,8 +10,8 @@ from src.core.shared.identity_map import IdentityMap
 class OrderStatusMovementModel(BaseModel):
     __tablename__ = 'order_status_movements'
 
-    id_order: Mapped[int] = Column(Integer, ForeignKey('orders.id'), nullable=False)
-    order = relationship('OrderModel', back_populates='status_history')
+    id_order: Mapped[int] = Column(Integer, ForeignKey('orders.id'), nullable=False, index=True)
+    order = relationship('OrderModel')
 
     order_snapshot: Mapped[dict] = Column(JSON, nullable=False, default=[])
     
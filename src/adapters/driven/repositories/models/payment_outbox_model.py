@@ -0,0 +1,65 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped
+
+from src.adapters.driven.repositories.models.base_model import BaseModel
+from src.constants.payment_outbox_status import PaymentOutboxStatusEnum
+from src.core.domain.entities.payment_outbox_entry import PaymentOutboxEntry
+
+
+class PaymentOutboxModel(BaseModel):
+    __tablename__ = 'payment_outbox'
+    __table_args__ = (
+        # Despachante: solicitações pendentes cuja próxima tentativa já venceu
+        Index('ix_payment_outbox_status_next_attempt_at', 'status', 'next_attempt_at'),
+        Index('ix_payment_outbox_id_order', 'id_order'),
+    )
+
+    id_order: Mapped[int] = Column(Integer, ForeignKey('orders.id', ondelete='CASCADE'), nullable=False)
+    payload: Mapped[Dict[str, Any]] = Column(JSON, nullable=False)
+    status: Mapped[str] = Column(String(20), nullable=False, default=PaymentOutboxStatusEnum.PENDING.status)
+    attempts: Mapped[int] = Column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = Column(DateTime(timezone=True), nullable=False)
+    payment_id: Mapped[Optional[str]] = Column(String(100), nullable=True)
+    qr_code: Mapped[Optional[str]] = Column(String(2000), nullable=True)
+    transaction_id: Mapped[Optional[str]] = Column(String(100), nullable=True)
+    last_error: Mapped[Optional[str]] = Column(String(500), nullable=True)
+    dispatched_at: Mapped[Optional[datetime]] = Column(DateTime(timezone=True), nullable=True)
+
+    @staticmethod
+    def from_entity(entry: PaymentOutboxEntry) -> 'PaymentOutboxModel':
+        return PaymentOutboxModel(
+            id=entry.id,
+            id_order=entry.id_order,
+            payload=entry.payload,
+            status=entry.status,
+            attempts=entry.attempts,
+            next_attempt_at=entry.next_attempt_at,
+            payment_id=entry.payment_id,
+            qr_code=entry.qr_code,
+            transaction_id=entry.transaction_id,
+            last_error=entry.last_error,
+            dispatched_at=entry.dispatched_at,
+        )
+
+    def to_entity(self) -> PaymentOutboxEntry:
+        return PaymentOutboxEntry(
+            id=self.id,
+            id_order=self.id_order,
+            payload=self.payload,
+            status=self.status,
+            attempts=self.attempts,
+            next_attempt_at=self.next_attempt_at,
+            payment_id=self.payment_id,
+            qr_code=self.qr_code,
+            transaction_id=self.transaction_id,
+            last_error=self.last_error,
+            dispatched_at=self.dispatched_at,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            inactivated_at=self.inactivated_at,
+        )
+
+
+__all__ = ['PaymentOutboxModel']
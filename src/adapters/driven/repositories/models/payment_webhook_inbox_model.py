@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Column, DateTime, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped
+
+from src.adapters.driven.repositories.models.base_model import BaseModel
+from src.core.domain.entities.payment_webhook_event import PaymentWebhookEvent
+
+
+class PaymentWebhookInboxModel(BaseModel):
+    __tablename__ = 'payment_webhook_inbox'
+    __table_args__ = (
+        UniqueConstraint('payment_id', 'transaction_id', 'event', name='uq_payment_webhook_inbox_key'),
+        # Fila: eventos pendentes em ordem de chegada
+        Index('ix_payment_webhook_inbox_processed_at_id', 'processed_at', 'id'),
+    )
+
+    payment_id: Mapped[str] = Column(String(100), nullable=False)
+    transaction_id: Mapped[str] = Column(String(100), nullable=False)
+    event: Mapped[str] = Column(String(100), nullable=False)
+    payment_status: Mapped[str] = Column(String(100), nullable=False)
+    attempts: Mapped[int] = Column(Integer, nullable=False, default=0)
+    processed_at: Mapped[Optional[datetime]] = Column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[Optional[str]] = Column(String(500), nullable=True)
+
+    def to_entity(self) -> PaymentWebhookEvent:
+        return PaymentWebhookEvent(
+            id=self.id,
+            payment_id=self.payment_id,
+            transaction_id=self.transaction_id,
+            event=self.event,
+            payment_status=self.payment_status,
+            attempts=self.attempts,
+            processed_at=self.processed_at,
+            last_error=self.last_error,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            inactivated_at=self.inactivated_at,
+        )
+
+
+__all__ = ['PaymentWebhookInboxModel']
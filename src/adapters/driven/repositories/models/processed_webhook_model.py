@@ -0,0 +1,21 @@
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Index, String, UniqueConstraint
+from sqlalchemy.orm import Mapped
+
+from src.adapters.driven.repositories.models.base_model import BaseModel
+
+
+class ProcessedWebhookModel(BaseModel):
+    __tablename__ = 'processed_webhooks'
+    __table_args__ = (
+        UniqueConstraint('payment_id', 'transaction_id', 'event', name='uq_processed_webhooks_key'),
+        Index('ix_processed_webhooks_expires_at', 'expires_at'),
+    )
+
+    payment_id: Mapped[str] = Column(String(100), nullable=False)
+    transaction_id: Mapped[str] = Column(String(100), nullable=False)
+    event: Mapped[str] = Column(String(100), nullable=False)
+    expires_at: Mapped[datetime] = Column(DateTime(timezone=True), nullable=False)
+
+
+__all__ = ['ProcessedWebhookModel']
@@ -1,13 +1,21 @@
+from datetime import datetime, timezone
 from typing import List, Optional
+from src.constants.order_load_profile import OrderLoadProfileEnum
 from src.constants.order_status import OrderStatusEnum
+from src.constants.order_transition import DEFAULT_ORDER_LIST_PRIORITY, ORDER_STATUS_LIST_PRIORITY
 from src.adapters.driven.repositories.models.order_status_movement_model import OrderStatusMovementModel
 from src.adapters.driven.repositories.models.order_model import OrderModel
 from src.adapters.driven.repositories.models.order_status_model import OrderStatusModel
+from src.adapters.driven.repositories.models.order_item_model import OrderItemModel
 from src.core.shared.identity_map import IdentityMap
+from src.core.shared.order_page_cursor import OrderPageCursor
+from src.core.shared.order_change_tracker import ORDER_ITEM_TRACKED_FIELDS, OrderChanges
 from src.core.domain.entities.order import Order
+from src.core.domain.entities.order_status_movement import OrderStatusMovement
+from src.core.exceptions.concurrent_update_exception import ConcurrentUpdateException
 from src.core.ports.order.i_order_repository import IOrderRepository
-from sqlalchemy.orm import Session
-from sqlalchemy import case
+from sqlalchemy.orm import Query, Session, contains_eager, joinedload, selectinload
+from sqlalchemy import DateTime, and_, case, delete, func, insert, literal, or_, update
 
 class OrderRepository(IOrderRepository):
 
@@ -23,32 +31,63 @@ class OrderRepository(IOrderRepository):
 
         order_model = OrderModel.from_entity(order)
         self.db_session.add(order_model)
+        self.db_session.flush()
+        self._append_movements(order_model.id, order.status_history)
         self.db_session.commit()
         self.db_session.refresh(order_model)
         return order_model.to_entity()
 
-    def get_by_customer_id(self, id_customer: int) -> List[Order]:
-        order_models = self.db_session.query(OrderModel).filter(OrderModel.id_customer == id_customer, OrderModel.inactivated_at.is_(None)).all()
-        return [order.to_entity() for order in order_models]
+    def get_by_customer_id(self, id_customer: int, profile: OrderLoadProfileEnum = OrderLoadProfileEnum.WITH_ITEMS) -> List[Order]:
+        query = self.db_session.query(OrderModel).filter(OrderModel.id_customer == id_customer, OrderModel.inactivated_at.is_(None))
+        order_models = self._apply_profile(query, profile).all()
+        return [order.to_entity(profile) for order in order_models]
     
     def get_by_employee_id(self, id_employee: int) -> List[Order]:
         order_models = self.db_session.query(OrderModel).filter(OrderModel.id_employee == id_employee, OrderModel.inactivated_at.is_(None)).all()
         return [order.to_entity() for order in order_models]
     
-    def get_by_payment_id(self, id_payment: int) -> Order:
-        order_model = self.db_session.query(OrderModel).filter(OrderModel.payment_id == id_payment).first()
+    def get_by_payment_id(self, id_payment: int, profile: OrderLoadProfileEnum = OrderLoadProfileEnum.FULL_HISTORY) -> Order:
+        query = self.db_session.query(OrderModel).filter(OrderModel.payment_id == id_payment)
+        order_model = self._apply_profile(query, profile).first()
         if not order_model:
             return None
-        return order_model.to_entity()
+        return order_model.to_entity(profile)
+
+    def get_by_payment_ids(self, payment_ids: List[str], profile: OrderLoadProfileEnum = OrderLoadProfileEnum.WITH_ITEMS) -> List[Order]:
+        """Loads the orders of several payments with a single ``payment_id IN (...)`` query."""
+        if not payment_ids:
+            return []
+        query = self.db_session.query(OrderModel).filter(OrderModel.payment_id.in_(set(payment_ids)))
+        return [order_model.to_entity(profile) for order_model in self._apply_profile(query, profile).all()]
 
-    def get_by_id(self, order_id: int) -> Order:
-        order_model = self.db_session.query(OrderModel).filter(OrderModel.id == order_id).first()
+    def get_by_id(self, order_id: int, profile: OrderLoadProfileEnum = OrderLoadProfileEnum.FULL_HISTORY) -> Order:
+        query = self.db_session.query(OrderModel).filter(OrderModel.id == order_id)
+        order_model = self._apply_profile(query, profile).first()
         if not order_model:
             return None
-        return order_model.to_entity()
+        return order_model.to_entity(profile)
+
+    def get_all(
+        self,
+        status: Optional[List[str]] = None,
+        customer_id: Optional[int] = None,
+        include_deleted: Optional[bool] = False,
+        profile: OrderLoadProfileEnum = OrderLoadProfileEnum.WITH_ITEMS,
+        limit: Optional[int] = None,
+        after: Optional[OrderPageCursor] = None,
+    ) -> List[Order]:
+        """
+        Lists orders by status priority and creation date.
 
-    def get_all(self, status: Optional[List[str]] = None, customer_id: Optional[int] = None, include_deleted: Optional[bool] = False) -> List[Order]:
-        query = self.db_session.query(OrderModel)
+        Args:
+            limit (int, optional): Page size; ``None`` returns every matching order.
+            after (OrderPageCursor, optional): Keyset cursor of the last order of the previous page. The page is read
+                with a ``(priority, created_at, id) > cursor`` predicate, so its cost does not grow with the page
+                number as an OFFSET would.
+        """
+        # Filtra pela tabela de status já unida (em vez de EXISTS correlacionado), para que o banco resolva os
+        # status primeiro e chegue aos pedidos pelo índice (id_order_status, created_at)
+        query = self.db_session.query(OrderModel).join(OrderStatusModel)
     
         if not include_deleted:
             query = query.filter(OrderModel.inactivated_at.is_(None))
@@ -57,38 +96,266 @@ class OrderRepository(IOrderRepository):
             query = query.filter(OrderModel.id_customer == customer_id)
         
         if status:
-            query = query.filter(OrderModel.order_status.has(OrderStatusModel.status.in_(status)))
+            query = query.filter(OrderStatusModel.status.in_(status))
 
         if status is None or OrderStatusEnum.ORDER_COMPLETED.status not in status:
-            query = query.filter(OrderModel.order_status.has(OrderStatusModel.status != OrderStatusEnum.ORDER_COMPLETED.status))
+            query = query.filter(OrderStatusModel.status != OrderStatusEnum.ORDER_COMPLETED.status)
             
         status_priority = case(
-            (OrderStatusModel.status == OrderStatusEnum.ORDER_PAID.status, 1),
-            (OrderStatusModel.status == OrderStatusEnum.ORDER_PREPARING.status, 2),
-            (OrderStatusModel.status == OrderStatusEnum.ORDER_READY.status, 3),
-            (OrderStatusModel.status == OrderStatusEnum.ORDER_COMPLETED.status, 4),
-            else_=5
+            *[
+                (OrderStatusModel.status == order_status.status, priority)
+                for order_status, priority in ORDER_STATUS_LIST_PRIORITY.items()
+            ],
+            else_=DEFAULT_ORDER_LIST_PRIORITY
         )
 
-        query = query.join(OrderStatusModel).order_by(status_priority, OrderModel.created_at.asc())
-        return [order_model.to_entity() for order_model in query.all()]
+        created_at = self._comparable_created_at(OrderModel.created_at)
+        if after is not None:
+            after_created_at = self._comparable_created_at(literal(after.created_at, DateTime(timezone=True)))
+            query = query.filter(
+                or_(
+                    status_priority > after.priority,
+                    and_(
+                        status_priority == after.priority,
+                        or_(
+                            created_at > after_created_at,
+                            and_(created_at == after_created_at, OrderModel.id > after.id),
+                        ),
+                    ),
+                )
+            )
+
+        query = (
+            query.options(contains_eager(OrderModel.order_status))
+                .order_by(status_priority, created_at.asc(), OrderModel.id.asc())
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        query = self._apply_profile(query, profile, load_status=False)
+        return [order_model.to_entity(profile) for order_model in query.all()]
+
+    def _comparable_created_at(self, expression):
+        """
+        SQLite stores datetimes as text, with (bound parameters) or without (CURRENT_TIMESTAMP) microseconds, so
+        both sides of the keyset comparison are normalized to the same format there.
+        """
+        if self.db_session.get_bind().dialect.name == "sqlite":
+            return func.strftime("%Y-%m-%d %H:%M:%f", expression)
+        return expression
+
+    def _apply_profile(self, query: Query, profile: OrderLoadProfileEnum, load_status: bool = True) -> Query:
+        """
+        Adds the eager loading options of the profile, so mapping N orders costs a fixed number of queries:
+        one for the orders (status joined) plus one SELECT ... IN per collection the profile loads.
+        """
+        options = []
+        if load_status:
+            options.append(joinedload(OrderModel.order_status))
+        if profile.loads_items:
+            options.append(selectinload(OrderModel.order_items))
+        if profile.loads_history:
+            options.append(selectinload(OrderModel.status_history))
+        return query.options(*options)
 
     def update(self, order: Order) -> Order:
+        """
+        Persists the changes made to the order since it was loaded.
+
+        Orders mapped by this repository carry a change tracker, so only the changed rows are written: the order
+        columns that changed, new and changed items, removed items and new status movements. A status advance
+        writes two small statements instead of re-merging the whole aggregate.
+
+        Every write is guarded by the order ``version``: when another request saved the order after it was loaded,
+        nothing is written, the order is evicted from the identity map and ``ConcurrentUpdateException`` is raised.
+        Any other failure of the write or of the commit is handled the same way before the error is re-raised.
+        """
+        changes = order.collect_changes() if isinstance(order, Order) else None
+        if changes is None:
+            return self._merge(order)
+
+        if not changes.is_empty:
+            try:
+                self._write_changes(order, changes)
+                self.db_session.commit()
+            except Exception:
+                self._discard([order])
+                raise
+            order.version += 1
+            order.mark_clean()
+        return order
+
+    def update_many(self, orders: List[Order]) -> List[Order]:
+        """
+        Persists the tracked changes of several orders in a single transaction (one commit).
+
+        Orders that were not loaded through this repository carry no change tracker and fall back to ``update``.
+        A version conflict on any of the orders rolls back the whole batch and evicts every tracked order of it,
+        written or not, so the next load reads them again from the database.
+        """
+        changed, untracked = [], set()
+        try:
+            for order in orders:
+                changes = order.collect_changes() if isinstance(order, Order) else None
+                if changes is None:
+                    untracked.add(id(order))
+                elif not changes.is_empty:
+                    changed.append(order)
+                    self._write_changes(order, changes)
+
+            if changed:
+                self.db_session.commit()
+        except Exception:
+            # Os pedidos ainda não gravados também guardam alterações que não chegaram ao banco
+            self._discard([order for order in orders if isinstance(order, Order)])
+            raise
+
+        for order in changed:
+            order.version += 1
+            order.mark_clean()
+
+        return [self._merge(order) if id(order) in untracked else order for order in orders]
+
+    def _write_changes(self, order: Order, changes: OrderChanges) -> None:
+        now = datetime.now(timezone.utc)
+
+        # A linha do pedido é sempre gravada: a versão protege o agregado inteiro, inclusive itens e histórico
+        self._bump_version(order, **changes.order_fields, updated_at=now)
+        order.updated_at = now
+
+        if changes.removed_items:
+            self.db_session.execute(
+                delete(OrderItemModel)
+                    .where(OrderItemModel.id.in_([item.id for item in changes.removed_items]))
+                    .execution_options(synchronize_session=False)
+            )
+            for item in changes.removed_items:
+                self.identity_map.remove(item)
+
+        for item, fields in changes.changed_items:
+            self.db_session.execute(
+                update(OrderItemModel)
+                    .where(OrderItemModel.id == item.id)
+                    .values(**fields, updated_at=now)
+                    .execution_options(synchronize_session=False)
+            )
+            item.updated_at = now
+
+        for item in changes.new_items:
+            values = self._coerce(OrderItemModel, {name: getattr(item, name) for name in ORDER_ITEM_TRACKED_FIELDS})
+            item.id = self._insert(OrderItemModel, order_id=order.id, created_at=now, updated_at=now, **values)
+            # A entidade passa a refletir a linha gravada (ex.: product_id vindo do estoque como string)
+            for name, value in values.items():
+                setattr(item, name, value)
+            item.created_at = item.updated_at = now
+            self.identity_map.add(item)
+
+        self._append_movements(order.id, changes.new_movements, now)
+
+    def _bump_version(self, order: Order, **values) -> None:
+        """
+        Writes the order row only if it still is at the version the entity was loaded from (compare-and-set), and
+        moves it to the next version. Raises ``ConcurrentUpdateException`` when no row matched.
+        """
+        statement = update(OrderModel).where(OrderModel.id == order.id)
+        if order.version is not None:
+            statement = statement.where(OrderModel.version == order.version)
+        result = self.db_session.execute(
+            statement
+                .values(**values, version=OrderModel.version + 1)
+                .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            raise ConcurrentUpdateException("Pedido", order.id, expected_version=order.version)
+
+    def _discard(self, orders: List[Order]) -> None:
+        """
+        Rolls back the transaction and evicts the orders (with their items and movements) from the identity map,
+        so the next load reads the rows written by the other request instead of the stale entities.
+        """
+        self.db_session.rollback()
+        for order in orders:
+            for entity in [*order.order_items, *order.status_history, order]:
+                self.identity_map.remove(entity)
+
+    def _append_movements(
+        self, order_id: int, movements: List[OrderStatusMovement], now: Optional[datetime] = None
+    ) -> None:
+        """Inserts the movements that were not persisted yet; the status history is append-only."""
+        now = now or datetime.now(timezone.utc)
+        for movement in movements:
+            if movement.id is not None:
+                continue
+
+            values = {"order_snapshot": movement.order_snapshot} if movement.order_snapshot is not None else {}
+            movement.id = self._insert(
+                OrderStatusMovementModel,
+                id_order=order_id,
+                old_status=movement.old_status,
+                new_status=movement.new_status,
+                changed_at=movement.changed_at,
+                changed_by=movement.changed_by,
+                created_at=now,
+                updated_at=now,
+                **values,
+            )
+            movement.created_at = movement.updated_at = now
+            self.identity_map.add(movement)
+
+    @staticmethod
+    def _coerce(model, values: dict) -> dict:
+        columns = model.__table__.c
+        coerced = {}
+        for name, value in values.items():
+            python_type = columns[name].type.python_type
+            if value is not None and python_type in (int, float, str) and not isinstance(value, python_type):
+                value = python_type(value)
+            coerced[name] = value
+        return coerced
+
+    def _insert(self, model, **values) -> int:
+        result = self.db_session.execute(insert(model.__table__).values(**values))
+        return result.inserted_primary_key[0]
+
+    def _merge(self, order: Order) -> Order:
+        """Full-graph merge, used for orders that were not loaded through this repository."""
         if order.id is not None:
             existing_order = self.get_by_id(order.id)
             if existing_order:
                 self.identity_map.remove(existing_order)
+                try:
+                    self._bump_version(order)
+                except ConcurrentUpdateException:
+                    self._discard([order])
+                    raise
+                order.version = (order.version or existing_order.version) + 1
 
         order_model = OrderModel.from_entity(order)
         order_model.id_customer = order.id_customer
         order_model.id_employee = order.id_employee
         order_model.order_status = OrderStatusModel.from_entity(order.order_status)
-        order_model.status_history = [OrderStatusMovementModel.from_entity(movement) for movement in order.status_history]
 
         self.db_session.merge(order_model)
+        self._append_movements(order_model.id, order.status_history)
         self.db_session.commit()
         return self.get_by_id(order_model.id)
 
+    def get_status_history(self, order_id: int, limit: int = 20, after_id: Optional[int] = None) -> List[OrderStatusMovement]:
+        """
+        Returns a page of the status history of the order, oldest first.
+
+        Movements are append-only, so their ids grow with time and the page is read by keyset: ``after_id`` is the
+        id of the last movement of the previous page. The cost of a page does not depend on the size of the history.
+        """
+        query = self.db_session.query(OrderStatusMovementModel).filter(OrderStatusMovementModel.id_order == order_id)
+        if after_id is not None:
+            query = query.filter(OrderStatusMovementModel.id > after_id)
+        movement_models = query.order_by(OrderStatusMovementModel.id.asc()).limit(limit).all()
+        return [movement_model.to_entity() for movement_model in movement_models]
+
+    def release(self) -> None:
+        # A sessão continua utilizável: a próxima consulta obtém outra conexão do pool
+        self.db_session.close()
+
     def delete(self, order: Order) -> None:
         order_model = (
             self.db_session.query(OrderModel)
@@ -96,6 +363,11 @@ class OrderRepository(IOrderRepository):
                 .first()
         )
         if order_model:
-            self.db_session.delete(order)
+            self.db_session.execute(
+                delete(OrderStatusMovementModel)
+                    .where(OrderStatusMovementModel.id_order == order.id)
+                    .execution_options(synchronize_session=False)
+            )
+            self.db_session.delete(order_model)
             self.db_session.commit()
             self.identity_map.remove(order)
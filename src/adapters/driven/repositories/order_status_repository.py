@@ -1,17 +1,43 @@
-from typing import List
+from typing import List, Optional
 from sqlalchemy.sql import exists
 from sqlalchemy.orm import Session
 from src.core.domain.entities.order_status import OrderStatus
 from src.core.ports.order_status.i_order_status_repository import IOrderStatusRepository
 from src.core.shared.identity_map import IdentityMap
+from src.core.shared.order_status_registry import OrderStatusRegistry
 from src.adapters.driven.repositories.models.order_status_model import OrderStatusModel
 
 
 class OrderStatusRepository(IOrderStatusRepository):
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, registry: Optional[OrderStatusRegistry] = None):
         self.db_session = db_session
         self.identity_map = IdentityMap.get_instance()
+        self.registry = registry
+
+    def warm_registry(self) -> None:
+        """Loads every order status into the registry in a single query."""
+        if self.registry is None:
+            return
+        order_status_models = self.db_session.query(OrderStatusModel).all()
+        self.registry.load(order_status_model.to_entity() for order_status_model in order_status_models)
+
+    def _ready_registry(self) -> Optional[OrderStatusRegistry]:
+        if self.registry is not None and not self.registry.is_warm:
+            self.warm_registry()
+        return self.registry
+
+    def _register(self, order_status_model: Optional[OrderStatusModel]) -> Optional[OrderStatus]:
+        if order_status_model is None:
+            return None
+        order_status = order_status_model.to_entity()
+        if self.registry is not None:
+            self.registry.register(order_status)
+        return order_status
+
+    def _invalidate_registry(self) -> None:
+        if self.registry is not None:
+            self.registry.invalidate()
 
     def create(self, order_status: OrderStatus) -> OrderStatus:
         if order_status.id is not None:
@@ -22,25 +48,30 @@ class OrderStatusRepository(IOrderStatusRepository):
         order_status_model = OrderStatusModel.from_entity(order_status)
         self.db_session.add(order_status_model)
         self.db_session.commit()
+        self._invalidate_registry()
         self.db_session.refresh(order_status_model)
         return order_status_model.to_entity()
 
     def exists_by_status(self, status: str) -> bool:
+        if (registry := self._ready_registry()) and registry.get_by_status(status):
+            return True
         return self.db_session.query(exists().where(OrderStatusModel.status == status)).scalar()
 
     def get_by_status(self, status: str) -> OrderStatus:
+        if (registry := self._ready_registry()) and (order_status := registry.get_by_status(status)):
+            return order_status
+
         order_status_model =  self.db_session.query(OrderStatusModel).filter(OrderStatusModel.status == status).first()
-        if order_status_model is None:
-            return None
-        return order_status_model.to_entity()
+        return self._register(order_status_model)
 
     def get_by_id(self, order_status_id: int) -> OrderStatus:
+        if (registry := self._ready_registry()) and (order_status := registry.get_by_id(order_status_id)):
+            return order_status
+
         order_status_model =  self.db_session.query(OrderStatusModel).filter(
             OrderStatusModel.id == order_status_id
         ).first()
-        if order_status_model is None:
-            return None
-        return order_status_model.to_entity()
+        return self._register(order_status_model)
 
     def get_all(self, include_deleted: bool = False) -> List[OrderStatus]:
         query = self.db_session.query(OrderStatusModel)
@@ -58,6 +89,7 @@ class OrderStatusRepository(IOrderStatusRepository):
         order_status_model = OrderStatusModel.from_entity(order_status)
         self.db_session.merge(order_status_model)
         self.db_session.commit()
+        self._invalidate_registry()
         return order_status_model.to_entity()
 
     def delete(self, order_status: OrderStatus) -> None:
@@ -67,4 +99,5 @@ class OrderStatusRepository(IOrderStatusRepository):
         if order_status_model:
             self.db_session.delete(order_status_model)
             self.db_session.commit()
+            self._invalidate_registry()
             self.identity_map.remove(order_status_model.to_entity())
@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from src.adapters.driven.repositories.models.payment_outbox_model import PaymentOutboxModel
+from src.constants.payment_outbox_status import PaymentOutboxStatusEnum
+from src.core.domain.entities.payment_outbox_entry import PaymentOutboxEntry
+from src.core.ports.payment.i_payment_outbox_repository import IPaymentOutboxRepository
+
+MAX_ERROR_LENGTH = 500
+
+
+class PaymentOutboxRepository(IPaymentOutboxRepository):
+    """
+    Outbox backed by the ``payment_outbox`` table.
+
+    Due requests are read through the (status, next_attempt_at) index with ``FOR UPDATE SKIP LOCKED`` where the
+    database supports it and leased by pushing ``next_attempt_at`` forward in the same transaction, so the network
+    call to the payment service happens without holding any row lock.
+    """
+
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def add(self, entry: PaymentOutboxEntry) -> PaymentOutboxEntry:
+        if entry.next_attempt_at is None:
+            entry.next_attempt_at = self._now()
+        entry_model = PaymentOutboxModel.from_entity(entry)
+        self.db_session.add(entry_model)
+        self.db_session.flush()
+        entry.id = entry_model.id
+        return entry
+
+    def get_by_order_id(self, order_id: int) -> Optional[PaymentOutboxEntry]:
+        entry_model = (
+            self.db_session.query(PaymentOutboxModel)
+            .filter(PaymentOutboxModel.id_order == order_id)
+            .order_by(PaymentOutboxModel.id.desc())
+            # Long polling: relê a linha mesmo que a sessão já a tenha carregado
+            .populate_existing()
+            .first()
+        )
+        return entry_model.to_entity() if entry_model else None
+
+    def claim_due(self, limit: int, lease_seconds: float) -> List[PaymentOutboxEntry]:
+        now = self._now()
+        entry_models = (
+            self.db_session.query(PaymentOutboxModel)
+            .filter(
+                PaymentOutboxModel.status == PaymentOutboxStatusEnum.PENDING.status,
+                PaymentOutboxModel.next_attempt_at <= now,
+            )
+            .order_by(PaymentOutboxModel.next_attempt_at.asc(), PaymentOutboxModel.id.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        if not entry_models:
+            self.db_session.commit()
+            return []
+
+        # Mapeadas antes do commit, que expira as instâncias da sessão
+        entries = [entry_model.to_entity() for entry_model in entry_models]
+        leased_until = now + timedelta(seconds=lease_seconds)
+        self.db_session.execute(
+            update(PaymentOutboxModel)
+            .where(PaymentOutboxModel.id.in_([entry.id for entry in entries]))
+            .values(next_attempt_at=leased_until, attempts=PaymentOutboxModel.attempts + 1, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        self.db_session.commit()
+
+        for entry in entries:
+            entry.attempts += 1
+            entry.next_attempt_at = leased_until
+        return entries
+
+    def mark_dispatched(self, entry: PaymentOutboxEntry, payment: Dict[str, Any]) -> None:
+        now = self._now()
+        self._update(
+            entry,
+            status=PaymentOutboxStatusEnum.DISPATCHED.status,
+            payment_id=payment.get("payment_id"),
+            qr_code=payment.get("qr_code"),
+            transaction_id=payment.get("transaction_id"),
+            last_error=None,
+            dispatched_at=now,
+            updated_at=now,
+        )
+
+    def reschedule(self, entry: PaymentOutboxEntry, error: str, next_attempt_at: datetime) -> None:
+        self._update(entry, last_error=error[:MAX_ERROR_LENGTH], next_attempt_at=next_attempt_at, updated_at=self._now())
+        self.db_session.commit()
+
+    def mark_failed(self, entry: PaymentOutboxEntry, error: str) -> None:
+        self._update(
+            entry,
+            status=PaymentOutboxStatusEnum.FAILED.status,
+            last_error=error[:MAX_ERROR_LENGTH],
+            updated_at=self._now(),
+        )
+        self.db_session.commit()
+
+    def _update(self, entry: PaymentOutboxEntry, **values) -> None:
+        self.db_session.execute(
+            update(PaymentOutboxModel)
+            .where(PaymentOutboxModel.id == entry.id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        for name, value in values.items():
+            setattr(entry, name, value)
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(timezone.utc)
+
+
+__all__ = ["PaymentOutboxRepository"]
@@ -0,0 +1,104 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from sqlalchemy import insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from config.settings import WEBHOOK_INBOX_MAX_ATTEMPTS
+from src.adapters.driven.repositories.models.payment_webhook_inbox_model import PaymentWebhookInboxModel
+from src.core.domain.dtos.webhook.payment_webhook_dto import PaymentWebhookDTO
+from src.core.domain.entities.payment_webhook_event import PaymentWebhookEvent
+from src.core.ports.webhook.i_payment_webhook_inbox_repository import IPaymentWebhookInboxRepository
+
+MAX_ERROR_LENGTH = 500
+
+
+class PaymentWebhookInboxRepository(IPaymentWebhookInboxRepository):
+    """
+    Inbox backed by the ``payment_webhook_inbox`` table (unique on payment_id + transaction_id + event).
+
+    Enqueueing is a single INSERT; a redelivery of a key already in the inbox hits the unique constraint and is
+    dropped. Pending rows (``processed_at IS NULL``) are read in arrival order through the (processed_at, id) index
+    and locked with ``FOR UPDATE SKIP LOCKED`` where the database supports it, so several workers never claim the
+    same delivery. Rows that failed ``max_attempts`` times stay in the table, out of the queue, for inspection.
+    """
+
+    def __init__(self, db_session: Session, max_attempts: int = WEBHOOK_INBOX_MAX_ATTEMPTS):
+        self.db_session = db_session
+        self.max_attempts = max_attempts
+
+    def enqueue(self, dto: PaymentWebhookDTO) -> bool:
+        try:
+            self.db_session.execute(
+                insert(PaymentWebhookInboxModel).values(
+                    payment_id=dto.payment_id,
+                    transaction_id=dto.transaction_id,
+                    event=dto.event,
+                    payment_status=dto.status,
+                    attempts=0,
+                )
+            )
+            self.db_session.commit()
+            return True
+        except IntegrityError:
+            self.db_session.rollback()
+            return False
+
+    def fetch_pending(self, limit: int) -> List[PaymentWebhookEvent]:
+        event_models = (
+            self.db_session.query(PaymentWebhookInboxModel)
+            .filter(
+                PaymentWebhookInboxModel.processed_at.is_(None),
+                PaymentWebhookInboxModel.attempts < self.max_attempts,
+            )
+            .order_by(PaymentWebhookInboxModel.id.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        return [event_model.to_entity() for event_model in event_models]
+
+    def mark_processed(self, event_ids: List[int]) -> None:
+        if not event_ids:
+            return
+        now = self._now()
+        self.db_session.execute(
+            update(PaymentWebhookInboxModel)
+            .where(PaymentWebhookInboxModel.id.in_(event_ids))
+            .values(processed_at=now, updated_at=now, attempts=PaymentWebhookInboxModel.attempts + 1)
+            .execution_options(synchronize_session=False)
+        )
+        self.db_session.commit()
+
+    def mark_discarded(self, errors: Dict[int, str]) -> None:
+        now = self._now()
+        self._update_by_error(errors, processed_at=now, updated_at=now, attempts=PaymentWebhookInboxModel.attempts + 1)
+
+    def mark_failed(self, errors: Dict[int, str]) -> None:
+        self._update_by_error(errors, updated_at=self._now(), attempts=PaymentWebhookInboxModel.attempts + 1)
+
+    def _update_by_error(self, errors: Dict[int, str], **values) -> None:
+        if not errors:
+            return
+        # Um UPDATE por mensagem distinta: um lote costuma falhar pelo mesmo motivo
+        ids_by_error = defaultdict(list)
+        for event_id, error in errors.items():
+            ids_by_error[error[:MAX_ERROR_LENGTH]].append(event_id)
+
+        for error, event_ids in ids_by_error.items():
+            self.db_session.execute(
+                update(PaymentWebhookInboxModel)
+                .where(PaymentWebhookInboxModel.id.in_(event_ids))
+                .values(last_error=error, **values)
+                .execution_options(synchronize_session=False)
+            )
+        self.db_session.commit()
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(timezone.utc)
+
+
+__all__ = ["PaymentWebhookInboxRepository"]
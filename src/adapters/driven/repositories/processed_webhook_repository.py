@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta, timezone
+import random
+from typing import Callable, Hashable, Optional
+
+from sqlalchemy import and_, delete, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from config.settings import WEBHOOK_IDEMPOTENCY_PURGE_PROBABILITY, WEBHOOK_IDEMPOTENCY_TTL
+from src.adapters.driven.repositories.models.processed_webhook_model import ProcessedWebhookModel
+from src.core.ports.webhook.i_processed_webhook_repository import IProcessedWebhookRepository
+from src.core.shared.ttl_cache import TTLCache
+
+
+class ProcessedWebhookRepository(IProcessedWebhookRepository):
+    """
+    Idempotency store backed by the ``processed_webhooks`` table (unique on payment_id + transaction_id + event).
+
+    Keys live until ``expires_at`` (``ttl`` seconds after processing) and are recorded by ``add_processed`` inside the
+    caller's transaction. A process-wide LRU (``cache``) in front of the table answers repeated lookups without a
+    query; a miss costs a single lookup on the unique index. Expired rows are removed in that same transaction before
+    a key is recorded, with probability ``purge_probability`` (otherwise only an expired copy of the key itself is),
+    or on demand by ``purge_expired``.
+    """
+
+    def __init__(
+        self,
+        db_session: Session,
+        cache: Optional[TTLCache] = None,
+        ttl: float = WEBHOOK_IDEMPOTENCY_TTL,
+        purge_probability: float = WEBHOOK_IDEMPOTENCY_PURGE_PROBABILITY,
+        random_source: Callable[[], float] = random.random,
+    ):
+        self.db_session = db_session
+        self.cache = cache
+        self.ttl = ttl
+        self.purge_probability = purge_probability
+        self._random = random_source
+
+    def is_processed(self, payment_id: str, transaction_id: str, event: str) -> bool:
+        key = (payment_id, transaction_id, event)
+        if self.cache is not None and self.cache.get(key):
+            return True
+
+        now = self._now()
+        expires_at = (
+            self.db_session.query(ProcessedWebhookModel.expires_at)
+            .filter(self._key_filter(payment_id, transaction_id, event), ProcessedWebhookModel.expires_at > now)
+            .scalar()
+        )
+        if expires_at is None:
+            return False
+
+        self._remember(key, expires_at, now)
+        return True
+
+    def add_processed(self, payment_id: str, transaction_id: str, event: str) -> bool:
+        now = self._now()
+        if self.purge_probability and self._random() < self.purge_probability:
+            self._delete_expired(now)
+        else:
+            # Uma chave expirada com o mesmo valor é substituída dentro da própria transação
+            self.db_session.execute(
+                delete(ProcessedWebhookModel)
+                .where(self._key_filter(payment_id, transaction_id, event), ProcessedWebhookModel.expires_at <= now)
+            )
+
+        try:
+            self.db_session.execute(
+                insert(ProcessedWebhookModel).values(
+                    payment_id=payment_id,
+                    transaction_id=transaction_id,
+                    event=event,
+                    expires_at=now + timedelta(seconds=self.ttl),
+                )
+            )
+        except IntegrityError:
+            self.db_session.rollback()
+            return False
+        return True
+
+    def purge_expired(self, now: Optional[datetime] = None) -> int:
+        deleted = self._delete_expired(now or self._now())
+        self.db_session.commit()
+        return deleted
+
+    def _delete_expired(self, now: datetime) -> int:
+        result = self.db_session.execute(delete(ProcessedWebhookModel).where(ProcessedWebhookModel.expires_at <= now))
+        return result.rowcount
+
+    def _remember(self, key: Hashable, expires_at: datetime, now: datetime) -> None:
+        if self.cache is None:
+            return
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        self.cache.set(key, True, ttl=min(self.ttl, (expires_at - now).total_seconds()))
+
+    @staticmethod
+    def _key_filter(payment_id: str, transaction_id: str, event: str):
+        return and_(
+            ProcessedWebhookModel.payment_id == payment_id,
+            ProcessedWebhookModel.transaction_id == transaction_id,
+            ProcessedWebhookModel.event == event,
+        )
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(timezone.utc)
+
+
+__all__ = ["ProcessedWebhookRepository"]
@@ -1,30 +1,44 @@
-from typing import List
+import asyncio
+from time import monotonic
+from typing import AsyncIterator, List, Optional
+
+from config.settings import ORDERS_PAGE_DEFAULT_LIMIT, PAYMENT_CREATION_MODE, PAYMENT_QR_CODE_POLL_INTERVAL
 
 from src.core.domain.entities.order import Order
 from src.core.domain.dtos.payment.payment_dto import PaymentDTO
+from src.core.domain.dtos.payment.order_payment_dto import OrderPaymentDTO
 from src.core.domain.dtos.product.product_dto import ProductDTO
 from src.core.domain.dtos.order_status.order_status_dto import OrderStatusDTO
+from src.core.domain.dtos.order_status_movement.order_status_movement_dto import OrderStatusMovementDTO
 from src.application.usecases.order_usecase.revert_order_status_usecase import RevertOrderStatusUseCase
 from src.application.usecases.order_usecase.advance_order_status_usecase import AdvanceOrderStatusUseCase
 from src.application.usecases.order_usecase.list_orders_usecase import ListOrdersUseCase
 from src.application.usecases.order_usecase.cancel_order_usecase import CancelOrderUseCase
 from src.application.usecases.order_usecase.list_order_item_usecase import ListOrderItemsUseCase
 from src.core.domain.dtos.order_item.order_item_dto import OrderItemDTO
+from src.core.domain.dtos.order_item.create_order_items_dto import CreateOrderItemsDTO
 from src.application.usecases.order_usecase.clear_order_usecase import ClearOrderUseCase
 from src.application.usecases.order_usecase.change_item_observation_usecase import ChangeItemObservationUseCase
 from src.application.usecases.order_usecase.change_item_quantity_usecase import ChangeItemQuantityUseCase
 from src.application.usecases.order_usecase.remove_order_item_from_order_usecase import RemoveOrderItemFromOrderUseCase
 from src.application.usecases.order_usecase.add_order_item_in_order_usecase import AddOrderItemInOrderUseCase
+from src.application.usecases.order_usecase.add_order_items_in_order_usecase import AddOrderItemsInOrderUseCase
 from src.application.usecases.order_usecase.get_order_by_id_usecase import GetOrderByIdUseCase
 from src.application.usecases.order_usecase.list_products_by_order_status_usecase import ListProductsByOrderStatusUseCase
 from src.adapters.driver.api.v1.presenters.dto_presenter import DTOPresenter
 from src.application.usecases.order_usecase.create_order_usecase import CreateOrderUseCase
 from src.core.domain.dtos.order.order_dto import OrderDTO
+from src.core.domain.dtos.order.order_page_dto import OrderPageDTO
+from src.core.shared.order_page_cursor import OrderPageCursor
 from src.core.ports.order.i_order_repository import IOrderRepository
+from src.core.ports.order.i_async_order_repository import IAsyncOrderRepository
 from src.core.ports.order_status.i_order_status_repository import IOrderStatusRepository
 from src.application.usecases.order_usecase.get_order_status_usecase import GetOrderStatusUsecase
+from src.application.usecases.order_usecase.get_order_payment_usecase import GetOrderPaymentUseCase
+from src.application.usecases.order_usecase.list_order_status_history_usecase import ListOrderStatusHistoryUseCase
 from src.core.ports.stock.i_stock_provider_gateway import IStockProviderGateway
 from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway
+from src.core.ports.payment.i_payment_outbox_repository import IPaymentOutboxRepository
 
 
 class OrderController:
@@ -33,32 +47,43 @@ class OrderController:
         self, 
         order_status_gateway: IOrderStatusRepository,        
         order_gateway: IOrderRepository,
+        async_order_gateway: IAsyncOrderRepository,
         stock_gateway: IStockProviderGateway,
-        payment_gateway: IPaymentProviderGateway
+        payment_gateway: IPaymentProviderGateway,
+        payment_outbox_gateway: Optional[IPaymentOutboxRepository] = None
     ):
         self.order_status_gateway: IOrderStatusRepository = order_status_gateway
+        # Rotas síncronas (def) rodam no threadpool com o repositório síncrono; as rotas assíncronas usam o
+        # repositório assíncrono, sem bloquear o event loop
         self.order_gateway: IOrderRepository = order_gateway
+        self.async_order_gateway: IAsyncOrderRepository = async_order_gateway
         self.stock_gateway: IStockProviderGateway = stock_gateway
         self.payment_gateway: IPaymentProviderGateway = payment_gateway
+        self.payment_outbox_gateway: Optional[IPaymentOutboxRepository] = payment_outbox_gateway
 
     def create_order(self, customer: dict) -> OrderDTO:
         create_order_usecase = CreateOrderUseCase.build(self.order_gateway, self.order_status_gateway)
         order = create_order_usecase.execute(customer_id=customer['id'])
         return DTOPresenter.transform(order, OrderDTO)
 
-    def list_products_by_order_status(self, order_id: int, current_user: dict) -> List[ProductDTO]:
-        list_products_by_order_status_usecase = ListProductsByOrderStatusUseCase.build(self.order_gateway, self.stock_gateway)
-        products = list_products_by_order_status_usecase.execute(order_id, current_user)
+    async def list_products_by_order_status(self, order_id: int, current_user: dict) -> List[ProductDTO]:
+        list_products_by_order_status_usecase = ListProductsByOrderStatusUseCase.build(self.async_order_gateway, self.stock_gateway)
+        products = await list_products_by_order_status_usecase.execute(order_id, current_user)
         return DTOPresenter.transform_list_from_dict(products, ProductDTO)
 
-    def get_order_by_id(self, order_id: int, current_user: dict) -> OrderDTO:
-        order_by_id_usecase = GetOrderByIdUseCase.build(self.order_gateway)
-        order = order_by_id_usecase.execute(order_id, current_user)
+    async def get_order_by_id(self, order_id: int, current_user: dict) -> OrderDTO:
+        order_by_id_usecase = GetOrderByIdUseCase.build(self.async_order_gateway)
+        order = await order_by_id_usecase.execute(order_id, current_user)
+        return DTOPresenter.transform(order, OrderDTO)
+
+    async def add_item(self, order_id: int, order_item_dto: dict, current_user: dict) -> OrderDTO:
+        add_order_item_in_order_usecase = AddOrderItemInOrderUseCase.build(self.async_order_gateway, self.stock_gateway)
+        order = await add_order_item_in_order_usecase.execute(order_id, order_item_dto, current_user)
         return DTOPresenter.transform(order, OrderDTO)
 
-    def add_item(self, order_id: int, order_item_dto: dict, current_user: dict) -> OrderDTO:
-        add_order_item_in_order_usecase = AddOrderItemInOrderUseCase.build(self.order_gateway, self.stock_gateway)
-        order = add_order_item_in_order_usecase.execute(order_id, order_item_dto, current_user)
+    async def add_items(self, order_id: int, order_items_dto: CreateOrderItemsDTO, current_user: dict) -> OrderDTO:
+        add_order_items_in_order_usecase = AddOrderItemsInOrderUseCase.build(self.async_order_gateway, self.stock_gateway)
+        order = await add_order_items_in_order_usecase.execute(order_id, order_items_dto.items, current_user)
         return DTOPresenter.transform(order, OrderDTO)
 
     def remove_item(self, order_id: int, order_item_id: int, current_user: dict) -> None:
@@ -77,33 +102,82 @@ class OrderController:
         clear_order_usecase = ClearOrderUseCase.build(self.order_gateway, self.order_status_gateway)
         clear_order_usecase.execute(order_id, current_user)
 
-    def list_order_items(self, order_id: int, current_user: dict) -> List[OrderItemDTO]:
-        list_order_items_usecase = ListOrderItemsUseCase.build(self.order_gateway)
-        order_items = list_order_items_usecase.execute(order_id)
+    async def list_order_items(self, order_id: int, current_user: dict) -> List[OrderItemDTO]:
+        list_order_items_usecase = ListOrderItemsUseCase.build(self.async_order_gateway)
+        order_items = await list_order_items_usecase.execute(order_id)
         return DTOPresenter.transform_list(order_items, OrderItemDTO)
 
     def cancel_order(self, order_id: int, current_user: dict) -> None:
         cancel_order_usecase = CancelOrderUseCase.build(self.order_gateway, self.order_status_gateway)
         cancel_order_usecase.execute(order_id)
 
-    def list_orders(self, status: List[str] = None, current_user: dict = None) -> List[OrderDTO]:
-        list_orders_usecase = ListOrdersUseCase.build(self.order_gateway)
-        orders = list_orders_usecase.execute(status, current_user)
-        return DTOPresenter.transform_list(orders, OrderDTO)
+    async def list_orders(
+        self,
+        status: List[str] = None,
+        current_user: dict = None,
+        limit: int = ORDERS_PAGE_DEFAULT_LIMIT,
+        cursor: Optional[str] = None,
+    ) -> OrderPageDTO:
+        list_orders_usecase = ListOrdersUseCase.build(self.async_order_gateway)
+        orders = await list_orders_usecase.execute(status, current_user, limit, cursor)
+
+        next_cursor = None
+        if len(orders) == limit:
+            next_cursor = OrderPageCursor.from_order(orders[-1]).encode()
+        return OrderPageDTO(items=DTOPresenter.transform_list(orders, OrderDTO), next_cursor=next_cursor)
+
+    async def stream_orders(
+        self, status: List[str] = None, current_user: dict = None, page_size: int = 100
+    ) -> AsyncIterator[str]:
+        """
+        Iterates over the orders as NDJSON lines, read page by page; each page takes a connection only while it is
+        read.
+        """
+        list_orders_usecase = ListOrdersUseCase.build(self.async_order_gateway)
+        async for orders in list_orders_usecase.iter_pages(status, current_user, page_size):
+            for order in orders:
+                yield DTOPresenter.transform(order, OrderDTO).model_dump_json() + "\n"
 
     def advance_order_status(self, order_id: int, current_user: dict) -> OrderDTO | PaymentDTO:
-        advance_status_usecase = AdvanceOrderStatusUseCase.build(self.order_gateway, self.order_status_gateway, self.payment_gateway)
+        advance_status_usecase = AdvanceOrderStatusUseCase.build(
+            self.order_gateway,
+            self.order_status_gateway,
+            self.payment_gateway,
+            self.payment_outbox_gateway if PAYMENT_CREATION_MODE == "outbox" else None
+        )
         response = advance_status_usecase.execute(order_id, current_user)
         if isinstance(response, Order):
             return DTOPresenter.transform(response, OrderDTO)
         return DTOPresenter.transform_from_dict(response, PaymentDTO)
     
+    async def get_order_payment(self, order_id: int, current_user: dict, wait: float = 0) -> OrderPaymentDTO:
+        """
+        Returns the payment of the order; with ``wait`` > 0 it long-polls, holding the request for up to ``wait``
+        seconds until the payment request leaves the ``pending`` status.
+        """
+        get_order_payment_usecase = GetOrderPaymentUseCase.build(self.async_order_gateway, self.payment_outbox_gateway)
+        entry = await get_order_payment_usecase.execute(order_id, current_user)
+
+        deadline = monotonic() + wait
+        while entry.is_pending and monotonic() < deadline:
+            await asyncio.sleep(min(PAYMENT_QR_CODE_POLL_INTERVAL, max(deadline - monotonic(), 0)))
+            entry = await asyncio.to_thread(get_order_payment_usecase.refresh, order_id)
+
+        return DTOPresenter.transform(entry, OrderPaymentDTO)
+
     def revert_order_status(self, order_id: int, current_user: dict) -> OrderDTO:
         revert_status_usecase = RevertOrderStatusUseCase.build(self.order_gateway, self.order_status_gateway)
         order = revert_status_usecase.execute(order_id, current_user)
         return DTOPresenter.transform(order, OrderDTO)
     
-    def get_order_status(self, order_id: int, current_user: dict) -> OrderStatusDTO:
-        get_order_status_usecase = GetOrderStatusUsecase.build(self.order_gateway)
-        order_status = get_order_status_usecase.execute(order_id, current_user)
+    async def list_order_status_history(
+        self, order_id: int, current_user: dict, limit: int = 20, after_id: Optional[int] = None
+    ) -> List[OrderStatusMovementDTO]:
+        list_order_status_history_usecase = ListOrderStatusHistoryUseCase.build(self.async_order_gateway)
+        movements = await list_order_status_history_usecase.execute(order_id, current_user, limit, after_id)
+        return DTOPresenter.transform_list(movements, OrderStatusMovementDTO)
+
+    async def get_order_status(self, order_id: int, current_user: dict) -> OrderStatusDTO:
+        get_order_status_usecase = GetOrderStatusUsecase.build(self.async_order_gateway)
+        order_status = await get_order_status_usecase.execute(order_id, current_user)
         return DTOPresenter.transform(order_status, OrderStatusDTO)
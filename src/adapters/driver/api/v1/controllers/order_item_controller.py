@@ -12,6 +12,7 @@ from src.core.domain.dtos.order_item.create_order_item_dto import CreateOrderIte
 from src.core.domain.dtos.order_item.order_item_dto import OrderItemDTO
 from src.core.ports.order.i_order_repository import IOrderRepository
 from src.core.ports.order_item.i_order_item_repository import IOrderItemRepository
+from src.core.ports.order_item.i_async_order_item_repository import IAsyncOrderItemRepository
 from src.core.ports.stock.i_stock_provider_gateway import IStockProviderGateway
 
 
@@ -20,35 +21,37 @@ class OrderItemController:
     def __init__(
             self,
             order_item_gateway: IOrderItemRepository,
+            async_order_item_gateway: IAsyncOrderItemRepository,
             order_gateway: IOrderRepository,
             stock_gateway: IStockProviderGateway
     ):
         self.order_item_gateway: IOrderItemRepository = order_item_gateway
+        self.async_order_item_gateway: IAsyncOrderItemRepository = async_order_item_gateway
         self.order_gateway: IOrderRepository = order_gateway
         self.stock_gateway: IStockProviderGateway = stock_gateway
         
-    def create_order_item(self, dto: CreateOrderItemDTO) -> OrderItemDTO:
+    async def create_order_item(self, dto: CreateOrderItemDTO) -> OrderItemDTO:
         create_order_item_usecase = CreateOrderItemUseCase.build(
             self.order_item_gateway,
             self.order_gateway,
             self.stock_gateway
         )
-        order_item = create_order_item_usecase.execute(dto)
+        order_item = await create_order_item_usecase.execute(dto)
         return DTOPresenter.transform(order_item, OrderItemDTO)
 
-    def get_order_item_by_id(self, order_item_id: int) -> OrderItemDTO:
-        order_item_by_id = GetOrderItemByIdUseCase.build(self.order_item_gateway)
-        order_item = order_item_by_id.execute(order_item_id)
+    async def get_order_item_by_id(self, order_item_id: int) -> OrderItemDTO:
+        order_item_by_id = GetOrderItemByIdUseCase.build(self.async_order_item_gateway)
+        order_item = await order_item_by_id.execute(order_item_id)
         return DTOPresenter.transform(order_item, OrderItemDTO)
 
-    def get_all_order_items(self, include_deleted: Optional[bool] = False) -> List[OrderItemDTO]:
-        order_items_usecase = GetAllOrderItemsUsecase.build(self.order_item_gateway)
-        order_items = order_items_usecase.execute(include_deleted)
+    async def get_all_order_items(self, include_deleted: Optional[bool] = False) -> List[OrderItemDTO]:
+        order_items_usecase = GetAllOrderItemsUsecase.build(self.async_order_item_gateway)
+        order_items = await order_items_usecase.execute(include_deleted)
         return DTOPresenter.transform_list(order_items, OrderItemDTO)
 
-    def update_order_item(self, order_item_id: int, dto: UpdateOrderItemDTO) -> OrderItemDTO:
+    async def update_order_item(self, order_item_id: int, dto: UpdateOrderItemDTO) -> OrderItemDTO:
         update_order_item_usecase = UpdateOrderItemUseCase.build(self.order_item_gateway, self.stock_gateway)
-        order_item = update_order_item_usecase.execute(order_item_id, dto)
+        order_item = await update_order_item_usecase.execute(order_item_id, dto)
         return DTOPresenter.transform(order_item, OrderItemDTO)
     
     def delete_order_item(self, order_item_id: int) -> None:
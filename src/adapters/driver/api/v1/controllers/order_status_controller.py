@@ -12,31 +12,37 @@ from src.application.usecases.order_status_usecase.create_order_status_usecase i
 from src.core.domain.dtos.order_status.create_order_status_dto import CreateOrderStatusDTO
 from src.core.domain.dtos.order_status.order_status_dto import OrderStatusDTO
 from src.core.ports.order_status.i_order_status_repository import IOrderStatusRepository
+from src.core.ports.order_status.i_async_order_status_repository import IAsyncOrderStatusRepository
 
 
 class OrderStatusController:
 
-    def __init__(self, order_status_gateway: IOrderStatusRepository):
+    def __init__(
+        self,
+        order_status_gateway: IOrderStatusRepository,
+        async_order_status_gateway: IAsyncOrderStatusRepository
+    ):
         self.order_status_gateway: IOrderStatusRepository = order_status_gateway
+        self.async_order_status_gateway: IAsyncOrderStatusRepository = async_order_status_gateway
         
     def create_order_status(self, dto: CreateOrderStatusDTO) -> OrderStatusDTO:
         create_order_status_use_case = CreateOrderStatusUseCase.build(self.order_status_gateway)
         order_status = create_order_status_use_case.execute(dto)
         return DTOPresenter.transform(order_status, OrderStatusDTO)
 
-    def get_order_status_by_status(self, status: str) -> OrderStatusDTO:
-        get_order_status_by_status_use_case = GetOrderStatusByStatusUseCase.build(self.order_status_gateway)
-        order_status = get_order_status_by_status_use_case.execute(status)
+    async def get_order_status_by_status(self, status: str) -> OrderStatusDTO:
+        get_order_status_by_status_use_case = GetOrderStatusByStatusUseCase.build(self.async_order_status_gateway)
+        order_status = await get_order_status_by_status_use_case.execute(status)
         return DTOPresenter.transform(order_status, OrderStatusDTO)
     
-    def get_order_status_by_id(self, order_status_id: int) -> OrderStatusDTO:
-        get_order_status_by_id_use_case = GetOrderStatusByIdUseCase.build(self.order_status_gateway)
-        order_status = get_order_status_by_id_use_case.execute(order_status_id)
+    async def get_order_status_by_id(self, order_status_id: int) -> OrderStatusDTO:
+        get_order_status_by_id_use_case = GetOrderStatusByIdUseCase.build(self.async_order_status_gateway)
+        order_status = await get_order_status_by_id_use_case.execute(order_status_id)
         return DTOPresenter.transform(order_status, OrderStatusDTO)
 
-    def get_all_orders_status(self, include_deleted: Optional[bool] = False) -> List[OrderStatusDTO]:
-        get_all_order_status_use_case = GetAllOrderStatusUseCase.build(self.order_status_gateway)
-        order_status = get_all_order_status_use_case.execute(include_deleted=include_deleted)
+    async def get_all_orders_status(self, include_deleted: Optional[bool] = False) -> List[OrderStatusDTO]:
+        get_all_order_status_use_case = GetAllOrderStatusUseCase.build(self.async_order_status_gateway)
+        order_status = await get_all_order_status_use_case.execute(include_deleted=include_deleted)
         return DTOPresenter.transform_list(order_status, OrderStatusDTO)
 
     def update_order_status(self, order_status_id: int, dto: UpdateOrderStatusDTO) -> OrderStatusDTO:
@@ -1,8 +1,11 @@
 from src.application.usecases.webhook_usecase.approval_payment_usecase import ApprovalPaymentUseCase
+from src.application.usecases.webhook_usecase.enqueue_payment_notification_usecase import EnqueuePaymentNotificationUseCase
 from src.core.domain.dtos.webhook.payment_webhook_dto import PaymentWebhookDTO
 from src.core.ports.order.i_order_repository import IOrderRepository
 from src.core.ports.order_status.i_order_status_repository import IOrderStatusRepository
 from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway
+from src.core.ports.webhook.i_payment_webhook_inbox_repository import IPaymentWebhookInboxRepository
+from src.core.ports.webhook.i_processed_webhook_repository import IProcessedWebhookRepository
 
 
 class WebhookController:
@@ -11,16 +14,33 @@ class WebhookController:
         self,
         order_gateway: IOrderRepository,
         order_status_gateway: IOrderStatusRepository,
-        payment_gateway: IPaymentProviderGateway
+        payment_gateway: IPaymentProviderGateway,
+        processed_webhook_gateway: IProcessedWebhookRepository,
+        payment_webhook_inbox_gateway: IPaymentWebhookInboxRepository
     ):
         self.order_gateway: IOrderRepository = order_gateway
         self.order_status_gateway: IOrderStatusRepository = order_status_gateway
         self.payment_gateway: IPaymentProviderGateway = payment_gateway
+        self.processed_webhook_gateway: IProcessedWebhookRepository = processed_webhook_gateway
+        self.payment_webhook_inbox_gateway: IPaymentWebhookInboxRepository = payment_webhook_inbox_gateway
 
-    async def handle_payment_notification(self, dto: PaymentWebhookDTO) -> None:
+    def handle_payment_notification(self, dto: PaymentWebhookDTO) -> None:
         approval_payment_usecase: ApprovalPaymentUseCase = ApprovalPaymentUseCase.build(
             order_gateway=self.order_gateway,
             order_status_gateway=self.order_status_gateway,
-            payment_gateway=self.payment_gateway
+            payment_gateway=self.payment_gateway,
+            processed_webhook_gateway=self.processed_webhook_gateway
         )
-        approval_payment_usecase.execute(payment_id=dto.payment_id, payment_status=dto.status)
+        approval_payment_usecase.execute(
+            payment_id=dto.payment_id,
+            payment_status=dto.status,
+            transaction_id=dto.transaction_id,
+            event=dto.event
+        )
+
+    def enqueue_payment_notification(self, dto: PaymentWebhookDTO) -> bool:
+        enqueue_payment_notification_usecase: EnqueuePaymentNotificationUseCase = EnqueuePaymentNotificationUseCase.build(
+            inbox_gateway=self.payment_webhook_inbox_gateway,
+            processed_webhook_gateway=self.processed_webhook_gateway
+        )
+        return enqueue_payment_notification_usecase.execute(dto)
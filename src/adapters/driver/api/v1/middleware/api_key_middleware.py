@@ -1,43 +1,44 @@
 import os
-from typing import Callable, List
-from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.routing import Match
+from starlette.datastructures import QueryParams
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-class ApiKeyMiddleware(BaseHTTPMiddleware):
-    """Middleware para validar a chave de API (x-api-key) como parâmetro na URL em rotas específicas."""
+from src.adapters.driver.api.v1.middleware.route_auth_policies import RouteAuthPolicies
+from src.constants.route_auth_policy import RouteAuthPolicyEnum
 
-    INCLUDED_PATHS: List[str] = [
-        "/api/v1/webhooks/payment_notification",
-    ]
+class ApiKeyMiddleware:
+    """Middleware ASGI para validar a chave de API (x-api-key) como parâmetro na URL nas rotas com política API_KEY."""
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        if request.url.path not in self.INCLUDED_PATHS:
-            return await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        # Verifica se a rota atual deve ignorar a autenticação por chave de API
-        for route in request.app.routes:
-            match, _ = route.matches(request.scope)
-            if match == Match.FULL:
-                if hasattr(route.endpoint, 'bypass_auth'):
-                    return await call_next(request)
-                break
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # A tabela de políticas já considera as rotas marcadas com bypass_auth
+        policies = RouteAuthPolicies.for_app(scope["app"])
+        if policies.resolve(scope["method"], scope["path"]) is not RouteAuthPolicyEnum.API_KEY:
+            await self.app(scope, receive, send)
+            return
 
         order_microservice_x_api_key = os.getenv("ORDER_MICROSERVICE_X_API_KEY")
         # Obtém a API key do parâmetro de query na URL
-        api_key = request.query_params.get("api_key")
+        api_key = QueryParams(scope.get("query_string", b"")).get("api_key")
 
         if not order_microservice_x_api_key:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=500,
                 content={"detail": "Internal server error: API Key not configured on server."}
             )
-
-        if not api_key or api_key != order_microservice_x_api_key:
-            return JSONResponse(
+        elif not api_key or api_key != order_microservice_x_api_key:
+            response = JSONResponse(
                 status_code=401,
                 content={"detail": "Invalid or missing API Key"}
             )
+        else:
+            await self.app(scope, receive, send)
+            return
 
-        return await call_next(request)
\ No newline at end of file
+        await response(scope, receive, send)
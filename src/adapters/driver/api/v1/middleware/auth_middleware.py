@@ -1,75 +1,69 @@
 from fastapi import Request, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from src.adapters.driver.api.v1.middleware.route_auth_policies import RouteAuthPolicies
+from src.constants.route_auth_policy import RouteAuthPolicyEnum
 from src.core.exceptions.utils import ErrorCode
-from src.core.utils.jwt_util import JWTUtil
+from src.core.auth.dependencies import get_verified_claims
 import logging
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        open_routes = [
-            "/openapi.json",
-            "/docs",
-            "/docs/oauth2-redirect",
-            "/redoc",
-            "/api/v1/auth/token",
-            "/api/v1/health",
-            "/api/v1/webhooks/payment_notification"
-        ]
-        if any(request.url.path.startswith(route) for route in open_routes):
-            return await call_next(request)
+class AuthMiddleware:
+    """Valida o token JWT das rotas com política BEARER (ASGI puro: não bufferiza a resposta)."""
 
-        for route in request.app.router.routes:
-            if (
-                hasattr(route, "path")
-                and hasattr(route, "methods")
-                and route.path == request.url.path
-                and request.method in route.methods
-            ):
-                if getattr(route.endpoint, "bypass_auth", False):
-                    return await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        token = request.headers.get("Authorization")
+        policies = RouteAuthPolicies.for_app(scope["app"])
+        if policies.resolve(scope["method"], scope["path"]) is not RouteAuthPolicyEnum.BEARER:
+            await self.app(scope, receive, send)
+            return
+
+        token = Headers(scope=scope).get("Authorization")
         if not token:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={
-                    "error": {
-                        "code": ErrorCode.UNAUTHORIZED.value,
-                        "message": ErrorCode.UNAUTHORIZED.description,
-                        "details": "Missing Authorization header",
-                    }
-                },
+            response = self._error_response(
+                status.HTTP_401_UNAUTHORIZED, ErrorCode.UNAUTHORIZED, "Missing Authorization header"
             )
+            await response(scope, receive, send)
+            return
 
         try:
             token = token.split("Bearer ")[1]
-            payload = JWTUtil.decode_token(token)
-            request.state.user = payload
+            get_verified_claims(Request(scope), token)
         except ValueError as e:
             logging.error(f"Unauthorized access: {e}")
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={
-                    "error": {
-                        "code": ErrorCode.UNAUTHORIZED.value,
-                        "message": ErrorCode.UNAUTHORIZED.description,
-                        "details": e.detail.get('message', str(e)),
-                    }
-                },
-            )
+            response = self._error_response(status.HTTP_401_UNAUTHORIZED, ErrorCode.UNAUTHORIZED, self._details(e))
+            await response(scope, receive, send)
+            return
         except Exception as e:
             logging.error(f"Forbidden access: {e}")
-            return JSONResponse(
-                status_code=status.HTTP_403_FORBIDDEN,
-                content={
-                    "error": {
-                        "code": ErrorCode.FORBIDDEN.value,
-                        "message": ErrorCode.FORBIDDEN.description,
-                        "details": e.detail.get('message', str(e)),
-                    }
-                },
-            )
+            response = self._error_response(status.HTTP_403_FORBIDDEN, ErrorCode.FORBIDDEN, self._details(e))
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _details(exc: Exception) -> str:
+        detail = getattr(exc, "detail", None)
+        if isinstance(detail, dict):
+            return detail.get('message', str(exc))
+        return str(exc)
 
-        return await call_next(request)
+    @staticmethod
+    def _error_response(status_code: int, error_code: ErrorCode, details: str) -> JSONResponse:
+        return JSONResponse(
+            status_code=status_code,
+            content={
+                "error": {
+                    "code": error_code.value,
+                    "message": error_code.description,
+                    "details": details,
+                }
+            },
+        )
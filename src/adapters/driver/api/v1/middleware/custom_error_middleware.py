@@ -4,11 +4,13 @@ import logging
 
 from src.core.exceptions.bad_request_exception import BadRequestException
 from src.core.exceptions.base_exception import BaseDomainException
+from src.core.exceptions.concurrent_update_exception import ConcurrentUpdateException
 from src.core.exceptions.entity_duplicated_exception import EntityDuplicatedException
 from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
 from src.core.exceptions.forbidden_exception import ForbiddenException
 from src.core.exceptions.invalid_credentials_exception import InvalidCredentialsException
 from src.core.exceptions.invalid_token_exception import InvalidTokenException
+from src.core.exceptions.service_unavailable_exception import ServiceUnavailableException
 from src.core.exceptions.unauthorized_access_exception import UnauthorizedAccessException
 from src.core.exceptions.validation_exception import ValidationException
 
@@ -35,12 +37,14 @@ class CustomErrorMiddleware:
         status_code_map = {
             EntityNotFoundException: status.HTTP_404_NOT_FOUND,
             EntityDuplicatedException: status.HTTP_409_CONFLICT,
+            ConcurrentUpdateException: status.HTTP_409_CONFLICT,
             ForbiddenException: status.HTTP_403_FORBIDDEN,
             UnauthorizedAccessException: status.HTTP_401_UNAUTHORIZED,
             InvalidCredentialsException: status.HTTP_401_UNAUTHORIZED,
             InvalidTokenException: status.HTTP_401_UNAUTHORIZED,
             ValidationException: status.HTTP_422_UNPROCESSABLE_ENTITY,
-            BadRequestException: status.HTTP_400_BAD_REQUEST
+            BadRequestException: status.HTTP_400_BAD_REQUEST,
+            ServiceUnavailableException: status.HTTP_503_SERVICE_UNAVAILABLE
         }
         status_code = status_code_map.get(type(exc), status.HTTP_500_INTERNAL_SERVER_ERROR)
 
@@ -55,6 +59,8 @@ class CustomErrorMiddleware:
             details = {}
 
         headers = {"WWW-Authenticate": "Bearer"} if status_code in [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN] else None
+        if isinstance(exc, ServiceUnavailableException) and exc.retry_after is not None:
+            headers = {"Retry-After": str(max(1, round(exc.retry_after)))}
 
         return JSONResponse(
             status_code=status_code,
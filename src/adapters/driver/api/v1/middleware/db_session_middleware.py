@@ -0,0 +1,74 @@
+import math
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config.database import replica_router
+from config.settings import JWT_SECRET_KEY
+from src.core.shared.replica_routing import (
+    LAST_WRITE_AT,
+    ReplicaRouter,
+    bind_request_state,
+    read_write_marker,
+    sign_write_marker,
+)
+
+# Cookie com o instante (assinado) da última escrita do cliente
+WRITE_MARKER_COOKIE = "db_last_write"
+
+
+class DbSessionMiddleware:
+    def __init__(self, app: ASGIApp, router: ReplicaRouter = replica_router, secret_key: str = JWT_SECRET_KEY) -> None:
+        self.app = app
+        self.router = router
+        self.secret_key = secret_key
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Escopos context-local criados antes que o contexto seja copiado para threadpool/tasks, que passam a
+        # compartilhá-los; cada sessão (síncrona ou assíncrona) só é aberta quando um repositório a usa.
+        container = scope["app"].container
+        session_scope_provider = container.db_session_scope
+        session_scope_provider.reset()
+        session_scope = session_scope_provider()
+        async_session_scope_provider = container.async_db_session_scope
+        async_session_scope_provider.reset()
+        async_session_scope = async_session_scope_provider()
+        state = scope.setdefault("state", {})
+        if self.router.has_replicas:
+            send = self._restore_write_marker(scope, state, send)
+        try:
+            # O estado da requisição guarda a última escrita do cliente, que decide a aderência ao primário
+            with bind_request_state(state):
+                await self.app(scope, receive, send)
+        finally:
+            # Só depois da resposta inteira (inclusive streaming) as conexões voltam ao pool
+            session_scope.close()
+            session_scope_provider.reset()
+            await async_session_scope.close()
+            async_session_scope_provider.reset()
+
+    def _restore_write_marker(self, scope: Scope, state: dict, send: Send) -> Send:
+        # A marca vem do cliente, e não da memória do processo: vale em qualquer worker ou pod
+        written_at: Optional[float] = read_write_marker(
+            HTTPConnection(scope).cookies.get(WRITE_MARKER_COOKIE), self.secret_key
+        )
+        if written_at is not None:
+            state[LAST_WRITE_AT] = written_at
+
+        async def send_with_write_marker(message: Message) -> None:
+            if message["type"] == "http.response.start" and state.get(LAST_WRITE_AT) != written_at:
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "set-cookie",
+                    f"{WRITE_MARKER_COOKIE}={sign_write_marker(state[LAST_WRITE_AT], self.secret_key)}; "
+                    f"Max-Age={math.ceil(self.router.sticky_seconds)}; Path=/; HttpOnly; SameSite=lax",
+                )
+            await send(message)
+
+        return send_with_write_marker
@@ -11,5 +11,11 @@ class IdentityMapMiddleware:
             await self.app(scope, receive, send)
             return
 
-        Container.identity_map.reset()  # Garante que uma nova instância seja criada
-        await self.app(scope, receive, send)
+        # O mapa é context-local: descarta qualquer instância herdada e cria a da requisição
+        # antes que o contexto seja copiado para threadpool/tasks, que passam a compartilhá-la.
+        Container.identity_map.reset()
+        Container.identity_map()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            Container.identity_map.reset()
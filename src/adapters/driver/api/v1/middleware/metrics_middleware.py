@@ -0,0 +1,50 @@
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.shared.metrics import (
+    DB_QUERIES_PER_REQUEST,
+    DB_QUERY_SECONDS_PER_REQUEST,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_PROGRESS,
+    track_request_metrics,
+)
+
+# Rótulo das requisições que não correspondem a nenhuma rota (mantém a cardinalidade limitada)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """Records latency by route template and status, and the database usage of each request (ASGI puro)."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        started = perf_counter()
+        with track_request_metrics() as request_metrics:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                elapsed = perf_counter() - started
+                HTTP_REQUESTS_IN_PROGRESS.dec()
+
+                # O roteador grava a rota encontrada no scope: o rótulo é o template, não o caminho com ids
+                route = scope.get("route")
+                route_template = getattr(route, "path", UNMATCHED_ROUTE)
+                HTTP_REQUEST_DURATION.labels(scope["method"], route_template, str(status_code)).observe(elapsed)
+                DB_QUERIES_PER_REQUEST.labels(route_template).observe(request_metrics.queries)
+                DB_QUERY_SECONDS_PER_REQUEST.labels(route_template).observe(request_metrics.query_seconds)
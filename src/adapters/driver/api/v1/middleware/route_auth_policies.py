@@ -0,0 +1,95 @@
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple
+
+from starlette.routing import BaseRoute
+
+from src.constants.route_auth_policy import RouteAuthPolicyEnum
+
+# Prefixos abertos (inclusive para caminhos que não correspondem a nenhuma rota)
+OPEN_ROUTE_PREFIXES: Tuple[str, ...] = (
+    "/openapi.json",
+    "/docs",
+    "/docs/oauth2-redirect",
+    "/redoc",
+    "/api/v1/auth/token",
+    "/api/v1/health",
+)
+
+# Rotas autenticadas pela chave de API do microsserviço (x-api-key no parâmetro api_key)
+API_KEY_PATHS: Tuple[str, ...] = (
+    "/api/v1/webhooks/payment_notification",
+)
+
+
+class RouteAuthPolicies:
+    """
+    Route → auth policy table, compiled once from the application routes.
+
+    Only routes whose policy differs from the default (``BEARER``) are stored: static paths in a dict keyed by
+    (method, path) and the few templated ones as precompiled regexes, so resolving a request does not depend on the
+    number of routes. The policy of a route comes from the ``bypass_auth`` decorator, the open prefixes and the API
+    key paths.
+    """
+
+    def __init__(
+        self,
+        routes: Iterable[BaseRoute],
+        open_route_prefixes: Tuple[str, ...] = OPEN_ROUTE_PREFIXES,
+        api_key_paths: Tuple[str, ...] = API_KEY_PATHS,
+        default: RouteAuthPolicyEnum = RouteAuthPolicyEnum.BEARER,
+    ):
+        self._open_route_prefixes = open_route_prefixes
+        self._api_key_paths = frozenset(api_key_paths)
+        self._default = default
+        self._static: Dict[Tuple[str, str], RouteAuthPolicyEnum] = {}
+        self._templated: List[Tuple[Pattern, Optional[Set[str]], RouteAuthPolicyEnum]] = []
+
+        for route in routes:
+            path = getattr(route, "path", None)
+            if path is None:
+                continue
+
+            policy = self._policy_for_route(route)
+            if policy is self._default:
+                continue
+
+            methods = getattr(route, "methods", None)
+            if "{" in path:
+                self._templated.append((route.path_regex, methods, policy))
+            else:
+                for method in methods or ("*",):
+                    self._static[(method, path)] = policy
+
+    @classmethod
+    def for_app(cls, app) -> "RouteAuthPolicies":
+        """Returns the table compiled for the application, compiling it on first use."""
+        policies = getattr(app.state, "route_auth_policies", None)
+        if policies is None:
+            policies = cls(app.routes)
+            app.state.route_auth_policies = policies
+        return policies
+
+    def resolve(self, method: str, path: str) -> RouteAuthPolicyEnum:
+        policy = self._static.get((method, path)) or self._static.get(("*", path))
+        if policy is not None:
+            return policy
+
+        for path_regex, methods, templated_policy in self._templated:
+            if (methods is None or method in methods) and path_regex.match(path):
+                return templated_policy
+
+        return self._policy_for_path(path)
+
+    def _policy_for_route(self, route: BaseRoute) -> RouteAuthPolicyEnum:
+        if getattr(getattr(route, "endpoint", None), "bypass_auth", False):
+            return RouteAuthPolicyEnum.PUBLIC
+        return self._policy_for_path(route.path)
+
+    def _policy_for_path(self, path: str) -> RouteAuthPolicyEnum:
+        if path in self._api_key_paths:
+            return RouteAuthPolicyEnum.API_KEY
+        if path.startswith(self._open_route_prefixes):
+            return RouteAuthPolicyEnum.PUBLIC
+        return self._default
+
+
+__all__ = ["API_KEY_PATHS", "OPEN_ROUTE_PREFIXES", "RouteAuthPolicies"]
@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+
+from src.adapters.driver.api.v1.decorators.bypass_auth import bypass_auth
+
+router = APIRouter()
+
+@router.get("/metrics", include_in_schema=False)
+@bypass_auth()
+async def metrics():
+    return Response(content=generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
@@ -20,12 +20,12 @@ router = APIRouter()
     dependencies=[Security(get_current_user, scopes=[OrderItemPermissions.CAN_CREATE_ORDER_ITEM])]
 )
 @inject
-def create_order_item(
+async def create_order_item(
     dto: CreateOrderItemDTO,
     controller: OrderItemController = Depends(Provide[Container.order_item_controller]),
     user: dict = Security(get_current_user)
 ):
-    return controller.create_order_item(dto)
+    return await controller.create_order_item(dto)
 
 @router.get(
     "/order-items/{order_item_id}/id",
@@ -34,12 +34,12 @@ def create_order_item(
     dependencies=[Security(get_current_user, scopes=[OrderItemPermissions.CAN_VIEW_ORDER_ITEMS])]
 )
 @inject
-def get_order_item_by_id(
+async def get_order_item_by_id(
     order_item_id: int,
     controller: OrderItemController = Depends(Provide[Container.order_item_controller]),
     user: dict = Security(get_current_user)
 ):
-    return controller.get_order_item_by_id(order_item_id)
+    return await controller.get_order_item_by_id(order_item_id)
 
 @router.get(
     "/order-items",
@@ -47,12 +47,12 @@ def get_order_item_by_id(
     dependencies=[Security(get_current_user, scopes=[OrderItemPermissions.CAN_VIEW_ORDER_ITEMS])]
 )
 @inject
-def get_all_order_items(
+async def get_all_order_items(
     include_deleted: bool = False,
     controller: OrderItemController = Depends(Provide[Container.order_item_controller]),
     user: dict = Security(get_current_user)
 ):
-    return controller.get_all_order_items(include_deleted)
+    return await controller.get_all_order_items(include_deleted)
 
 @router.put(
     "/order-items/{order_item_id}",
@@ -60,13 +60,13 @@ def get_all_order_items(
     dependencies=[Security(get_current_user, scopes=[OrderItemPermissions.CAN_UPDATE_ORDER_ITEM])]
 )
 @inject
-def update_order_item(
+async def update_order_item(
     order_item_id: int,
     dto: UpdateOrderItemDTO,
     controller: OrderItemController = Depends(Provide[Container.order_item_controller]),
     user: dict = Security(get_current_user)
 ):
-    return controller.update_order_item(order_item_id, dto)
+    return await controller.update_order_item(order_item_id, dto)
 
 @router.delete(
     "/order-items/{order_item_id}",
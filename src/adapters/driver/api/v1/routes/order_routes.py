@@ -1,16 +1,22 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, Security, status
+from fastapi import APIRouter, Depends, Query, Request, Response, Security, status
+from fastapi.responses import StreamingResponse
 from dependency_injector.wiring import inject, Provide
 
+from config.settings import ORDERS_PAGE_DEFAULT_LIMIT, ORDERS_PAGE_MAX_LIMIT, ORDERS_STREAM_PAGE_SIZE, PAYMENT_QR_CODE_MAX_WAIT
 from src.core.domain.dtos.product.product_dto import ProductDTO
 from src.core.auth.dependencies import get_current_user
 from src.constants.order_status import OrderStatusEnum
+from src.constants.payment_outbox_status import PaymentOutboxStatusEnum
 from src.adapters.driver.api.v1.controllers.order_controller import OrderController
 from src.constants.permissions import OrderPermissions
 from src.core.domain.dtos.order_item.create_order_item_dto import CreateOrderItemDTO
+from src.core.domain.dtos.order_item.create_order_items_dto import CreateOrderItemsDTO
 from src.core.domain.dtos.order_item.order_item_dto import OrderItemDTO
 from src.core.domain.dtos.order.order_dto import OrderDTO
 from src.core.domain.dtos.order_status.order_status_dto import OrderStatusDTO
+from src.core.domain.dtos.order_status_movement.order_status_movement_dto import OrderStatusMovementDTO
+from src.core.domain.dtos.payment.order_payment_dto import OrderPaymentDTO
 from src.core.containers import Container
 
 router = APIRouter()
@@ -23,7 +29,7 @@ router = APIRouter()
     dependencies=[Security(get_current_user, scopes=[OrderPermissions.CAN_CREATE_ORDER])],
 )
 @inject
-async def create_order(
+def create_order(
     current_user: dict = Depends(get_current_user),
     controller: OrderController = Depends(Provide[Container.order_controller]),
 ):
@@ -42,7 +48,7 @@ async def list_products_by_order_status(
     current_user: dict = Depends(get_current_user),
     controller: OrderController = Depends(Provide[Container.order_controller]),
 ):
-    return controller.list_products_by_order_status(order_id, current_user)
+    return await controller.list_products_by_order_status(order_id, current_user)
 
 @router.get(
     "/orders/{order_id}",
@@ -56,7 +62,7 @@ async def get_order_by_id(
     current_user: dict = Depends(get_current_user),
     controller: OrderController = Depends(Provide[Container.order_controller]),
 ):
-    return controller.get_order_by_id(order_id, current_user)
+    return await controller.get_order_by_id(order_id, current_user)
 
 # Adicionar item ao pedido
 @router.post(
@@ -71,9 +77,25 @@ async def add_item(
     current_user: dict = Depends(get_current_user),
     controller: OrderController = Depends(Provide[Container.order_controller]),
 ):
-    controller.add_item(order_id, dto, current_user)
+    await controller.add_item(order_id, dto, current_user)
     return {"detail": "Item adicionado com sucesso."}
 
+# Adicionar vários itens da etapa atual ao pedido em uma única requisição (todos da mesma categoria)
+@router.post(
+    "/orders/{order_id}/items/batch",
+    dependencies=[Security(get_current_user, scopes=[OrderPermissions.CAN_ADD_ITEM])],
+    status_code=status.HTTP_201_CREATED,
+)
+@inject
+async def add_items(
+    order_id: int,
+    dto: CreateOrderItemsDTO,
+    current_user: dict = Depends(get_current_user),
+    controller: OrderController = Depends(Provide[Container.order_controller]),
+):
+    await controller.add_items(order_id, dto, current_user)
+    return {"detail": "Itens adicionados com sucesso."}
+
 # Remover item do pedido
 @router.delete(
     "/orders/{order_id}/items/{item_id}",
@@ -81,7 +103,7 @@ async def add_item(
     status_code=status.HTTP_200_OK,
 )
 @inject
-async def remove_item(
+def remove_item(
     order_id: int,
     item_id: int,
     current_user: dict = Depends(get_current_user),
@@ -97,7 +119,7 @@ async def remove_item(
     status_code=status.HTTP_200_OK,
 )
 @inject
-async def change_item_quantity(
+def change_item_quantity(
     order_id: int,
     order_item_id: int,
     new_quantity: int,
@@ -114,7 +136,7 @@ async def change_item_quantity(
     status_code=status.HTTP_200_OK,
 )
 @inject
-async def change_item_observation(
+def change_item_observation(
     order_id: int,
     item_id: int,
     new_observation: str,
@@ -130,7 +152,7 @@ async def change_item_observation(
     status_code=status.HTTP_200_OK,
 )
 @inject
-async def clear_order(
+def clear_order(
     order_id: int,
     current_user: dict = Depends(get_current_user),
     controller: OrderController = Depends(Provide[Container.order_controller]),
@@ -151,7 +173,7 @@ async def list_order_items(
     current_user: dict = Depends(get_current_user),
     controller: OrderController = Depends(Provide[Container.order_controller]),
 ):
-    return controller.list_order_items(order_id, current_user)
+    return await controller.list_order_items(order_id, current_user)
 
 # Cancelar pedido
 @router.post(
@@ -160,7 +182,7 @@ async def list_order_items(
     status_code=status.HTTP_200_OK,
 )
 @inject
-async def cancel_order(
+def cancel_order(
     order_id: int,
     current_user: dict = Depends(get_current_user),
     controller: OrderController = Depends(Provide[Container.order_controller]),
@@ -171,12 +193,39 @@ async def cancel_order(
 # Avançar para o próximo passo no pedido
 @router.post("/orders/{order_id}/advance")
 @inject
-async def advance_order_status(
+def advance_order_status(
     order_id: int,
+    request: Request,
     current_user: dict = Depends(get_current_user),
     controller: OrderController = Depends(Provide[Container.order_controller]),
 ):
-    return controller.advance_order_status(order_id, current_user)
+    response = controller.advance_order_status(order_id, current_user)
+    # Modo outbox: acorda o despachante para criar o pagamento do pedido recém-fechado
+    dispatcher = getattr(request.app.state, "payment_outbox_dispatcher", None)
+    if dispatcher is not None:
+        dispatcher.notify()
+    return response
+
+# Consultar o pagamento (QR code) do pedido; wait > 0 aguarda (long polling) enquanto o pagamento é criado
+@router.get(
+    "/orders/{order_id}/payment",
+    response_model=OrderPaymentDTO,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Security(get_current_user, scopes=[OrderPermissions.CAN_VIEW_ORDER])],
+)
+@inject
+async def get_order_payment(
+    order_id: int,
+    response: Response,
+    wait: float = Query(default=0, ge=0, le=PAYMENT_QR_CODE_MAX_WAIT, description="Segundos a aguardar pelo QR code"),
+    current_user: dict = Depends(get_current_user),
+    controller: OrderController = Depends(Provide[Container.order_controller]),
+):
+    payment = await controller.get_order_payment(order_id, current_user, wait)
+    if payment.status == PaymentOutboxStatusEnum.PENDING.status:
+        response.status_code = status.HTTP_202_ACCEPTED
+        response.headers["Retry-After"] = "1"
+    return payment
 
 # Retornar ao passo anterior
 @router.post(
@@ -185,14 +234,14 @@ async def advance_order_status(
     status_code=status.HTTP_200_OK,
 )
 @inject
-async def go_back(
+def go_back(
     order_id: int,
     current_user: dict = Depends(get_current_user),
     controller: OrderController = Depends(Provide[Container.order_controller]),
 ):
     return controller.revert_order_status(order_id, current_user)
 
-# Listar todos os pedidos
+# Listar todos os pedidos (paginado por cursor; stream=true devolve NDJSON)
 @router.get(
     "/orders",
     response_model=List[OrderDTO],
@@ -201,15 +250,34 @@ async def go_back(
 )
 @inject
 async def list_orders(
+    response: Response,
     status: Optional[List[str]] = Query(
         default=[],
         # example=[s.status for s in OrderStatusEnum],
         description=f"Lista de status dos pedidos para filtrar. Valores válidos: {', '.join([str(s.status) for s in OrderStatusEnum])}"
     ),
+    limit: Optional[int] = Query(
+        default=None, ge=1, le=ORDERS_PAGE_MAX_LIMIT,
+        description=(
+            f"Tamanho da página (padrão {ORDERS_PAGE_DEFAULT_LIMIT}; com stream=true, {ORDERS_STREAM_PAGE_SIZE}). "
+            "O cursor da próxima página é devolvido no header X-Next-Cursor"
+        )
+    ),
+    cursor: Optional[str] = Query(default=None, description="Cursor devolvido pela página anterior (X-Next-Cursor)"),
+    stream: bool = Query(default=False, description="Devolve todos os pedidos como NDJSON (application/x-ndjson), lidos página a página"),
     current_user: dict = Depends(get_current_user),
     controller: OrderController = Depends(Provide[Container.order_controller]),
 ):
-    return controller.list_orders(status, current_user)
+    if stream:
+        return StreamingResponse(
+            controller.stream_orders(status, current_user, limit or ORDERS_STREAM_PAGE_SIZE),
+            media_type="application/x-ndjson",
+        )
+
+    page = await controller.list_orders(status, current_user, limit or ORDERS_PAGE_DEFAULT_LIMIT, cursor)
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return page.items
 
 
 @router.get(
@@ -224,4 +292,22 @@ async def get_order_status(
     current_user: dict = Depends(get_current_user),
     controller: OrderController = Depends(Provide[Container.order_controller])
 ):
-    return controller.get_order_status(order_id, current_user)
\ No newline at end of file
+    return await controller.get_order_status(order_id, current_user)
+
+
+# Listar o histórico de status do pedido (paginado por cursor)
+@router.get(
+    '/orders/{order_id}/status-history',
+    response_model=List[OrderStatusMovementDTO],
+    status_code=status.HTTP_200_OK,
+    dependencies=[Security(get_current_user, scopes=[OrderPermissions.CAN_VIEW_ORDER])]
+)
+@inject
+async def list_order_status_history(
+    order_id: int,
+    limit: int = Query(default=20, ge=1, le=100, description="Quantidade máxima de movimentações na página"),
+    after_id: Optional[int] = Query(default=None, description="ID da última movimentação da página anterior"),
+    current_user: dict = Depends(get_current_user),
+    controller: OrderController = Depends(Provide[Container.order_controller])
+):
+    return await controller.list_order_status_history(order_id, current_user, limit, after_id)
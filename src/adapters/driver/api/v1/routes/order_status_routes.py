@@ -36,12 +36,12 @@ def create_order_status(
     dependencies=[Security(get_current_user, scopes=[OrderStatusPermissions.CAN_VIEW_ORDER_STATUSES])]
 )
 @inject
-def get_order_status_by_status(
+async def get_order_status_by_status(
     order_status: str,
     controller: OrderStatusController = Depends(Provide[Container.order_status_controller]),
     user: dict = Security(get_current_user)
 ):
-    return controller.get_order_status_by_status(status=order_status)
+    return await controller.get_order_status_by_status(status=order_status)
 
 @router.get(
     "/order_status/{order_status_id}/id",
@@ -50,12 +50,12 @@ def get_order_status_by_status(
     dependencies=[Security(get_current_user, scopes=[OrderStatusPermissions.CAN_VIEW_ORDER_STATUSES])]
 )
 @inject
-def get_order_status_by_id(
+async def get_order_status_by_id(
     order_status_id: int,
     controller: OrderStatusController = Depends(Provide[Container.order_status_controller]),
     user: dict = Security(get_current_user)
 ):
-    return controller.get_order_status_by_id(order_status_id=order_status_id)
+    return await controller.get_order_status_by_id(order_status_id=order_status_id)
 
 @router.get(
     "/order_status",
@@ -63,12 +63,12 @@ def get_order_status_by_id(
     dependencies=[Security(get_current_user, scopes=[OrderStatusPermissions.CAN_VIEW_ORDER_STATUSES])]
 )
 @inject
-def get_all_order_status(
+async def get_all_order_status(
     include_deleted: Optional[bool] = Query(False),
     controller: OrderStatusController = Depends(Provide[Container.order_status_controller]),
     user: dict = Security(get_current_user)
 ):
-    return controller.get_all_orders_status(include_deleted=include_deleted)
+    return await controller.get_all_orders_status(include_deleted=include_deleted)
 
 @router.put(
     "/order_status/{order_status_id}",
@@ -0,0 +1,38 @@
+from typing import Literal
+
+from fastapi import APIRouter, Query, Request, Security, status
+
+from src.constants.permissions import DiagnosticsPermissions
+from src.core.auth.dependencies import get_current_user
+from src.core.domain.dtos.diagnostics.slow_query_dto import SlowQueryReportDTO
+
+router = APIRouter()
+
+
+# Consultas SQL agregadas por fingerprint, das mais custosas para as menos
+@router.get(
+    "/admin/slow-queries",
+    response_model=SlowQueryReportDTO,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Security(get_current_user, scopes=[DiagnosticsPermissions.CAN_VIEW_SLOW_QUERIES])],
+)
+async def list_slow_queries(
+    request: Request,
+    order_by: Literal["total", "p95", "count", "max", "slow"] = Query("total"),
+    limit: int = Query(20, ge=1, le=500),
+):
+    recorder = request.app.state.slow_query_recorder
+    return SlowQueryReportDTO(
+        threshold_ms=recorder.threshold * 1000,
+        dropped=recorder.dropped,
+        queries=recorder.top(order_by=order_by, limit=limit),
+    )
+
+@router.delete(
+    "/admin/slow-queries",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Security(get_current_user, scopes=[DiagnosticsPermissions.CAN_RESET_SLOW_QUERIES])],
+)
+async def reset_slow_queries(request: Request):
+    request.app.state.slow_query_recorder.reset()
+    return {"detail": "Registro de consultas lentas reiniciado."}
@@ -1,7 +1,7 @@
-
-from fastapi import APIRouter, status, Depends
+from fastapi import APIRouter, Request, Response, status, Depends
 from dependency_injector.wiring import inject, Provide
 
+from config.settings import WEBHOOK_INGEST_MODE
 from src.adapters.driver.api.v1.controllers.webhook_controller import WebhookController
 from src.core.domain.dtos.webhook.payment_webhook_dto import PaymentWebhookDTO
 from src.core.containers import Container
@@ -13,9 +13,20 @@ router = APIRouter()
     status_code=status.HTTP_200_OK,
 )
 @inject
-async def payment_notification(
+def payment_notification(
     dto: PaymentWebhookDTO,
+    request: Request,
+    response: Response,
     controller: WebhookController = Depends(Provide[Container.webhook_controller]),
 ):
-    await controller.handle_payment_notification(dto)
+    if WEBHOOK_INGEST_MODE == "queued":
+        # Grava na caixa de entrada e confirma de imediato; o worker aplica a entrega em lote
+        if controller.enqueue_payment_notification(dto):
+            worker = getattr(request.app.state, "payment_webhook_worker", None)
+            if worker is not None:
+                worker.notify()
+        response.status_code = status.HTTP_202_ACCEPTED
+        return {"status": "accepted"}
+
+    controller.handle_payment_notification(dto)
     return {"status": "success"}
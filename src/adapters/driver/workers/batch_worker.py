@@ -0,0 +1,89 @@
+from abc import ABC, abstractmethod
+import asyncio
+import logging
+from typing import Optional
+
+
+class BatchWorker(ABC):
+    """
+    Background task that repeatedly runs ``process_batch`` inside the API process.
+
+    The API wakes the worker up (``notify``) right after writing work for it; ``poll_interval`` is the fallback for
+    work written by other replicas or left behind by a failure. Batches run in a worker thread (``process_batch`` is
+    synchronous and talks to the database), so the event loop keeps serving requests meanwhile.
+    """
+
+    name = "batch-worker"
+
+    def __init__(self, batch_size: int, poll_interval: float):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    @abstractmethod
+    def process_batch(self) -> int:
+        """Processes up to ``batch_size`` units of work and returns how many were taken."""
+        pass
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.create_task(self._run(), name=self.name)
+
+    def notify(self) -> None:
+        """Wakes the worker up; safe to call from the threadpool that runs the synchronous routes."""
+        if self._wakeup is None:
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._wakeup.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def stop(self) -> None:
+        """Finishes the batch in progress and stops the worker."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self.notify()
+        await self._task
+        self._task = None
+
+    async def drain(self) -> int:
+        """Processes batches until there is no work left and returns how many units were taken."""
+        total = 0
+        while not self._stopping:
+            taken = await asyncio.to_thread(self.process_batch)
+            total += taken
+            if taken < self.batch_size:
+                break
+        return total
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await self.drain()
+            except Exception:
+                logging.exception(f"Falha no worker em segundo plano {self.name}")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+
+__all__ = ["BatchWorker"]
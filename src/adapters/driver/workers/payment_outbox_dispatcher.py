@@ -0,0 +1,49 @@
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from config.settings import PAYMENT_OUTBOX_BATCH_SIZE, PAYMENT_OUTBOX_POLL_INTERVAL
+from src.adapters.driven.repositories.order_repository import OrderRepository
+from src.adapters.driven.repositories.payment_outbox_repository import PaymentOutboxRepository
+from src.adapters.driver.workers.batch_worker import BatchWorker
+from src.application.usecases.payment_usecase.dispatch_payment_outbox_usecase import DispatchPaymentOutboxUseCase
+from src.core.containers import Container
+from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway
+
+
+class PaymentOutboxDispatcher(BatchWorker):
+    """
+    Sends the payment requests of the outbox to the payment service; each batch runs with its own session and
+    identity map.
+    """
+
+    name = "payment-outbox-dispatcher"
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        payment_gateway: IPaymentProviderGateway,
+        batch_size: int = PAYMENT_OUTBOX_BATCH_SIZE,
+        poll_interval: float = PAYMENT_OUTBOX_POLL_INTERVAL,
+    ):
+        super().__init__(batch_size, poll_interval)
+        self.session_factory = session_factory
+        self.payment_gateway = payment_gateway
+
+    def process_batch(self) -> int:
+        session = self.session_factory()
+        # Executado numa cópia do contexto: o mapa de identidade é exclusivo do lote
+        Container.identity_map.reset()
+        try:
+            usecase = DispatchPaymentOutboxUseCase.build(
+                order_gateway=OrderRepository(session),
+                payment_outbox_gateway=PaymentOutboxRepository(session),
+                payment_gateway=self.payment_gateway,
+            )
+            return usecase.execute(self.batch_size)
+        finally:
+            session.close()
+            Container.identity_map.reset()
+
+
+__all__ = ["PaymentOutboxDispatcher"]
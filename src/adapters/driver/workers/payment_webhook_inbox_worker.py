@@ -0,0 +1,49 @@
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from config.settings import WEBHOOK_INBOX_BATCH_SIZE, WEBHOOK_INBOX_POLL_INTERVAL
+from src.adapters.driven.repositories.order_repository import OrderRepository
+from src.adapters.driven.repositories.order_status_repository import OrderStatusRepository
+from src.adapters.driven.repositories.payment_webhook_inbox_repository import PaymentWebhookInboxRepository
+from src.adapters.driver.workers.batch_worker import BatchWorker
+from src.application.usecases.webhook_usecase.approve_payment_batch_usecase import ApprovePaymentBatchUseCase
+from src.core.containers import Container
+from src.core.shared.order_status_registry import OrderStatusRegistry
+
+
+class PaymentWebhookInboxWorker(BatchWorker):
+    """
+    Drains the payment webhook inbox in batches; each batch runs with its own session and identity map.
+    """
+
+    name = "payment-webhook-inbox-worker"
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        order_status_registry: Optional[OrderStatusRegistry] = None,
+        batch_size: int = WEBHOOK_INBOX_BATCH_SIZE,
+        poll_interval: float = WEBHOOK_INBOX_POLL_INTERVAL,
+    ):
+        super().__init__(batch_size, poll_interval)
+        self.session_factory = session_factory
+        self.order_status_registry = order_status_registry
+
+    def process_batch(self) -> int:
+        session = self.session_factory()
+        # Executado numa cópia do contexto: o mapa de identidade é exclusivo do lote
+        Container.identity_map.reset()
+        try:
+            usecase = ApprovePaymentBatchUseCase.build(
+                order_gateway=OrderRepository(session),
+                order_status_gateway=OrderStatusRepository(session, registry=self.order_status_registry),
+                inbox_gateway=PaymentWebhookInboxRepository(session),
+            )
+            return usecase.execute(self.batch_size)
+        finally:
+            session.close()
+            Container.identity_map.reset()
+
+
+__all__ = ["PaymentWebhookInboxWorker"]
@@ -1,18 +1,100 @@
+from contextlib import asynccontextmanager
+import logging
 from fastapi import FastAPI
+from sqlalchemy.exc import SQLAlchemyError
 from config.custom_openapi import custom_openapi
+from config.database import SessionLocal, async_engine, async_replica_engines, engine, replica_engines, warm_up_pool
+from config.settings import (
+    DB_QUERY_LOG_LEVEL,
+    DB_QUERY_LOG_SAMPLE_RATE,
+    METRICS_ENABLED,
+    PAYMENT_CREATION_MODE,
+    SLOW_QUERY_EXPLAIN_THRESHOLD_MS,
+    SLOW_QUERY_LOG_ENABLED,
+    SLOW_QUERY_MAX_FINGERPRINTS,
+    SLOW_QUERY_SAMPLE_SIZE,
+    SLOW_QUERY_THRESHOLD_MS,
+    WEBHOOK_INGEST_MODE,
+)
 from src.adapters.driver.api.v1.middleware.api_key_middleware import ApiKeyMiddleware
+from src.adapters.driver.api.v1.middleware.db_session_middleware import DbSessionMiddleware
 from src.adapters.driver.api.v1.middleware.identity_map_middleware import IdentityMapMiddleware
 from src.core.containers import Container
 from src.adapters.driver.api.v1.middleware.auth_middleware import AuthMiddleware
+from src.adapters.driver.api.v1.middleware.route_auth_policies import RouteAuthPolicies
 from src.adapters.driver.api.v1.middleware.custom_error_middleware import CustomErrorMiddleware
+from src.adapters.driver.api.v1.middleware.metrics_middleware import MetricsMiddleware
 from src.adapters.driver.api.v1.routes.health_check import router as health_check_router
 from src.adapters.driver.api.v1.routes.order_item_routes import router as order_item_routes
 from src.adapters.driver.api.v1.routes.order_status_routes import router as order_status_routes
 from src.adapters.driver.api.v1.routes.order_routes import router as order_routes
 from src.adapters.driver.api.v1.routes.webhook_routes import router as webhook_routes
+from src.adapters.driver.api.v1.routes.metrics import router as metrics_router
+from src.adapters.driver.api.v1.routes.slow_query_routes import router as slow_query_routes
+from src.adapters.driver.workers.payment_outbox_dispatcher import PaymentOutboxDispatcher
+from src.adapters.driver.workers.payment_webhook_inbox_worker import PaymentWebhookInboxWorker
+from src.core.shared.metrics import database_pool_collector, instrument_database
+from src.core.shared.query_logger import install_query_logger
+from src.core.shared.slow_query_log import SlowQueryRecorder
 
 
-app = FastAPI(title="Tech Challenger SOAT10 - FIAP")
+def warm_database_pool() -> None:
+    for pool_engine in (engine, *replica_engines):
+        try:
+            warm_up_pool(pool_engine)
+        except SQLAlchemyError as exc:
+            # Sem banco na subida as conexões são abertas sob demanda
+            logging.warning(f"Não foi possível pré-aquecer o pool de conexões: {exc}")
+
+
+def warm_order_status_registry(container: Container) -> None:
+    try:
+        container.order_status_gateway().warm_registry()
+    except SQLAlchemyError as exc:
+        # Sem banco na subida o registro é carregado na primeira consulta
+        logging.warning(f"Não foi possível pré-carregar os status de pedido: {exc}")
+    finally:
+        container.db_session_scope().close()
+        container.db_session_scope.reset()
+        Container.identity_map.reset()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Abre o pool HTTP do microsserviço de estoque na subida e o fecha no desligamento
+    app.container.stock_http_client()
+    warm_database_pool()
+    warm_order_status_registry(app.container)
+    # Tabela rota → política de autenticação, compilada uma única vez com todas as rotas registradas
+    app.state.route_auth_policies = RouteAuthPolicies(app.routes)
+    if WEBHOOK_INGEST_MODE == "queued":
+        # Worker da caixa de entrada de webhooks de pagamento, no mesmo processo da API
+        app.state.payment_webhook_worker = PaymentWebhookInboxWorker(
+            SessionLocal, order_status_registry=app.container.order_status_registry()
+        )
+        app.state.payment_webhook_worker.start()
+    if PAYMENT_CREATION_MODE == "outbox":
+        # Despachante do outbox de pagamentos, no mesmo processo da API
+        app.state.payment_outbox_dispatcher = PaymentOutboxDispatcher(
+            SessionLocal, payment_gateway=app.container.payment_provider_gateway()
+        )
+        app.state.payment_outbox_dispatcher.start()
+    yield
+    if WEBHOOK_INGEST_MODE == "queued":
+        await app.state.payment_webhook_worker.stop()
+    if PAYMENT_CREATION_MODE == "outbox":
+        await app.state.payment_outbox_dispatcher.stop()
+    await app.container.stock_http_client().aclose()
+    app.container.stock_provider_gateway.reset()
+    app.container.resilient_stock_gateway.reset()
+    app.container.stock_microservice_gateway.reset()
+    app.container.stock_http_client.reset()
+    # O pool assíncrono pertence a este event loop: as conexões são fechadas antes que ele termine
+    for pool_engine in (async_engine, *async_replica_engines):
+        await pool_engine.dispose()
+
+
+app = FastAPI(title="Tech Challenger SOAT10 - FIAP", lifespan=lifespan)
 
 
 # Inicializando o container de dependências
@@ -21,11 +103,41 @@ app.container = container
 
 app.openapi = lambda: custom_openapi(app)
 
+# Os motores assíncronos são instrumentados pelo motor síncrono que embrulham
+async_sync_engines = [async_pool_engine.sync_engine for async_pool_engine in (async_engine, *async_replica_engines)]
+
+install_query_logger(engine, DB_QUERY_LOG_LEVEL, DB_QUERY_LOG_SAMPLE_RATE)
+for logged_engine in (*replica_engines, *async_sync_engines):
+    install_query_logger(logged_engine, DB_QUERY_LOG_LEVEL, DB_QUERY_LOG_SAMPLE_RATE)
+
+# Consultas agregadas por fingerprint, expostas em /api/v1/admin/slow-queries
+app.state.slow_query_recorder = SlowQueryRecorder(
+    threshold=SLOW_QUERY_THRESHOLD_MS / 1000,
+    explain_threshold=SLOW_QUERY_EXPLAIN_THRESHOLD_MS / 1000 if SLOW_QUERY_EXPLAIN_THRESHOLD_MS > 0 else None,
+    max_fingerprints=SLOW_QUERY_MAX_FINGERPRINTS,
+    sample_size=SLOW_QUERY_SAMPLE_SIZE,
+)
+if SLOW_QUERY_LOG_ENABLED:
+    for instrumented_engine in (engine, *replica_engines, *async_sync_engines):
+        app.state.slow_query_recorder.install(instrumented_engine)
+
 app.add_middleware(CustomErrorMiddleware)
 app.add_middleware(AuthMiddleware)
 app.add_middleware(IdentityMapMiddleware)
+app.add_middleware(DbSessionMiddleware)
 app.add_middleware(ApiKeyMiddleware)
 
+if METRICS_ENABLED:
+    # Mais externo: mede a requisição inteira, inclusive as respostas de erro dos demais middlewares
+    app.add_middleware(MetricsMiddleware)
+    instrument_database()
+    database_pool_collector.register("sync", engine)
+    database_pool_collector.register("async", async_engine.sync_engine)
+    for index, replica_engine in enumerate(replica_engines):
+        database_pool_collector.register(f"replica_{index}", replica_engine)
+    for index, async_replica_engine in enumerate(async_replica_engines):
+        database_pool_collector.register(f"async_replica_{index}", async_replica_engine.sync_engine)
+
 PREFIX_API_V1 = "/api/v1"
 
 # Adicionando rotas da versão 1
@@ -34,3 +146,8 @@ app.include_router(order_routes, prefix=PREFIX_API_V1, tags=["order"])
 app.include_router(order_item_routes, prefix=PREFIX_API_V1, tags=["order-items"], include_in_schema=False)
 app.include_router(order_status_routes, prefix=PREFIX_API_V1, tags=["order-status"])
 app.include_router(webhook_routes, prefix=PREFIX_API_V1, tags=["webhooks"], include_in_schema=False)
+app.include_router(slow_query_routes, prefix=PREFIX_API_V1, tags=["admin"], include_in_schema=False)
+
+if METRICS_ENABLED:
+    # GET /metrics (formato Prometheus), fora do prefixo da API
+    app.include_router(metrics_router, include_in_schema=False)
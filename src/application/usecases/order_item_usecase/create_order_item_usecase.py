@@ -1,3 +1,4 @@
+import asyncio
 
 from src.core.domain.dtos.order_item.create_order_item_dto import CreateOrderItemDTO
 from src.core.domain.entities.order_item import OrderItem
@@ -27,15 +28,15 @@ class CreateOrderItemUseCase:
     ) -> 'CreateOrderItemUseCase':
         return cls(order_item_gateway, order_gateway, stock_gateway)
 
-    def execute(self, dto: CreateOrderItemDTO) -> OrderItem:
-        product = self.stock_gateway.get_product_by_id(dto.product_id)
+    async def execute(self, dto: CreateOrderItemDTO) -> OrderItem:
+        product = await self.stock_gateway.get_product_by_id(dto.product_id)
         if not product:
             raise EntityNotFoundException(entity_name="Product")
 
         if not dto.order_id:
             raise EntityNotFoundException(entity_name="Order ID")
 
-        order = self.order_gateway.get_by_id(dto.order_id)
+        order = await asyncio.to_thread(self.order_gateway.get_by_id, dto.order_id)
         if not order:
             raise EntityNotFoundException(entity_name="Order")
 
@@ -49,5 +50,5 @@ class CreateOrderItemUseCase:
             observation=dto.observation,
         )
 
-        order_item = self.order_item_gateway.create(order_item)
+        order_item = await asyncio.to_thread(self.order_item_gateway.create, order_item)
         return order_item
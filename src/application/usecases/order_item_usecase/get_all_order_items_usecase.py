@@ -1,19 +1,19 @@
 
 from typing import List, Optional
 from src.core.domain.dtos.order_item.order_item_dto import OrderItemDTO
-from src.core.ports.order_item.i_order_item_repository import IOrderItemRepository
+from src.core.ports.order_item.i_async_order_item_repository import IAsyncOrderItemRepository
 
 
 class GetAllOrderItemsUsecase:
     
-    def __init__(self, order_item_gateway: IOrderItemRepository):
+    def __init__(self, order_item_gateway: IAsyncOrderItemRepository):
         self.order_item_gateway = order_item_gateway
     
     @classmethod
-    def build(cls, order_item_gateway: IOrderItemRepository) -> 'GetAllOrderItemsUsecase':
+    def build(cls, order_item_gateway: IAsyncOrderItemRepository) -> 'GetAllOrderItemsUsecase':
         return cls(order_item_gateway)
     
-    def execute(self, include_deleted: Optional[bool] = False) -> List[OrderItemDTO]:
-        order_items = self.order_item_gateway.get_all(include_deleted)
+    async def execute(self, include_deleted: Optional[bool] = False) -> List[OrderItemDTO]:
+        order_items = await self.order_item_gateway.get_all(include_deleted)
         return order_items
     
\ No newline at end of file
@@ -1,3 +1,4 @@
+import asyncio
 
 from src.core.domain.dtos.order_item.update_order_item_dto import UpdateOrderItemDTO
 from src.core.domain.entities.order_item import OrderItem
@@ -20,12 +21,12 @@ class UpdateOrderItemUseCase:
     ) -> 'UpdateOrderItemUseCase':
         return cls(order_item_gateway, stock_gateway)
     
-    def execute(self, order_item_id: int, dto: UpdateOrderItemDTO) -> OrderItem:
-        order_item = self.order_item_gateway.get_by_id(order_item_id)
+    async def execute(self, order_item_id: int, dto: UpdateOrderItemDTO) -> OrderItem:
+        order_item = await asyncio.to_thread(self.order_item_gateway.get_by_id, order_item_id)
         if not order_item:
             raise EntityNotFoundException(entity_name="Order Item")
 
-        product = self.stock_gateway.get_product_by_id(dto.product_id)
+        product = await self.stock_gateway.get_product_by_id(dto.product_id)
         if not product:
             raise EntityNotFoundException(entity_name="Product")
 
@@ -33,5 +34,5 @@ class UpdateOrderItemUseCase:
         order_item.quantity = dto.quantity
         order_item.observation = dto.observation
 
-        order_item = self.order_item_gateway.update(order_item)
+        order_item = await asyncio.to_thread(self.order_item_gateway.update, order_item)
         return order_item
@@ -1,31 +1,33 @@
-
+from src.constants.order_load_profile import OrderLoadProfileEnum
 from src.core.domain.entities.order import Order
 from src.core.domain.entities.order_item import OrderItem
 from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
-from src.core.ports.order.i_order_repository import IOrderRepository
+from src.core.ports.order.i_async_order_repository import IAsyncOrderRepository
 from src.core.ports.stock.i_stock_provider_gateway import IStockProviderGateway
+from src.core.shared.optimistic_concurrency import retry_on_conflict
 
 
 class AddOrderItemInOrderUseCase:
-    def __init__(self, order_gateway: IOrderRepository, stock_gateway: IStockProviderGateway):
+    def __init__(self, order_gateway: IAsyncOrderRepository, stock_gateway: IStockProviderGateway):
         self.order_gateway = order_gateway
         self.stock_gateway = stock_gateway
 
     @classmethod
     def build(
-        cls, order_gateway: IOrderRepository, stock_gateway: IStockProviderGateway
+        cls, order_gateway: IAsyncOrderRepository, stock_gateway: IStockProviderGateway
     ) -> 'AddOrderItemInOrderUseCase':
         return cls(order_gateway, stock_gateway)
 
-    def execute(self, order_id: int, order_item_dto: dict, current_user: dict) -> Order:
-        order = self.order_gateway.get_by_id(order_id)
+    @retry_on_conflict()
+    async def execute(self, order_id: int, order_item_dto: dict, current_user: dict) -> Order:
+        order = await self.order_gateway.get_by_id(order_id, profile=OrderLoadProfileEnum.WITH_ITEMS)
         if not order:
             raise EntityNotFoundException(message=f"O pedido com ID '{order_id}' não foi encontrado.")
 
         if current_user['profile']['name'] in ['customer', 'anonymous'] and order.id_customer != current_user['person']['id']:
             raise EntityNotFoundException(message=f"O pedido com ID '{order_id}' não foi encontrado.")
 
-        product = self.stock_gateway.get_product_by_id(order_item_dto.product_id)
+        product = await self.stock_gateway.get_product_by_id(order_item_dto.product_id)
         if not product:
             raise EntityNotFoundException(f"Product ID '{order_item_dto.product_id}'")
 
@@ -40,5 +42,5 @@ class AddOrderItemInOrderUseCase:
         )
         order.add_item(order_item)
 
-        updated_order = self.order_gateway.update(order)
+        updated_order = await self.order_gateway.update(order)
         return updated_order
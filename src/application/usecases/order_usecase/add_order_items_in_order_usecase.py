@@ -0,0 +1,60 @@
+from typing import List
+
+from src.constants.order_load_profile import OrderLoadProfileEnum
+from src.core.domain.dtos.order_item.create_order_item_dto import CreateOrderItemDTO
+from src.core.domain.entities.order import Order
+from src.core.domain.entities.order_item import OrderItem
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.ports.order.i_async_order_repository import IAsyncOrderRepository
+from src.core.ports.stock.i_stock_provider_gateway import IStockProviderGateway
+from src.core.shared.optimistic_concurrency import retry_on_conflict
+
+
+class AddOrderItemsInOrderUseCase:
+    """
+    Adds several items of the current step to an order in one go (e.g. three burgers with different observations).
+
+    The products are resolved with a single batched stock lookup, all the items are validated against the current
+    status before any of them is added (a batch mixing categories is rejected, see ``Order.add_items``), and the
+    order is persisted with a single write.
+    """
+
+    def __init__(self, order_gateway: IAsyncOrderRepository, stock_gateway: IStockProviderGateway):
+        self.order_gateway = order_gateway
+        self.stock_gateway = stock_gateway
+
+    @classmethod
+    def build(
+        cls, order_gateway: IAsyncOrderRepository, stock_gateway: IStockProviderGateway
+    ) -> 'AddOrderItemsInOrderUseCase':
+        return cls(order_gateway, stock_gateway)
+
+    @retry_on_conflict()
+    async def execute(self, order_id: int, order_item_dtos: List[CreateOrderItemDTO], current_user: dict) -> Order:
+        order = await self.order_gateway.get_by_id(order_id, profile=OrderLoadProfileEnum.WITH_ITEMS)
+        if not order:
+            raise EntityNotFoundException(message=f"O pedido com ID '{order_id}' não foi encontrado.")
+
+        if current_user['profile']['name'] in ['customer', 'anonymous'] and order.id_customer != current_user['person']['id']:
+            raise EntityNotFoundException(message=f"O pedido com ID '{order_id}' não foi encontrado.")
+
+        products = await self.stock_gateway.get_products_by_ids(dto.product_id for dto in order_item_dtos)
+
+        order_items = []
+        for order_item_dto, product in zip(order_item_dtos, products):
+            if not product:
+                raise EntityNotFoundException(f"Product ID '{order_item_dto.product_id}'")
+
+            order_items.append(OrderItem(
+                order=order,
+                product_id=product['id'],
+                product_name=product['name'],
+                product_price=product['price'],
+                quantity=order_item_dto.quantity,
+                observation=order_item_dto.observation,
+                product_category_name=product['category']['name'] if 'category' in product else None
+            ))
+        order.add_items(order_items)
+
+        updated_order = await self.order_gateway.update(order)
+        return updated_order
@@ -1,13 +1,17 @@
-
+from typing import Optional
+from src.constants.order_load_profile import OrderLoadProfileEnum
 import os
 from src.constants.payment_method_enum import PaymentMethodEnum
 from src.core.domain.entities.order import Order
+from src.core.domain.entities.payment_outbox_entry import PaymentOutboxEntry
 from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
 from src.core.ports.order.i_order_repository import IOrderRepository
 from src.core.ports.order_status.i_order_status_repository import IOrderStatusRepository
+from src.core.ports.payment.i_payment_outbox_repository import IPaymentOutboxRepository
 from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway
 from src.constants.order_status import OrderStatusEnum
 from src.core.domain.dtos.payment.create_payment_dto import CreatePaymentDTO
+from src.core.shared.optimistic_concurrency import retry_on_conflict
 
 
 class AdvanceOrderStatusUseCase:
@@ -15,23 +19,32 @@ class AdvanceOrderStatusUseCase:
             self,
             order_gateway: IOrderRepository,
             order_status_gateway: IOrderStatusRepository,
-            payment_gateway: IPaymentProviderGateway
+            payment_gateway: IPaymentProviderGateway,
+            payment_outbox_gateway: Optional[IPaymentOutboxRepository] = None
     ):
         self.order_gateway = order_gateway
         self.order_status_gateway = order_status_gateway
         self.payment_gateway = payment_gateway
+        self.payment_outbox_gateway = payment_outbox_gateway
 
     @classmethod
     def build(
         cls,
         order_gateway: IOrderRepository,
         order_status_gateway: IOrderStatusRepository,
-        payment_gateway: IPaymentProviderGateway
+        payment_gateway: IPaymentProviderGateway,
+        payment_outbox_gateway: Optional[IPaymentOutboxRepository] = None
     ) -> 'AdvanceOrderStatusUseCase':
-        return cls(order_gateway, order_status_gateway, payment_gateway)
+        """
+        Args:
+            payment_outbox_gateway: When given, the payment of a placed order is not created in the request: the
+                request is written to the outbox together with the order and the order is returned.
+        """
+        return cls(order_gateway, order_status_gateway, payment_gateway, payment_outbox_gateway)
 
+    @retry_on_conflict()
     def execute(self, order_id: int, current_user: dict) -> Order:
-        order = self.order_gateway.get_by_id(order_id)
+        order = self.order_gateway.get_by_id(order_id, profile=OrderLoadProfileEnum.WITH_ITEMS)
         if not order:
             raise EntityNotFoundException(message=f"O pedido com ID '{order_id}' não foi encontrado.")
 
@@ -64,12 +77,23 @@ class AdvanceOrderStatusUseCase:
                     "name": current_user.get('person', {}).get('name'),
                     "email": current_user.get('person', {}).get('email'),
                 },
+                # Uma chave por versão fechada do pedido: tentativas concorrentes (ou refeitas) sobre a mesma versão
+                # recebem o mesmo pagamento do provedor em vez de criar outro
+                idempotency_key=f"order-{order.id}-v{order.version}",
             )
 
+            if self.payment_outbox_gateway is not None:
+                # Gravada na mesma transação do pedido: o despachante cria o pagamento fora da requisição
+                self.payment_outbox_gateway.add(
+                    PaymentOutboxEntry(id_order=order.id, payload=payment_dto.model_dump(mode='json'))
+                )
+                return self.order_gateway.update(order)
+
+            # Nenhuma trava fica presa durante a chamada ao provedor: a gravação com versão vem depois, e um conflito
+            # é refeito sobre o pedido recarregado
             payment = self.payment_gateway.create_payment(payment_dto)
             order.payment_id = payment['payment_id']
-            
-            order = self.order_gateway.update(order)
+            self.order_gateway.update(order)
 
             return payment
 
@@ -1,6 +1,7 @@
-
+from src.constants.order_load_profile import OrderLoadProfileEnum
 from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
 from src.core.ports.order.i_order_repository import IOrderRepository
+from src.core.shared.optimistic_concurrency import retry_on_conflict
 
 
 class ChangeItemObservationUseCase:
@@ -11,8 +12,9 @@ class ChangeItemObservationUseCase:
     def build(cls, order_gateway: IOrderRepository) -> 'ChangeItemObservationUseCase':
         return cls(order_gateway)
     
+    @retry_on_conflict()
     def execute(self, order_id: int, order_item_id: int, new_observation: str, current_user: dict) -> None:
-        order = self.order_gateway.get_by_id(order_id)
+        order = self.order_gateway.get_by_id(order_id, profile=OrderLoadProfileEnum.WITH_ITEMS)
         if order is None:
             raise EntityNotFoundException(message=f"O pedido com ID '{order_id}' não foi encontrado.")
 
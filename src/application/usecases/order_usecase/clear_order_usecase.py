@@ -1,7 +1,8 @@
-
+from src.constants.order_load_profile import OrderLoadProfileEnum
 from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
 from src.core.ports.order_status.i_order_status_repository import IOrderStatusRepository
 from src.core.ports.order.i_order_repository import IOrderRepository
+from src.core.shared.optimistic_concurrency import retry_on_conflict
 
 
 class ClearOrderUseCase:
@@ -13,8 +14,9 @@ class ClearOrderUseCase:
     def build(cls, order_gateway: IOrderRepository, order_status_gateway: IOrderStatusRepository) -> 'ClearOrderUseCase':
         return cls(order_gateway, order_status_gateway)
     
+    @retry_on_conflict()
     def execute(self, order_id: int, current_user: dict) -> None:
-        order = self.order_gateway.get_by_id(order_id)
+        order = self.order_gateway.get_by_id(order_id, profile=OrderLoadProfileEnum.WITH_ITEMS)
         if not order:
             raise EntityNotFoundException(message=f"O pedido com ID '{order_id}' não foi encontrado.")
 
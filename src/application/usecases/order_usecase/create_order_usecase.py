@@ -1,4 +1,5 @@
 
+from src.constants.order_load_profile import OrderLoadProfileEnum
 from src.constants.order_status import OrderStatusEnum
 from src.core.domain.entities.order import Order
 from src.core.exceptions.bad_request_exception import BadRequestException
@@ -45,7 +46,12 @@ class CreateOrderUseCase:
             OrderStatusEnum.ORDER_READY_TO_PLACE.status   
         ]
 
-        open_orders = self.order_gateway.get_all(status=open_statuses, customer_id=customer_id, include_deleted=False)
+        open_orders = self.order_gateway.get_all(
+            status=open_statuses,
+            customer_id=customer_id,
+            include_deleted=False,
+            profile=OrderLoadProfileEnum.SUMMARY
+        )
         if open_orders:
             raise BadRequestException("Já existe um pedido em aberto para este cliente")
         
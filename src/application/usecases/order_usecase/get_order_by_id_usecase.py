@@ -1,19 +1,22 @@
 
+from src.constants.order_load_profile import OrderLoadProfileEnum
 from src.core.domain.entities.order import Order
 from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
-from src.core.ports.order.i_order_repository import IOrderRepository
+from src.core.ports.order.i_async_order_repository import IAsyncOrderRepository
+from src.core.shared.replica_routing import read_only
 
 
 class GetOrderByIdUseCase:
-    def __init__(self, order_gateway: IOrderRepository):
+    def __init__(self, order_gateway: IAsyncOrderRepository):
         self.order_gateway = order_gateway
 
     @staticmethod
-    def build(order_gateway: IOrderRepository):
+    def build(order_gateway: IAsyncOrderRepository):
         return GetOrderByIdUseCase(order_gateway)
 
-    def execute(self, order_id: int, current_user: dict) -> Order:
-        order = self.order_gateway.get_by_id(order_id)
+    @read_only
+    async def execute(self, order_id: int, current_user: dict) -> Order:
+        order = await self.order_gateway.get_by_id(order_id, profile=OrderLoadProfileEnum.WITH_ITEMS)
         if not order:
             raise EntityNotFoundException(message=f"O pedido com ID '{order_id}' não foi encontrado.")
 
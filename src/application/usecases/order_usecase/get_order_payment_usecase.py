@@ -0,0 +1,31 @@
+import asyncio
+
+from src.application.usecases.order_usecase.get_order_by_id_usecase import GetOrderByIdUseCase
+from src.core.domain.entities.payment_outbox_entry import PaymentOutboxEntry
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.ports.order.i_async_order_repository import IAsyncOrderRepository
+from src.core.ports.payment.i_payment_outbox_repository import IPaymentOutboxRepository
+
+
+class GetOrderPaymentUseCase:
+    def __init__(self, order_gateway: IAsyncOrderRepository, payment_outbox_gateway: IPaymentOutboxRepository):
+        self.order_gateway = order_gateway
+        self.payment_outbox_gateway = payment_outbox_gateway
+
+    @classmethod
+    def build(
+        cls, order_gateway: IAsyncOrderRepository, payment_outbox_gateway: IPaymentOutboxRepository
+    ) -> 'GetOrderPaymentUseCase':
+        return cls(order_gateway, payment_outbox_gateway)
+
+    async def execute(self, order_id: int, current_user: dict) -> PaymentOutboxEntry:
+        await GetOrderByIdUseCase.build(self.order_gateway).execute(order_id, current_user)
+        # O outbox só tem repositório síncrono: a leitura roda no threadpool
+        return await asyncio.to_thread(self.refresh, order_id)
+
+    def refresh(self, order_id: int) -> PaymentOutboxEntry:
+        """Re-reads the payment request of an order already authorized by ``execute`` (long polling)."""
+        entry = self.payment_outbox_gateway.get_by_order_id(order_id)
+        if not entry:
+            raise EntityNotFoundException(message=f"O pagamento do pedido com ID '{order_id}' não foi encontrado.")
+        return entry
@@ -1,20 +1,22 @@
-from src.core.ports.order.i_order_repository import IOrderRepository
+from src.core.ports.order.i_async_order_repository import IAsyncOrderRepository
 from src.core.domain.entities.order_status import OrderStatus
 from src.application.usecases.order_usecase.get_order_by_id_usecase import GetOrderByIdUseCase
+from src.core.shared.replica_routing import read_only
 
 
 class GetOrderStatusUsecase():
-    def __init__(self, order_gateway: IOrderRepository):
+    def __init__(self, order_gateway: IAsyncOrderRepository):
         self.order_gateway = order_gateway
     
     @classmethod
-    def build(cls, order_gateway: IOrderRepository) -> 'GetOrderStatusUsecase':
+    def build(cls, order_gateway: IAsyncOrderRepository) -> 'GetOrderStatusUsecase':
         return GetOrderStatusUsecase(order_gateway)
 
-    def execute(self, order_id: int, current_user: dict) -> OrderStatus:
+    @read_only
+    async def execute(self, order_id: int, current_user: dict) -> OrderStatus:
         get_order_by_id_usecase = GetOrderByIdUseCase.build(self.order_gateway)
         
-        order = get_order_by_id_usecase.execute(order_id, current_user)
+        order = await get_order_by_id_usecase.execute(order_id, current_user)
 
         return order.order_status
         
\ No newline at end of file
@@ -1,21 +1,24 @@
 
 from typing import List
 
+from src.constants.order_load_profile import OrderLoadProfileEnum
 from src.core.domain.entities.order_item import OrderItem
 from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
-from src.core.ports.order.i_order_repository import IOrderRepository
+from src.core.ports.order.i_async_order_repository import IAsyncOrderRepository
+from src.core.shared.replica_routing import read_only
 
 
 class ListOrderItemsUseCase:
-    def __init__(self, order_gateway: IOrderRepository):
+    def __init__(self, order_gateway: IAsyncOrderRepository):
         self.order_gateway = order_gateway
         
     @classmethod
-    def build(cls, order_gateway: IOrderRepository) -> 'ListOrderItemsUseCase':
+    def build(cls, order_gateway: IAsyncOrderRepository) -> 'ListOrderItemsUseCase':
         return cls(order_gateway)
     
-    def execute(self, order_id: int) -> List[OrderItem]:
-        order = self.order_gateway.get_by_id(order_id)
+    @read_only
+    async def execute(self, order_id: int) -> List[OrderItem]:
+        order = await self.order_gateway.get_by_id(order_id, profile=OrderLoadProfileEnum.WITH_ITEMS)
         if order is None:
             raise EntityNotFoundException(message=f"O pedido com ID '{order_id}' não foi encontrado.")
         
@@ -0,0 +1,39 @@
+from typing import List, Optional
+
+from src.constants.order_load_profile import OrderLoadProfileEnum
+from src.core.domain.entities.order_status_movement import OrderStatusMovement
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.ports.order.i_async_order_repository import IAsyncOrderRepository
+from src.core.shared.replica_routing import read_only
+
+
+class ListOrderStatusHistoryUseCase:
+    def __init__(self, order_gateway: IAsyncOrderRepository):
+        self.order_gateway = order_gateway
+
+    @classmethod
+    def build(cls, order_gateway: IAsyncOrderRepository) -> 'ListOrderStatusHistoryUseCase':
+        return cls(order_gateway)
+
+    @read_only
+    async def execute(self, order_id: int, current_user: dict, limit: int = 20, after_id: Optional[int] = None) -> List[OrderStatusMovement]:
+        """
+        Lists a page of the status history of an order, oldest first.
+
+        Args:
+            order_id (int): The order id.
+            current_user (dict): The current user's information.
+            limit (int): Maximum number of movements in the page.
+            after_id (int, optional): Id of the last movement of the previous page.
+
+        Raises:
+            EntityNotFoundException: If the order does not exist or does not belong to the customer.
+        """
+        order = await self.order_gateway.get_by_id(order_id, profile=OrderLoadProfileEnum.SUMMARY)
+        if not order:
+            raise EntityNotFoundException(message=f"O pedido com ID '{order_id}' não foi encontrado.")
+
+        if current_user['profile']['name'] in ['customer', 'anonymous'] and order.id_customer != current_user['person']['id']:
+            raise EntityNotFoundException(message=f"O pedido com ID '{order_id}' não foi encontrado.")
+
+        return await self.order_gateway.get_status_history(order_id, limit=limit, after_id=after_id)
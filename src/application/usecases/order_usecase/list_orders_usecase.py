@@ -1,20 +1,40 @@
-
-from typing import List
+from typing import AsyncIterator, List, Optional
 from src.core.domain.entities.order import Order
-from src.core.ports.order.i_order_repository import IOrderRepository
+from src.core.ports.order.i_async_order_repository import IAsyncOrderRepository
+from src.core.shared.identity_map import IdentityMap
+from src.core.shared.order_page_cursor import OrderPageCursor
+from src.constants.order_load_profile import OrderLoadProfileEnum
 from src.constants.order_status import OrderStatusEnum
+from src.core.shared.replica_routing import read_only
 
 
 class ListOrdersUseCase:
     
-    def __init__(self, order_gateway: IOrderRepository):
+    def __init__(self, order_gateway: IAsyncOrderRepository):
         self.order_gateway = order_gateway
         
     @classmethod
-    def build(cls, order_gateway: IOrderRepository):
+    def build(cls, order_gateway: IAsyncOrderRepository):
         return cls(order_gateway)
 
-    def execute(self, status: List[str] = None, current_user: dict = {}) -> List[Order]:
+    @read_only
+    async def execute(
+        self,
+        status: List[str] = None,
+        current_user: dict = {},
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> List[Order]:
+        """
+        Lists the orders ordered by status priority and creation date.
+
+        Args:
+            limit (int, optional): Page size; ``None`` lists every matching order.
+            cursor (str, optional): Opaque cursor of the previous page (see ``OrderPageCursor``).
+
+        Raises:
+            BadRequestException: If the cursor is invalid.
+        """
         customer_id = current_user['person']['id'] if current_user.get('profile', {}).get('name') == 'customer' else None
 
         if status is None:
@@ -24,5 +44,34 @@ class ListOrdersUseCase:
                 OrderStatusEnum.ORDER_READY.status # Order ready for pickup
             ]
 
-        orders = self.order_gateway.get_all(status=status, customer_id=customer_id)
+        after = OrderPageCursor.decode(cursor) if cursor else None
+        orders = await self.order_gateway.get_all(
+            status=status,
+            customer_id=customer_id,
+            profile=OrderLoadProfileEnum.WITH_ITEMS,
+            limit=limit,
+            after=after,
+        )
         return orders
+
+    async def iter_pages(
+        self, status: List[str] = None, current_user: dict = {}, page_size: int = 100
+    ) -> AsyncIterator[List[Order]]:
+        """
+        Walks the whole listing page by page, so exports hold a single page in memory at a time.
+
+        The connection is released after each page is read, so a slow consumer does not hold a pooled connection
+        nor an open read transaction while it handles the page.
+        """
+        cursor = None
+        while True:
+            orders = await self.execute(status, current_user, limit=page_size, cursor=cursor)
+            await self.order_gateway.release()
+            if orders:
+                yield orders
+            if len(orders) < page_size:
+                return
+
+            cursor = OrderPageCursor.from_order(orders[-1]).encode()
+            # Os pedidos da página já foram consumidos: o mapa de identidade não cresce com a exportação
+            IdentityMap.get_instance().clear()
@@ -1,24 +1,23 @@
-
 from typing import Any, Dict, List
 from src.core.ports.stock.i_stock_provider_gateway import IStockProviderGateway
 from src.constants.order_status import OrderStatusEnum
 from src.constants.product_category import ProductCategoryEnum
 from src.core.exceptions.bad_request_exception import BadRequestException
 from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
-from src.core.ports.order.i_order_repository import IOrderRepository
+from src.core.ports.order.i_async_order_repository import IAsyncOrderRepository
 
 
 class ListProductsByOrderStatusUseCase:
-    def __init__(self, order_gateway: IOrderRepository, stock_provider_gateway: IStockProviderGateway):
+    def __init__(self, order_gateway: IAsyncOrderRepository, stock_provider_gateway: IStockProviderGateway):
         self.order_gateway = order_gateway
         self.stock_provider_gateway = stock_provider_gateway
 
     @classmethod
-    def build(cls, order_gateway: IOrderRepository, stock_provider_gateway: IStockProviderGateway) -> 'ListProductsByOrderStatusUseCase':
+    def build(cls, order_gateway: IAsyncOrderRepository, stock_provider_gateway: IStockProviderGateway) -> 'ListProductsByOrderStatusUseCase':
         return cls(order_gateway, stock_provider_gateway)
 
-    def execute(self, order_id: int, current_user: dict) -> List[Dict[str, Any]]:
-        order = self.order_gateway.get_by_id(order_id)
+    async def execute(self, order_id: int, current_user: dict) -> List[Dict[str, Any]]:
+        order = await self.order_gateway.get_by_id(order_id)
         if order is None:
             raise EntityNotFoundException(message=f"O pedido com ID '{order_id}' não foi encontrado.")
 
@@ -39,10 +38,10 @@ class ListProductsByOrderStatusUseCase:
         if category is None:
             raise BadRequestException("Não existem produtos disponíveis para este status de pedido.")
 
-        category = self.stock_provider_gateway.get_category_by_name(category)
+        category = await self.stock_provider_gateway.get_category_by_name(category)
         if not category:
             raise EntityNotFoundException(message=f"Categoria '{category}' não encontrada.")
 
-        products = self.stock_provider_gateway.get_products_by_category_name(category['name'])
+        products = await self.stock_provider_gateway.get_products_by_category_name(category['name'])
 
         return products
@@ -1,10 +1,11 @@
-
+from src.constants.order_load_profile import OrderLoadProfileEnum
 from src.constants.order_transition import STATUS_ALLOWED_ACCESS_ONLY_CUSTOMER
 from src.core.exceptions.bad_request_exception import BadRequestException
 from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
 from src.core.domain.entities.order import Order
 from src.core.ports.order.i_order_repository import IOrderRepository
 from src.core.ports.order_status.i_order_status_repository import IOrderStatusRepository
+from src.core.shared.optimistic_concurrency import retry_on_conflict
 
 
 class RevertOrderStatusUseCase:
@@ -16,8 +17,9 @@ class RevertOrderStatusUseCase:
     def build(cls, order_gateway: IOrderRepository, order_status_gateway: IOrderStatusRepository) -> 'RevertOrderStatusUseCase':
         return cls(order_gateway, order_status_gateway)
     
+    @retry_on_conflict()
     def execute(self, order_id: int, current_user: dict) -> Order:
-        order = self.order_gateway.get_by_id(order_id)
+        order = self.order_gateway.get_by_id(order_id, profile=OrderLoadProfileEnum.WITH_ITEMS)
         if not order:
             raise EntityNotFoundException(message=f"O pedido com ID '{order_id}' não foi encontrado.")
 
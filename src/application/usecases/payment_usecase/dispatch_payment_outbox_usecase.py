@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+import logging
+import random
+from typing import Callable
+
+from config.settings import (
+    PAYMENT_OUTBOX_BACKOFF_BASE,
+    PAYMENT_OUTBOX_BACKOFF_MAX,
+    PAYMENT_OUTBOX_LEASE,
+    PAYMENT_OUTBOX_MAX_ATTEMPTS,
+)
+from src.constants.order_load_profile import OrderLoadProfileEnum
+from src.constants.order_status import OrderStatusEnum
+from src.core.domain.dtos.payment.create_payment_dto import CreatePaymentDTO
+from src.core.domain.entities.payment_outbox_entry import PaymentOutboxEntry
+from src.core.ports.order.i_order_repository import IOrderRepository
+from src.core.ports.payment.i_payment_outbox_repository import IPaymentOutboxRepository
+from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway
+from src.core.shared.optimistic_concurrency import retry_on_conflict
+
+
+class DispatchPaymentOutboxUseCase:
+    """
+    Sends the due payment requests of the outbox to the payment service.
+
+    A created payment is recorded in the outbox row and in the order (``payment_id``) in one transaction. A failed
+    call is retried with exponential backoff and jitter until ``max_attempts``; requests of orders that are no longer
+    placed (cancelled or reverted meanwhile) are given up without calling the payment service. Delivery is
+    at-least-once: a crash between the payment service answering and the commit repeats the call.
+    """
+
+    def __init__(
+        self,
+        order_gateway: IOrderRepository,
+        payment_outbox_gateway: IPaymentOutboxRepository,
+        payment_gateway: IPaymentProviderGateway,
+        max_attempts: int = PAYMENT_OUTBOX_MAX_ATTEMPTS,
+        backoff_base: float = PAYMENT_OUTBOX_BACKOFF_BASE,
+        backoff_max: float = PAYMENT_OUTBOX_BACKOFF_MAX,
+        lease_seconds: float = PAYMENT_OUTBOX_LEASE,
+        random_source: Callable[[], float] = random.random,
+    ):
+        self.order_gateway = order_gateway
+        self.payment_outbox_gateway = payment_outbox_gateway
+        self.payment_gateway = payment_gateway
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.lease_seconds = lease_seconds
+        self._random = random_source
+
+    @classmethod
+    def build(
+        cls,
+        order_gateway: IOrderRepository,
+        payment_outbox_gateway: IPaymentOutboxRepository,
+        payment_gateway: IPaymentProviderGateway
+    ) -> 'DispatchPaymentOutboxUseCase':
+        return cls(order_gateway, payment_outbox_gateway, payment_gateway)
+
+    def execute(self, limit: int) -> int:
+        """Dispatches up to ``limit`` due requests and returns how many were taken from the outbox."""
+        entries = self.payment_outbox_gateway.claim_due(limit, self.lease_seconds)
+        for entry in entries:
+            self._dispatch(entry)
+        return len(entries)
+
+    def _dispatch(self, entry: PaymentOutboxEntry) -> None:
+        order = self.order_gateway.get_by_id(entry.id_order, profile=OrderLoadProfileEnum.SUMMARY)
+        if order is None or order.order_status.status != OrderStatusEnum.ORDER_PLACED.status:
+            self.payment_outbox_gateway.mark_failed(entry, f"Order with ID {entry.id_order} is no longer placed.")
+            return
+
+        try:
+            payment = self.payment_gateway.create_payment(CreatePaymentDTO(**entry.payload))
+        except Exception as exc:
+            logging.warning(f"Falha ao criar o pagamento do pedido {entry.id_order} (tentativa {entry.attempts}): {exc}")
+            if entry.attempts >= self.max_attempts:
+                self.payment_outbox_gateway.mark_failed(entry, str(exc))
+            else:
+                self.payment_outbox_gateway.reschedule(entry, str(exc), self._next_attempt_at(entry.attempts))
+            return
+
+        self._attach_payment(entry, payment)
+
+    @retry_on_conflict()
+    def _attach_payment(self, entry: PaymentOutboxEntry, payment: dict) -> None:
+        # A solicitação e o pedido são gravados na mesma transação: num conflito de versão ambos são desfeitos e
+        # refeitos sobre o pedido recarregado, sem criar o pagamento de novo
+        order = self.order_gateway.get_by_id(entry.id_order, profile=OrderLoadProfileEnum.SUMMARY)
+        order.payment_id = payment["payment_id"]
+        self.payment_outbox_gateway.mark_dispatched(entry, payment)
+        self.order_gateway.update(order)
+
+    def _next_attempt_at(self, attempts: int) -> datetime:
+        # Backoff exponencial com "equal jitter": metade fixa, metade aleatória
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempts - 1))
+        delay = delay / 2 + self._random() * delay / 2
+        return datetime.now(timezone.utc) + timedelta(seconds=delay)
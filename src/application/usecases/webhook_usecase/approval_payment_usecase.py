@@ -1,10 +1,16 @@
 
 from src.constants.order_status import OrderStatusEnum
+from src.constants.order_transition import ORDER_PAID_STATUSES
 from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway
 from src.core.ports.order_status.i_order_status_repository import IOrderStatusRepository
 from src.constants.payment_status import PaymentStatusEnum
 from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
 from src.core.ports.order.i_order_repository import IOrderRepository
+from src.core.ports.webhook.i_processed_webhook_repository import IProcessedWebhookRepository
+from src.core.shared.optimistic_concurrency import retry_on_conflict
+import logging
+
+PAID_STATUSES = {order_status.status for order_status in ORDER_PAID_STATUSES}
 
 
 class ApprovalPaymentUseCase:
@@ -12,22 +18,31 @@ class ApprovalPaymentUseCase:
         self,
         order_gateway: IOrderRepository,
         order_status_gateway: IOrderStatusRepository,
-        payment_gateway: IPaymentProviderGateway
+        payment_gateway: IPaymentProviderGateway,
+        processed_webhook_gateway: IProcessedWebhookRepository
     ):
         self.order_repository = order_gateway
         self.order_status_gateway = order_status_gateway
         self.payment_gateway = payment_gateway
+        self.processed_webhook_gateway = processed_webhook_gateway
         
     @classmethod
     def build(
         cls,
         order_gateway: IOrderRepository,
         order_status_gateway: IOrderStatusRepository,
-        payment_gateway: IPaymentProviderGateway
+        payment_gateway: IPaymentProviderGateway,
+        processed_webhook_gateway: IProcessedWebhookRepository
     ) -> 'ApprovalPaymentUseCase':
-        return cls(order_gateway, order_status_gateway, payment_gateway)
+        return cls(order_gateway, order_status_gateway, payment_gateway, processed_webhook_gateway)
+
+    @retry_on_conflict()
+    def execute(self, payment_id: int, payment_status: str, transaction_id: str, event: str) -> None:
+        # Reentregas do provedor de pagamento são confirmadas sem carregar o pedido
+        if self.processed_webhook_gateway.is_processed(payment_id, transaction_id, event):
+            logging.info(f"Webhook duplicado ignorado: payment_id={payment_id}, transaction_id={transaction_id}, event={event}")
+            return
 
-    def execute(self, payment_id: int, payment_status: str) -> None:
         order = self.order_repository.get_by_payment_id(payment_id)
         if not order:
             # if payment_status == PaymentStatusEnum.PAYMENT_COMPLETED.status:
@@ -36,6 +51,11 @@ class ApprovalPaymentUseCase:
         
         if payment_id != order.payment_id:
             raise EntityNotFoundException(f"Payment ID {payment_id} does not match order payment ID {order.payment_id}.")
+
+        # Outra entrega do mesmo pagamento já confirmou o pedido
+        if order.order_status.status in PAID_STATUSES:
+            logging.info(f"Pagamento já confirmado para o pedido {order.id}: payment_id={payment_id}, transaction_id={transaction_id}")
+            return
         
         if order.order_status.status != OrderStatusEnum.ORDER_PLACED.status:
             raise EntityNotFoundException(f"Order with ID {order.id} is not in the 'ORDER_PLACED' status.")
@@ -50,6 +70,10 @@ class ApprovalPaymentUseCase:
             order.order_status.status == OrderStatusEnum.ORDER_PLACED.status and
             payment_status == PaymentStatusEnum.PAYMENT_COMPLETED.status
         ):
+            # A chave de idempotência é gravada na mesma transação (e no mesmo commit) do pedido
+            if not self.processed_webhook_gateway.add_processed(payment_id, transaction_id, event):
+                logging.info(f"Webhook duplicado ignorado: payment_id={payment_id}, transaction_id={transaction_id}, event={event}")
+                return
             order.advance_order_status(self.order_status_gateway)
             self.order_repository.update(order)
         else:
@@ -0,0 +1,131 @@
+from typing import Dict, List
+import logging
+
+from src.constants.order_load_profile import OrderLoadProfileEnum
+from src.constants.order_status import OrderStatusEnum
+from src.constants.order_transition import ORDER_PAID_STATUSES
+from src.constants.payment_status import PaymentStatusEnum
+from src.core.domain.entities.order import Order
+from src.core.exceptions.concurrent_update_exception import ConcurrentUpdateException
+from src.core.ports.order.i_order_repository import IOrderRepository
+from src.core.ports.order_status.i_order_status_repository import IOrderStatusRepository
+from src.core.ports.webhook.i_payment_webhook_inbox_repository import IPaymentWebhookInboxRepository
+
+PAID_STATUSES = {order_status.status for order_status in ORDER_PAID_STATUSES}
+
+
+class ApprovePaymentBatchUseCase:
+    """
+    Applies a batch of payment webhook deliveries taken from the inbox.
+
+    The orders of the whole batch are loaded with one ``payment_id IN (...)`` query and every order advanced to
+    ``ORDER_PAID`` is written in a single transaction. Deliveries for orders that are already paid are acknowledged
+    as no-ops, deliveries that can never apply (payment not completed) are discarded, and the rest are retried.
+
+    A version conflict rolls back the whole batch write; the advanced orders are then redone one at a time on a
+    fresh copy, and the deliveries of an order that conflicts again go back to the inbox without counting an attempt.
+    """
+
+    def __init__(
+        self,
+        order_gateway: IOrderRepository,
+        order_status_gateway: IOrderStatusRepository,
+        inbox_gateway: IPaymentWebhookInboxRepository
+    ):
+        self.order_repository = order_gateway
+        self.order_status_gateway = order_status_gateway
+        self.inbox_gateway = inbox_gateway
+
+    @classmethod
+    def build(
+        cls,
+        order_gateway: IOrderRepository,
+        order_status_gateway: IOrderStatusRepository,
+        inbox_gateway: IPaymentWebhookInboxRepository
+    ) -> 'ApprovePaymentBatchUseCase':
+        return cls(order_gateway, order_status_gateway, inbox_gateway)
+
+    def execute(self, limit: int) -> int:
+        """Processes up to ``limit`` pending deliveries and returns how many were taken from the inbox."""
+        events = self.inbox_gateway.fetch_pending(limit)
+        if not events:
+            return 0
+
+        orders: Dict[str, Order] = {
+            order.payment_id: order
+            for order in self.order_repository.get_by_payment_ids(
+                [event.payment_id for event in events], profile=OrderLoadProfileEnum.WITH_ITEMS
+            )
+        }
+
+        processed: List[int] = []
+        discarded: Dict[int, str] = {}
+        failed: Dict[int, str] = {}
+        advanced: Dict[int, List[int]] = {}
+
+        for event in events:
+            if event.payment_status != PaymentStatusEnum.PAYMENT_COMPLETED.status:
+                discarded[event.id] = f"Payment with ID {event.payment_id} is not completed."
+                continue
+
+            order = orders.get(event.payment_id)
+            if order is None:
+                failed[event.id] = f"Order with payment ID {event.payment_id} not found."
+                continue
+
+            # Reentrega (ou entrega repetida no mesmo lote) de um pedido já pago
+            if order.order_status.status in PAID_STATUSES:
+                (advanced[order.id] if order.id in advanced else processed).append(event.id)
+                continue
+
+            if order.order_status.status != OrderStatusEnum.ORDER_PLACED.status:
+                failed[event.id] = f"Order with ID {order.id} is not in the 'ORDER_PLACED' status."
+                continue
+
+            try:
+                order.advance_order_status(self.order_status_gateway)
+            except Exception as exc:
+                failed[event.id] = str(exc)
+                continue
+            advanced[order.id] = [event.id]
+
+        if advanced:
+            orders_by_id = {order.id: order for order in orders.values()}
+            try:
+                self.order_repository.update_many([orders_by_id[order_id] for order_id in advanced])
+            except ConcurrentUpdateException:
+                # O conflito é de um pedido só, e não das entregas: cada pedido é refeito sozinho
+                for order_id, event_ids in advanced.items():
+                    self._retry_order(order_id, event_ids, processed, failed)
+            except Exception as exc:
+                logging.exception("Falha ao gravar o lote de pedidos pagos")
+                failed.update({event_id: str(exc) for event_ids in advanced.values() for event_id in event_ids})
+            else:
+                processed.extend(event_id for event_ids in advanced.values() for event_id in event_ids)
+
+        self.inbox_gateway.mark_processed(processed)
+        self.inbox_gateway.mark_discarded(discarded)
+        self.inbox_gateway.mark_failed(failed)
+        return len(events)
+
+    def _retry_order(self, order_id: int, event_ids: List[int], processed: List[int], failed: Dict[int, str]) -> None:
+        """Advances the order alone from its current version, after the batch write was rolled back by a conflict."""
+        try:
+            order = self.order_repository.get_by_id(order_id, profile=OrderLoadProfileEnum.WITH_ITEMS)
+            if order.order_status.status not in PAID_STATUSES:
+                if order.order_status.status != OrderStatusEnum.ORDER_PLACED.status:
+                    failed.update({
+                        event_id: f"Order with ID {order.id} is not in the 'ORDER_PLACED' status."
+                        for event_id in event_ids
+                    })
+                    return
+                order.advance_order_status(self.order_status_gateway)
+                self.order_repository.update(order)
+        except ConcurrentUpdateException:
+            # Conflitou de novo: as entregas ficam pendentes, sem tentativa contada, e voltam no próximo lote
+            logging.info("Pedido %s alterado concorrentemente; entregas devolvidas ao inbox", order_id)
+            return
+        except Exception as exc:
+            failed.update({event_id: str(exc) for event_id in event_ids})
+            return
+        processed.extend(event_ids)
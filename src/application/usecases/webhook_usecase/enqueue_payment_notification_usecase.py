@@ -0,0 +1,34 @@
+from src.core.domain.dtos.webhook.payment_webhook_dto import PaymentWebhookDTO
+from src.core.ports.webhook.i_payment_webhook_inbox_repository import IPaymentWebhookInboxRepository
+from src.core.ports.webhook.i_processed_webhook_repository import IProcessedWebhookRepository
+import logging
+
+
+class EnqueuePaymentNotificationUseCase:
+    def __init__(
+        self,
+        inbox_gateway: IPaymentWebhookInboxRepository,
+        processed_webhook_gateway: IProcessedWebhookRepository
+    ):
+        self.inbox_gateway = inbox_gateway
+        self.processed_webhook_gateway = processed_webhook_gateway
+
+    @classmethod
+    def build(
+        cls,
+        inbox_gateway: IPaymentWebhookInboxRepository,
+        processed_webhook_gateway: IProcessedWebhookRepository
+    ) -> 'EnqueuePaymentNotificationUseCase':
+        return cls(inbox_gateway, processed_webhook_gateway)
+
+    def execute(self, dto: PaymentWebhookDTO) -> bool:
+        """Stores the delivery in the inbox; returns ``False`` when it was already processed or enqueued."""
+        # Entregas já aplicadas pelo fluxo síncrono não voltam para a fila
+        if self.processed_webhook_gateway.is_processed(dto.payment_id, dto.transaction_id, dto.event):
+            logging.info(f"Webhook duplicado ignorado: payment_id={dto.payment_id}, transaction_id={dto.transaction_id}, event={dto.event}")
+            return False
+
+        if not self.inbox_gateway.enqueue(dto):
+            logging.info(f"Webhook já enfileirado: payment_id={dto.payment_id}, transaction_id={dto.transaction_id}, event={dto.event}")
+            return False
+        return True
@@ -0,0 +1,22 @@
+from enum import Enum
+
+class CircuitStateEnum(Enum):
+    CLOSED = ("closed", 0, "Calls flow to the dependency; consecutive failures are counted.")
+    OPEN = ("open", 1, "Calls are rejected without reaching the dependency until the recovery timeout elapses.")
+    HALF_OPEN = ("half_open", 2, "A limited number of probe calls decide whether the circuit closes or reopens.")
+
+    @property
+    def state(self):
+        return self.value[0]
+
+    @property
+    def metric_value(self):
+        return self.value[1]
+
+    @property
+    def description(self):
+        return self.value[2]
+
+    @classmethod
+    def values_and_descriptions(cls):
+        return [{"name": member.state, "description": member.description} for member in cls]
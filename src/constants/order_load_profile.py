@@ -0,0 +1,26 @@
+from enum import Enum
+
+class OrderLoadProfileEnum(Enum):
+    SUMMARY = ("summary", "Order and its current status only.")
+    WITH_ITEMS = ("with_items", "Order, current status and order items.")
+    FULL_HISTORY = ("full_history", "Order, current status, order items and the full status history.")
+
+    @property
+    def profile(self):
+        return self.value[0]
+
+    @property
+    def description(self):
+        return self.value[1]
+
+    @property
+    def loads_items(self) -> bool:
+        return self in (OrderLoadProfileEnum.WITH_ITEMS, OrderLoadProfileEnum.FULL_HISTORY)
+
+    @property
+    def loads_history(self) -> bool:
+        return self is OrderLoadProfileEnum.FULL_HISTORY
+
+    @classmethod
+    def values_and_descriptions(cls):
+        return [{"profile": member.profile, "description": member.description} for member in cls]
@@ -45,3 +45,21 @@ ORDER_STATUSES_ALLOWING_REVERSAL_TRANSITIONS = [
     OrderStatusEnum.ORDER_WAITING_DESSERTS,
     OrderStatusEnum.ORDER_READY_TO_PLACE,
 ]
+
+# Prioridade dos pedidos na listagem (menor valor aparece primeiro); os demais status usam a prioridade padrão
+ORDER_STATUS_LIST_PRIORITY = {
+    OrderStatusEnum.ORDER_PAID: 1,
+    OrderStatusEnum.ORDER_PREPARING: 2,
+    OrderStatusEnum.ORDER_READY: 3,
+    OrderStatusEnum.ORDER_COMPLETED: 4,
+}
+
+DEFAULT_ORDER_LIST_PRIORITY = 5
+
+# Status em que o pagamento do pedido já foi confirmado
+ORDER_PAID_STATUSES = [
+    OrderStatusEnum.ORDER_PAID,
+    OrderStatusEnum.ORDER_PREPARING,
+    OrderStatusEnum.ORDER_READY,
+    OrderStatusEnum.ORDER_COMPLETED,
+]
@@ -0,0 +1,18 @@
+from enum import Enum
+
+class PaymentOutboxStatusEnum(Enum):
+    PENDING = ("pending", "The payment request is waiting to be sent to the payment service.")
+    DISPATCHED = ("dispatched", "The payment was created by the payment service.")
+    FAILED = ("failed", "The payment request was given up after the last attempt.")
+
+    @property
+    def status(self):
+        return self.value[0]
+
+    @property
+    def description(self):
+        return self.value[1]
+
+    @classmethod
+    def values_and_descriptions(cls):
+        return [{"name": member.status, "description": member.description} for member in cls]
@@ -186,3 +186,7 @@ class PersonPermissions(BasePermissionEnum):
     CAN_VIEW_PERSONS = ("can_view_persons", "Permission to view all persons")
     CAN_UPDATE_PERSON = ("can_update_person", "Permission to update a person")
     CAN_DELETE_PERSON = ("can_delete_person", "Permission to delete a person")
+
+class DiagnosticsPermissions(BasePermissionEnum):
+    CAN_VIEW_SLOW_QUERIES = ("can_view_slow_queries", "Permission to view the slow query log")
+    CAN_RESET_SLOW_QUERIES = ("can_reset_slow_queries", "Permission to reset the slow query log")
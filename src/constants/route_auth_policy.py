@@ -0,0 +1,18 @@
+from enum import Enum
+
+class RouteAuthPolicyEnum(Enum):
+    PUBLIC = ("public", "No authentication is required.")
+    BEARER = ("bearer", "A JWT bearer token is required in the Authorization header.")
+    API_KEY = ("api_key", "The service API key is required in the `api_key` query parameter.")
+
+    @property
+    def policy(self):
+        return self.value[0]
+
+    @property
+    def description(self):
+        return self.value[1]
+
+    @classmethod
+    def values_and_descriptions(cls):
+        return [{"policy": member.policy, "description": member.description} for member in cls]
@@ -1,11 +1,24 @@
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import SecurityScopes
 from src.core.exceptions.forbidden_exception import ForbiddenException
-from src.core.utils.jwt_util import JWTUtil
 from src.core.auth.oauth2 import oauth2_scheme
+from src.core.auth.verified_token_cache import verified_token_cache
 
-def get_current_user(security_scopes: SecurityScopes, token: str = Depends(oauth2_scheme)):
-    payload = JWTUtil.decode_token(token)
+def get_verified_claims(request: Request, token: str) -> dict:
+    """
+    Returns the verified claims of the request, decoding the token at most once per request.
+
+    AuthMiddleware stores the claims in ``request.state.user``; every later call (one per `Security`/`Depends`
+    occurrence in the route) reuses them.
+    """
+    payload = getattr(request.state, "user", None)
+    if payload is None:
+        payload = verified_token_cache.verify(token)
+        request.state.user = payload
+    return payload
+
+def get_current_user(request: Request, security_scopes: SecurityScopes, token: str = Depends(oauth2_scheme)):
+    payload = get_verified_claims(request, token)
     permissions = payload.get("profile", {}).get("permissions", [])
 
     for scope in security_scopes.scopes:
@@ -0,0 +1,67 @@
+import copy
+import hashlib
+import time
+from typing import Callable, Dict, Optional
+
+from config.settings import JWT_CACHE_MAX_ENTRIES, JWT_CACHE_TTL
+from src.core.shared.ttl_cache import TTLCache
+from src.core.utils.jwt_util import JWTUtil
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of JWT claims whose signature was already verified.
+
+    Entries are keyed by the SHA-256 of the token (the raw token is never kept) and live for ``ttl`` seconds at
+    most, never beyond the token's ``exp``. Each caller gets its own copy of the claims.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[TTLCache] = None,
+        ttl: float = JWT_CACHE_TTL,
+        clock: Callable[[], float] = time.time,
+    ):
+        if cache is None:
+            cache = TTLCache(max_entries=JWT_CACHE_MAX_ENTRIES, ttl=ttl)
+        self._cache = cache
+        self._ttl = ttl
+        self._clock = clock
+
+    def verify(self, token: str) -> dict:
+        """Returns the claims of the token, verifying its signature only on a cache miss."""
+        key = hashlib.sha256(token.encode()).hexdigest()
+        payload = self._cache.get(key)
+        if payload is not None and self._is_expired(payload):
+            self._cache.delete(key)
+            payload = None
+
+        if payload is None:
+            payload = JWTUtil.decode_token(token)
+            ttl = self._ttl_for(payload)
+            if ttl > 0:
+                self._cache.set(key, payload, ttl=ttl)
+
+        return copy.deepcopy(payload)
+
+    def stats(self) -> Dict[str, int]:
+        return self._cache.stats()
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def _ttl_for(self, payload: dict) -> float:
+        exp = payload.get("exp")
+        if exp is None:
+            return self._ttl
+        return min(self._ttl, float(exp) - self._clock())
+
+    def _is_expired(self, payload: dict) -> bool:
+        exp = payload.get("exp")
+        return exp is not None and float(exp) <= self._clock()
+
+
+verified_token_cache = VerifiedTokenCache()
+
+
+__all__ = ["VerifiedTokenCache", "verified_token_cache"]
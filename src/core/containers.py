@@ -1,16 +1,38 @@
+from operator import attrgetter
+
 from dependency_injector import containers, providers
 
-from config.database import get_db
+from config.database import AsyncSessionLocal, SessionLocal
+from config.settings import WEBHOOK_IDEMPOTENCY_CACHE_MAX_ENTRIES, WEBHOOK_IDEMPOTENCY_TTL
+from src.core.shared.database_session_scope import AsyncDatabaseSessionScope, DatabaseSessionScope
 from src.core.shared.identity_map import IdentityMap
+from src.core.shared.order_status_registry import OrderStatusRegistry
+from src.core.shared.ttl_cache import TTLCache
 from src.adapters.driven.repositories.order_status_repository import OrderStatusRepository
 from src.adapters.driver.api.v1.controllers.order_status_controller import OrderStatusController
 from src.adapters.driver.api.v1.controllers.webhook_controller import WebhookController
 from src.adapters.driven.repositories.order_repository import OrderRepository
 from src.adapters.driver.api.v1.controllers.order_controller import OrderController
 from src.adapters.driven.repositories.order_item_repository import OrderItemRepository
+from src.adapters.driven.repositories.processed_webhook_repository import ProcessedWebhookRepository
+from src.adapters.driven.repositories.payment_webhook_inbox_repository import PaymentWebhookInboxRepository
+from src.adapters.driven.repositories.payment_outbox_repository import PaymentOutboxRepository
+from src.adapters.driven.repositories.async_order_repository import AsyncOrderRepository
+from src.adapters.driven.repositories.async_order_item_repository import AsyncOrderItemRepository
+from src.adapters.driven.repositories.async_order_status_repository import AsyncOrderStatusRepository
 from src.adapters.driver.api.v1.controllers.order_item_controller import OrderItemController
 from src.adapters.driven.providers.stock_provider.stock_microservice_gateway import StockMicroserviceGateway
+from src.adapters.driven.providers.stock_provider.stock_http_client import create_stock_http_client
+from src.adapters.driven.providers.stock_provider.cached_stock_provider_gateway import CachedStockProviderGateway
+from src.adapters.driven.providers.stock_provider.resilient_stock_provider_gateway import (
+    ResilientStockProviderGateway,
+    create_stock_resilience_policy,
+)
 from src.adapters.driven.providers.payment_provider.payment_provider_gateway import PaymentProviderGateway
+from src.adapters.driven.providers.payment_provider.resilient_payment_provider_gateway import (
+    ResilientPaymentProviderGateway,
+    create_payment_resilience_policy,
+)
 
 class Container(containers.DeclarativeContainer):
 
@@ -27,37 +49,97 @@ class Container(containers.DeclarativeContainer):
         "src.adapters.driven.providers.payment_provider.payment_provider_gateway",
     ])
     
-    identity_map = providers.Singleton(IdentityMap)
+    identity_map = providers.ContextLocalSingleton(IdentityMap)
+    order_status_registry = providers.Singleton(OrderStatusRegistry)
+    # LRU das entregas de webhook já processadas, compartilhado entre as requisições
+    processed_webhook_cache = providers.Singleton(
+        TTLCache,
+        max_entries=WEBHOOK_IDEMPOTENCY_CACHE_MAX_ENTRIES,
+        ttl=WEBHOOK_IDEMPOTENCY_TTL
+    )
 
-    db_session = providers.Resource(get_db)
+    # Sessão por requisição: aberta no primeiro uso e fechada pelo DbSessionMiddleware ao fim da resposta
+    db_session_scope = providers.ContextLocalSingleton(
+        DatabaseSessionScope,
+        session_factory=providers.Object(SessionLocal)
+    )
+    db_session = providers.Callable(attrgetter("session"), db_session_scope)
+    # Sessão assíncrona por requisição, com o mesmo ciclo de vida, usada pelas rotas que não bloqueiam o event loop
+    async_session_factory = providers.Object(AsyncSessionLocal)
+    async_db_session_scope = providers.ContextLocalSingleton(
+        AsyncDatabaseSessionScope,
+        session_factory=async_session_factory
+    )
+    async_db_session = providers.Callable(attrgetter("session"), async_db_session_scope)
 
-    stock_provider_gateway = providers.Singleton(StockMicroserviceGateway)
-    payment_provider_gateway = providers.Singleton(PaymentProviderGateway)
+    stock_http_client = providers.Singleton(create_stock_http_client)
+    stock_microservice_gateway = providers.Singleton(StockMicroserviceGateway, http_client=stock_http_client)
+    # Bulkhead, circuit breaker e retentativas por dependência, compartilhados por todas as requisições
+    stock_resilience_policy = providers.Singleton(create_stock_resilience_policy)
+    payment_resilience_policy = providers.Singleton(create_payment_resilience_policy)
+    resilient_stock_gateway = providers.Singleton(
+        ResilientStockProviderGateway,
+        gateway=stock_microservice_gateway,
+        policy=stock_resilience_policy
+    )
+    stock_provider_gateway = providers.Singleton(CachedStockProviderGateway, gateway=resilient_stock_gateway)
+    payment_provider_gateway = providers.Singleton(
+        ResilientPaymentProviderGateway,
+        gateway=providers.Singleton(PaymentProviderGateway),
+        policy=payment_resilience_policy
+    )
 
 
-    order_status_gateway = providers.Factory(OrderStatusRepository, db_session=db_session)
-    order_status_controller = providers.Factory(OrderStatusController, order_status_gateway=order_status_gateway)
+    order_status_gateway = providers.Factory(
+        OrderStatusRepository,
+        db_session=db_session,
+        registry=order_status_registry
+    )
+    async_order_status_gateway = providers.Factory(
+        AsyncOrderStatusRepository,
+        db_session=async_db_session,
+        registry=order_status_registry
+    )
+    order_status_controller = providers.Factory(
+        OrderStatusController,
+        order_status_gateway=order_status_gateway,
+        async_order_status_gateway=async_order_status_gateway
+    )
 
     order_gateway = providers.Factory(OrderRepository, db_session=db_session)
+    async_order_gateway = providers.Factory(AsyncOrderRepository, db_session=async_db_session)
+    payment_outbox_gateway = providers.Factory(PaymentOutboxRepository, db_session=db_session)
     order_controller = providers.Factory(
         OrderController,
         order_gateway=order_gateway,
+        async_order_gateway=async_order_gateway,
         order_status_gateway=order_status_gateway,
         stock_gateway=stock_provider_gateway,
-        payment_gateway=payment_provider_gateway
+        payment_gateway=payment_provider_gateway,
+        payment_outbox_gateway=payment_outbox_gateway
     )
 
+    processed_webhook_gateway = providers.Factory(
+        ProcessedWebhookRepository,
+        db_session=db_session,
+        cache=processed_webhook_cache
+    )
+    payment_webhook_inbox_gateway = providers.Factory(PaymentWebhookInboxRepository, db_session=db_session)
     webhook_controller = providers.Factory(
         WebhookController,
         order_gateway=order_gateway,
         order_status_gateway=order_status_gateway,
-        payment_gateway=payment_provider_gateway
+        payment_gateway=payment_provider_gateway,
+        processed_webhook_gateway=processed_webhook_gateway,
+        payment_webhook_inbox_gateway=payment_webhook_inbox_gateway
     )
 
     order_item_gateway = providers.Factory(OrderItemRepository, db_session=db_session)
+    async_order_item_gateway = providers.Factory(AsyncOrderItemRepository, db_session=async_db_session)
     order_item_controller = providers.Factory(
         OrderItemController,
         order_item_gateway=order_item_gateway,
+        async_order_item_gateway=async_order_item_gateway,
         order_gateway=order_gateway,
         stock_gateway=stock_provider_gateway
     )
@@ -0,0 +1,26 @@
+from typing import Any, List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SlowQueryDTO(BaseModel):
+    """Aggregated timings of one statement fingerprint."""
+    model_config = ConfigDict(extra='forbid')
+
+    fingerprint: str
+    statement: str = Field(..., description="Consulta normalizada: literais e parâmetros substituídos por ?")
+    count: int
+    slow_count: int
+    total_ms: float
+    mean_ms: float
+    p95_ms: float
+    max_ms: float
+    last_seen_at: float
+    explain: Optional[List[Any]] = None
+
+
+class SlowQueryReportDTO(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+
+    threshold_ms: float
+    dropped: int = Field(..., description="Execuções não agregadas por excederem o limite de fingerprints")
+    queries: List[SlowQueryDTO]
@@ -0,0 +1,8 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+from src.core.domain.dtos.order.order_dto import OrderDTO
+
+class OrderPageDTO(BaseModel):
+    items: List[OrderDTO]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,10 @@
+from typing import List
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.core.domain.dtos.order_item.create_order_item_dto import CreateOrderItemDTO
+
+class CreateOrderItemsDTO(BaseModel):
+
+    model_config = ConfigDict(extra='forbid')
+
+    items: List[CreateOrderItemDTO] = Field(..., min_length=1, max_length=50)
@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+from src.core.domain.entities.order_status_movement import OrderStatusMovement
+
+class OrderStatusMovementDTO(BaseModel):
+    id: int
+    old_status: Optional[str] = None
+    new_status: str
+    changed_by: Optional[str] = None
+    changed_at: datetime
+
+    @classmethod
+    def from_entity(cls, movement: OrderStatusMovement) -> "OrderStatusMovementDTO":
+        return cls(
+            id=movement.id,
+            old_status=movement.old_status,
+            new_status=movement.new_status,
+            changed_by=movement.changed_by,
+            changed_at=movement.changed_at,
+        )
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -90,4 +92,9 @@ class CreatePaymentDTO(BaseModel):
             "name": "João da Silva",
             "email": ""
         }
+    )
+    idempotency_key: Optional[str] = Field(
+        default=None,
+        description="Chave enviada no cabeçalho Idempotency-Key: repetições com a mesma chave devolvem o mesmo pagamento",
+        example="order-12345-v3",
     )
\ No newline at end of file
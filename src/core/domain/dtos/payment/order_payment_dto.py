@@ -0,0 +1,29 @@
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.core.domain.entities.payment_outbox_entry import PaymentOutboxEntry
+
+
+class OrderPaymentDTO(BaseModel):
+    """Payment of an order created through the outbox; ``qr_code`` is set once the status is ``dispatched``."""
+    model_config = ConfigDict(str_strip_whitespace=True, extra='forbid')
+
+    order_id: int
+    status: str = Field(..., description="Situação da solicitação de pagamento: pending, dispatched ou failed")
+    payment_id: Optional[str] = None
+    qr_code: Optional[str] = None
+    transaction_id: Optional[str] = None
+    attempts: int = 0
+    last_error: Optional[str] = None
+
+    @classmethod
+    def from_entity(cls, entry: PaymentOutboxEntry) -> "OrderPaymentDTO":
+        return cls(
+            order_id=entry.id_order,
+            status=entry.status,
+            payment_id=entry.payment_id,
+            qr_code=entry.qr_code,
+            transaction_id=entry.transaction_id,
+            attempts=entry.attempts,
+            last_error=entry.last_error,
+        )
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any, Set
 import uuid
 
 from src.core.domain.entities.order_status_movement import OrderStatusMovement
@@ -10,6 +10,7 @@ from src.core.domain.entities.order_status import OrderStatus
 from src.core.domain.entities.order_item import OrderItem
 from src.core.exceptions.bad_request_exception import BadRequestException
 from src.constants.order_status import OrderStatusEnum
+from src.core.shared.order_change_tracker import OrderChanges, OrderChangeTracker, TRACKED_RELATIONS
 from .base_entity import BaseEntity
 
 
@@ -20,21 +21,24 @@ class Order(BaseEntity):
         id_customer: str = None,
         id_employee: str = None,
         order_status: Optional[OrderStatus] = None,
-        order_items: List[OrderItem] = [],
-        status_history: Optional[List[OrderStatusMovement]] = [],
+        order_items: Optional[List[OrderItem]] = None,
+        status_history: Optional[List[OrderStatusMovement]] = None,
         id: Optional[int] = None,
         payment_id: Optional[str] = "",
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
         inactivated_at: Optional[datetime] = None,
+        version: Optional[int] = None,
     ):
         super().__init__(id, created_at, updated_at, inactivated_at)
         self.id_customer = id_customer
         self.id_employee = id_employee
         self.order_status = order_status
-        self.order_items = order_items
-        self.status_history = status_history
+        self.order_items = order_items if order_items is not None else []
+        self.status_history = status_history if status_history is not None else []
         self.payment_id = payment_id
+        self.version = version
+        self._change_tracker = OrderChangeTracker()
         
         initial_status = OrderStatusMovement(
             order=self,
@@ -69,6 +73,15 @@ class Order(BaseEntity):
     def payment_id(self, value: Optional[str]) -> None:
         self._payment_id = value
 
+    @property
+    def version(self) -> Optional[int]:
+        """Version of the persisted order this entity was loaded from; ``None`` until the order is saved."""
+        return self._version
+
+    @version.setter
+    def version(self, value: Optional[int]) -> None:
+        self._version = value
+
     @property
     def order_status(self) -> OrderStatus:
         return self._order_status
@@ -111,9 +124,7 @@ class Order(BaseEntity):
 
     @property
     def total(self) -> float:
-        if not hasattr(self, "_total"):
-            self._total = sum(item.total for item in self.order_items)
-        return self._total
+        return sum(item.total for item in self.order_items)
         
     '''
     @property
@@ -123,6 +134,35 @@ class Order(BaseEntity):
         return False
     '''
 
+    def mark_clean(self, relations: Iterable[str] = TRACKED_RELATIONS, fields: bool = True) -> None:
+        '''
+        Records the current state as the persisted one; later changes are reported by `collect_changes`.
+
+        :param relations: The relations that were loaded and must be tracked as well.
+        :param fields: Whether the order's own columns are recorded too.
+        '''
+        self._change_tracker.snapshot(self, relations, fields)
+
+    @property
+    def is_tracked(self) -> bool:
+        return self._change_tracker.is_tracking
+
+    @property
+    def unloaded_relations(self) -> Set[str]:
+        '''
+        Relations the order was loaded without (see `OrderLoadProfileEnum`); they are filled in when a richer
+        profile loads the same order again.
+        '''
+        return self._change_tracker.unloaded_relations
+
+    def collect_changes(self) -> Optional[OrderChanges]:
+        '''
+        Returns the rows changed since the last `mark_clean`, or None if the order was never marked clean.
+        '''
+        if not self.is_tracked:
+            return None
+        return self._change_tracker.diff(self)
+
     def _validate_status(self, valid_statuses: List[OrderStatusEnum], action: str) -> None:
         '''
         Validates if the current status of the order is in the list of valid statuses.
@@ -240,6 +280,23 @@ class Order(BaseEntity):
         self.order_items.append(item)
         self._sort_order_items()
 
+    def add_items(self, items: Iterable[OrderItem]) -> None:
+        '''
+        Adds several items of the current step at once.
+
+        The order is built one category per step (burgers, sides, drinks, desserts), as with ``add_item``: every item
+        must belong to the category of the current status, so a batch mixing categories (e.g. a burger and a drink)
+        is rejected as a whole. Every item is validated before any of them is added, and the items are sorted only
+        once.
+        '''
+        items = list(items)
+        self._validate_status([*PRODUCT_CATEGORY_TO_ORDER_STATUS.values()], "adicionar itens")
+        for item in items:
+            self._validate_category_for_status(item.product_category_name)
+
+        self.order_items.extend(items)
+        self._sort_order_items()
+
     def remove_item(self, order_item: OrderItem) -> None:
         self._validate_status([*PRODUCT_CATEGORY_TO_ORDER_STATUS.values()], "remover itens")
         if order_item.quantity > 1:
@@ -0,0 +1,124 @@
+from typing import Any, Dict, Optional
+from datetime import datetime
+from src.constants.payment_outbox_status import PaymentOutboxStatusEnum
+from src.core.domain.entities.base_entity import BaseEntity
+
+class PaymentOutboxEntry(BaseEntity):
+    """Payment creation request written with the order and sent to the payment service by the outbox dispatcher."""
+
+    def __init__(
+        self,
+        id_order: int,
+        payload: Dict[str, Any],
+        status: str = PaymentOutboxStatusEnum.PENDING.status,
+        attempts: int = 0,
+        next_attempt_at: Optional[datetime] = None,
+        payment_id: Optional[str] = None,
+        qr_code: Optional[str] = None,
+        transaction_id: Optional[str] = None,
+        last_error: Optional[str] = None,
+        dispatched_at: Optional[datetime] = None,
+        id: Optional[int] = None,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+        inactivated_at: Optional[datetime] = None,
+    ):
+        super().__init__(id, created_at, updated_at, inactivated_at)
+        self.id_order = id_order
+        self.payload = payload
+        self.status = status
+        self.attempts = attempts
+        self.next_attempt_at = next_attempt_at
+        self.payment_id = payment_id
+        self.qr_code = qr_code
+        self.transaction_id = transaction_id
+        self.last_error = last_error
+        self.dispatched_at = dispatched_at
+
+    @property
+    def is_pending(self) -> bool:
+        return self.status == PaymentOutboxStatusEnum.PENDING.status
+
+    # getters and setters
+    @property
+    def id_order(self) -> int:
+        return self._id_order
+
+    @id_order.setter
+    def id_order(self, value: int) -> None:
+        self._id_order = value
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        return self._payload
+
+    @payload.setter
+    def payload(self, value: Dict[str, Any]) -> None:
+        self._payload = value
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @status.setter
+    def status(self, value: str) -> None:
+        self._status = value
+
+    @property
+    def attempts(self) -> int:
+        return self._attempts
+
+    @attempts.setter
+    def attempts(self, value: int) -> None:
+        self._attempts = value
+
+    @property
+    def next_attempt_at(self) -> Optional[datetime]:
+        return self._next_attempt_at
+
+    @next_attempt_at.setter
+    def next_attempt_at(self, value: Optional[datetime]) -> None:
+        self._next_attempt_at = value
+
+    @property
+    def payment_id(self) -> Optional[str]:
+        return self._payment_id
+
+    @payment_id.setter
+    def payment_id(self, value: Optional[str]) -> None:
+        self._payment_id = value
+
+    @property
+    def qr_code(self) -> Optional[str]:
+        return self._qr_code
+
+    @qr_code.setter
+    def qr_code(self, value: Optional[str]) -> None:
+        self._qr_code = value
+
+    @property
+    def transaction_id(self) -> Optional[str]:
+        return self._transaction_id
+
+    @transaction_id.setter
+    def transaction_id(self, value: Optional[str]) -> None:
+        self._transaction_id = value
+
+    @property
+    def last_error(self) -> Optional[str]:
+        return self._last_error
+
+    @last_error.setter
+    def last_error(self, value: Optional[str]) -> None:
+        self._last_error = value
+
+    @property
+    def dispatched_at(self) -> Optional[datetime]:
+        return self._dispatched_at
+
+    @dispatched_at.setter
+    def dispatched_at(self, value: Optional[datetime]) -> None:
+        self._dispatched_at = value
+
+
+__all__ = ["PaymentOutboxEntry"]
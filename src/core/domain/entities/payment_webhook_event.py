@@ -0,0 +1,89 @@
+from typing import Optional
+from datetime import datetime
+from src.core.domain.entities.base_entity import BaseEntity
+
+class PaymentWebhookEvent(BaseEntity):
+    """Payment webhook delivery stored in the inbox, waiting to be applied by the background worker."""
+
+    def __init__(
+        self,
+        payment_id: str,
+        transaction_id: str,
+        event: str,
+        payment_status: str,
+        attempts: int = 0,
+        processed_at: Optional[datetime] = None,
+        last_error: Optional[str] = None,
+        id: Optional[int] = None,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+        inactivated_at: Optional[datetime] = None,
+    ):
+        super().__init__(id, created_at, updated_at, inactivated_at)
+        self.payment_id = payment_id
+        self.transaction_id = transaction_id
+        self.event = event
+        self.payment_status = payment_status
+        self.attempts = attempts
+        self.processed_at = processed_at
+        self.last_error = last_error
+
+    # getters and setters
+    @property
+    def payment_id(self) -> str:
+        return self._payment_id
+
+    @payment_id.setter
+    def payment_id(self, value: str) -> None:
+        self._payment_id = value
+
+    @property
+    def transaction_id(self) -> str:
+        return self._transaction_id
+
+    @transaction_id.setter
+    def transaction_id(self, value: str) -> None:
+        self._transaction_id = value
+
+    @property
+    def event(self) -> str:
+        return self._event
+
+    @event.setter
+    def event(self, value: str) -> None:
+        self._event = value
+
+    @property
+    def payment_status(self) -> str:
+        return self._payment_status
+
+    @payment_status.setter
+    def payment_status(self, value: str) -> None:
+        self._payment_status = value
+
+    @property
+    def attempts(self) -> int:
+        return self._attempts
+
+    @attempts.setter
+    def attempts(self, value: int) -> None:
+        self._attempts = value
+
+    @property
+    def processed_at(self) -> Optional[datetime]:
+        return self._processed_at
+
+    @processed_at.setter
+    def processed_at(self, value: Optional[datetime]) -> None:
+        self._processed_at = value
+
+    @property
+    def last_error(self) -> Optional[str]:
+        return self._last_error
+
+    @last_error.setter
+    def last_error(self, value: Optional[str]) -> None:
+        self._last_error = value
+
+
+__all__ = ["PaymentWebhookEvent"]
@@ -0,0 +1,26 @@
+from typing import Optional
+
+from src.core.exceptions.utils import ErrorCode
+from src.core.exceptions.base_exception import BaseDomainException
+
+
+class ConcurrentUpdateException(BaseDomainException):
+    """
+    Raised when an entity is written from a stale version: another request changed it after it was loaded.
+
+    ``retryable`` tells ``retry_on_conflict`` whether the work may be redone on a fresh copy of the entity; it is
+    cleared when the work already had side effects outside the transaction.
+    """
+
+    def __init__(self, entity_name: str, entity_id: int, expected_version: Optional[int] = None, **kwargs):
+        self.entity_name = entity_name
+        self.entity_id = entity_id
+        self.expected_version = expected_version
+        self.retryable = True
+        super().__init__(
+            message=f"{entity_name} '{entity_id}' foi alterado por outra requisição. Tente novamente.",
+            error_code=ErrorCode.CONCURRENT_UPDATE,
+            details={"entity": entity_name, "id": entity_id, "expected_version": expected_version, **kwargs}
+        )
+
+__all__ = ["ConcurrentUpdateException"]
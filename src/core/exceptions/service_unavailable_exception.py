@@ -0,0 +1,25 @@
+from typing import Optional
+
+from src.core.exceptions.utils import ErrorCode
+from src.core.exceptions.base_exception import BaseDomainException
+
+
+class ServiceUnavailableException(BaseDomainException):
+    """Raised when an external dependency is failing, its circuit is open or its concurrency limit is reached."""
+
+    def __init__(
+        self,
+        dependency: str,
+        message: Optional[str] = None,
+        retry_after: Optional[float] = None,
+        **kwargs
+    ):
+        self.dependency = dependency
+        self.retry_after = retry_after
+        super().__init__(
+            message=message or f"O serviço '{dependency}' está indisponível no momento.",
+            error_code=ErrorCode.SERVICE_UNAVAILABLE,
+            details={"dependency": dependency, **kwargs}
+        )
+
+__all__ = ["ServiceUnavailableException"]
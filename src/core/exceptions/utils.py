@@ -11,6 +11,8 @@ class ErrorCode(Enum):
     UNAUTHORIZED = ("UNAUTHORIZED", "Unauthorized.")
     BAD_REQUEST = ("BAD_REQUEST", "Bad request.")
     INTERNAL_SERVER_ERROR = ("INTERNAL_SERVER_ERROR", "Internal server error.")
+    SERVICE_UNAVAILABLE = ("SERVICE_UNAVAILABLE", "A dependency of the service is unavailable.")
+    CONCURRENT_UPDATE = ("CONCURRENT_UPDATE", "The entity was changed by another request.")
 
     def __init__(self, value: str, description: str):
         self._value_ = value
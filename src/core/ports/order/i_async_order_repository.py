@@ -0,0 +1,72 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from src.constants.order_load_profile import OrderLoadProfileEnum
+from src.core.domain.entities.order import Order
+from src.core.shared.order_page_cursor import OrderPageCursor
+from src.core.domain.entities.order_status_movement import OrderStatusMovement
+
+
+class IAsyncOrderRepository(ABC):
+    
+    @abstractmethod
+    async def create(self, order: Order) -> Order:
+        pass
+
+    @abstractmethod
+    async def get_by_customer_id(self, id_customer: int, profile: OrderLoadProfileEnum = OrderLoadProfileEnum.WITH_ITEMS) -> List[Order]:
+        pass
+
+    @abstractmethod
+    async def get_by_employee_id(self, id_employee: int) -> List[Order]:
+        pass
+    
+    @abstractmethod
+    async def get_by_payment_id(self, id_payment: int, profile: OrderLoadProfileEnum = OrderLoadProfileEnum.FULL_HISTORY) -> Order:
+        pass
+
+    @abstractmethod
+    async def get_by_payment_ids(self, payment_ids: List[str], profile: OrderLoadProfileEnum = OrderLoadProfileEnum.WITH_ITEMS) -> List[Order]:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, order_id: int, profile: OrderLoadProfileEnum = OrderLoadProfileEnum.FULL_HISTORY) -> Order:
+        pass
+
+    @abstractmethod
+    async def get_all(
+        self,
+        status: Optional[List[str]],
+        customer_id: Optional[int],
+        include_deleted: Optional[bool],
+        profile: OrderLoadProfileEnum = OrderLoadProfileEnum.WITH_ITEMS,
+        limit: Optional[int] = None,
+        after: Optional[OrderPageCursor] = None,
+    ) -> List[Order]:
+        pass
+
+    @abstractmethod
+    async def get_status_history(self, order_id: int, limit: int = 20, after_id: Optional[int] = None) -> List[OrderStatusMovement]:
+        pass
+
+    @abstractmethod
+    async def update(self, order: Order) -> Order:
+        pass
+
+    @abstractmethod
+    async def update_many(self, orders: List[Order]) -> List[Order]:
+        pass
+
+    @abstractmethod
+    async def delete(self, order: Order) -> None:
+        pass
+
+    async def release(self) -> None:
+        """
+        Ends the current read transaction and returns its connection to the pool; the repository stays usable.
+        Long reads done in steps (e.g. a streamed export) call it between steps.
+        """
+        pass
+
+
+__all__ = ["IAsyncOrderRepository"]
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.core.domain.entities.order_status import OrderStatus
+
+
+class IAsyncOrderStatusRepository(ABC):
+    
+    @abstractmethod
+    async def create(self, order_status: OrderStatus) -> OrderStatus:
+        pass
+
+    @abstractmethod
+    async def exists_by_status(self, status: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_by_status(self, status: str) -> OrderStatus:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, order_status_id: int) -> OrderStatus:
+        pass
+
+    @abstractmethod
+    async def get_all(self, include_deleted: bool = False) -> List[OrderStatus]:
+        pass
+
+    @abstractmethod
+    async def update(self, order_status: OrderStatus) -> OrderStatus:
+        pass
+
+    @abstractmethod
+    async def delete(self, order_status: OrderStatus) -> None:
+        pass
+
+
+__all__ = ["IAsyncOrderStatusRepository"]
@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from src.core.domain.entities.payment_outbox_entry import PaymentOutboxEntry
+
+
+class IPaymentOutboxRepository(ABC):
+    """
+    Outbox of the payment creation requests.
+
+    ``add`` and ``mark_dispatched`` only stage their rows in the current transaction, so they are committed together
+    with the order write that follows them (and never without it).
+    """
+
+    @abstractmethod
+    def add(self, entry: PaymentOutboxEntry) -> PaymentOutboxEntry:
+        """Stages a new payment request in the current transaction."""
+        pass
+
+    @abstractmethod
+    def get_by_order_id(self, order_id: int) -> Optional[PaymentOutboxEntry]:
+        """Returns the latest payment request of the order, read from the database."""
+        pass
+
+    @abstractmethod
+    def claim_due(self, limit: int, lease_seconds: float) -> List[PaymentOutboxEntry]:
+        """
+        Reserves up to ``limit`` pending requests whose next attempt is due, counting the attempt.
+
+        A reserved request is hidden from other dispatchers for ``lease_seconds``; if it is not dispatched nor
+        rescheduled by then (the dispatcher died), it becomes due again.
+        """
+        pass
+
+    @abstractmethod
+    def mark_dispatched(self, entry: PaymentOutboxEntry, payment: Dict[str, Any]) -> None:
+        """Stages the created payment (payment_id, qr_code, transaction_id) in the current transaction."""
+        pass
+
+    @abstractmethod
+    def reschedule(self, entry: PaymentOutboxEntry, error: str, next_attempt_at: datetime) -> None:
+        """Records a failed attempt and when the request must be retried."""
+        pass
+
+    @abstractmethod
+    def mark_failed(self, entry: PaymentOutboxEntry, error: str) -> None:
+        """Gives up on the request."""
+        pass
@@ -1,34 +1,49 @@
-from typing import Dict, List, Any
+import asyncio
+from typing import Dict, Iterable, List, Any
 from abc import ABC, abstractmethod
 
 
 class IStockProviderGateway(ABC):
     @abstractmethod
-    def get_product_by_id(self, product_id: str) -> Dict[str, Any]:
+    async def get_product_by_id(self, product_id: str) -> Dict[str, Any]:
         """Retrieve a product by its ID."""
         pass
 
+    async def get_products_by_ids(self, product_ids: Iterable[int | str]) -> List[Dict[str, Any]]:
+        """
+        Retrieve several products at once, in the order of ``product_ids`` (repeated IDs are fetched once).
+
+        Lookups run concurrently through ``get_product_by_id``, so caching and resilience decorators apply to each
+        product; gateways backed by a batch endpoint may override it. Raises ``EntityNotFoundException`` if any
+        product does not exist.
+        """
+        product_ids = list(product_ids)
+        unique_ids = list(dict.fromkeys(product_ids))
+        products = await asyncio.gather(*(self.get_product_by_id(product_id) for product_id in unique_ids))
+        products_by_id = dict(zip(unique_ids, products))
+        return [products_by_id[product_id] for product_id in product_ids]
+
     @abstractmethod
-    def get_products_by_category_name(self, category_id: str) -> List[Dict[str, Any]]:
+    async def get_products_by_category_name(self, category_id: str) -> List[Dict[str, Any]]:
         """Retrieve products by their category."""
         pass
 
     @abstractmethod
-    def get_product_by_name(self, name: str) -> Dict[str, Any]:
+    async def get_product_by_name(self, name: str) -> Dict[str, Any]:
         """Retrieve a product by its name."""
         pass
 
     @abstractmethod
-    def get_categories(self) -> List[Dict[str, Any]]:
+    async def get_categories(self) -> List[Dict[str, Any]]:
         """Retrieve all available categories."""
         pass
 
     @abstractmethod
-    def get_category_by_id(self, category_id: str) -> Dict[str, Any]:
+    async def get_category_by_id(self, category_id: str) -> Dict[str, Any]:
         """Retrieve a category by its ID."""
         pass
 
     @abstractmethod
-    def get_category_by_name(self, category_name: str) -> Dict[str, Any]:
+    async def get_category_by_name(self, category_name: str) -> Dict[str, Any]:
         """Retrieve a category by its name."""
         pass
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+from src.core.domain.dtos.webhook.payment_webhook_dto import PaymentWebhookDTO
+from src.core.domain.entities.payment_webhook_event import PaymentWebhookEvent
+
+
+class IPaymentWebhookInboxRepository(ABC):
+    """
+    Inbox of the payment webhook deliveries accepted by the API and not yet applied to the orders,
+    keyed by payment_id + transaction_id + event.
+    """
+
+    @abstractmethod
+    def enqueue(self, dto: PaymentWebhookDTO) -> bool:
+        """
+        Stores the delivery in the inbox.
+
+        Returns:
+            bool: ``False`` when a delivery with the same key is already in the inbox.
+        """
+        pass
+
+    @abstractmethod
+    def fetch_pending(self, limit: int) -> List[PaymentWebhookEvent]:
+        """Returns up to ``limit`` pending deliveries, oldest first."""
+        pass
+
+    @abstractmethod
+    def mark_processed(self, event_ids: List[int]) -> None:
+        """Marks the deliveries as applied."""
+        pass
+
+    @abstractmethod
+    def mark_discarded(self, errors: Dict[int, str]) -> None:
+        """Marks the deliveries as done without being applied, recording why (event id -> reason)."""
+        pass
+
+    @abstractmethod
+    def mark_failed(self, errors: Dict[int, str]) -> None:
+        """Records a failed attempt of each delivery (event id -> error); they are retried until the attempt limit."""
+        pass
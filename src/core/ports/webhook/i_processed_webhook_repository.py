@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+
+class IProcessedWebhookRepository(ABC):
+    """
+    Idempotency store of the payment webhook deliveries already processed, keyed by
+    payment_id + transaction_id + event.
+    """
+
+    @abstractmethod
+    def is_processed(self, payment_id: str, transaction_id: str, event: str) -> bool:
+        """Returns whether this delivery was already processed (and its key has not expired)."""
+        pass
+
+    @abstractmethod
+    def add_processed(self, payment_id: str, transaction_id: str, event: str) -> bool:
+        """
+        Records the delivery as processed in the current transaction, without committing: the key becomes durable
+        with the caller's commit and is undone with its rollback. Must be called before anything else is written in
+        the transaction.
+
+        Returns:
+            bool: ``False`` (with the transaction rolled back) when another delivery with the same key was recorded first.
+        """
+        pass
+
+    @abstractmethod
+    def purge_expired(self, now: Optional[datetime] = None) -> int:
+        """Removes the expired keys and returns how many were removed."""
+        pass
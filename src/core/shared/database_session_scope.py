@@ -0,0 +1,70 @@
+from threading import Lock
+from typing import Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+class DatabaseSessionScope:
+    """
+    Database session of one request (or unit of work).
+
+    The session is only created when a repository first asks for it, and ``close`` returns its connection to the
+    pool. Each request gets its own scope (see ``DbSessionMiddleware``), so concurrent requests use separate pooled
+    connections and transactions instead of sharing a single session.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session]):
+        self._session_factory = session_factory
+        self._session: Optional[Session] = None
+        self._lock = Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._session is not None
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._session_factory()
+        return self._session
+
+    def close(self) -> None:
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+
+class AsyncDatabaseSessionScope:
+    """
+    ``AsyncSession`` of one request, the async counterpart of ``DatabaseSessionScope``.
+
+    The session is only created when an async repository first asks for it, and ``close`` (awaited by
+    ``DbSessionMiddleware`` once the response is sent) returns its connection to the pool. It is only used from the
+    request's event loop, so no lock is needed.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]):
+        self._session_factory = session_factory
+        self._session: Optional[AsyncSession] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._session is not None
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    async def close(self) -> None:
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
+
+
+__all__ = ["AsyncDatabaseSessionScope", "DatabaseSessionScope"]
@@ -1,15 +1,23 @@
 
 from src.core.domain.entities.base_entity import BaseEntity
+from src.core.shared.metrics import IDENTITY_MAP_HITS, IDENTITY_MAP_MISSES
 
 # pattern Identity Map - Martin Fowler
 # https://martinfowler.com/eaaCatalog/identityMap.html
 class IdentityMap:
+    """
+    Mapa de identidade com escopo de contexto (contextvars).
+
+    Cada requisição (task asyncio) enxerga a sua própria instância, de modo que requisições
+    concorrentes não compartilham nem apagam as entidades umas das outras.
+    """
     
     def __init__(self):
         self._entities = {}
         
     @classmethod
     def get_instance(cls) -> "IdentityMap":
+        """Retorna o mapa de identidade do contexto atual, criando-o se necessário."""
         from src.core.containers import Container
         return Container.identity_map()
         
@@ -19,7 +27,12 @@ class IdentityMap:
     
     def get(self, entity_class, entity_id):
         key = (entity_class, entity_id)
-        return self._entities.get(key)
+        entity = self._entities.get(key)
+        if entity is None:
+            IDENTITY_MAP_MISSES.inc()
+        else:
+            IDENTITY_MAP_HITS.inc()
+        return entity
     
     def has(self, entity: BaseEntity):
         key = (entity.__class__, entity.id)
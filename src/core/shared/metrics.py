@@ -0,0 +1,257 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+import inspect
+from time import perf_counter
+from typing import Callable, Dict, Iterator, Optional
+
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency, by route template and status code.",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge("http_requests_in_progress", "HTTP requests currently being served.")
+
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "Number of database queries executed while serving a request.",
+    ["route"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+DB_QUERY_SECONDS_PER_REQUEST = Histogram(
+    "db_query_duration_seconds_per_request",
+    "Time spent in database queries while serving a request.",
+    ["route"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_SESSION_ROUTES = Counter(
+    "db_session_routes_total",
+    "Engine chosen for the statements of the routing session, by target (primary or replica).",
+    ["target"],
+)
+
+GATEWAY_CALL_DURATION = Histogram(
+    "gateway_call_duration_seconds",
+    "Latency of calls to external services, by gateway, operation and outcome.",
+    ["gateway", "operation", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+
+CIRCUIT_BREAKER_STATE = Gauge(
+    "circuit_breaker_state",
+    "Circuit breaker state of each external dependency (0 closed, 1 open, 2 half-open).",
+    ["dependency"],
+)
+CIRCUIT_BREAKER_TRANSITIONS = Counter(
+    "circuit_breaker_transitions_total",
+    "Circuit breaker state transitions, by dependency and new state.",
+    ["dependency", "state"],
+)
+BULKHEAD_IN_FLIGHT = Gauge(
+    "bulkhead_in_flight_calls",
+    "Calls currently in flight to each external dependency.",
+    ["dependency"],
+)
+BULKHEAD_REJECTIONS = Counter(
+    "bulkhead_rejections_total",
+    "Calls rejected because the concurrency limit of the dependency was reached.",
+    ["dependency"],
+)
+GATEWAY_RETRIES = Counter(
+    "gateway_retries_total",
+    "Retries of failed calls to external dependencies, by outcome (retried or budget_exhausted).",
+    ["dependency", "outcome"],
+)
+GATEWAY_STALE_FALLBACKS = Counter(
+    "gateway_stale_fallbacks_total",
+    "Responses served from the last known value because the dependency was unavailable.",
+    ["dependency"],
+)
+SINGLE_FLIGHT_SHARED_CALLS = Counter(
+    "single_flight_shared_calls_total",
+    "Calls that joined an identical call already in flight instead of calling the dependency again.",
+    ["name"],
+)
+OPTIMISTIC_LOCK_CONFLICTS = Counter(
+    "optimistic_lock_conflicts_total",
+    "Writes rejected because the entity changed since it was loaded, by entity and outcome (retried or exhausted).",
+    ["entity", "outcome"],
+)
+
+IDENTITY_MAP_LOOKUPS = Counter(
+    "identity_map_lookups_total",
+    "Identity map lookups, by result (hit or miss).",
+    ["result"],
+)
+IDENTITY_MAP_HITS = IDENTITY_MAP_LOOKUPS.labels(result="hit")
+IDENTITY_MAP_MISSES = IDENTITY_MAP_LOOKUPS.labels(result="miss")
+
+
+@dataclass
+class RequestMetrics:
+    """Database usage accumulated while serving one request."""
+
+    queries: int = 0
+    query_seconds: float = 0.0
+
+
+_request_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar("request_metrics", default=None)
+
+
+@contextmanager
+def track_request_metrics() -> Iterator[RequestMetrics]:
+    """Accumulates the database usage of the current context (one request) in the yielded ``RequestMetrics``."""
+    request_metrics = RequestMetrics()
+    token = _request_metrics.set(request_metrics)
+    try:
+        yield request_metrics
+    finally:
+        _request_metrics.reset(token)
+
+
+def current_request_metrics() -> Optional[RequestMetrics]:
+    return _request_metrics.get()
+
+
+def observe_gateway_call(gateway: str) -> Callable:
+    """Decorator that records the latency of a (sync or async) gateway method in ``gateway_call_duration_seconds``."""
+
+    def decorator(func: Callable) -> Callable:
+        operation = func.__name__
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                started = perf_counter()
+                outcome = "error"
+                try:
+                    result = await func(*args, **kwargs)
+                    outcome = "success"
+                    return result
+                finally:
+                    GATEWAY_CALL_DURATION.labels(gateway, operation, outcome).observe(perf_counter() - started)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started = perf_counter()
+            outcome = "error"
+            try:
+                result = func(*args, **kwargs)
+                outcome = "success"
+                return result
+            finally:
+                GATEWAY_CALL_DURATION.labels(gateway, operation, outcome).observe(perf_counter() - started)
+
+        return wrapper
+
+    return decorator
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._metrics_started_at = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    request_metrics = _request_metrics.get()
+    started_at = getattr(context, "_metrics_started_at", None)
+    if request_metrics is None or started_at is None:
+        return
+    request_metrics.queries += 1
+    request_metrics.query_seconds += perf_counter() - started_at
+
+
+_database_instrumented = False
+
+
+def instrument_database() -> None:
+    """Counts and times every query of every engine (sync and async) for the per-request database metrics."""
+    global _database_instrumented
+    if _database_instrumented:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    _database_instrumented = True
+
+
+class DatabasePoolCollector(Collector):
+    """
+    Exposes the state of the registered connection pools, read at scrape time.
+
+    ``db_pool_saturation`` is the share of the pool capacity (size + max overflow) currently checked out.
+    """
+
+    def __init__(self):
+        self._engines: Dict[str, Engine] = {}
+
+    def register(self, name: str, engine: Engine) -> None:
+        self._engines[name] = engine
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        size = GaugeMetricFamily("db_pool_size", "Configured size of the connection pool.", labels=["pool"])
+        checked_out = GaugeMetricFamily(
+            "db_pool_checked_out", "Connections currently checked out of the pool.", labels=["pool"]
+        )
+        overflow = GaugeMetricFamily("db_pool_overflow", "Connections open beyond the pool size.", labels=["pool"])
+        saturation = GaugeMetricFamily(
+            "db_pool_saturation", "Checked out connections over the pool capacity (0 to 1).", labels=["pool"]
+        )
+
+        for name, engine in self._engines.items():
+            pool = engine.pool
+            if not hasattr(pool, "checkedout"):
+                continue
+            pool_size = pool.size() if hasattr(pool, "size") else 0
+            pool_checked_out = pool.checkedout()
+            capacity = pool_size + max(getattr(pool, "_max_overflow", 0), 0)
+
+            size.add_metric([name], pool_size)
+            checked_out.add_metric([name], pool_checked_out)
+            overflow.add_metric([name], max(pool.overflow(), 0) if hasattr(pool, "overflow") else 0)
+            saturation.add_metric([name], pool_checked_out / capacity if capacity else 0.0)
+
+        yield from (size, checked_out, overflow, saturation)
+
+
+database_pool_collector = DatabasePoolCollector()
+REGISTRY.register(database_pool_collector)
+
+
+__all__ = [
+    "BULKHEAD_IN_FLIGHT",
+    "BULKHEAD_REJECTIONS",
+    "CIRCUIT_BREAKER_STATE",
+    "CIRCUIT_BREAKER_TRANSITIONS",
+    "DB_QUERIES_PER_REQUEST",
+    "DB_QUERY_SECONDS_PER_REQUEST",
+    "DB_SESSION_ROUTES",
+    "GATEWAY_CALL_DURATION",
+    "GATEWAY_RETRIES",
+    "GATEWAY_STALE_FALLBACKS",
+    "HTTP_REQUEST_DURATION",
+    "HTTP_REQUESTS_IN_PROGRESS",
+    "IDENTITY_MAP_HITS",
+    "IDENTITY_MAP_LOOKUPS",
+    "IDENTITY_MAP_MISSES",
+    "OPTIMISTIC_LOCK_CONFLICTS",
+    "SINGLE_FLIGHT_SHARED_CALLS",
+    "DatabasePoolCollector",
+    "RequestMetrics",
+    "current_request_metrics",
+    "database_pool_collector",
+    "instrument_database",
+    "observe_gateway_call",
+    "track_request_metrics",
+]
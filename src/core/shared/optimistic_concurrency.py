@@ -0,0 +1,59 @@
+from functools import wraps
+import inspect
+import logging
+from typing import Callable
+
+from config.settings import ORDER_UPDATE_MAX_ATTEMPTS
+from src.core.exceptions.concurrent_update_exception import ConcurrentUpdateException
+from src.core.shared.metrics import OPTIMISTIC_LOCK_CONFLICTS
+
+
+def retry_on_conflict(attempts: int = ORDER_UPDATE_MAX_ATTEMPTS) -> Callable:
+    """
+    Decorator for the (sync or async) ``execute`` of use cases that load, change and save an aggregate.
+
+    When the save raises ``ConcurrentUpdateException`` the repository has already rolled back and evicted the stale
+    aggregate, so the use case is simply run again: it re-loads the current version and re-applies its change (and
+    its validations) on top of it. There is no backoff, since the conflicting write is already committed. After
+    ``attempts`` runs, or when the conflict is not retryable, the exception is raised (HTTP 409).
+    """
+
+    def should_retry(exc: ConcurrentUpdateException, attempt: int) -> bool:
+        retry = exc.retryable and attempt < attempts
+        OPTIMISTIC_LOCK_CONFLICTS.labels(exc.entity_name, "retried" if retry else "exhausted").inc()
+        if retry:
+            logging.info(f"Conflito de versão em {exc.entity_name} '{exc.entity_id}', nova tentativa ({attempt + 1}/{attempts})")
+        return retry
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                attempt = 1
+                while True:
+                    try:
+                        return await func(*args, **kwargs)
+                    except ConcurrentUpdateException as exc:
+                        if not should_retry(exc, attempt):
+                            raise
+                    attempt += 1
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            attempt = 1
+            while True:
+                try:
+                    return func(*args, **kwargs)
+                except ConcurrentUpdateException as exc:
+                    if not should_retry(exc, attempt):
+                        raise
+                attempt += 1
+
+        return wrapper
+
+    return decorator
+
+
+__all__ = ["retry_on_conflict"]
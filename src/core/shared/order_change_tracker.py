@@ -0,0 +1,127 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# pattern Unit of Work - Martin Fowler
+# https://martinfowler.com/eaaCatalog/unitOfWork.html
+
+ORDER_TRACKED_FIELDS = ("id_customer", "id_employee", "payment_id", "created_at", "inactivated_at")
+ORDER_ITEM_TRACKED_FIELDS = (
+    "product_id",
+    "product_name",
+    "product_sku",
+    "product_price",
+    "product_category_name",
+    "quantity",
+    "observation",
+    "inactivated_at",
+)
+TRACKED_RELATIONS = ("order_items", "status_history")
+
+
+@dataclass
+class OrderChanges:
+    """Rows that must be written to persist an ``Order`` aggregate, as computed by ``OrderChangeTracker``."""
+
+    order_fields: Dict[str, Any] = field(default_factory=dict)
+    new_items: List[Any] = field(default_factory=list)
+    changed_items: List[Tuple[Any, Dict[str, Any]]] = field(default_factory=list)
+    removed_items: List[Any] = field(default_factory=list)
+    new_movements: List[Any] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.order_fields or self.new_items or self.changed_items or self.removed_items or self.new_movements
+        )
+
+
+class OrderChangeTracker:
+    """
+    Snapshot-based change tracker for the ``Order`` aggregate.
+
+    ``snapshot`` records the persisted state of the order and of the relations that were loaded; ``diff`` compares
+    the current aggregate against it. Status movements are append-only, so only the ones without an id are new.
+    Relations that were never snapshotted (not loaded by the query profile) are only appended to: their rows are
+    never updated nor deleted by the diff.
+    """
+
+    def __init__(self):
+        self._order_state: Optional[Dict[str, Any]] = None
+        self._items: Dict[int, Tuple[Any, Dict[str, Any]]] = {}
+        self._tracked_relations: Set[str] = set()
+
+    @property
+    def is_tracking(self) -> bool:
+        return self._order_state is not None
+
+    @property
+    def unloaded_relations(self) -> Set[str]:
+        """Tracked relations that were not snapshotted yet, i.e. not loaded by the query profile."""
+        if not self.is_tracking:
+            return set()
+        return set(TRACKED_RELATIONS) - self._tracked_relations
+
+    def snapshot(self, order, relations: Iterable[str] = TRACKED_RELATIONS, fields: bool = True) -> None:
+        """
+        Records the persisted state of the order.
+
+        Args:
+            relations: Relations that were loaded and must be tracked from now on.
+            fields: Whether the order's own columns are snapshotted too; ``False`` when a relation is mapped later
+                onto an order that may already hold unsaved changes.
+        """
+        relations = set(relations)
+        if fields or self._order_state is None:
+            self._order_state = self._order_fields(order)
+        if "order_items" in relations:
+            self._items = {
+                item.id: (item, self._item_fields(item)) for item in order.order_items if item.id is not None
+            }
+        self._tracked_relations |= relations
+
+    def diff(self, order) -> OrderChanges:
+        changes = OrderChanges()
+
+        current_state = self._order_fields(order)
+        changes.order_fields = {
+            name: value for name, value in current_state.items() if self._order_state.get(name) != value
+        }
+
+        current_ids = set()
+        for item in order.order_items:
+            if item.id is None:
+                changes.new_items.append(item)
+                continue
+
+            current_ids.add(item.id)
+            item_state = self._item_fields(item)
+            if item.id not in self._items:
+                # Item já persistido, mas carregado fora deste pedido: é adotado pelo pedido
+                changes.changed_items.append((item, {**item_state, "order_id": order.id}))
+                continue
+
+            _, snapshot = self._items[item.id]
+            changed_fields = {name: value for name, value in item_state.items() if snapshot.get(name) != value}
+            if changed_fields:
+                changes.changed_items.append((item, changed_fields))
+
+        if "order_items" in self._tracked_relations:
+            changes.removed_items = [
+                item for item_id, (item, _) in self._items.items() if item_id not in current_ids
+            ]
+
+        changes.new_movements = [movement for movement in order.status_history if movement.id is None]
+        return changes
+
+    @staticmethod
+    def _order_fields(order) -> Dict[str, Any]:
+        state = {name: getattr(order, name) for name in ORDER_TRACKED_FIELDS}
+        state["id_order_status"] = order.order_status.id if order.order_status else None
+        return state
+
+    @staticmethod
+    def _item_fields(item) -> Dict[str, Any]:
+        return {name: getattr(item, name) for name in ORDER_ITEM_TRACKED_FIELDS}
+
+
+__all__ = ["OrderChanges", "OrderChangeTracker", "ORDER_ITEM_TRACKED_FIELDS", "TRACKED_RELATIONS"]
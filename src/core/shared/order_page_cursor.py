@@ -0,0 +1,50 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+import json
+
+from src.constants.order_transition import DEFAULT_ORDER_LIST_PRIORITY, ORDER_STATUS_LIST_PRIORITY
+from src.core.exceptions.bad_request_exception import BadRequestException
+
+
+def order_list_priority(status: str) -> int:
+    """Returns the listing priority of an order status (see ``ORDER_STATUS_LIST_PRIORITY``)."""
+    for order_status, priority in ORDER_STATUS_LIST_PRIORITY.items():
+        if order_status.status == status:
+            return priority
+    return DEFAULT_ORDER_LIST_PRIORITY
+
+
+@dataclass(frozen=True)
+class OrderPageCursor:
+    """
+    Keyset cursor over the order listing, ordered by (status priority, created_at, id).
+
+    It points at the last order of a page; the next page starts right after it. The token handed to clients is
+    opaque (urlsafe base64 of a small JSON document).
+    """
+
+    priority: int
+    created_at: datetime
+    id: int
+
+    @classmethod
+    def from_order(cls, order) -> "OrderPageCursor":
+        return cls(priority=order_list_priority(order.order_status.status), created_at=order.created_at, id=order.id)
+
+    def encode(self) -> str:
+        payload = json.dumps([self.priority, self.created_at.isoformat(), self.id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "OrderPageCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            priority, created_at, order_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            return cls(priority=int(priority), created_at=datetime.fromisoformat(created_at), id=int(order_id))
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+            raise BadRequestException("Cursor de paginação inválido.")
+
+
+__all__ = ["OrderPageCursor", "order_list_priority"]
@@ -0,0 +1,73 @@
+from threading import Lock
+from typing import Dict, Iterable, Optional
+
+from src.core.domain.entities.order_status import OrderStatus
+from src.core.shared.identity_map import IdentityMap
+
+
+class OrderStatusRegistry:
+    """
+    Process-wide registry of the ``order_status`` reference table, keyed by status string and by id.
+
+    Rows are kept as plain snapshots and materialized as ``OrderStatus`` entities in the identity map of the
+    current request, so callers may mutate the entities they receive without touching the registry.
+    """
+
+    def __init__(self):
+        self._by_status: Dict[str, dict] = {}
+        self._by_id: Dict[int, dict] = {}
+        self._lock = Lock()
+        self.is_warm = False
+
+    def load(self, order_statuses: Iterable[OrderStatus]) -> None:
+        """Replaces the registry content with the given statuses and marks it as warm."""
+        snapshots = [self._snapshot(order_status) for order_status in order_statuses]
+        with self._lock:
+            self._by_status = {snapshot["status"]: snapshot for snapshot in snapshots}
+            self._by_id = {snapshot["id"]: snapshot for snapshot in snapshots}
+            self.is_warm = True
+
+    def register(self, order_status: OrderStatus) -> None:
+        snapshot = self._snapshot(order_status)
+        with self._lock:
+            self._by_status[snapshot["status"]] = snapshot
+            self._by_id[snapshot["id"]] = snapshot
+
+    def get_by_status(self, status: str) -> Optional[OrderStatus]:
+        return self._materialize(self._by_status.get(status))
+
+    def get_by_id(self, order_status_id: int) -> Optional[OrderStatus]:
+        return self._materialize(self._by_id.get(order_status_id))
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._by_status = {}
+            self._by_id = {}
+            self.is_warm = False
+
+    @staticmethod
+    def _snapshot(order_status: OrderStatus) -> dict:
+        return {
+            "id": order_status.id,
+            "status": order_status.status,
+            "description": order_status.description,
+            "created_at": order_status.created_at,
+            "updated_at": order_status.updated_at,
+            "inactivated_at": order_status.inactivated_at,
+        }
+
+    @staticmethod
+    def _materialize(snapshot: Optional[dict]) -> Optional[OrderStatus]:
+        if snapshot is None:
+            return None
+
+        identity_map = IdentityMap.get_instance()
+        if existing := identity_map.get(OrderStatus, snapshot["id"]):
+            return existing
+
+        order_status = OrderStatus(**snapshot)
+        identity_map.add(order_status)
+        return order_status
+
+
+__all__ = ["OrderStatusRegistry"]
@@ -0,0 +1,61 @@
+import logging
+import random
+from time import perf_counter
+from typing import Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryLogger:
+    """
+    Sampled SQL statement logger, in place of the engine's ``echo``.
+
+    Only ``sample_rate`` of the statements (0 to 1) are logged, at ``level``, with their duration; bound parameters
+    are left out so no personal data reaches the logs. Statements are neither timed nor sampled when the logger
+    does not accept ``level``, so production pods pay nothing for it.
+    """
+
+    def __init__(
+        self,
+        level: int = logging.DEBUG,
+        sample_rate: float = 1.0,
+        logger: Optional[logging.Logger] = None,
+        random_source: Callable[[], float] = random.random,
+    ):
+        self.level = level
+        self.sample_rate = sample_rate
+        self.logger = logger or logging.getLogger("sql.query")
+        self._random = random_source
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.sample_rate > 0 and self.logger.isEnabledFor(self.level)
+
+    def install(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # Decide a amostragem antes da execução: só as consultas amostradas são cronometradas
+        if self.is_enabled and self._random() < self.sample_rate:
+            context._query_log_started_at = perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started_at = getattr(context, "_query_log_started_at", None)
+        if started_at is None:
+            return
+        elapsed_ms = (perf_counter() - started_at) * 1000
+        self.logger.log(self.level, "%.2f ms | %s", elapsed_ms, " ".join(statement.split()))
+
+
+def install_query_logger(engine: Engine, level: str, sample_rate: float) -> Optional[QueryLogger]:
+    """Installs a ``QueryLogger`` on ``engine`` unless ``level`` is ``OFF`` or ``sample_rate`` is zero."""
+    if level.upper() == "OFF" or sample_rate <= 0:
+        return None
+    query_logger = QueryLogger(level=logging.getLevelName(level.upper()), sample_rate=sample_rate)
+    query_logger.install(engine)
+    return query_logger
+
+
+__all__ = ["QueryLogger", "install_query_logger"]
@@ -0,0 +1,189 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+import hashlib
+import hmac
+import inspect
+from itertools import cycle
+from threading import Lock
+import time
+from typing import Callable, Iterator, List, Optional, Sequence
+
+from sqlalchemy import Delete, Insert, Select, Update, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from src.core.shared.metrics import DB_SESSION_ROUTES
+
+# Chave do estado da requisição com o instante (epoch) da última escrita do cliente
+LAST_WRITE_AT = "last_write_at"
+
+_read_only: ContextVar[bool] = ContextVar("read_only", default=False)
+_request_state: ContextVar[Optional[dict]] = ContextVar("request_state", default=None)
+
+
+@contextmanager
+def read_only_context() -> Iterator[None]:
+    """Marks the work done in the current context as read-only, so its queries may be served by a replica."""
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+def read_only(func: Callable) -> Callable:
+    """
+    Decorator for the (sync or async) ``execute`` of use cases that never write: their queries may go to a read
+    replica.
+
+    A use case that reads and then writes must not use it, since replicas may lag behind the primary.
+    """
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with read_only_context():
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with read_only_context():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def is_read_only() -> bool:
+    return _read_only.get()
+
+
+@contextmanager
+def bind_request_state(state: dict) -> Iterator[None]:
+    """Exposes the request state (where the client's last write time is kept) to the routing of the request's session."""
+    token = _request_state.set(state)
+    try:
+        yield
+    finally:
+        _request_state.reset(token)
+
+
+def sign_write_marker(written_at: float, secret: str) -> str:
+    """Encodes the time of a write as ``<epoch>.<hmac>``, the value the client sends back on its next requests."""
+    value = f"{written_at:.3f}"
+    return f"{value}.{_marker_signature(value, secret)}"
+
+
+def read_write_marker(marker: Optional[str], secret: str) -> Optional[float]:
+    """Returns the write time carried by ``marker``, or ``None`` when it is missing, malformed or not signed by us."""
+    value, _, signature = (marker or "").rpartition(".")
+    if not value or not hmac.compare_digest(signature, _marker_signature(value, secret)):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _marker_signature(value: str, secret: str) -> str:
+    return hmac.new(secret.encode(), value.encode(), hashlib.sha256).hexdigest()
+
+
+class ReplicaRouter:
+    """
+    Picks the read replica for read-only queries (round robin) and keeps the reads of recent writers on the primary.
+
+    The time of the last write lives in the request state, not in the router: ``DbSessionMiddleware`` restores it
+    from a signed cookie and sends the new one back after a write, so the client's reads stay on the primary for
+    ``sticky_seconds`` whichever worker or pod serves them. ``clock`` must be the wall clock shared by the pods.
+    """
+
+    def __init__(
+        self,
+        replicas: Sequence[Engine],
+        sticky_seconds: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.replicas: List[Engine] = list(replicas)
+        self.sticky_seconds = sticky_seconds
+        self._clock = clock
+        self._next_replica = cycle(self.replicas)
+        self._lock = Lock()
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self.replicas)
+
+    def choose_replica(self) -> Engine:
+        with self._lock:
+            return next(self._next_replica)
+
+    def mark_write(self) -> None:
+        """Records the write in the current request state (work outside a request has no client to stick)."""
+        state = _request_state.get()
+        if state is not None:
+            state[LAST_WRITE_AT] = self._clock()
+
+    def is_sticky(self) -> bool:
+        state = _request_state.get()
+        written_at = state.get(LAST_WRITE_AT) if state else None
+        return written_at is not None and self._clock() - written_at < self.sticky_seconds
+
+
+class RoutingSession(Session):
+    """
+    Session that sends the queries of read-only work (see ``read_only``) to a replica.
+
+    Everything else goes to the primary: flushes, ``INSERT``/``UPDATE``/``DELETE``, ``SELECT ... FOR UPDATE``,
+    queries of a session that already wrote, and queries of a client that wrote within the stickiness window.
+    """
+
+    def __init__(self, router: Optional[ReplicaRouter] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.router = router
+        self.wrote = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if isinstance(clause, (Insert, Update, Delete)):
+            # Escritas em massa (session.execute(update(...))) não passam pelo flush
+            self.wrote = True
+        if self.router is None or not self.router.has_replicas:
+            return super().get_bind(mapper, clause=clause, **kwargs)
+
+        if self._use_replica(clause):
+            DB_SESSION_ROUTES.labels("replica").inc()
+            return self.router.choose_replica()
+        DB_SESSION_ROUTES.labels("primary").inc()
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+    def _use_replica(self, clause) -> bool:
+        if not is_read_only() or self._flushing or self.wrote:
+            return False
+        if isinstance(clause, Select) and clause._for_update_arg is not None:
+            return False
+        return not self.router.is_sticky()
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_session_wrote(session: RoutingSession, flush_context) -> None:
+    session.wrote = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _mark_writer_sticky(session: RoutingSession) -> None:
+    if session.wrote and session.router is not None:
+        session.router.mark_write()
+
+
+__all__ = [
+    "LAST_WRITE_AT",
+    "ReplicaRouter",
+    "RoutingSession",
+    "bind_request_state",
+    "is_read_only",
+    "read_only",
+    "read_only_context",
+    "read_write_marker",
+    "sign_write_marker",
+]
@@ -0,0 +1,309 @@
+import asyncio
+from threading import Lock
+import random
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from src.constants.circuit_state import CircuitStateEnum
+from src.core.exceptions.service_unavailable_exception import ServiceUnavailableException
+from src.core.shared.metrics import (
+    BULKHEAD_IN_FLIGHT,
+    BULKHEAD_REJECTIONS,
+    CIRCUIT_BREAKER_STATE,
+    CIRCUIT_BREAKER_TRANSITIONS,
+    GATEWAY_RETRIES,
+)
+
+R = TypeVar("R")
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and calls are rejected for
+    ``recovery_timeout`` seconds. It then turns half-open: up to ``half_open_max_calls`` probe calls are let through;
+    as many successes close the circuit, a single failure opens it again. Thread-safe, so it can guard both the
+    async stock calls and the sync payment calls made from worker threads.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = Lock()
+        self._state = CircuitStateEnum.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        CIRCUIT_BREAKER_STATE.labels(name).set(self._state.metric_value)
+
+    @property
+    def state(self) -> CircuitStateEnum:
+        with self._lock:
+            self._refresh_state()
+            return self._state
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a probe through."""
+        with self._lock:
+            if self._state is not CircuitStateEnum.OPEN:
+                return 0.0
+            return max(self._opened_at + self.recovery_timeout - self._clock(), 0.0)
+
+    def acquire(self) -> None:
+        """Admits a call or raises ``ServiceUnavailableException`` when the circuit does not allow it."""
+        with self._lock:
+            self._refresh_state()
+            if self._state is CircuitStateEnum.CLOSED:
+                return
+            if self._state is CircuitStateEnum.HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                return
+            retry_after = max(self._opened_at + self.recovery_timeout - self._clock(), 0.0)
+
+        raise ServiceUnavailableException(self.name, retry_after=retry_after, circuit=self._state.state)
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state is CircuitStateEnum.HALF_OPEN:
+                self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_max_calls:
+                    self._transition(CircuitStateEnum.CLOSED)
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state is CircuitStateEnum.HALF_OPEN:
+                self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+                self._open()
+                return
+
+            self._failures += 1
+            if self._state is CircuitStateEnum.CLOSED and self._failures >= self.failure_threshold:
+                self._open()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._transition(CircuitStateEnum.CLOSED)
+
+    def _refresh_state(self) -> None:
+        if self._state is CircuitStateEnum.OPEN and self._clock() >= self._opened_at + self.recovery_timeout:
+            self._transition(CircuitStateEnum.HALF_OPEN)
+
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self._transition(CircuitStateEnum.OPEN)
+
+    def _transition(self, state: CircuitStateEnum) -> None:
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        if state is self._state:
+            return
+        self._state = state
+        CIRCUIT_BREAKER_STATE.labels(self.name).set(state.metric_value)
+        CIRCUIT_BREAKER_TRANSITIONS.labels(self.name, state.state).inc()
+
+
+class Bulkhead:
+    """
+    Concurrency limit of one dependency.
+
+    Calls beyond ``max_concurrent`` are rejected immediately instead of queueing, so a slow dependency holds at
+    most ``max_concurrent`` requests and the rest of the service keeps its workers.
+    """
+
+    def __init__(self, name: str, max_concurrent: int):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self._in_flight = 0
+        self._lock = Lock()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._in_flight >= self.max_concurrent:
+                BULKHEAD_REJECTIONS.labels(self.name).inc()
+                raise ServiceUnavailableException(
+                    self.name,
+                    message=f"O serviço '{self.name}' atingiu o limite de chamadas simultâneas.",
+                    retry_after=1,
+                )
+            self._in_flight += 1
+            BULKHEAD_IN_FLIGHT.labels(self.name).set(self._in_flight)
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_flight = max(self._in_flight - 1, 0)
+            BULKHEAD_IN_FLIGHT.labels(self.name).set(self._in_flight)
+
+
+class RetryBudget:
+    """
+    Token bucket that caps retries to a share of the traffic.
+
+    Every first attempt deposits ``ratio`` tokens and every retry withdraws one, so retries never exceed ``ratio``
+    of the calls; ``min_per_second`` tokens are added over time so low traffic can still retry. The balance is
+    capped at ``max_tokens``. During an outage the budget drains and calls fail fast instead of multiplying the
+    load on the dependency.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        max_tokens: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._clock = clock
+        self._tokens = max_tokens
+        self._updated_at = clock()
+        self._lock = Lock()
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens + self.ratio, self.max_tokens)
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._tokens + (now - self._updated_at) * self.min_per_second, self.max_tokens)
+        self._updated_at = now
+
+
+class ResiliencePolicy:
+    """
+    Bulkhead + circuit breaker + budgeted retries around the calls to one dependency.
+
+    ``is_failure`` classifies the exceptions raised by the call: failures (timeouts, connection errors, 5xx) count
+    against the breaker and may be retried, with exponential backoff and full jitter, while the retry budget allows;
+    other exceptions (e.g. a 404 turned into ``EntityNotFoundException``) mean the dependency answered and are
+    re-raised untouched. A call that still fails raises ``ServiceUnavailableException``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        breaker: CircuitBreaker,
+        bulkhead: Bulkhead,
+        retry_budget: RetryBudget,
+        is_failure: Callable[[BaseException], bool],
+        max_retries: int = 2,
+        backoff_base: float = 0.05,
+        backoff_max: float = 1.0,
+        random_source: Callable[[], float] = random.random,
+    ):
+        self.name = name
+        self.breaker = breaker
+        self.bulkhead = bulkhead
+        self.retry_budget = retry_budget
+        self.is_failure = is_failure
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._random = random_source
+
+    async def call_async(self, func: Callable[[], Awaitable[R]], retry: bool = True) -> R:
+        self.bulkhead.acquire()
+        try:
+            self.retry_budget.deposit()
+            attempt = 0
+            while True:
+                self.breaker.acquire()
+                try:
+                    result = await func()
+                except Exception as exc:
+                    if not self._record(exc):
+                        raise
+                    if not self._should_retry(attempt, retry):
+                        raise self._unavailable(exc) from exc
+                    attempt += 1
+                    await asyncio.sleep(self._backoff(attempt))
+                    continue
+                self.breaker.record_success()
+                return result
+        finally:
+            self.bulkhead.release()
+
+    def call(self, func: Callable[[], R], retry: bool = True) -> R:
+        """Blocking variant of ``call_async``: backs off with ``time.sleep``, so it must not run on the event loop."""
+        self.bulkhead.acquire()
+        try:
+            self.retry_budget.deposit()
+            attempt = 0
+            while True:
+                self.breaker.acquire()
+                try:
+                    result = func()
+                except Exception as exc:
+                    if not self._record(exc):
+                        raise
+                    if not self._should_retry(attempt, retry):
+                        raise self._unavailable(exc) from exc
+                    attempt += 1
+                    time.sleep(self._backoff(attempt))
+                    continue
+                self.breaker.record_success()
+                return result
+        finally:
+            self.bulkhead.release()
+
+    def _record(self, exc: Exception) -> bool:
+        """Reports the outcome to the breaker; returns whether ``exc`` is a dependency failure."""
+        if self.is_failure(exc):
+            self.breaker.record_failure()
+            return True
+        self.breaker.record_success()
+        return False
+
+    def _should_retry(self, attempt: int, retry: bool) -> bool:
+        if not retry or attempt >= self.max_retries:
+            return False
+        if not self.retry_budget.try_withdraw():
+            GATEWAY_RETRIES.labels(self.name, "budget_exhausted").inc()
+            return False
+        GATEWAY_RETRIES.labels(self.name, "retried").inc()
+        return True
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter: espera aleatória entre zero e o teto exponencial
+        return self._random() * min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+
+    def _unavailable(self, exc: Exception) -> ServiceUnavailableException:
+        return ServiceUnavailableException(self.name, retry_after=self.breaker.retry_after or None, error=str(exc))
+
+
+__all__ = ["Bulkhead", "CircuitBreaker", "ResiliencePolicy", "RetryBudget"]
@@ -0,0 +1,49 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+from src.core.shared.metrics import SINGLE_FLIGHT_SHARED_CALLS
+
+R = TypeVar("R")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls: while a call for a key is in flight, callers of the same key await it
+    instead of starting another one, and all of them get its result (or its exception).
+
+    The call runs as its own task, so a caller that is cancelled does not cancel it for the others. Nothing is kept
+    after the call finishes: caching the result is up to the caller.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.shared = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[R]]) -> R:
+        loop = asyncio.get_running_loop()
+        task = self._calls.get(key)
+        # Chamadas presas a outro event loop (ex.: de um TestClient já encerrado) não são compartilhadas
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda finished: self._forget(key, finished))
+        else:
+            self.shared += 1
+            SINGLE_FLIGHT_SHARED_CALLS.labels(self.name).inc()
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Marca a exceção como recuperada mesmo que todos os chamadores tenham sido cancelados
+            task.exception()
+
+
+__all__ = ["SingleFlight"]
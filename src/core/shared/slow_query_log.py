@@ -0,0 +1,190 @@
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+import hashlib
+import logging
+import math
+import re
+from threading import Lock
+from time import perf_counter, time
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|:\w+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize_statement(statement: str) -> str:
+    """
+    Normalizes a SQL statement into its fingerprint text: literals and bound parameters become ``?``, ``IN`` lists
+    collapse to ``(?+)`` and whitespace is squeezed, so the same query with different values (or a different number
+    of ids) maps to the same fingerprint.
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(?+)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def fingerprint_id(normalized_statement: str) -> str:
+    return hashlib.sha1(normalized_statement.encode()).hexdigest()[:12]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for no samples)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+
+@dataclass
+class FingerprintStats:
+    """Aggregated timings of one statement fingerprint."""
+
+    fingerprint: str
+    statement: str
+    count: int = 0
+    slow_count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_seen_at: float = 0.0
+    explain: Optional[List[Any]] = None
+    samples: Deque[float] = field(default_factory=deque)
+
+    def to_dict(self) -> Dict[str, Any]:
+        samples = list(self.samples)
+        return {
+            "fingerprint": self.fingerprint,
+            "statement": self.statement,
+            "count": self.count,
+            "slow_count": self.slow_count,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "mean_ms": round(self.total_seconds * 1000 / self.count, 3) if self.count else 0.0,
+            "p95_ms": round(percentile(samples, 95) * 1000, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "last_seen_at": self.last_seen_at,
+            "explain": self.explain,
+        }
+
+
+class SlowQueryRecorder:
+    """
+    SQLAlchemy event-based statement recorder.
+
+    Every statement of the instrumented engines is timed and aggregated by fingerprint (count, total, p95 over the
+    last ``sample_size`` executions, max). Statements slower than ``threshold`` seconds are counted as slow and
+    written to the ``sql.slow`` logger; with ``explain_threshold`` set, the plan of a fingerprint's first ``SELECT``
+    above it is captured with ``EXPLAIN`` on the same connection. At most ``max_fingerprints`` fingerprints are
+    kept; executions of further ones are only counted in ``dropped``.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.2,
+        explain_threshold: Optional[float] = None,
+        max_fingerprints: int = 500,
+        sample_size: int = 256,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.threshold = threshold
+        self.explain_threshold = explain_threshold
+        self.max_fingerprints = max_fingerprints
+        self.sample_size = sample_size
+        self.logger = logger or logging.getLogger("sql.slow")
+        self.dropped = 0
+        self._stats: Dict[str, FingerprintStats] = {}
+        self._lock = Lock()
+
+    def install(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def record(self, statement: str, elapsed: float) -> Optional[FingerprintStats]:
+        """Aggregates one execution; returns the stats of its fingerprint (``None`` if it was dropped)."""
+        normalized = normalize_statement(statement)
+        key = fingerprint_id(normalized)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                if len(self._stats) >= self.max_fingerprints:
+                    self.dropped += 1
+                    return None
+                stats = FingerprintStats(key, normalized, samples=deque(maxlen=self.sample_size))
+                self._stats[key] = stats
+
+            stats.count += 1
+            stats.total_seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+            stats.last_seen_at = time()
+            stats.samples.append(elapsed)
+            if elapsed >= self.threshold:
+                stats.slow_count += 1
+
+        if elapsed >= self.threshold:
+            self.logger.warning(
+                "Consulta lenta %s: %.2f ms | %s", key, elapsed * 1000, normalized,
+                extra={"fingerprint": key, "elapsed_ms": elapsed * 1000},
+            )
+        return stats
+
+    def top(self, order_by: str = "total", limit: int = 20) -> List[Dict[str, Any]]:
+        """The ``limit`` fingerprints with the highest ``order_by`` (``total``, ``p95``, ``count``, ``max`` or ``slow``)."""
+        with self._lock:
+            entries = [stats.to_dict() for stats in self._stats.values()]
+        sort_key = {
+            "total": "total_ms",
+            "p95": "p95_ms",
+            "count": "count",
+            "max": "max_ms",
+            "slow": "slow_count",
+        }[order_by]
+        return sorted(entries, key=lambda entry: entry[sort_key], reverse=True)[:limit]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self.dropped = 0
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        context._slow_query_started_at = perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started_at = getattr(context, "_slow_query_started_at", None)
+        if started_at is None:
+            return
+        elapsed = perf_counter() - started_at
+        stats = self.record(statement, elapsed)
+
+        if (
+            stats is not None
+            and stats.explain is None
+            and self.explain_threshold is not None
+            and elapsed >= self.explain_threshold
+            and not executemany
+            and statement.lstrip()[:6].upper() == "SELECT"
+        ):
+            stats.explain = self._explain(conn, statement, parameters)
+
+    def _explain(self, conn, statement: str, parameters) -> Optional[List[Any]]:
+        prefix = "EXPLAIN QUERY PLAN" if conn.dialect.name == "sqlite" else "EXPLAIN"
+        # Cursor DBAPI direto: o EXPLAIN não passa pelos eventos do SQLAlchemy nem é registrado
+        explain_cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            explain_cursor.execute(f"{prefix} {statement}", parameters)
+            return [list(row) for row in explain_cursor.fetchall()]
+        except Exception as exc:
+            self.logger.debug(f"Não foi possível capturar o EXPLAIN da consulta: {exc}")
+            return None
+        finally:
+            explain_cursor.close()
+
+
+__all__ = ["FingerprintStats", "SlowQueryRecorder", "fingerprint_id", "normalize_statement", "percentile"]
@@ -0,0 +1,96 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    expires_at: float
+    stale: bool = False
+
+
+class TTLCache:
+    """
+    In-memory cache with per-entry TTL and LRU eviction.
+
+    Expired entries are kept for ``stale_ttl`` extra seconds and returned flagged as ``stale``, so callers can
+    serve them while revalidating in the background.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 300.0,
+        stale_ttl: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_entry(self, key: Hashable) -> Optional[CacheEntry]:
+        """Returns the entry for ``key`` (flagged as stale once its TTL has passed) or ``None`` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            now = self._clock()
+            if entry is None or now >= entry.expires_at + self.stale_ttl:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            entry.stale = now >= entry.expires_at
+            if entry.stale:
+                self.stale_hits += 1
+            else:
+                self.hits += 1
+            return entry
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the fresh value for ``key``; stale entries count as misses."""
+        entry = self.get_entry(key)
+        if entry is None or entry.stale:
+            return default
+        return entry.value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._entries[key] = CacheEntry(value=value, expires_at=self._clock() + (self.ttl if ttl is None else ttl))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = ["CacheEntry", "TTLCache"]
@@ -59,6 +59,11 @@ resource "kubernetes_deployment" "order_app" {
         labels = {
           app = "order-app"
         }
+        annotations = {
+          "prometheus.io/scrape" = "true"
+          "prometheus.io/path"   = "/metrics"
+          "prometheus.io/port"   = "8080"
+        }
       }
       spec {
         container {
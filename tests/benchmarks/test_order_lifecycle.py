@@ -0,0 +1,25 @@
+from benchmarks.order_lifecycle import LIFECYCLE_STEPS, format_report, percentile, run_benchmark
+
+
+def test_percentile_uses_nearest_rank():
+    samples = [float(value) for value in range(1, 101)]
+
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 95) == 95.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 95) == 0.0
+
+
+def test_run_benchmark_completes_every_lifecycle():
+    report = run_benchmark(orders=2, warmup=0)
+
+    assert report.completed_orders == 2
+    assert set(report.steps) == set(LIFECYCLE_STEPS)
+    assert all(stats.errors == 0 for stats in report.steps.values())
+    assert len(report.steps["create"].durations) == 2
+    assert len(report.steps["add_item"].durations) == 8
+    assert len(report.steps["webhook"].durations) == 2
+
+    summary = report.to_dict()
+    assert summary["requests"] == 30
+    assert "p99" in format_report(summary, baseline=summary)
@@ -0,0 +1,15 @@
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from config.database import warm_up_pool
+
+
+def test_warm_up_pool_opens_connections_up_to_the_pool_size(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.sqlite'}", poolclass=QueuePool, pool_size=3)
+
+    try:
+        assert warm_up_pool(engine, connections=5) == 3
+        assert engine.pool.checkedin() == 3
+        assert engine.pool.checkedout() == 0
+    finally:
+        engine.dispose()
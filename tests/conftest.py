@@ -1,10 +1,12 @@
 import os
 from faker import Faker
 import pytest
-from typing import Dict, Generator, List, Optional
+from typing import AsyncGenerator, Dict, Generator, List, Optional
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 from alembic.config import Config
 from alembic import command
 from src.core.containers import Container
@@ -16,6 +18,7 @@ from src.core.utils.jwt_util import JWTUtil
 from tests.factories.order_factory import OrderFactory
 from tests.factories.order_item_factory import OrderItemFactory
 from tests.factories.order_status_factory import OrderStatusFactory
+from tests.factories.order_status_movement_factory import OrderStatusMovementFactory
 
 @pytest.fixture(scope="function")
 def test_engine(tmp_path_factory):
@@ -55,6 +58,10 @@ def db_session(test_engine):
     app.dependency_overrides[get_db] = override_get_db
     container = Container()
     container.db_session.override(session)
+    # Rotas assíncronas: uma sessão aiosqlite por requisição no mesmo arquivo SQLite (NullPool, pois cada
+    # requisição do TestClient pode rodar em outro event loop)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{test_engine.url.database}", poolclass=NullPool)
+    container.async_session_factory.override(async_sessionmaker(bind=async_engine, autoflush=False))
     app.container = container
 
     try:
@@ -67,6 +74,23 @@ def db_session(test_engine):
         identity_map.clear()
 
 
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="function")
+async def async_db_session(db_session) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Sessão assíncrona (aiosqlite) apontando para o mesmo arquivo SQLite do test_engine.
+    """
+    session = app.container.async_session_factory()()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
 @pytest.fixture(scope="function")
 def client(db_session) -> Generator[TestClient, None, None]:
     """
@@ -131,6 +155,7 @@ def setup_factories(db_session):
         OrderItemFactory,
         OrderStatusFactory,
         OrderFactory,
+        OrderStatusMovementFactory,
     ]
     
     identity_map = IdentityMap.get_instance()
@@ -0,0 +1,22 @@
+from datetime import datetime, timezone
+
+import factory
+from factory.alchemy import SQLAlchemyModelFactory
+
+from src.adapters.driven.repositories.models.order_status_movement_model import OrderStatusMovementModel
+from src.constants.order_status import OrderStatusEnum
+
+
+class OrderStatusMovementFactory(SQLAlchemyModelFactory):
+    class Meta:
+        model = OrderStatusMovementModel
+        sqlalchemy_session_persistence = "commit"
+
+    order = factory.SubFactory("tests.factories.order_factory.OrderFactory")
+    id_order = factory.LazyAttribute(lambda obj: obj.order.id)
+
+    order_snapshot = factory.LazyAttribute(lambda obj: {"id": obj.order.id})
+    old_status = OrderStatusEnum.ORDER_PENDING.status
+    new_status = OrderStatusEnum.ORDER_WAITING_BURGERS.status
+    changed_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
+    changed_by = "System"
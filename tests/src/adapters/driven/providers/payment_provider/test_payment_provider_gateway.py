@@ -1,8 +1,17 @@
 
 
 import os
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
 from src.adapters.driven.providers.payment_provider.payment_provider_gateway import PaymentProviderGateway
+from src.adapters.driven.providers.payment_provider.resilient_payment_provider_gateway import (
+    ResilientPaymentProviderGateway,
+    create_payment_resilience_policy,
+)
+from src.core.exceptions.service_unavailable_exception import ServiceUnavailableException
 from src.constants.payment_method_enum import PaymentMethodEnum
 from src.core.domain.dtos.payment.create_payment_dto import CreatePaymentDTO
 
@@ -45,3 +54,36 @@ def test_change_base_url():
     new_url = "new-payment-provider.com"
     gateway.base_url = new_url
     assert gateway.base_url == f"http://{new_url}"
+
+
+@patch("time.sleep")
+def test_resilient_gateway_never_retries_the_payment_service(mock_sleep):
+    inner = MagicMock(spec=PaymentProviderGateway)
+    inner.get_payment.side_effect = requests.ConnectionError("connection refused")
+    gateway = ResilientPaymentProviderGateway(inner, create_payment_resilience_policy())
+
+    with pytest.raises(ServiceUnavailableException):
+        gateway.get_payment("123")
+
+    inner.get_payment.assert_called_once_with("123")
+    mock_sleep.assert_not_called()
+
+
+@patch("requests.post")
+def test_create_payment_sends_the_idempotency_key_as_a_header(mock_post):
+    mock_post.return_value.json.return_value = {"payment_id": "123"}
+    payment_data = CreatePaymentDTO(
+        title="Test Payment",
+        payment_method=PaymentMethodEnum.QR_CODE.name,
+        total_amount=100.0,
+        currency="BRL",
+        notification_url="http://example.com/callback",
+        items=[],
+        customer={},
+        idempotency_key="order-1-v3",
+    )
+
+    PaymentProviderGateway().create_payment(payment_data)
+
+    assert mock_post.call_args.kwargs["headers"]["Idempotency-Key"] == "order-1-v3"
+    assert "idempotency_key" not in mock_post.call_args.kwargs["json"]
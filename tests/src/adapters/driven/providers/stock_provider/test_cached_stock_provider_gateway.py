@@ -0,0 +1,156 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from src.adapters.driven.providers.stock_provider.cached_stock_provider_gateway import CachedStockProviderGateway
+from src.adapters.driven.providers.stock_provider.resilient_stock_provider_gateway import (
+    ResilientStockProviderGateway,
+    is_stock_failure,
+)
+from src.adapters.driven.providers.stock_provider.stock_microservice_gateway import StockMicroserviceGateway
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.exceptions.service_unavailable_exception import ServiceUnavailableException
+from src.core.ports.stock.i_stock_provider_gateway import IStockProviderGateway
+from src.core.shared.resilience import Bulkhead, CircuitBreaker, ResiliencePolicy, RetryBudget
+from src.core.shared.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.anyio
+class TestCachedStockProviderGateway:
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.clock = FakeClock()
+        self.inner = AsyncMock(spec=IStockProviderGateway)
+        self.gateway = CachedStockProviderGateway(
+            self.inner,
+            cache=TTLCache(max_entries=10, ttl=10, stale_ttl=20, clock=self.clock),
+            negative_ttl=5,
+        )
+
+    @staticmethod
+    async def _settle_background_refresh():
+        # A revalidação roda em uma task que aguarda a chamada compartilhada pelo single-flight
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    async def test_second_lookup_is_served_from_cache(self):
+        self.inner.get_product_by_id.return_value = {"id": 1, "name": "Burger"}
+
+        first = await self.gateway.get_product_by_id(1)
+        second = await self.gateway.get_product_by_id(1)
+
+        assert first == second == {"id": 1, "name": "Burger"}
+        self.inner.get_product_by_id.assert_awaited_once_with(1)
+        assert self.gateway.stats()["hits"] == 1
+        assert self.gateway.stats()["misses"] == 1
+
+    async def test_category_flow_makes_remote_calls_once(self):
+        self.inner.get_category_by_name.return_value = {"name": "BURGERS"}
+        self.inner.get_products_by_category_name.return_value = [{"id": 1}]
+
+        for _ in range(3):
+            category = await self.gateway.get_category_by_name("BURGERS")
+            await self.gateway.get_products_by_category_name(category["name"])
+
+        assert self.inner.get_category_by_name.await_count == 1
+        assert self.inner.get_products_by_category_name.await_count == 1
+
+    async def test_not_found_is_cached_for_negative_ttl(self):
+        self.inner.get_product_by_id.side_effect = EntityNotFoundException(message="Produto não encontrado", id=9)
+
+        for _ in range(2):
+            with pytest.raises(EntityNotFoundException):
+                await self.gateway.get_product_by_id(9)
+        assert self.inner.get_product_by_id.await_count == 1
+        assert self.gateway.stats()["negative_hits"] == 1
+
+        self.clock.now = 7
+        with pytest.raises(EntityNotFoundException):
+            await self.gateway.get_product_by_id(9)
+        assert self.inner.get_product_by_id.await_count == 2
+
+    async def test_stale_value_is_served_while_revalidating(self):
+        self.inner.get_categories.return_value = [{"name": "old"}]
+        await self.gateway.get_categories()
+
+        self.inner.get_categories.return_value = [{"name": "new"}]
+        self.clock.now = 15
+
+        assert await self.gateway.get_categories() == [{"name": "old"}]
+        assert await self.gateway.get_categories() == [{"name": "old"}]
+        await self._settle_background_refresh()
+
+        assert await self.gateway.get_categories() == [{"name": "new"}]
+        assert self.inner.get_categories.await_count == 2
+
+    async def test_failed_revalidation_keeps_stale_value(self):
+        self.inner.get_categories.return_value = [{"name": "old"}]
+        await self.gateway.get_categories()
+
+        self.inner.get_categories.side_effect = RuntimeError("stock service down")
+        self.clock.now = 15
+
+        assert await self.gateway.get_categories() == [{"name": "old"}]
+        await self._settle_background_refresh()
+        assert await self.gateway.get_categories() == [{"name": "old"}]
+
+    async def test_last_known_value_is_served_while_stock_is_unavailable(self):
+        self.inner.get_product_by_id.return_value = {"id": 1, "name": "Burger"}
+        await self.gateway.get_product_by_id(1)
+
+        self.inner.get_product_by_id.side_effect = ServiceUnavailableException("stock")
+        self.clock.now = 40
+
+        assert await self.gateway.get_product_by_id(1) == {"id": 1, "name": "Burger"}
+        with pytest.raises(ServiceUnavailableException):
+            await self.gateway.get_product_by_id(2)
+
+    async def test_concurrent_misses_share_one_upstream_call(self):
+        async def get_category_by_name(name):
+            await asyncio.sleep(0)
+            return {"name": name}
+
+        self.inner.get_category_by_name.side_effect = get_category_by_name
+
+        results = await asyncio.gather(*(self.gateway.get_category_by_name("BURGERS") for _ in range(10)))
+
+        assert results == [{"name": "BURGERS"}] * 10
+        self.inner.get_category_by_name.assert_awaited_once_with("BURGERS")
+        assert self.gateway.stats()["shared_loads"] == 9
+
+    async def test_stock_outage_on_a_product_lookup_is_not_negative_cached(self):
+        responses = [httpx.Response(503, json={"detail": "unavailable"}), httpx.Response(200, json={"id": 9})]
+        stock_gateway = StockMicroserviceGateway(
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(lambda request: responses.pop(0)))
+        )
+        policy = ResiliencePolicy(
+            "stock",
+            breaker=CircuitBreaker("stock", failure_threshold=5, recovery_timeout=30),
+            bulkhead=Bulkhead("stock", max_concurrent=10),
+            retry_budget=RetryBudget(),
+            is_failure=is_stock_failure,
+            max_retries=0,
+        )
+        gateway = CachedStockProviderGateway(
+            ResilientStockProviderGateway(stock_gateway, policy),
+            cache=TTLCache(max_entries=10, ttl=10, stale_ttl=20, clock=self.clock),
+            negative_ttl=5,
+        )
+
+        with pytest.raises(ServiceUnavailableException):
+            await gateway.get_product_by_id(9)
+
+        # Dentro da janela negativa: a indisponibilidade não foi lembrada como "produto não encontrado"
+        assert await gateway.get_product_by_id(9) == {"id": 9}
+        assert gateway.stats()["negative_hits"] == 0
@@ -1,7 +1,41 @@
 import os
 from unittest.mock import patch
 
+import httpx
+import pytest
+
+from src.adapters.driven.providers.stock_provider.resilient_stock_provider_gateway import (
+    ResilientStockProviderGateway,
+    is_stock_failure,
+)
 from src.adapters.driven.providers.stock_provider.stock_microservice_gateway import StockMicroserviceGateway
+from src.constants.circuit_state import CircuitStateEnum
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.exceptions.service_unavailable_exception import ServiceUnavailableException
+from src.core.shared.resilience import Bulkhead, CircuitBreaker, ResiliencePolicy, RetryBudget
+
+STOCK_ENV = {
+    "STOCK_MICROSERVICE_URL": "test-stock-provider.com",
+    "STOCK_MICROSERVICE_X_API_KEY": "test-api-key"
+}
+
+
+def build_gateway(json_body, status_code=200):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status_code, json=json_body)
+
+    gateway = StockMicroserviceGateway(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return gateway, requests
+
+
+def assert_single_request(requests, url):
+    assert len(requests) == 1
+    assert str(requests[0].url) == url
+    assert requests[0].headers["Content-Type"] == "application/json"
+    assert requests[0].headers["x-api-key"] == "test-api-key"
 
 
 @patch.dict(os.environ, {"STOCK_MICROSERVICE_URL": "test-stock-provider.com"})
@@ -16,136 +50,113 @@ def test_change_base_url():
     gateway.base_url = new_url
     assert gateway.base_url == f"http://{new_url}"
 
-@patch.dict(os.environ, {
-    "STOCK_MICROSERVICE_URL": "test-stock-provider.com",
-    "STOCK_MICROSERVICE_X_API_KEY": "test-api-key"
-})
-@patch("requests.get")
-def test_get_product_by_id(mock_get):
-    mock_response = mock_get.return_value
-    mock_response.json.return_value = {"id": "123", "name": "Test Product"}
-    mock_response.status_code = 200
+@pytest.mark.anyio
+@patch.dict(os.environ, STOCK_ENV)
+async def test_get_product_by_id():
+    gateway, requests = build_gateway({"id": "123", "name": "Test Product"})
 
-    gateway = StockMicroserviceGateway()
-    product = gateway.get_product_by_id("123")
+    product = await gateway.get_product_by_id("123")
 
     assert product == {"id": "123", "name": "Test Product"}
-    mock_get.assert_called_once_with(
-        "http://test-stock-provider.com/products/123/id",
-        headers={
-            'Content-Type': 'application/json',
-            "x-api-key": "test-api-key"
-        }
+    assert_single_request(requests, "http://test-stock-provider.com/products/123/id")
+
+@pytest.mark.anyio
+@patch.dict(os.environ, STOCK_ENV)
+async def test_get_product_by_id_not_found():
+    gateway, _ = build_gateway({"detail": "not found"}, status_code=404)
+
+    with pytest.raises(EntityNotFoundException):
+        await gateway.get_product_by_id("123")
+
+@pytest.mark.anyio
+@patch.dict(os.environ, STOCK_ENV)
+async def test_get_product_by_id_service_error_is_not_a_missing_product():
+    gateway, _ = build_gateway({"detail": "unavailable"}, status_code=503)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await gateway.get_product_by_id("123")
+
+@pytest.mark.anyio
+@patch.dict(os.environ, STOCK_ENV)
+async def test_product_lookup_outage_opens_the_breaker():
+    gateway, requests = build_gateway({"detail": "unavailable"}, status_code=503)
+    breaker = CircuitBreaker("stock", failure_threshold=2, recovery_timeout=30)
+    policy = ResiliencePolicy(
+        "stock",
+        breaker=breaker,
+        bulkhead=Bulkhead("stock", max_concurrent=10),
+        retry_budget=RetryBudget(),
+        is_failure=is_stock_failure,
+        max_retries=0,
     )
+    resilient_gateway = ResilientStockProviderGateway(gateway, policy)
 
+    for _ in range(2):
+        with pytest.raises(ServiceUnavailableException):
+            await resilient_gateway.get_product_by_id("123")
 
-@patch.dict(os.environ, {
-    "STOCK_MICROSERVICE_URL": "test-stock-provider.com",
-    "STOCK_MICROSERVICE_X_API_KEY": "test-api-key"
-})
-@patch("requests.get")
-def test_get_products_by_category_name(mock_get):
-    mock_response = mock_get.return_value
-    mock_response.json.return_value = [{"id": "123", "name": "Test Product"}]
-    mock_response.status_code = 200
+    assert breaker.state is CircuitStateEnum.OPEN
+    with pytest.raises(ServiceUnavailableException):
+        await resilient_gateway.get_product_by_id("123")
+    assert len(requests) == 2
 
-    gateway = StockMicroserviceGateway()
-    products = gateway.get_products_by_category_name("Test Category")
+@pytest.mark.anyio
+@patch.dict(os.environ, STOCK_ENV)
+async def test_get_products_by_category_name():
+    gateway, requests = build_gateway([{"id": "123", "name": "Test Product"}])
+
+    products = await gateway.get_products_by_category_name("Test Category")
 
     assert products == [{"id": "123", "name": "Test Product"}]
-    mock_get.assert_called_once_with(
-        "http://test-stock-provider.com/categories/Test Category/products",
-        headers={
-            'Content-Type': 'application/json',
-            "x-api-key": "test-api-key"
-        }
-    )
+    assert_single_request(requests, "http://test-stock-provider.com/categories/Test%20Category/products")
 
-@patch.dict(os.environ, {
-    "STOCK_MICROSERVICE_URL": "test-stock-provider.com",
-    "STOCK_MICROSERVICE_X_API_KEY": "test-api-key"
-})
-@patch("requests.get")
-def test_get_product_by_name(mock_get):
-    mock_response = mock_get.return_value
-    mock_response.json.return_value = [{"id": "123", "name": "Test Product"}]
-    mock_response.status_code = 200
+@pytest.mark.anyio
+@patch.dict(os.environ, STOCK_ENV)
+async def test_get_product_by_name():
+    gateway, requests = build_gateway([{"id": "123", "name": "Test Product"}])
 
-    gateway = StockMicroserviceGateway()
-    product = gateway.get_product_by_name("Test Product")
+    product = await gateway.get_product_by_name("Test Product")
 
     assert product == {"id": "123", "name": "Test Product"}
-    mock_get.assert_called_once_with(
-        "http://test-stock-provider.com/products/Test Product/name",
-        headers={
-            'Content-Type': 'application/json',
-            "x-api-key": "test-api-key"
-        }
-    )
-    
-@patch.dict(os.environ, {
-    "STOCK_MICROSERVICE_URL": "test-stock-provider.com",
-    "STOCK_MICROSERVICE_X_API_KEY": "test-api-key"
-})
-@patch("requests.get")
-def test_get_categories(mock_get):
-    mock_response = mock_get.return_value
-    mock_response.json.return_value = [{"name": "Test Category"}]
-    mock_response.status_code = 200
+    assert_single_request(requests, "http://test-stock-provider.com/products/Test%20Product/name")
 
-    gateway = StockMicroserviceGateway()
-    categories = gateway.get_categories()
+@pytest.mark.anyio
+@patch.dict(os.environ, STOCK_ENV)
+async def test_get_categories():
+    gateway, requests = build_gateway([{"name": "Test Category"}])
+
+    categories = await gateway.get_categories()
 
     assert categories == [{"name": "Test Category"}]
-    mock_get.assert_called_once_with(
-        "http://test-stock-provider.com/categories",
-        headers={
-            'Content-Type': 'application/json',
-            "x-api-key": "test-api-key"
-        }
-    )
+    assert_single_request(requests, "http://test-stock-provider.com/categories")
 
-@patch.dict(os.environ, {
-    "STOCK_MICROSERVICE_URL": "test-stock-provider.com",
-    "STOCK_MICROSERVICE_X_API_KEY": "test-api-key"
-})
-@patch("requests.get")
-def test_get_category_by_id(mock_get):
-    mock_response = mock_get.return_value
-    mock_response.json.return_value = {"id": "123", "name": "Test Category"}
-    mock_response.status_code = 200
+@pytest.mark.anyio
+@patch.dict(os.environ, STOCK_ENV)
+async def test_get_category_by_id():
+    gateway, requests = build_gateway({"id": "123", "name": "Test Category"})
 
-    gateway = StockMicroserviceGateway()
-    category = gateway.get_category_by_id("123")
+    category = await gateway.get_category_by_id("123")
 
     assert category == {"id": "123", "name": "Test Category"}
-    mock_get.assert_called_once_with(
-        "http://test-stock-provider.com/categories/123/id",
-        headers={
-            'Content-Type': 'application/json',
-            "x-api-key": "test-api-key"
-        }
-    )
+    assert_single_request(requests, "http://test-stock-provider.com/categories/123/id")
 
+@pytest.mark.anyio
+@patch.dict(os.environ, STOCK_ENV)
+async def test_get_category_by_name():
+    gateway, requests = build_gateway({"id": "123", "name": "Test Category"})
 
-@patch.dict(os.environ, {
-    "STOCK_MICROSERVICE_URL": "test-stock-provider.com",
-    "STOCK_MICROSERVICE_X_API_KEY": "test-api-key"
-})
-@patch("requests.get")
-def test_get_category_by_name(mock_get):
-    mock_response = mock_get.return_value
-    mock_response.json.return_value = {"id": "123", "name": "Test Category"}
-    mock_response.status_code = 200
-
-    gateway = StockMicroserviceGateway()
-    category = gateway.get_category_by_name("Test Category")
+    category = await gateway.get_category_by_name("Test Category")
 
     assert category == {"id": "123", "name": "Test Category"}
-    mock_get.assert_called_once_with(
-        "http://test-stock-provider.com/categories/Test Category/name",
-        headers={
-            'Content-Type': 'application/json',
-            "x-api-key": "test-api-key"
-        }
-    )
+    assert_single_request(requests, "http://test-stock-provider.com/categories/Test%20Category/name")
+
+@pytest.mark.anyio
+@patch.dict(os.environ, STOCK_ENV)
+async def test_requests_reuse_the_shared_client():
+    gateway, requests = build_gateway({"id": "123", "name": "Test Product"})
+
+    await gateway.get_product_by_id("123")
+    await gateway.get_category_by_id("123")
+
+    assert len(requests) == 2
+    assert not gateway._http_client.is_closed
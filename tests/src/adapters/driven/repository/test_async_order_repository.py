@@ -0,0 +1,78 @@
+import pytest
+
+from src.adapters.driven.repositories.async_order_repository import AsyncOrderRepository
+from src.adapters.driven.repositories.models.order_status_model import OrderStatusModel
+from src.adapters.driven.repositories.async_order_status_repository import AsyncOrderStatusRepository
+from src.constants.order_status import OrderStatusEnum
+from src.core.domain.entities.order import Order
+from tests.factories.order_factory import OrderFactory
+from tests.factories.order_item_factory import OrderItemFactory
+
+
+@pytest.mark.anyio
+class TestAsyncOrderRepository:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, async_db_session, populate_order_status):
+        self.db_session = db_session
+        self.repository = AsyncOrderRepository(async_db_session)
+        self.order_status_repository = AsyncOrderStatusRepository(async_db_session)
+
+    def _get_status_model(self, status: str) -> OrderStatusModel:
+        return self.db_session.query(OrderStatusModel).filter_by(status=status).one()
+
+    async def test_create_and_get_by_id_success(self):
+        order_status = await self.order_status_repository.get_by_status(OrderStatusEnum.ORDER_PENDING.status)
+        order = Order(id_customer="customer", order_status=order_status, id_employee="employee")
+
+        created_order = await self.repository.create(order)
+        order_from_db = await self.repository.get_by_id(created_order.id)
+
+        assert created_order.id is not None
+        assert order_from_db.id == created_order.id
+        assert order_from_db.id_customer == "customer"
+        assert order_from_db.order_status.status == OrderStatusEnum.ORDER_PENDING.status
+
+    async def test_get_by_id_returns_none_when_not_found(self):
+        assert await self.repository.get_by_id(999) is None
+
+    async def test_get_by_customer_id_loads_items(self):
+        order = OrderFactory()
+        OrderItemFactory(order=order)
+
+        orders = await self.repository.get_by_customer_id(order.id_customer)
+
+        assert len(orders) == 1
+        assert len(orders[0].order_items) == 1
+
+    async def test_get_all_filters_by_status(self):
+        OrderFactory(order_status=self._get_status_model(OrderStatusEnum.ORDER_PAID.status))
+        OrderFactory(order_status=self._get_status_model(OrderStatusEnum.ORDER_PREPARING.status))
+
+        orders = await self.repository.get_all(status=[OrderStatusEnum.ORDER_PAID.status])
+
+        assert len(orders) == 1
+        assert orders[0].order_status.status == OrderStatusEnum.ORDER_PAID.status
+
+    async def test_update_writes_the_tracked_changes(self):
+        order = OrderFactory()
+        paid_status = await self.order_status_repository.get_by_status(OrderStatusEnum.ORDER_PAID.status)
+
+        loaded_order = await self.repository.get_by_id(order.id)
+        loaded_order.order_status = paid_status
+        await self.repository.update(loaded_order)
+
+        self.db_session.expire_all()
+        assert self._get_status_model(OrderStatusEnum.ORDER_PAID.status).id == (
+            self.db_session.get(type(order), order.id).id_order_status
+        )
+
+    async def test_release_ends_the_read_transaction(self, async_db_session):
+        order = OrderFactory()
+        await self.repository.get_by_id(order.id)
+        assert async_db_session.in_transaction()
+
+        await self.repository.release()
+
+        assert not async_db_session.in_transaction()
+        assert (await self.repository.get_by_id(order.id)).id == order.id
@@ -0,0 +1,30 @@
+from datetime import datetime
+import pytest
+
+from src.adapters.driven.repositories.async_order_status_repository import AsyncOrderStatusRepository
+from src.core.domain.entities.order_status import OrderStatus
+from tests.factories.order_status_factory import OrderStatusFactory
+
+
+@pytest.mark.anyio
+class TestAsyncOrderStatusRepository:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, async_db_session):
+        self.repository = AsyncOrderStatusRepository(async_db_session)
+
+    async def test_create_order_status_success(self):
+        created = await self.repository.create(OrderStatus(status="PENDING", description="Order is pending"))
+
+        assert created.id is not None
+        assert await self.repository.exists_by_status("PENDING") is True
+
+    async def test_get_all_excludes_inactivated(self):
+        OrderStatusFactory(status="PENDING", description="Order is pending")
+        OrderStatusFactory(status="PAID", description="Order is paid", inactivated_at=datetime.now())
+
+        active = await self.repository.get_all()
+        everything = await self.repository.get_all(include_deleted=True)
+
+        assert [status.status for status in active] == ["PENDING"]
+        assert len(everything) == 2
@@ -1,16 +1,25 @@
 import pytest
-from sqlalchemy.exc import IntegrityError
+from unittest.mock import patch
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError, OperationalError
 
 from src.adapters.driven.repositories.models.order_model import OrderModel
+from src.adapters.driven.repositories.models.order_status_model import OrderStatusModel
 from src.adapters.driven.repositories.order_status_repository import OrderStatusRepository
+from src.constants.order_load_profile import OrderLoadProfileEnum
 from src.constants.product_category import ProductCategoryEnum
+from src.core.shared.identity_map import IdentityMap
+from src.core.shared.order_page_cursor import OrderPageCursor
 from src.core.exceptions.bad_request_exception import BadRequestException
+from src.core.exceptions.concurrent_update_exception import ConcurrentUpdateException
 from src.adapters.driven.repositories.order_repository import OrderRepository
 from src.core.domain.entities.order import Order
+from src.core.domain.entities.order_item import OrderItem
 from src.constants.order_status import OrderStatusEnum
 from tests.factories.order_factory import OrderFactory
 from tests.factories.order_item_factory import OrderItemFactory
 from tests.factories.order_status_factory import OrderStatusFactory
+from tests.factories.order_status_movement_factory import OrderStatusMovementFactory
 
 
 class TestOrderRepository:
@@ -436,3 +445,243 @@ class TestOrderRepository:
         order = self.repository.update(order)
         assert len(order.order_items) == 0
         assert order.order_status.status == OrderStatusEnum.ORDER_WAITING_BURGERS.status
+
+    def _count_queries(self, callback, reset=True):
+        statements = []
+        engine = self.db_session.get_bind()
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        if reset:
+            IdentityMap.get_instance().clear()
+            self.db_session.expire_all()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            result = callback()
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        return result, len(statements)
+
+    def test_get_all_runs_a_fixed_number_of_queries(self):
+        for _ in range(2):
+            OrderItemFactory.create_batch(2, order=OrderFactory())
+        orders, queries_with_two_orders = self._count_queries(lambda: self.repository.get_all())
+
+        for _ in range(5):
+            OrderItemFactory.create_batch(2, order=OrderFactory())
+        orders, queries_with_seven_orders = self._count_queries(lambda: self.repository.get_all())
+
+        assert len(orders) == 7
+        assert all(len(order.order_items) == 2 for order in orders)
+        assert queries_with_two_orders == 2
+        assert queries_with_seven_orders == queries_with_two_orders
+
+    def test_get_by_id_summary_profile_does_not_load_collections(self):
+        order_model = OrderFactory()
+        OrderItemFactory(order=order_model)
+        order_id, order_status_id = order_model.id, order_model.order_status.id
+
+        order, queries = self._count_queries(
+            lambda: self.repository.get_by_id(order_id, profile=OrderLoadProfileEnum.SUMMARY)
+        )
+
+        assert queries == 1
+        assert order.order_status.id == order_status_id
+        assert order.order_items == []
+
+    def test_richer_profile_fills_collections_of_mapped_order(self):
+        order_model = OrderFactory()
+        OrderItemFactory(order=order_model)
+
+        summary, _ = self._count_queries(
+            lambda: self.repository.get_by_id(order_model.id, profile=OrderLoadProfileEnum.SUMMARY)
+        )
+        assert summary.unloaded_relations == {"order_items", "status_history"}
+        full = self.repository.get_by_id(order_model.id, profile=OrderLoadProfileEnum.FULL_HISTORY)
+
+        assert full is summary
+        assert len(full.order_items) == 1
+        assert full.unloaded_relations == set()
+        assert not hasattr(full, "_pending_relations")
+
+    def _create_order_with_items(self, status: OrderStatusEnum, quantity: int = 1) -> Order:
+        order_status_model = self.db_session.query(OrderStatusModel).filter(OrderStatusModel.status == status.status).first()
+        order_model = OrderFactory(order_status=order_status_model)
+        OrderItemFactory(order=order_model, quantity=quantity, product_category_name=ProductCategoryEnum.BURGERS.name)
+        order_id = order_model.id
+        IdentityMap.get_instance().clear()
+        self.db_session.expire_all()
+        return self.repository.get_by_id(order_id)
+
+    def test_update_status_advance_writes_only_the_movement_and_the_status(self):
+        order = self._create_order_with_items(OrderStatusEnum.ORDER_READY_TO_PLACE)
+
+        order.advance_order_status(self.order_status_repository)
+        _, statements = self._count_queries(lambda: self.repository.update(order), reset=False)
+
+        assert statements == 2
+        assert order.status_history[-1].id is not None
+
+        IdentityMap.get_instance().clear()
+        self.db_session.expire_all()
+        order_from_db = self.repository.get_by_id(order.id)
+        assert order_from_db.order_status.status == OrderStatusEnum.ORDER_PLACED.status
+        assert [movement.new_status for movement in order_from_db.status_history] == [OrderStatusEnum.ORDER_PLACED.status]
+
+    def test_update_without_changes_writes_nothing(self):
+        order = self._create_order_with_items(OrderStatusEnum.ORDER_WAITING_BURGERS)
+
+        _, statements = self._count_queries(lambda: self.repository.update(order), reset=False)
+
+        assert statements == 0
+
+    def test_update_writes_item_changes_as_single_rows(self):
+        # Cada gravação é a linha do item mais a verificação/incremento da versão do pedido
+        order = self._create_order_with_items(OrderStatusEnum.ORDER_WAITING_BURGERS, quantity=3)
+        item = order.order_items[0]
+
+        version = order.version
+
+        order.change_item_quantity(item, 2)
+        _, statements = self._count_queries(lambda: self.repository.update(order), reset=False)
+        assert statements == 2
+
+        new_item = OrderItem(
+            order=order, product_id="2", product_name="X-Salada", product_price=20.0, quantity=1,
+            product_category_name=ProductCategoryEnum.BURGERS.name
+        )
+        order.add_item(new_item)
+        _, statements = self._count_queries(lambda: self.repository.update(order), reset=False)
+        assert statements == 2
+        assert new_item.id is not None
+        assert new_item.product_id == 2
+        assert order.version == version + 2
+
+        order.clear_order(self.order_status_repository)
+        _, statements = self._count_queries(lambda: self.repository.update(order), reset=False)
+        assert statements == 2
+
+        IdentityMap.get_instance().clear()
+        self.db_session.expire_all()
+        assert self.repository.get_by_id(order.id).order_items == []
+
+    def _simulate_concurrent_write(self, order: Order) -> None:
+        self.db_session.query(OrderModel).filter_by(id=order.id).update({"version": OrderModel.version + 1})
+        self.db_session.commit()
+
+    def test_update_of_stale_order_raises_conflict_and_writes_nothing(self):
+        order = self._create_order_with_items(OrderStatusEnum.ORDER_WAITING_BURGERS, quantity=3)
+        item = order.order_items[0]
+        self._simulate_concurrent_write(order)
+
+        order.change_item_quantity(item, 1)
+        with pytest.raises(ConcurrentUpdateException) as exc_info:
+            self.repository.update(order)
+
+        assert exc_info.value.expected_version == order.version
+        assert IdentityMap.get_instance().get(Order, order.id) is None
+
+        fresh_order = self.repository.get_by_id(order.id)
+        assert fresh_order is not order
+        assert fresh_order.version == order.version + 1
+        assert fresh_order.order_items[0].quantity == 3
+
+    def test_update_failure_rolls_back_and_evicts_the_order(self):
+        order = self._create_order_with_items(OrderStatusEnum.ORDER_WAITING_BURGERS, quantity=3)
+        order.change_item_quantity(order.order_items[0], 1)
+
+        with patch.object(self.db_session, "commit", side_effect=OperationalError("COMMIT", {}, Exception("gone away"))):
+            with pytest.raises(OperationalError):
+                self.repository.update(order)
+
+        assert not self.db_session.in_transaction()
+        assert IdentityMap.get_instance().get(Order, order.id) is None
+        fresh_order = self.repository.get_by_id(order.id)
+        assert fresh_order.version == order.version
+        assert fresh_order.order_items[0].quantity == 3
+
+    def test_update_many_rolls_back_the_batch_on_conflict(self):
+        first = self._create_order_with_items(OrderStatusEnum.ORDER_READY_TO_PLACE)
+        second = self._create_order_with_items(OrderStatusEnum.ORDER_READY_TO_PLACE)
+        self._simulate_concurrent_write(second)
+
+        for order in (first, second):
+            order.advance_order_status(self.order_status_repository)
+        with pytest.raises(ConcurrentUpdateException):
+            self.repository.update_many([first, second])
+
+        IdentityMap.get_instance().clear()
+        self.db_session.expire_all()
+        assert self.repository.get_by_id(first.id).order_status.status == OrderStatusEnum.ORDER_READY_TO_PLACE.status
+        assert self.repository.get_by_id(first.id).version == first.version
+
+    def test_update_many_conflict_evicts_the_orders_not_written_yet(self):
+        first = self._create_order_with_items(OrderStatusEnum.ORDER_READY_TO_PLACE)
+        second = self._create_order_with_items(OrderStatusEnum.ORDER_READY_TO_PLACE)
+        self._simulate_concurrent_write(first)
+
+        for order in (first, second):
+            order.advance_order_status(self.order_status_repository)
+        with pytest.raises(ConcurrentUpdateException):
+            self.repository.update_many([first, second])
+
+        assert IdentityMap.get_instance().get(Order, first.id) is None
+        assert IdentityMap.get_instance().get(Order, second.id) is None
+        fresh_second = self.repository.get_by_id(second.id)
+        assert fresh_second is not second
+        assert fresh_second.order_status.status == OrderStatusEnum.ORDER_READY_TO_PLACE.status
+
+    def test_update_of_untracked_order_falls_back_to_merge(self):
+        order_model = OrderFactory()
+        order_model.id_customer = "untracked"
+
+        updated_order = self.repository.update(order_model)
+
+        assert updated_order.id_customer == "untracked"
+
+    def test_update_never_rewrites_persisted_movements(self):
+        order = self._create_order_with_items(OrderStatusEnum.ORDER_READY_TO_PLACE)
+        order.advance_order_status(self.order_status_repository)
+        order = self.repository.update(order)
+        first_movement_id = order.status_history[-1].id
+
+        IdentityMap.get_instance().clear()
+        self.db_session.expire_all()
+        order = self.repository.get_by_id(order.id)
+        order.advance_order_status(self.order_status_repository)
+        order = self.repository.update(order)
+
+        movement_ids = [movement.id for movement in self.repository.get_status_history(order.id)]
+        assert movement_ids[0] == first_movement_id
+        assert len(movement_ids) == 2
+
+    def test_get_status_history_pages_by_cursor(self):
+        order_model = OrderFactory()
+        movement_ids = [OrderStatusMovementFactory(order=order_model).id for _ in range(5)]
+
+        first_page = self.repository.get_status_history(order_model.id, limit=2)
+        second_page = self.repository.get_status_history(order_model.id, limit=2, after_id=first_page[-1].id)
+        last_page = self.repository.get_status_history(order_model.id, limit=2, after_id=second_page[-1].id)
+
+        assert [movement.id for movement in first_page + second_page + last_page] == movement_ids
+        assert len(last_page) == 1
+
+    def test_get_all_pages_by_keyset_cursor(self):
+        order_status_models = {
+            status.status: self.db_session.query(OrderStatusModel).filter(OrderStatusModel.status == status.status).first()
+            for status in (OrderStatusEnum.ORDER_PAID, OrderStatusEnum.ORDER_READY)
+        }
+        ready_ids = [OrderFactory(order_status=order_status_models[OrderStatusEnum.ORDER_READY.status]).id for _ in range(2)]
+        paid_ids = [OrderFactory(order_status=order_status_models[OrderStatusEnum.ORDER_PAID.status]).id for _ in range(3)]
+
+        listed_ids = []
+        cursor = None
+        while True:
+            page = self.repository.get_all(limit=2, after=cursor, profile=OrderLoadProfileEnum.SUMMARY)
+            listed_ids.extend(order.id for order in page)
+            if len(page) < 2:
+                break
+            cursor = OrderPageCursor.from_order(page[-1])
+
+        assert listed_ids == paid_ids + ready_ids
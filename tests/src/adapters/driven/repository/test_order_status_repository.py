@@ -1,8 +1,11 @@
 import pytest
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
 
 from src.adapters.driven.repositories.order_status_repository import OrderStatusRepository
 from src.core.domain.entities.order_status import OrderStatus
+from src.core.shared.identity_map import IdentityMap
+from src.core.shared.order_status_registry import OrderStatusRegistry
 from tests.factories.order_status_factory import OrderStatusFactory
 from src.adapters.driven.repositories.models.order_status_model import OrderStatusModel
 
@@ -100,3 +103,56 @@ class TestOrderStatusRepository:
 
         db_order_status = self.db_session.query(OrderStatusModel).filter_by(status="PENDING").first()
         assert db_order_status is None
+
+    def _count_queries(self, callback):
+        statements = []
+        engine = self.db_session.get_bind()
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            result = callback()
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        return result, len(statements)
+
+    def test_registry_serves_statuses_without_queries(self):
+        OrderStatusFactory(status="PENDING", description="Order is pending")
+        paid_id = OrderStatusFactory(status="PAID", description="Order is paid").id
+        repository = OrderStatusRepository(self.db_session, OrderStatusRegistry())
+        repository.warm_registry()
+        IdentityMap.get_instance().clear()
+
+        (pending, paid, exists), queries = self._count_queries(lambda: (
+            repository.get_by_status("PENDING"),
+            repository.get_by_id(paid_id),
+            repository.exists_by_status("PAID"),
+        ))
+
+        assert pending.status == "PENDING"
+        assert paid.status == "PAID"
+        assert exists is True
+        assert queries == 0
+
+    def test_registry_falls_back_to_database_for_unknown_status(self):
+        repository = OrderStatusRepository(self.db_session, OrderStatusRegistry())
+        repository.warm_registry()
+        OrderStatusFactory(status="PENDING", description="Order is pending")
+
+        assert repository.get_by_status("PENDING").status == "PENDING"
+        assert repository.registry.get_by_status("PENDING") is not None
+
+    def test_registry_is_invalidated_by_writes(self):
+        registry = OrderStatusRegistry()
+        repository = OrderStatusRepository(self.db_session, registry)
+        order_status = repository.create(OrderStatus(status="PENDING", description="Order is pending"))
+        repository.get_by_status("PENDING")
+
+        order_status.description = "Updated"
+        repository.update(order_status)
+        assert registry.is_warm is False
+
+        IdentityMap.get_instance().clear()
+        assert repository.get_by_status("PENDING").description == "Updated"
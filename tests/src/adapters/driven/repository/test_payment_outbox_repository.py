@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.adapters.driven.repositories.payment_outbox_repository import PaymentOutboxRepository
+from src.constants.payment_outbox_status import PaymentOutboxStatusEnum
+from src.core.domain.entities.payment_outbox_entry import PaymentOutboxEntry
+from tests.factories.order_factory import OrderFactory
+
+
+class TestPaymentOutboxRepository:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        self.db_session = db_session
+        self.repository = PaymentOutboxRepository(db_session)
+
+    def add_entry(self, **kwargs) -> PaymentOutboxEntry:
+        entry = self.repository.add(PaymentOutboxEntry(id_order=OrderFactory().id, payload={"title": "order"}, **kwargs))
+        self.db_session.commit()
+        return entry
+
+    def test_add_is_only_staged_until_the_transaction_commits(self):
+        order = OrderFactory()
+        self.repository.add(PaymentOutboxEntry(id_order=order.id, payload={}))
+        self.db_session.rollback()
+
+        assert self.repository.get_by_order_id(order.id) is None
+
+    def test_claim_due_leases_the_entries_and_counts_the_attempt(self):
+        entry = self.add_entry()
+
+        claimed = self.repository.claim_due(limit=10, lease_seconds=60)
+
+        assert [(e.id, e.attempts) for e in claimed] == [(entry.id, 1)]
+        assert self.repository.claim_due(limit=10, lease_seconds=60) == []
+
+    def test_claim_due_skips_entries_not_due_yet_and_finished_ones(self):
+        self.add_entry(next_attempt_at=datetime.now(timezone.utc) + timedelta(minutes=5))
+        self.add_entry(status=PaymentOutboxStatusEnum.FAILED.status)
+        due = self.add_entry()
+
+        assert [e.id for e in self.repository.claim_due(limit=10, lease_seconds=60)] == [due.id]
+
+    def test_expired_lease_makes_the_entry_due_again(self):
+        entry = self.add_entry()
+        self.repository.claim_due(limit=10, lease_seconds=0)
+
+        assert [(e.id, e.attempts) for e in self.repository.claim_due(limit=10, lease_seconds=60)] == [(entry.id, 2)]
@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.adapters.driven.repositories.payment_webhook_inbox_repository import PaymentWebhookInboxRepository
+from src.constants.payment_status import PaymentStatusEnum
+from src.core.domain.dtos.webhook.payment_webhook_dto import PaymentWebhookDTO
+
+
+def build_dto(payment_id="pay-1", transaction_id="txn-1", event="payment.completed", status=PaymentStatusEnum.PAYMENT_COMPLETED.status):
+    return PaymentWebhookDTO(
+        event=event,
+        payment_id=payment_id,
+        external_reference="order_1",
+        amount=10.0,
+        status=status,
+        transaction_id=transaction_id,
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+class TestPaymentWebhookInboxRepository:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        self.repository = PaymentWebhookInboxRepository(db_session, max_attempts=2)
+
+    def test_enqueue_drops_redeliveries_of_the_same_key(self):
+        assert self.repository.enqueue(build_dto()) is True
+        assert self.repository.enqueue(build_dto()) is False
+        assert self.repository.enqueue(build_dto(transaction_id="txn-2")) is True
+
+        assert [event.transaction_id for event in self.repository.fetch_pending(10)] == ["txn-1", "txn-2"]
+
+    def test_fetch_pending_respects_limit_and_arrival_order(self):
+        for index in range(3):
+            self.repository.enqueue(build_dto(payment_id=f"pay-{index}"))
+
+        assert [event.payment_id for event in self.repository.fetch_pending(2)] == ["pay-0", "pay-1"]
+
+    def test_processed_and_discarded_events_leave_the_queue(self):
+        self.repository.enqueue(build_dto(payment_id="pay-1"))
+        self.repository.enqueue(build_dto(payment_id="pay-2"))
+        first, second = self.repository.fetch_pending(10)
+
+        self.repository.mark_processed([first.id])
+        self.repository.mark_discarded({second.id: "not completed"})
+
+        assert self.repository.fetch_pending(10) == []
+
+    def test_failed_events_are_retried_until_the_attempt_limit(self):
+        self.repository.enqueue(build_dto())
+        event = self.repository.fetch_pending(10)[0]
+
+        self.repository.mark_failed({event.id: "order not found"})
+        retried = self.repository.fetch_pending(10)
+        assert [(e.attempts, e.last_error) for e in retried] == [(1, "order not found")]
+
+        self.repository.mark_failed({event.id: "order not found"})
+        assert self.repository.fetch_pending(10) == []
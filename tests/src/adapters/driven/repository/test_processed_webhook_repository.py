@@ -0,0 +1,132 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+
+from src.adapters.driven.repositories.models.processed_webhook_model import ProcessedWebhookModel
+from src.adapters.driven.repositories.processed_webhook_repository import ProcessedWebhookRepository
+from src.core.shared.ttl_cache import TTLCache
+
+
+class TestProcessedWebhookRepository:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        self.db_session = db_session
+        self.cache = TTLCache(max_entries=10, ttl=60)
+        self.repository = ProcessedWebhookRepository(db_session, cache=self.cache, ttl=60, purge_probability=0)
+
+    def record(self, payment_id, transaction_id, event_name, repository=None):
+        recorded = (repository or self.repository).add_processed(payment_id, transaction_id, event_name)
+        self.db_session.commit()
+        return recorded
+
+    def count_queries(self):
+        statements = []
+        engine = self.db_session.get_bind()
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        return statements, lambda: event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    def test_unknown_delivery_is_not_processed(self):
+        assert self.repository.is_processed("pay-1", "txn-1", "payment.completed") is False
+
+    def test_marked_delivery_is_processed(self):
+        assert self.record("pay-1", "txn-1", "payment.completed") is True
+
+        assert self.repository.is_processed("pay-1", "txn-1", "payment.completed") is True
+        assert self.repository.is_processed("pay-1", "txn-2", "payment.completed") is False
+        assert self.repository.is_processed("pay-1", "txn-1", "payment.refunded") is False
+
+    def test_repeated_lookup_is_served_from_cache(self):
+        self.record("pay-1", "txn-1", "payment.completed")
+        self.repository.is_processed("pay-1", "txn-1", "payment.completed")
+        statements, stop = self.count_queries()
+        try:
+            assert self.repository.is_processed("pay-1", "txn-1", "payment.completed") is True
+        finally:
+            stop()
+
+        assert statements == []
+
+    def test_lookup_after_cache_miss_hits_the_database_once_and_warms_cache(self):
+        self.record("pay-1", "txn-1", "payment.completed")
+
+        statements, stop = self.count_queries()
+        try:
+            assert self.repository.is_processed("pay-1", "txn-1", "payment.completed") is True
+            assert self.repository.is_processed("pay-1", "txn-1", "payment.completed") is True
+        finally:
+            stop()
+
+        assert len(statements) == 1
+
+    def test_recording_the_same_key_twice_reports_duplicate(self):
+        assert self.record("pay-1", "txn-1", "payment.completed") is True
+        assert self.record("pay-1", "txn-1", "payment.completed") is False
+        assert self.db_session.query(ProcessedWebhookModel).count() == 1
+
+    def test_expired_key_is_not_processed_and_can_be_recorded_again(self):
+        self.record("pay-1", "txn-1", "payment.completed")
+        self.db_session.query(ProcessedWebhookModel).update(
+            {"expires_at": datetime.now(timezone.utc) - timedelta(seconds=1)}
+        )
+        self.db_session.commit()
+        self.cache.clear()
+
+        assert self.repository.is_processed("pay-1", "txn-1", "payment.completed") is False
+        assert self.record("pay-1", "txn-1", "payment.completed") is True
+        assert self.repository.is_processed("pay-1", "txn-1", "payment.completed") is True
+
+    def test_purge_expired_removes_only_expired_keys(self):
+        self.record("pay-1", "txn-1", "payment.completed")
+        self.record("pay-2", "txn-2", "payment.completed")
+        self.db_session.query(ProcessedWebhookModel).filter_by(payment_id="pay-1").update(
+            {"expires_at": datetime.now(timezone.utc) - timedelta(seconds=1)}
+        )
+        self.db_session.commit()
+
+        assert self.repository.purge_expired() == 1
+        assert [model.payment_id for model in self.db_session.query(ProcessedWebhookModel)] == ["pay-2"]
+
+    def test_add_processed_purges_expired_keys_when_sampled(self, db_session):
+        repository = ProcessedWebhookRepository(db_session, ttl=60, purge_probability=1, random_source=lambda: 0.0)
+        self.record("pay-1", "txn-1", "payment.completed", repository)
+        db_session.query(ProcessedWebhookModel).update(
+            {"expires_at": datetime.now(timezone.utc) - timedelta(seconds=1)}
+        )
+        db_session.commit()
+
+        self.record("pay-2", "txn-2", "payment.completed", repository)
+
+        assert [model.payment_id for model in db_session.query(ProcessedWebhookModel)] == ["pay-2"]
+
+    def test_added_delivery_is_recorded_with_the_callers_transaction(self):
+        assert self.repository.add_processed("pay-1", "txn-1", "payment.completed") is True
+        self.db_session.rollback()
+        assert self.repository.is_processed("pay-1", "txn-1", "payment.completed") is False
+
+        assert self.repository.add_processed("pay-1", "txn-1", "payment.completed") is True
+        self.db_session.commit()
+        assert self.repository.is_processed("pay-1", "txn-1", "payment.completed") is True
+
+    def test_add_processed_reports_a_key_recorded_first(self):
+        self.record("pay-1", "txn-1", "payment.completed")
+
+        assert self.repository.add_processed("pay-1", "txn-1", "payment.completed") is False
+        assert not self.db_session.in_transaction()
+
+    def test_add_processed_replaces_an_expired_key(self):
+        self.record("pay-1", "txn-1", "payment.completed")
+        self.db_session.query(ProcessedWebhookModel).update(
+            {"expires_at": datetime.now(timezone.utc) - timedelta(seconds=1)}
+        )
+        self.db_session.commit()
+        self.cache.clear()
+
+        assert self.repository.add_processed("pay-1", "txn-1", "payment.completed") is True
+        self.db_session.commit()
+        assert self.repository.is_processed("pay-1", "txn-1", "payment.completed") is True
@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import event
+
+from src.adapters.driven.repositories.order_repository import OrderRepository
+from src.constants.order_load_profile import OrderLoadProfileEnum
+from src.constants.order_status import OrderStatusEnum
+from src.core.shared.identity_map import IdentityMap
+from tests.factories.order_factory import OrderFactory
+from tests.factories.order_item_factory import OrderItemFactory
+from tests.factories.order_status_movement_factory import OrderStatusMovementFactory
+
+
+class TestQueryPlans:
+    """Checks on SQLite that the hot lookups are served by the indexes of the lookup migration."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, populate_order_status):
+        self.db_session = db_session
+        self.repository = OrderRepository(db_session)
+        order = OrderFactory(payment_id="payment-1")
+        OrderItemFactory(order=order)
+        OrderStatusMovementFactory(order=order)
+        self.order_id, self.id_customer = order.id, order.id_customer
+        IdentityMap.get_instance().clear()
+        self.db_session.expire_all()
+
+    def _query_plans(self, callback):
+        statements = []
+        engine = self.db_session.get_bind()
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            callback()
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+        connection = self.db_session.connection()
+        return [
+            " | ".join(row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters))
+            for statement, parameters in statements
+        ]
+
+    def test_get_by_payment_id_uses_payment_id_index(self):
+        plans = self._query_plans(lambda: self.repository.get_by_payment_id("payment-1"))
+
+        assert "ix_orders_payment_id" in plans[0]
+
+    def test_get_by_customer_id_uses_customer_index(self):
+        plans = self._query_plans(
+            lambda: self.repository.get_by_customer_id(self.id_customer, profile=OrderLoadProfileEnum.SUMMARY)
+        )
+
+        assert "ix_orders_id_customer_inactivated_at" in plans[0]
+
+    def test_collections_are_loaded_through_foreign_key_indexes(self):
+        plans = self._query_plans(
+            lambda: self.repository.get_by_id(self.order_id, profile=OrderLoadProfileEnum.FULL_HISTORY)
+        )
+
+        assert any("ix_order_items_order_id" in plan for plan in plans)
+        assert any("ix_order_status_movements_id_order" in plan for plan in plans)
+
+    def test_status_history_page_uses_order_index(self):
+        plans = self._query_plans(lambda: self.repository.get_status_history(self.order_id))
+
+        assert "ix_order_status_movements_id_order" in plans[0]
+
+    def test_get_all_by_status_uses_status_index(self):
+        plans = self._query_plans(
+            lambda: self.repository.get_all(status=[OrderStatusEnum.ORDER_PAID.status], profile=OrderLoadProfileEnum.SUMMARY)
+        )
+
+        assert "ix_orders_id_order_status_created_at" in plans[0]
+        assert "SCAN orders" not in plans[0]
@@ -0,0 +1,133 @@
+from unittest.mock import MagicMock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from dependency_injector import providers
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from src.adapters.driver.api.v1.middleware.db_session_middleware import WRITE_MARKER_COOKIE, DbSessionMiddleware
+from src.core.containers import Container
+from src.core.shared.database_session_scope import AsyncDatabaseSessionScope, DatabaseSessionScope
+from src.core.shared.replica_routing import ReplicaRouter
+
+
+def build_app():
+    sessions = []
+
+    def session_factory():
+        session = MagicMock(name=f"session-{len(sessions)}")
+        sessions.append(session)
+        return session
+
+    app = FastAPI()
+    app.container = Container()
+    app.container.db_session_scope.override(
+        providers.ContextLocalSingleton(DatabaseSessionScope, session_factory=providers.Object(session_factory))
+    )
+    app.add_middleware(DbSessionMiddleware)
+
+    def get_session():
+        return app.container.db_session()
+
+    @app.get("/uses-db")
+    def uses_db(first=Depends(get_session), second=Depends(get_session)):
+        assert first is second
+        return {"closed": first.close.called}
+
+    @app.get("/no-db")
+    def no_db():
+        return {}
+
+    return app, sessions
+
+
+def test_each_request_gets_its_own_session_closed_at_response_end():
+    app, sessions = build_app()
+
+    with TestClient(app) as client:
+        assert client.get("/uses-db").json() == {"closed": False}
+        assert client.get("/uses-db").json() == {"closed": False}
+
+    assert len(sessions) == 2
+    assert sessions[0] is not sessions[1]
+    assert all(session.close.call_count == 1 for session in sessions)
+
+
+def test_session_is_not_opened_when_the_request_does_not_use_it():
+    app, sessions = build_app()
+
+    with TestClient(app) as client:
+        client.get("/no-db")
+
+    assert sessions == []
+
+
+def test_async_session_of_the_request_is_closed_at_response_end():
+    sessions = []
+
+    def session_factory():
+        session = MagicMock(spec=AsyncSession, name=f"async-session-{len(sessions)}")
+        sessions.append(session)
+        return session
+
+    app = FastAPI()
+    app.container = Container()
+    app.container.async_db_session_scope.override(
+        providers.ContextLocalSingleton(AsyncDatabaseSessionScope, session_factory=providers.Object(session_factory))
+    )
+    app.add_middleware(DbSessionMiddleware)
+
+    @app.get("/uses-async-db")
+    async def uses_async_db():
+        first, second = app.container.async_db_session(), app.container.async_db_session()
+        assert first is second
+        return {"closed": first.close.await_count}
+
+    with TestClient(app) as client:
+        assert client.get("/uses-async-db").json() == {"closed": 0}
+        assert client.get("/uses-async-db").json() == {"closed": 0}
+
+    assert len(sessions) == 2
+    assert all(session.close.await_count == 1 for session in sessions)
+
+
+def build_routed_app(clock):
+    # Cada app representa um worker/pod, com o seu próprio roteador
+    router = ReplicaRouter([MagicMock(name="replica")], sticky_seconds=5, clock=clock)
+    app = FastAPI()
+    app.container = Container()
+    app.container.db_session_scope.override(
+        providers.ContextLocalSingleton(DatabaseSessionScope, session_factory=providers.Object(MagicMock))
+    )
+    app.add_middleware(DbSessionMiddleware, router=router, secret_key="secret")
+
+    @app.post("/writes")
+    def write():
+        router.mark_write()
+        return {}
+
+    @app.get("/sticky")
+    def sticky():
+        return {"sticky": router.is_sticky()}
+
+    return app
+
+
+def test_write_marker_travels_with_the_client_to_another_worker():
+    now = [100.0]
+    clock = lambda: now[0]
+
+    with TestClient(build_routed_app(clock)) as writer, TestClient(build_routed_app(clock)) as reader:
+        assert WRITE_MARKER_COOKIE not in reader.get("/sticky").cookies
+
+        response = writer.post("/writes")
+        marker = response.cookies[WRITE_MARKER_COOKIE]
+        assert "Max-Age=5" in response.headers["set-cookie"]
+
+        assert reader.get("/sticky", cookies={WRITE_MARKER_COOKIE: marker}).json() == {"sticky": True}
+        assert reader.get("/sticky", cookies={WRITE_MARKER_COOKIE: "100.000.forged"}).json() == {"sticky": False}
+        assert WRITE_MARKER_COOKIE not in reader.get("/sticky", cookies={WRITE_MARKER_COOKIE: marker}).cookies
+
+        now[0] = 106.0
+        assert reader.get("/sticky", cookies={WRITE_MARKER_COOKIE: marker}).json() == {"sticky": False}
@@ -0,0 +1,109 @@
+from fastapi import FastAPI, status
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.adapters.driver.api.v1.decorators.bypass_auth import bypass_auth
+from src.adapters.driver.api.v1.middleware.api_key_middleware import ApiKeyMiddleware
+from src.adapters.driver.api.v1.middleware.auth_middleware import AuthMiddleware
+from src.adapters.driver.api.v1.middleware.route_auth_policies import RouteAuthPolicies
+from src.app import app as main_app
+from src.constants.route_auth_policy import RouteAuthPolicyEnum
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/private")
+    async def private():
+        return {"ok": True}
+
+    @app.get("/api/v1/public/{item_id}")
+    @bypass_auth()
+    async def public(item_id: int):
+        return {"item_id": item_id}
+
+    @app.post("/api/v1/webhooks/payment_notification")
+    async def webhook():
+        return {"ok": True}
+
+    @app.get("/api/v1/stream")
+    @bypass_auth()
+    async def stream():
+        return StreamingResponse((f"{i}\n" for i in range(3)), media_type="application/x-ndjson")
+
+    app.add_middleware(AuthMiddleware)
+    app.add_middleware(ApiKeyMiddleware)
+    return app
+
+
+def test_policies_are_compiled_from_routes():
+    policies = RouteAuthPolicies(_build_app().routes)
+
+    assert policies.resolve("GET", "/api/v1/private") is RouteAuthPolicyEnum.BEARER
+    assert policies.resolve("GET", "/api/v1/public/10") is RouteAuthPolicyEnum.PUBLIC
+    assert policies.resolve("POST", "/api/v1/public/10") is RouteAuthPolicyEnum.BEARER
+    assert policies.resolve("POST", "/api/v1/webhooks/payment_notification") is RouteAuthPolicyEnum.API_KEY
+    assert policies.resolve("GET", "/docs") is RouteAuthPolicyEnum.PUBLIC
+    assert policies.resolve("GET", "/api/v1/unknown") is RouteAuthPolicyEnum.BEARER
+
+
+def test_main_app_policies():
+    policies = RouteAuthPolicies(main_app.routes)
+
+    assert policies.resolve("GET", "/api/v1/health") is RouteAuthPolicyEnum.PUBLIC
+    assert policies.resolve("POST", "/api/v1/auth/token") is RouteAuthPolicyEnum.PUBLIC
+    assert policies.resolve("GET", "/api/v1/orders") is RouteAuthPolicyEnum.BEARER
+    assert policies.resolve("GET", "/api/v1/orders/1/status-history") is RouteAuthPolicyEnum.BEARER
+    assert (
+        policies.resolve("POST", "/api/v1/webhooks/payment_notification") is RouteAuthPolicyEnum.API_KEY
+    )
+
+
+def test_auth_middleware_rejects_missing_token():
+    client = TestClient(_build_app())
+
+    response = client.get("/api/v1/private")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json()["error"]["details"] == "Missing Authorization header"
+
+
+def test_auth_middleware_rejects_invalid_token():
+    client = TestClient(_build_app())
+
+    response = client.get("/api/v1/private", headers={"Authorization": "Bearer invalid"})
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_bypass_auth_route_is_public():
+    client = TestClient(_build_app())
+
+    response = client.get("/api/v1/public/7")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"item_id": 7}
+
+
+def test_api_key_middleware(monkeypatch):
+    monkeypatch.setenv("ORDER_MICROSERVICE_X_API_KEY", "secret")
+    client = TestClient(_build_app())
+
+    assert client.post("/api/v1/webhooks/payment_notification").status_code == status.HTTP_401_UNAUTHORIZED
+    assert (
+        client.post("/api/v1/webhooks/payment_notification?api_key=wrong").status_code
+        == status.HTTP_401_UNAUTHORIZED
+    )
+    assert (
+        client.post("/api/v1/webhooks/payment_notification?api_key=secret").status_code == status.HTTP_200_OK
+    )
+
+
+def test_streaming_response_passes_through():
+    client = TestClient(_build_app())
+
+    with client.stream("GET", "/api/v1/stream") as response:
+        lines = list(response.iter_lines())
+
+    assert response.status_code == status.HTTP_200_OK
+    assert lines == ["0", "1", "2"]
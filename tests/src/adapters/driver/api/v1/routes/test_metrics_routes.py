@@ -0,0 +1,35 @@
+from fastapi import status
+
+from src.constants.permissions import OrderPermissions
+from tests.factories.order_factory import OrderFactory
+
+
+def test_metrics_endpoint_is_public_and_labels_by_route_template(client):
+    order = OrderFactory()
+    client.get(
+        f"/api/v1/orders/{order.id}",
+        permissions=[OrderPermissions.CAN_VIEW_ORDER],
+        profile_name="customer",
+        person={"id": order.id_customer},
+    )
+
+    response = client._original_get("/metrics")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/api/v1/orders/{order_id}",status="200"}' in body
+    )
+    assert 'db_queries_per_request_count{route="/api/v1/orders/{order_id}"}' in body
+    assert "identity_map_lookups_total" in body
+    assert f"/api/v1/orders/{order.id}\"" not in body
+
+
+def test_unmatched_paths_share_a_single_label(client):
+    client._original_get("/api/v1/does-not-exist")
+
+    body = client._original_get("/metrics").text
+
+    assert 'route="unmatched"' in body
+    assert "does-not-exist" not in body
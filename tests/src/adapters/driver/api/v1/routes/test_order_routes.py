@@ -2,13 +2,19 @@ from fastapi import status
 import pytest
 from unittest.mock import patch
 import uuid
+import json
 
 from src.constants.permissions import OrderPermissions
 from src.constants.product_category import ProductCategoryEnum
 from src.constants.order_status import OrderStatusEnum
+from src.constants.payment_outbox_status import PaymentOutboxStatusEnum
+from src.adapters.driven.repositories.payment_outbox_repository import PaymentOutboxRepository
+from src.application.usecases.order_usecase.get_order_payment_usecase import GetOrderPaymentUseCase
+from src.core.domain.entities.payment_outbox_entry import PaymentOutboxEntry
 from tests.factories.order_factory import OrderFactory
 from tests.factories.order_item_factory import OrderItemFactory
 from tests.factories.order_status_factory import OrderStatusFactory
+from tests.factories.order_status_movement_factory import OrderStatusMovementFactory
 
 
 def test_create_order_success(client, populate_order_status):
@@ -152,6 +158,83 @@ def test_try_add_item_product_with_different_category_and_return_error(mock_get_
     data = response.json()
     assert data["detail"]["message"] == "Não é possível adicionar itens da categoria 'burgers' no status atual 'order_waiting_drinks'."
 
+@patch("src.adapters.driven.providers.stock_provider.stock_microservice_gateway.StockMicroserviceGateway.get_product_by_id")
+def test_add_items_in_batch_and_return_success(mock_get_product_by_id, client):
+    mock_get_product_by_id.side_effect = lambda product_id: {
+        "id": product_id,
+        "name": f"Burger {product_id}",
+        "category": {"id": "1", "name": ProductCategoryEnum.BURGERS.name},
+        "price": 6.0
+    }
+
+    order_status = OrderStatusFactory(status=OrderStatusEnum.ORDER_WAITING_BURGERS.status, description=OrderStatusEnum.ORDER_WAITING_BURGERS.description)
+    order = OrderFactory(order_status=order_status)
+
+    payload = {
+        "items": [
+            {"product_id": 11, "quantity": 1, "observation": "No onions"},
+            {"product_id": 12, "quantity": 2, "observation": ""},
+            {"product_id": 11, "quantity": 1, "observation": "Extra cheese"},
+        ]
+    }
+
+    response = client.post(
+        f"/api/v1/orders/{order.id}/items/batch",
+        json=payload,
+        permissions=[OrderPermissions.CAN_ADD_ITEM],
+        profile_name="customer",
+        person={ "id": order.id_customer }
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["detail"] == "Itens adicionados com sucesso."
+
+    response = client.get(
+        f"/api/v1/orders/{order.id}/items",
+        permissions=[OrderPermissions.CAN_LIST_ORDER_ITEMS],
+        profile_name="customer",
+        person={ "id": order.id_customer }
+    )
+    assert sorted(item["observation"] for item in response.json()) == ["", "Extra cheese", "No onions"]
+
+@patch("src.adapters.driven.providers.stock_provider.stock_microservice_gateway.StockMicroserviceGateway.get_product_by_id")
+def test_try_add_items_in_batch_mixing_categories_adds_none(mock_get_product_by_id, client):
+    products = {
+        21: {"id": 21, "name": "Burger", "category": {"id": "1", "name": ProductCategoryEnum.BURGERS.name}, "price": 6.0},
+        22: {"id": 22, "name": "Soda", "category": {"id": "3", "name": ProductCategoryEnum.DRINKS.name}, "price": 3.0},
+    }
+    mock_get_product_by_id.side_effect = lambda product_id: products[product_id]
+
+    order_status = OrderStatusFactory(status=OrderStatusEnum.ORDER_WAITING_BURGERS.status, description=OrderStatusEnum.ORDER_WAITING_BURGERS.description)
+    order = OrderFactory(order_status=order_status)
+
+    response = client.post(
+        f"/api/v1/orders/{order.id}/items/batch",
+        json={
+            "items": [
+                {"product_id": 21, "quantity": 1, "observation": ""},
+                {"product_id": 22, "quantity": 1, "observation": ""},
+            ]
+        },
+        permissions=[OrderPermissions.CAN_ADD_ITEM],
+        profile_name="customer",
+        person={ "id": order.id_customer }
+    )
+
+    # Um lote só aceita itens da categoria da etapa atual: a bebida invalida o lote inteiro
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["message"] == (
+        "Não é possível adicionar itens da categoria 'drinks' no status atual 'order_waiting_burgers'."
+    )
+
+    response = client.get(
+        f"/api/v1/orders/{order.id}/items",
+        permissions=[OrderPermissions.CAN_LIST_ORDER_ITEMS],
+        profile_name="customer",
+        person={ "id": order.id_customer }
+    )
+    assert response.json() == []
+
 @patch("src.adapters.driven.providers.stock_provider.stock_microservice_gateway.StockMicroserviceGateway.get_product_by_id")
 def test_remove_item_and_return_success(mock_get_product_by_id, client):
     order_status = OrderStatusFactory(status=OrderStatusEnum.ORDER_WAITING_BURGERS.status, description=OrderStatusEnum.ORDER_WAITING_BURGERS.description)
@@ -536,3 +619,155 @@ def test_get_order_status_success(client, order_status):
 
     data = res.json()
     assert data['status'] == order.order_status.status
+
+def test_list_order_status_history_success(client):
+    order = OrderFactory(id_customer='1')
+    movements = [OrderStatusMovementFactory(order=order) for _ in range(3)]
+
+    res = client.get(
+        f'api/v1/orders/{order.id}/status-history',
+        params={"limit": 2, "after_id": movements[0].id},
+        permissions=[OrderPermissions.CAN_VIEW_ORDER],
+        profile_name="customer",
+        person={ "id": order.id_customer }
+    )
+    assert res.status_code == status.HTTP_200_OK
+
+    data = res.json()
+    assert [movement["id"] for movement in data] == [movements[1].id, movements[2].id]
+    assert data[0]["new_status"] == movements[1].new_status
+
+def test_try_list_order_status_history_of_another_customer_and_return_error(client):
+    order = OrderFactory(id_customer='1')
+
+    res = client.get(
+        f'api/v1/orders/{order.id}/status-history',
+        permissions=[OrderPermissions.CAN_VIEW_ORDER],
+        profile_name="customer",
+        person={ "id": "2" }
+    )
+    assert res.status_code == status.HTTP_404_NOT_FOUND
+
+def test_list_orders_by_pages_and_return_success(client):
+    order_status_paid = OrderStatusFactory(status=OrderStatusEnum.ORDER_PAID.status, description=OrderStatusEnum.ORDER_PAID.description)
+    order_ids = [OrderFactory(order_status=order_status_paid, id_customer='1').id for _ in range(5)]
+
+    listed_ids = []
+    params = {"status": OrderStatusEnum.ORDER_PAID.status, "limit": 2}
+    while True:
+        response = client.get(
+            "/api/v1/orders",
+            params=params,
+            permissions=[OrderPermissions.CAN_LIST_ORDERS],
+            profile_name="customer",
+            person={ "id": "1" }
+        )
+        assert response.status_code == status.HTTP_200_OK
+        listed_ids.extend(order["id"] for order in response.json())
+
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if not next_cursor:
+            break
+        params["cursor"] = next_cursor
+
+    assert listed_ids == order_ids
+
+def test_list_orders_without_limit_returns_the_default_page(client, monkeypatch):
+    monkeypatch.setattr("src.adapters.driver.api.v1.routes.order_routes.ORDERS_PAGE_DEFAULT_LIMIT", 2)
+    order_status_paid = OrderStatusFactory(status=OrderStatusEnum.ORDER_PAID.status, description=OrderStatusEnum.ORDER_PAID.description)
+    order_ids = [OrderFactory(order_status=order_status_paid, id_customer='1').id for _ in range(3)]
+
+    response = client.get(
+        "/api/v1/orders",
+        params={"status": OrderStatusEnum.ORDER_PAID.status},
+        permissions=[OrderPermissions.CAN_LIST_ORDERS],
+        profile_name="customer",
+        person={ "id": "1" }
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [order["id"] for order in response.json()] == order_ids[:2]
+    assert response.headers.get("X-Next-Cursor")
+
+def test_try_list_orders_with_invalid_cursor_and_return_error(client):
+    response = client.get(
+        "/api/v1/orders",
+        params={"limit": 2, "cursor": "not-a-cursor"},
+        permissions=[OrderPermissions.CAN_LIST_ORDERS],
+        profile_name="customer",
+        person={ "id": "1" }
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+def test_stream_orders_as_ndjson_and_return_success(client):
+    order_status_paid = OrderStatusFactory(status=OrderStatusEnum.ORDER_PAID.status, description=OrderStatusEnum.ORDER_PAID.description)
+    order_ids = [OrderFactory(order_status=order_status_paid, id_customer='1').id for _ in range(3)]
+
+    response = client.get(
+        "/api/v1/orders",
+        params={"status": OrderStatusEnum.ORDER_PAID.status, "limit": 2, "stream": True},
+        permissions=[OrderPermissions.CAN_LIST_ORDERS],
+        profile_name="customer",
+        person={ "id": "1" }
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [order["id"] for order in lines] == order_ids
+
+
+def test_get_order_payment_returns_202_while_the_payment_is_being_created(client, db_session):
+    order = OrderFactory()
+    PaymentOutboxRepository(db_session).add(PaymentOutboxEntry(id_order=order.id, payload={}))
+    db_session.commit()
+
+    response = client.get(
+        f"/api/v1/orders/{order.id}/payment",
+        permissions=[OrderPermissions.CAN_VIEW_ORDER],
+        profile_name="customer",
+        person={ "id": order.id_customer }
+    )
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.headers["Retry-After"] == "1"
+    assert response.json()["status"] == PaymentOutboxStatusEnum.PENDING.status
+
+def test_get_order_payment_long_polls_until_the_qr_code_is_available(client, db_session, monkeypatch):
+    order = OrderFactory()
+    outbox_gateway = PaymentOutboxRepository(db_session)
+    entry = outbox_gateway.add(PaymentOutboxEntry(id_order=order.id, payload={}))
+    db_session.commit()
+
+    # Simula o despachante concluindo o pagamento durante a espera
+    original_refresh = GetOrderPaymentUseCase.refresh
+    def refresh_after_dispatch(self, order_id):
+        outbox_gateway.mark_dispatched(entry, {"payment_id": "pay-1", "qr_code": "qr-1", "transaction_id": "txn-1"})
+        db_session.commit()
+        return original_refresh(self, order_id)
+    monkeypatch.setattr(GetOrderPaymentUseCase, "refresh", refresh_after_dispatch)
+
+    response = client.get(
+        f"/api/v1/orders/{order.id}/payment",
+        params={"wait": 5},
+        permissions=[OrderPermissions.CAN_VIEW_ORDER],
+        profile_name="customer",
+        person={ "id": order.id_customer }
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert (data["status"], data["qr_code"], data["payment_id"]) == ("dispatched", "qr-1", "pay-1")
+
+def test_try_get_order_payment_when_no_payment_was_requested_and_return_error(client):
+    order = OrderFactory()
+
+    response = client.get(
+        f"/api/v1/orders/{order.id}/payment",
+        permissions=[OrderPermissions.CAN_VIEW_ORDER],
+        profile_name="customer",
+        person={ "id": order.id_customer }
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
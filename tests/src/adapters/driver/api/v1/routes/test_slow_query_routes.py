@@ -0,0 +1,31 @@
+from fastapi import status
+
+from src.app import app
+from src.constants.permissions import DiagnosticsPermissions
+
+
+def test_list_slow_queries_returns_the_costliest_fingerprints(client):
+    recorder = app.state.slow_query_recorder
+    recorder.reset()
+    recorder.record("SELECT * FROM orders WHERE id = 1", 0.002)
+    recorder.record("SELECT * FROM order_items WHERE order_id IN (1, 2)", 0.010)
+
+    response = client.get(
+        "/api/v1/admin/slow-queries?order_by=p95&limit=1",
+        permissions=[DiagnosticsPermissions.CAN_VIEW_SLOW_QUERIES],
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [query["statement"] for query in data["queries"]] == [
+        "SELECT * FROM order_items WHERE order_id IN (?+)"
+    ]
+
+
+def test_reset_slow_queries_requires_permission(client):
+    response = client.delete("/api/v1/admin/slow-queries", permissions=[DiagnosticsPermissions.CAN_VIEW_SLOW_QUERIES])
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    response = client.delete("/api/v1/admin/slow-queries", permissions=[DiagnosticsPermissions.CAN_RESET_SLOW_QUERIES])
+    assert response.status_code == status.HTTP_200_OK
+    assert app.state.slow_query_recorder.top() == []
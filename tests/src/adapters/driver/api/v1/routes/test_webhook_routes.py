@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.adapters.driven.repositories.models.payment_webhook_inbox_model import PaymentWebhookInboxModel
+from src.adapters.driven.repositories.models.order_model import OrderModel
+from src.adapters.driven.repositories.models.order_status_model import OrderStatusModel
+from src.constants.order_status import OrderStatusEnum
+from src.constants.payment_status import PaymentStatusEnum
+from tests.factories.order_factory import OrderFactory
+
+WEBHOOK_URL = "/api/v1/webhooks/payment_notification"
+
+
+def build_payload(payment_id="pay-1", transaction_id="txn-1"):
+    return {
+        "event": "payment.completed",
+        "payment_id": payment_id,
+        "external_reference": "order_1",
+        "amount": 10.0,
+        "status": PaymentStatusEnum.PAYMENT_COMPLETED.status,
+        "transaction_id": transaction_id,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+class TestWebhookRoutes:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, client, db_session, populate_order_status, monkeypatch):
+        monkeypatch.setenv("ORDER_MICROSERVICE_X_API_KEY", "webhook-key")
+        self.client = client
+        self.db_session = db_session
+        self.url = f"{WEBHOOK_URL}?api_key=webhook-key"
+        placed = db_session.query(OrderStatusModel).filter_by(status=OrderStatusEnum.ORDER_PLACED.status).first()
+        self.order = OrderFactory(order_status=placed, payment_id="pay-1")
+
+    def test_inline_mode_advances_the_order_in_the_request(self):
+        response = self.client._original_post(self.url, json=build_payload())
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "success"}
+        self.db_session.expire_all()
+        assert self.db_session.get(OrderModel, self.order.id).order_status.status == OrderStatusEnum.ORDER_PAID.status
+        assert self.db_session.query(PaymentWebhookInboxModel).count() == 0
+
+    def test_queued_mode_stores_the_delivery_and_acknowledges_immediately(self, monkeypatch):
+        monkeypatch.setattr("src.adapters.driver.api.v1.routes.webhook_routes.WEBHOOK_INGEST_MODE", "queued")
+
+        first = self.client._original_post(self.url, json=build_payload())
+        redelivery = self.client._original_post(self.url, json=build_payload())
+
+        assert first.status_code == redelivery.status_code == 202
+        assert first.json() == {"status": "accepted"}
+        self.db_session.expire_all()
+        rows = self.db_session.query(PaymentWebhookInboxModel).all()
+        assert [(row.payment_id, row.processed_at) for row in rows] == [("pay-1", None)]
+        assert self.db_session.get(OrderModel, self.order.id).order_status.status == OrderStatusEnum.ORDER_PLACED.status
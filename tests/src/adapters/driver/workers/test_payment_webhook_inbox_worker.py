@@ -0,0 +1,94 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from src.adapters.driven.repositories.order_repository import OrderRepository
+from src.adapters.driven.repositories.payment_webhook_inbox_repository import PaymentWebhookInboxRepository
+from src.adapters.driven.repositories.models.order_status_model import OrderStatusModel
+from src.adapters.driver.workers.payment_webhook_inbox_worker import PaymentWebhookInboxWorker
+from src.constants.order_status import OrderStatusEnum
+from src.constants.payment_status import PaymentStatusEnum
+from src.core.domain.dtos.webhook.payment_webhook_dto import PaymentWebhookDTO
+from tests.factories.order_factory import OrderFactory
+
+
+def build_dto(payment_id):
+    return PaymentWebhookDTO(
+        event="payment.completed",
+        payment_id=payment_id,
+        external_reference="order_1",
+        amount=10.0,
+        status=PaymentStatusEnum.PAYMENT_COMPLETED.status,
+        transaction_id=f"txn-{payment_id}",
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+class TestPaymentWebhookInboxWorker:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, test_engine, populate_order_status):
+        self.db_session = db_session
+        self.inbox_gateway = PaymentWebhookInboxRepository(db_session)
+        placed = db_session.query(OrderStatusModel).filter_by(status=OrderStatusEnum.ORDER_PLACED.status).first()
+        self.orders = [OrderFactory(order_status=placed, payment_id=f"pay-{index}") for index in range(5)]
+        for index in range(5):
+            self.inbox_gateway.enqueue(build_dto(f"pay-{index}"))
+        db_session.commit()
+        self.session_factory = sessionmaker(bind=test_engine)
+
+    def assert_orders_paid(self):
+        self.db_session.expire_all()
+        order_gateway = OrderRepository(self.db_session)
+        for order in self.orders:
+            assert order_gateway.get_by_id(order.id).order_status.status == OrderStatusEnum.ORDER_PAID.status
+
+    @pytest.mark.anyio
+    async def test_drain_processes_every_pending_batch(self):
+        worker = PaymentWebhookInboxWorker(self.session_factory, batch_size=2)
+
+        assert await worker.drain() == 5
+
+        self.assert_orders_paid()
+        assert self.inbox_gateway.fetch_pending(10) == []
+
+    @pytest.mark.anyio
+    async def test_started_worker_drains_the_inbox_in_the_background(self):
+        worker = PaymentWebhookInboxWorker(self.session_factory, batch_size=2, poll_interval=0.05)
+
+        worker.start()
+        worker.notify()
+        for _ in range(100):
+            if not self.inbox_gateway.fetch_pending(10):
+                break
+            await asyncio.sleep(0.05)
+        await worker.stop()
+
+        assert worker.is_running is False
+        self.assert_orders_paid()
+
+    async def wait_until_inbox_is_empty(self):
+        for _ in range(100):
+            if not self.inbox_gateway.fetch_pending(10):
+                return
+            await asyncio.sleep(0.05)
+
+    @pytest.mark.anyio
+    async def test_notify_from_the_threadpool_wakes_the_worker(self):
+        worker = PaymentWebhookInboxWorker(self.session_factory, batch_size=2, poll_interval=60)
+        worker.start()
+        await self.wait_until_inbox_is_empty()
+
+        placed = self.db_session.query(OrderStatusModel).filter_by(status=OrderStatusEnum.ORDER_PLACED.status).first()
+        self.orders.append(OrderFactory(order_status=placed, payment_id="pay-late"))
+        self.inbox_gateway.enqueue(build_dto("pay-late"))
+        self.db_session.commit()
+
+        # Rotas síncronas chamam notify a partir do threadpool; sem ele o worker só acordaria após 60s
+        await asyncio.to_thread(worker.notify)
+        await self.wait_until_inbox_is_empty()
+        await worker.stop()
+
+        self.assert_orders_paid()
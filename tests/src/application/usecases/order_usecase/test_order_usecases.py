@@ -10,13 +10,16 @@ from src.constants.product_category import ProductCategoryEnum
 
 from src.core.domain.dtos.order_item.create_order_item_dto import CreateOrderItemDTO
 
+from src.adapters.driven.repositories.models.order_model import OrderModel
 from src.adapters.driven.repositories.order_repository import OrderRepository
+from src.adapters.driven.repositories.async_order_repository import AsyncOrderRepository
 from src.adapters.driven.repositories.order_status_repository import OrderStatusRepository
 from src.adapters.driven.providers.stock_provider.stock_microservice_gateway import StockMicroserviceGateway
 from src.adapters.driven.providers.payment_provider.payment_provider_gateway import PaymentProviderGateway
 
 from src.application.usecases.order_usecase.create_order_usecase import CreateOrderUseCase
 from src.application.usecases.order_usecase.add_order_item_in_order_usecase import AddOrderItemInOrderUseCase
+from src.application.usecases.order_usecase.add_order_items_in_order_usecase import AddOrderItemsInOrderUseCase
 from src.application.usecases.order_usecase.list_orders_usecase import ListOrdersUseCase
 from src.application.usecases.order_usecase.list_order_item_usecase import ListOrderItemsUseCase
 from src.application.usecases.order_usecase.remove_order_item_from_order_usecase import RemoveOrderItemFromOrderUseCase
@@ -41,15 +44,6 @@ class TestOrderUseCases:
             order_status_gateway=self.order_status_gateway,
         )
         
-        self.add_order_item_usecase = AddOrderItemInOrderUseCase.build(
-            order_gateway=self.order_gateway,
-            stock_gateway=self.stock_gateway,
-        )
-        
-        self.list_orders_usecase = ListOrdersUseCase.build(order_gateway=self.order_gateway)
-        
-        self.list_order_items_usecase = ListOrderItemsUseCase.build(order_gateway=self.order_gateway)
-        
         self.remove_order_item_usecase = RemoveOrderItemFromOrderUseCase.build(order_gateway=self.order_gateway)
         
         self.change_item_quantity_usecase = ChangeItemQuantityUseCase.build(order_gateway=self.order_gateway)
@@ -70,14 +64,33 @@ class TestOrderUseCases:
             order_status_gateway=self.order_status_gateway
         )
         
+        self._create_test_data()
+
+    @pytest.fixture
+    def async_usecases(self, async_db_session):
+        """Use cases that read and write through the async repository (the async order routes)."""
+        self.async_order_gateway = AsyncOrderRepository(async_db_session)
+
+        self.add_order_item_usecase = AddOrderItemInOrderUseCase.build(
+            order_gateway=self.async_order_gateway,
+            stock_gateway=self.stock_gateway,
+        )
+
+        self.add_order_items_usecase = AddOrderItemsInOrderUseCase.build(
+            order_gateway=self.async_order_gateway,
+            stock_gateway=self.stock_gateway,
+        )
+
+        self.list_orders_usecase = ListOrdersUseCase.build(order_gateway=self.async_order_gateway)
+
+        self.list_order_items_usecase = ListOrderItemsUseCase.build(order_gateway=self.async_order_gateway)
+
         self.list_products_by_order_status_usecase = ListProductsByOrderStatusUseCase.build(
-            order_gateway=self.order_gateway,
+            order_gateway=self.async_order_gateway,
             stock_provider_gateway=self.stock_gateway
         )
 
-        self.get_order_status_usecase = GetOrderStatusUsecase.build(order_gateway=self.order_gateway)
-        
-        self._create_test_data()
+        self.get_order_status_usecase = GetOrderStatusUsecase.build(order_gateway=self.async_order_gateway)
     
     def _create_test_data(self):        
         self.test_customer = 'customer'
@@ -108,12 +121,14 @@ class TestOrderUseCases:
             self.create_order_usecase.execute(customer=customer_user)
     '''
 
-    def test_list_orders_usecase(self, customer_user):
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("async_usecases")
+    async def test_list_orders_usecase(self, customer_user):
         order = self.create_order_usecase.execute(customer_id=customer_user['person']['id'])
         order.order_status = self.order_status_gateway.get_by_status(OrderStatusEnum.ORDER_PAID.status)
         self.order_gateway.update(order)
         
-        orders = self.list_orders_usecase.execute(current_user=customer_user)
+        orders = await self.list_orders_usecase.execute(current_user=customer_user)
         
         assert len(orders) == 1
         assert orders[0].id == order.id
@@ -125,8 +140,66 @@ class TestOrderUseCases:
 
         assert updated_order.order_status.status == OrderStatusEnum.ORDER_WAITING_BURGERS.status
     
+    def test_advance_order_status_reloads_and_retries_on_version_conflict(self, db_session, customer_user):
+        order = self.create_order_usecase.execute(customer_id=customer_user['person']['id'])
+        get_by_id = self.order_gateway.get_by_id
+        loads = []
+
+        def get_by_id_with_concurrent_write(*args, **kwargs):
+            loaded_order = get_by_id(*args, **kwargs)
+            if not loads:
+                # Outra requisição grava o pedido entre a leitura e a gravação da primeira tentativa
+                db_session.query(OrderModel).filter_by(id=order.id).update({"version": OrderModel.version + 1})
+                db_session.commit()
+            print("LOAD", loaded_order.version, loaded_order.order_status.status, loaded_order.payment_id); loads.append(loaded_order)
+            return loaded_order
+
+        with patch.object(self.order_gateway, "get_by_id", side_effect=get_by_id_with_concurrent_write):
+            updated_order = self.advance_order_status_usecase.execute(order_id=order.id, current_user=customer_user)
+
+        assert len(loads) == 2
+        assert loads[1] is not loads[0]
+        assert updated_order.order_status.status == OrderStatusEnum.ORDER_WAITING_BURGERS.status
+        assert updated_order.version == order.version + 2
+
+    def test_placement_conflict_is_retried_with_the_idempotency_key_of_the_reloaded_version(self, db_session, customer_user):
+        order = self.create_order_usecase.execute(customer_id=customer_user['person']['id'])
+        order.order_status = self.order_status_gateway.get_by_status(OrderStatusEnum.ORDER_READY_TO_PLACE.status)
+        self.order_gateway.update(order)
+        get_by_id = self.order_gateway.get_by_id
+        loaded_versions = []
+
+        def get_by_id_with_concurrent_write(*args, **kwargs):
+            loaded_order = get_by_id(*args, **kwargs)
+            if not loaded_versions:
+                # Outra requisição grava o pedido depois da leitura e antes da gravação desta
+                db_session.query(OrderModel).filter_by(id=order.id).update({"version": OrderModel.version + 1})
+                db_session.commit()
+            loaded_versions.append(loaded_order.version)
+            return loaded_order
+
+        payments = [
+            {"payment_id": f"pay-{attempt}", "qr_code": "qr", "transaction_id": f"txn-{attempt}"} for attempt in (1, 2)
+        ]
+        with patch.object(self.order_gateway, "get_by_id", side_effect=get_by_id_with_concurrent_write), \
+                patch.object(self.payment_gateway, "create_payment", side_effect=payments) as create_payment:
+            # Nenhuma trava é mantida durante a chamada ao provedor: o conflito aparece na gravação e é refeito
+            payment = self.advance_order_status_usecase.execute(order_id=order.id, current_user=customer_user)
+
+        assert loaded_versions == [order.version, order.version + 1]
+        # Cada tentativa envia a chave da versão que leu: uma repetição sobre a mesma versão recebe o mesmo pagamento
+        assert [call.args[0].idempotency_key for call in create_payment.call_args_list] == [
+            f"order-{order.id}-v{version}" for version in loaded_versions
+        ]
+        assert payment["payment_id"] == "pay-2"
+        placed_order = get_by_id(order.id)
+        assert placed_order.order_status.status == OrderStatusEnum.ORDER_PLACED.status
+        assert placed_order.payment_id == "pay-2"
+
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("async_usecases")
     @patch("src.adapters.driven.providers.stock_provider.stock_microservice_gateway.StockMicroserviceGateway.get_product_by_id")
-    def test_add_order_item_in_order_usecase(self, mock_get_product_by_id, customer_user):
+    async def test_add_order_item_in_order_usecase(self, mock_get_product_by_id, customer_user):
         mock_get_product_by_id.return_value = {
             "id": "1",
             "name": "Burger",
@@ -145,7 +218,7 @@ class TestOrderUseCases:
             observation="No pickles"
         )
         
-        updated_order = self.add_order_item_usecase.execute(
+        updated_order = await self.add_order_item_usecase.execute(
             order_id=order.id,
             order_item_dto=order_item_dto,
             current_user=customer_user
@@ -156,8 +229,72 @@ class TestOrderUseCases:
         assert updated_order.order_items[0].quantity == 2
         assert updated_order.order_items[0].observation == "No pickles"
 
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("async_usecases")
+    @patch("src.adapters.driven.providers.stock_provider.stock_microservice_gateway.StockMicroserviceGateway.get_product_by_id")
+    async def test_add_order_item_in_order_usecase_awaits_the_async_repository(self, mock_get_product_by_id, customer_user):
+        mock_get_product_by_id.return_value = {
+            "id": "1",
+            "name": "Burger",
+            "category": {"id": "1", "name": ProductCategoryEnum.BURGERS.name},
+            "price": 6.0
+        }
+        order = self.create_order_usecase.execute(customer_id=customer_user['person']['id'])
+        self.advance_order_status_usecase.execute(order_id=order.id, current_user=customer_user)
+
+        # Leitura e escrita passam pelo driver assíncrono: nenhuma chamada bloqueante ao repositório síncrono
+        with patch.object(self.async_order_gateway, "get_by_id", wraps=self.async_order_gateway.get_by_id) as get_by_id, \
+                patch.object(self.async_order_gateway, "update", wraps=self.async_order_gateway.update) as update, \
+                patch.object(self.order_gateway, "get_by_id") as sync_get_by_id, \
+                patch.object(self.order_gateway, "update") as sync_update:
+            updated_order = await self.add_order_item_usecase.execute(
+                order_id=order.id,
+                order_item_dto=CreateOrderItemDTO(product_id=1, quantity=1, observation=""),
+                current_user=customer_user
+            )
+
+        get_by_id.assert_awaited_once()
+        update.assert_awaited_once()
+        sync_get_by_id.assert_not_called()
+        sync_update.assert_not_called()
+        assert len(updated_order.order_items) == 1
+
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("async_usecases")
+    @patch("src.adapters.driven.providers.stock_provider.stock_microservice_gateway.StockMicroserviceGateway.get_product_by_id")
+    async def test_add_order_items_in_order_usecase_writes_once(self, mock_get_product_by_id, customer_user):
+        mock_get_product_by_id.side_effect = lambda product_id: {
+            "id": product_id,
+            "name": f"Burger {product_id}",
+            "category": {"id": "1", "name": ProductCategoryEnum.BURGERS.name},
+            "price": 6.0
+        }
+
+        order = self.create_order_usecase.execute(customer_id=customer_user['person']['id'])
+        self.advance_order_status_usecase.execute(order_id=order.id, current_user=customer_user)
+
+        order_item_dtos = [
+            CreateOrderItemDTO(product_id=1, quantity=1, observation="No pickles"),
+            CreateOrderItemDTO(product_id=2, quantity=2, observation=""),
+            CreateOrderItemDTO(product_id=1, quantity=1, observation="Extra cheese"),
+        ]
+
+        with patch.object(self.async_order_gateway, "update", wraps=self.async_order_gateway.update) as spy_update:
+            updated_order = await self.add_order_items_usecase.execute(
+                order_id=order.id,
+                order_item_dtos=order_item_dtos,
+                current_user=customer_user
+            )
+
+        spy_update.assert_called_once()
+        assert mock_get_product_by_id.call_count == 2
+        assert [item.product_id for item in updated_order.order_items] == [1, 2, 1]
+        assert all(item.id is not None for item in updated_order.order_items)
+
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("async_usecases")
     @patch("src.adapters.driven.providers.stock_provider.stock_microservice_gateway.StockMicroserviceGateway.get_product_by_id")
-    def test_list_order_items_usecase(self, mock_get_product_by_id, customer_user):
+    async def test_list_order_items_usecase(self, mock_get_product_by_id, customer_user):
         mock_get_product_by_id.return_value = {
             "id": "1",
             "name": "Burger",
@@ -176,16 +313,18 @@ class TestOrderUseCases:
             observation="No pickles"
         )
 
-        self.add_order_item_usecase.execute(order_id=order.id, order_item_dto=order_item_dto, current_user=customer_user)
+        await self.add_order_item_usecase.execute(order_id=order.id, order_item_dto=order_item_dto, current_user=customer_user)
 
-        order_items = self.list_order_items_usecase.execute(order_id=order.id)
+        order_items = await self.list_order_items_usecase.execute(order_id=order.id)
         
         assert len(order_items) == 1
         assert order_items[0].product_id == self.burger_order_item['product_id']
         assert order_items[0].quantity == 2
 
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("async_usecases")
     @patch("src.adapters.driven.providers.stock_provider.stock_microservice_gateway.StockMicroserviceGateway.get_product_by_id")
-    def test_change_item_quantity_usecase(self, mock_get_product_by_id, customer_user):
+    async def test_change_item_quantity_usecase(self, mock_get_product_by_id, customer_user):
         mock_get_product_by_id.return_value = {
             "id": "1",
             "name": "Burger",
@@ -204,18 +343,20 @@ class TestOrderUseCases:
             observation="No pickles"
         )
 
-        updated_order = self.add_order_item_usecase.execute(order_id=order.id, order_item_dto=order_item_dto, current_user=customer_user)
+        updated_order = await self.add_order_item_usecase.execute(order_id=order.id, order_item_dto=order_item_dto, current_user=customer_user)
 
         order_item_id = updated_order.order_items[0].id
 
         self.change_item_quantity_usecase.execute(order_id=order.id, order_item_id=order_item_id, new_quantity=3, current_user=customer_user)
 
-        order_items = self.list_order_items_usecase.execute(order_id=order.id)
+        order_items = await self.list_order_items_usecase.execute(order_id=order.id)
         
         assert order_items[0].quantity == 3
 
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("async_usecases")
     @patch("src.adapters.driven.providers.stock_provider.stock_microservice_gateway.StockMicroserviceGateway.get_product_by_id")
-    def test_remove_order_item_from_order_usecase(self, mock_get_product_by_id, customer_user):
+    async def test_remove_order_item_from_order_usecase(self, mock_get_product_by_id, customer_user):
         mock_get_product_by_id.return_value = {
             "id": "1",
             "name": "Burger",
@@ -234,18 +375,20 @@ class TestOrderUseCases:
             observation="No pickles"
         )
 
-        updated_order = self.add_order_item_usecase.execute(order_id=order.id, order_item_dto=order_item_dto, current_user=customer_user)
+        updated_order = await self.add_order_item_usecase.execute(order_id=order.id, order_item_dto=order_item_dto, current_user=customer_user)
 
         order_item_id = updated_order.order_items[0].id
 
         self.remove_order_item_usecase.execute(order_id=order.id, order_item_id=order_item_id)
 
-        order_items = self.list_order_items_usecase.execute(order_id=order.id)
+        order_items = await self.list_order_items_usecase.execute(order_id=order.id)
         
         assert len(order_items) == 0
     
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("async_usecases")
     @patch("src.adapters.driven.providers.stock_provider.stock_microservice_gateway.StockMicroserviceGateway.get_product_by_id")
-    def test_clear_order_usecase(self, mock_get_product_by_id, customer_user):
+    async def test_clear_order_usecase(self, mock_get_product_by_id, customer_user):
         mock_get_product_by_id.return_value = {
             "id": "1",
             "name": "Burger",
@@ -264,11 +407,11 @@ class TestOrderUseCases:
             observation="No pickles"
         )
 
-        self.add_order_item_usecase.execute(order_id=order.id, order_item_dto=order_item_dto, current_user=customer_user)
+        await self.add_order_item_usecase.execute(order_id=order.id, order_item_dto=order_item_dto, current_user=customer_user)
 
         self.clear_order_usecase.execute(order_id=order.id, current_user=customer_user)
 
-        order_items = self.list_order_items_usecase.execute(order_id=order.id)
+        order_items = await self.list_order_items_usecase.execute(order_id=order.id)
 
         assert len(order_items) == 0
     
@@ -296,9 +439,11 @@ class TestOrderUseCases:
         
         assert updated_order.order_status.status == OrderStatusEnum.ORDER_WAITING_BURGERS.status
     
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("async_usecases")
     @patch("src.adapters.driven.providers.stock_provider.stock_microservice_gateway.StockMicroserviceGateway.get_products_by_category_name")
     @patch("src.adapters.driven.providers.stock_provider.stock_microservice_gateway.StockMicroserviceGateway.get_category_by_name")
-    def test_list_products_by_order_status_usecase(self, mock_get_category_by_name, mock_get_products_by_category_name, customer_user):
+    async def test_list_products_by_order_status_usecase(self, mock_get_category_by_name, mock_get_products_by_category_name, customer_user):
         mock_get_category_by_name.return_value = {
             "id": "1",
             "name": ProductCategoryEnum.BURGERS.name,
@@ -317,16 +462,20 @@ class TestOrderUseCases:
 
         self.advance_order_status_usecase.execute(order_id=order.id, current_user=customer_user)
 
-        products = self.list_products_by_order_status_usecase.execute(order_id=order.id, current_user=customer_user)
+        products = await self.list_products_by_order_status_usecase.execute(order_id=order.id, current_user=customer_user)
 
         assert len(products) == 1
         assert products[0]['id'] == f"{self.burger_order_item['product_id']}"
     
-    def test_access_non_existent_order(self, customer_user):
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("async_usecases")
+    async def test_access_non_existent_order(self, customer_user):
         with pytest.raises(EntityNotFoundException):
-            self.list_order_items_usecase.execute(order_id=999)
+            await self.list_order_items_usecase.execute(order_id=999)
             
-    def test_sorting_orders_by_status_priority(self, customer_user):
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("async_usecases")
+    async def test_sorting_orders_by_status_priority(self, customer_user):
         order1 = self.create_order_usecase.execute(customer_id=customer_user['person']['id'])
         order1.created_at = datetime(2025, 2, 10, 10, 31, 15)
         order1.order_status = self.order_status_gateway.get_by_status(OrderStatusEnum.ORDER_PREPARING.status)
@@ -352,7 +501,7 @@ class TestOrderUseCases:
         order5.order_status = self.order_status_gateway.get_by_status(OrderStatusEnum.ORDER_READY.status)
         self.order_gateway.update(order5)
     
-        orders = self.list_orders_usecase.execute()
+        orders = await self.list_orders_usecase.execute()
 
         assert orders[0].id == order4.id # created_at: 9:25:40, status: ORDER_PAID
         assert orders[1].id == order2.id # created_at: 10:15:20, status: ORDER_PAID
@@ -360,7 +509,9 @@ class TestOrderUseCases:
         assert orders[3].id == order5.id # created_at: 9:15:50, status: ORDER_READY
         assert orders[4].id == order3.id # created_at: 10:05:30, status: ORDER_READY
 
-    def test_list_orders_with_default_status_filter(self, customer_user):
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("async_usecases")
+    async def test_list_orders_with_default_status_filter(self, customer_user):
         order1 = self.create_order_usecase.execute(customer_id=customer_user['person']['id'])
         order1.order_status = self.order_status_gateway.get_by_status(OrderStatusEnum.ORDER_PAID.status)
         self.order_gateway.update(order1)
@@ -380,17 +531,37 @@ class TestOrderUseCases:
         order5 = self.create_order_usecase.execute(customer_id=customer_user['person']['id'])
         order5.order_status = self.order_status_gateway.get_by_status(OrderStatusEnum.ORDER_PLACED.status)
         
-        orders = self.list_orders_usecase.execute()
+        orders = await self.list_orders_usecase.execute()
         
         assert len(orders) == 3
         assert orders[0].id == order1.id
         assert orders[1].id == order2.id
         assert orders[2].id == order3.id
 
-    def test_get_order_status_usecase(self, customer_user):
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("async_usecases")
+    async def test_iter_pages_releases_the_connection_between_pages(self, async_db_session, customer_user):
+        order_ids = []
+        for _ in range(3):
+            order = self.create_order_usecase.execute(customer_id=customer_user['person']['id'])
+            order.order_status = self.order_status_gateway.get_by_status(OrderStatusEnum.ORDER_PAID.status)
+            self.order_gateway.update(order)
+            order_ids.append(order.id)
+
+        pages = []
+        async for page in self.list_orders_usecase.iter_pages(current_user=customer_user, page_size=2):
+            # Nenhuma transação fica aberta enquanto o consumidor processa a página
+            assert not async_db_session.in_transaction()
+            pages.append([order.id for order in page])
+
+        assert pages == [order_ids[:2], order_ids[2:]]
+
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("async_usecases")
+    async def test_get_order_status_usecase(self, customer_user):
         order = self.create_order_usecase.execute(customer_id=customer_user['person']['id'])
 
-        status = self.get_order_status_usecase.execute(order.id, current_user=customer_user)
+        status = await self.get_order_status_usecase.execute(order.id, current_user=customer_user)
 
         assert status == order.order_status
 
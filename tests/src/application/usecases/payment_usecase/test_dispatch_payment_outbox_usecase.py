@@ -0,0 +1,105 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.adapters.driven.repositories.order_repository import OrderRepository
+from src.adapters.driven.repositories.order_status_repository import OrderStatusRepository
+from src.adapters.driven.repositories.payment_outbox_repository import PaymentOutboxRepository
+from src.adapters.driven.repositories.models.order_model import OrderModel
+from src.adapters.driven.repositories.models.order_status_model import OrderStatusModel
+from src.application.usecases.order_usecase.advance_order_status_usecase import AdvanceOrderStatusUseCase
+from src.application.usecases.payment_usecase.dispatch_payment_outbox_usecase import DispatchPaymentOutboxUseCase
+from src.constants.order_status import OrderStatusEnum
+from src.constants.payment_outbox_status import PaymentOutboxStatusEnum
+from src.core.domain.entities.order import Order
+from src.core.ports.payment.i_payment_provider_gateway import IPaymentProviderGateway
+from src.core.shared.identity_map import IdentityMap
+from tests.factories.order_factory import OrderFactory
+from tests.factories.order_item_factory import OrderItemFactory
+
+PAYMENT = {"payment_id": "pay-1", "qr_code": "https://qr.example/pay-1", "transaction_id": "txn-1"}
+
+
+class TestDispatchPaymentOutboxUseCase:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, populate_order_status, mocker):
+        self.db_session = db_session
+        self.order_gateway = OrderRepository(db_session)
+        self.outbox_gateway = PaymentOutboxRepository(db_session)
+        self.payment_gateway = mocker.Mock(spec=IPaymentProviderGateway)
+        self.payment_gateway.create_payment.return_value = PAYMENT
+        self.customer = {"profile": {"name": "customer"}, "person": {"id": "1", "name": "Cliente", "email": "c@x.com"}}
+
+    def place_order(self) -> Order:
+        ready = self.db_session.query(OrderStatusModel).filter_by(status=OrderStatusEnum.ORDER_READY_TO_PLACE.status).first()
+        order = OrderFactory(order_status=ready, id_customer="1")
+        OrderItemFactory(order=order, product_price=10.0, quantity=2)
+
+        usecase = AdvanceOrderStatusUseCase.build(
+            order_gateway=self.order_gateway,
+            order_status_gateway=OrderStatusRepository(self.db_session),
+            payment_gateway=self.payment_gateway,
+            payment_outbox_gateway=self.outbox_gateway,
+        )
+        return usecase.execute(order.id, self.customer)
+
+    def build_dispatcher(self, **kwargs) -> DispatchPaymentOutboxUseCase:
+        return DispatchPaymentOutboxUseCase(self.order_gateway, self.outbox_gateway, self.payment_gateway, **kwargs)
+
+    def test_placing_an_order_writes_the_payment_request_instead_of_calling_the_provider(self):
+        order = self.place_order()
+
+        assert order.order_status.status == OrderStatusEnum.ORDER_PLACED.status
+        self.payment_gateway.create_payment.assert_not_called()
+        entry = self.outbox_gateway.get_by_order_id(order.id)
+        assert entry.status == PaymentOutboxStatusEnum.PENDING.status
+        assert entry.payload["total_amount"] == 20.0
+
+    def test_dispatch_creates_the_payment_and_records_it_on_the_order(self):
+        order = self.place_order()
+
+        assert self.build_dispatcher().execute(limit=10) == 1
+
+        entry = self.outbox_gateway.get_by_order_id(order.id)
+        assert entry.status == PaymentOutboxStatusEnum.DISPATCHED.status
+        assert (entry.payment_id, entry.qr_code, entry.attempts) == ("pay-1", "https://qr.example/pay-1", 1)
+        self.db_session.expire_all()
+        assert self.order_gateway.get_by_id(order.id).payment_id == "pay-1"
+        assert self.build_dispatcher().execute(limit=10) == 0
+
+    def test_failed_call_is_rescheduled_with_backoff(self):
+        order = self.place_order()
+        self.payment_gateway.create_payment.side_effect = RuntimeError("payment service unavailable")
+        before = datetime.now(timezone.utc)
+
+        self.build_dispatcher(backoff_base=4, random_source=lambda: 1.0).execute(limit=10)
+
+        entry = self.outbox_gateway.get_by_order_id(order.id)
+        assert entry.status == PaymentOutboxStatusEnum.PENDING.status
+        assert entry.last_error == "payment service unavailable"
+        next_attempt_at = entry.next_attempt_at.replace(tzinfo=timezone.utc)
+        assert 3.5 <= (next_attempt_at - before).total_seconds() <= 10
+        # Ainda não venceu: não é reservado de novo
+        assert self.build_dispatcher().execute(limit=10) == 0
+
+    def test_request_is_given_up_after_the_last_attempt(self):
+        order = self.place_order()
+        self.payment_gateway.create_payment.side_effect = RuntimeError("boom")
+
+        self.build_dispatcher(max_attempts=1).execute(limit=10)
+
+        assert self.outbox_gateway.get_by_order_id(order.id).status == PaymentOutboxStatusEnum.FAILED.status
+
+    def test_request_of_an_order_no_longer_placed_is_given_up_without_calling_the_provider(self):
+        order = self.place_order()
+        cancelled = self.db_session.query(OrderStatusModel).filter_by(status=OrderStatusEnum.ORDER_CANCELLED.status).first()
+        self.db_session.query(OrderModel).filter_by(id=order.id).update({"id_order_status": cancelled.id})
+        self.db_session.commit()
+        # O despachante roda com um mapa de identidade próprio por lote
+        IdentityMap.get_instance().clear()
+
+        self.build_dispatcher().execute(limit=10)
+
+        self.payment_gateway.create_payment.assert_not_called()
+        assert self.outbox_gateway.get_by_order_id(order.id).status == PaymentOutboxStatusEnum.FAILED.status
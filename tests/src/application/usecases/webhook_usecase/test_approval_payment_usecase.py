@@ -0,0 +1,73 @@
+import pytest
+
+from src.adapters.driven.providers.payment_provider.payment_provider_gateway import PaymentProviderGateway
+from src.adapters.driven.repositories.order_repository import OrderRepository
+from src.adapters.driven.repositories.order_status_repository import OrderStatusRepository
+from src.adapters.driven.repositories.processed_webhook_repository import ProcessedWebhookRepository
+from src.adapters.driven.repositories.models.order_status_model import OrderStatusModel
+from src.application.usecases.webhook_usecase.approval_payment_usecase import ApprovalPaymentUseCase
+from src.constants.order_status import OrderStatusEnum
+from src.constants.payment_status import PaymentStatusEnum
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.shared.ttl_cache import TTLCache
+from tests.factories.order_factory import OrderFactory
+
+
+class TestApprovalPaymentUseCase:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, populate_order_status):
+        self.db_session = db_session
+        self.order_gateway = OrderRepository(db_session)
+        self.processed_webhook_gateway = ProcessedWebhookRepository(db_session, cache=TTLCache(), purge_probability=0)
+        self.usecase = ApprovalPaymentUseCase.build(
+            order_gateway=self.order_gateway,
+            order_status_gateway=OrderStatusRepository(db_session),
+            payment_gateway=PaymentProviderGateway(),
+            processed_webhook_gateway=self.processed_webhook_gateway,
+        )
+
+    def create_placed_order(self, payment_id, status=OrderStatusEnum.ORDER_PLACED.status):
+        placed = self.db_session.query(OrderStatusModel).filter_by(status=status).first()
+        return OrderFactory(order_status=placed, payment_id=payment_id)
+
+    def test_approve_payment_advances_order_and_records_delivery(self):
+        order = self.create_placed_order("pay-1")
+
+        self.usecase.execute("pay-1", PaymentStatusEnum.PAYMENT_COMPLETED.status, "txn-1", "payment.completed")
+
+        assert self.order_gateway.get_by_id(order.id).order_status.status == OrderStatusEnum.ORDER_PAID.status
+        assert self.processed_webhook_gateway.is_processed("pay-1", "txn-1", "payment.completed") is True
+
+    def test_duplicate_delivery_is_acknowledged_without_loading_the_order(self, mocker):
+        self.create_placed_order("pay-1")
+        self.usecase.execute("pay-1", PaymentStatusEnum.PAYMENT_COMPLETED.status, "txn-1", "payment.completed")
+        get_by_payment_id = mocker.spy(self.order_gateway, "get_by_payment_id")
+
+        self.usecase.execute("pay-1", PaymentStatusEnum.PAYMENT_COMPLETED.status, "txn-1", "payment.completed")
+
+        get_by_payment_id.assert_not_called()
+
+    def test_failed_delivery_is_not_recorded(self):
+        self.create_placed_order("pay-1")
+
+        with pytest.raises(EntityNotFoundException):
+            self.usecase.execute("pay-1", PaymentStatusEnum.PAYMENT_FAILED.status, "txn-1", "payment.failed")
+
+        assert self.processed_webhook_gateway.is_processed("pay-1", "txn-1", "payment.failed") is False
+
+    def test_order_and_delivery_are_committed_together(self, mocker):
+        self.create_placed_order("pay-1")
+        commit = mocker.spy(self.db_session, "commit")
+
+        self.usecase.execute("pay-1", PaymentStatusEnum.PAYMENT_COMPLETED.status, "txn-1", "payment.completed")
+
+        assert commit.call_count == 1
+        assert self.processed_webhook_gateway.is_processed("pay-1", "txn-1", "payment.completed") is True
+
+    def test_delivery_for_an_already_paid_order_is_acknowledged(self):
+        order = self.create_placed_order("pay-1", status=OrderStatusEnum.ORDER_PAID.status)
+
+        self.usecase.execute("pay-1", PaymentStatusEnum.PAYMENT_COMPLETED.status, "txn-2", "payment.completed")
+
+        assert self.order_gateway.get_by_id(order.id).order_status.status == OrderStatusEnum.ORDER_PAID.status
@@ -0,0 +1,148 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.adapters.driven.repositories.order_repository import OrderRepository
+from src.adapters.driven.repositories.order_status_repository import OrderStatusRepository
+from src.adapters.driven.repositories.payment_webhook_inbox_repository import PaymentWebhookInboxRepository
+from src.adapters.driven.repositories.models.order_model import OrderModel
+from src.adapters.driven.repositories.models.order_status_model import OrderStatusModel
+from src.adapters.driven.repositories.models.payment_webhook_inbox_model import PaymentWebhookInboxModel
+from src.application.usecases.webhook_usecase.approve_payment_batch_usecase import ApprovePaymentBatchUseCase
+from src.constants.order_status import OrderStatusEnum
+from src.constants.payment_status import PaymentStatusEnum
+from src.core.domain.dtos.webhook.payment_webhook_dto import PaymentWebhookDTO
+from src.core.exceptions.concurrent_update_exception import ConcurrentUpdateException
+from tests.factories.order_factory import OrderFactory
+
+
+def build_dto(payment_id, transaction_id, status=PaymentStatusEnum.PAYMENT_COMPLETED.status):
+    return PaymentWebhookDTO(
+        event="payment.completed",
+        payment_id=payment_id,
+        external_reference="order_1",
+        amount=10.0,
+        status=status,
+        transaction_id=transaction_id,
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+class TestApprovePaymentBatchUseCase:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, populate_order_status):
+        self.db_session = db_session
+        self.order_gateway = OrderRepository(db_session)
+        self.inbox_gateway = PaymentWebhookInboxRepository(db_session)
+        self.usecase = ApprovePaymentBatchUseCase.build(
+            order_gateway=self.order_gateway,
+            order_status_gateway=OrderStatusRepository(db_session),
+            inbox_gateway=self.inbox_gateway,
+        )
+
+    def create_order(self, payment_id, status=OrderStatusEnum.ORDER_PLACED):
+        order_status = self.db_session.query(OrderStatusModel).filter_by(status=status.status).first()
+        return OrderFactory(order_status=order_status, payment_id=payment_id)
+
+    def inbox_rows(self):
+        self.db_session.expire_all()
+        return {row.transaction_id: row for row in self.db_session.query(PaymentWebhookInboxModel).all()}
+
+    def test_batch_advances_every_order_with_one_lookup_and_one_write(self, mocker):
+        orders = [self.create_order(f"pay-{index}") for index in range(3)]
+        for index in range(3):
+            self.inbox_gateway.enqueue(build_dto(payment_id=f"pay-{index}", transaction_id=f"txn-{index}"))
+        get_by_payment_ids = mocker.spy(self.order_gateway, "get_by_payment_ids")
+        update_many = mocker.spy(self.order_gateway, "update_many")
+        update = mocker.spy(self.order_gateway, "update")
+
+        assert self.usecase.execute(limit=10) == 3
+
+        get_by_payment_ids.assert_called_once()
+        update_many.assert_called_once()
+        update.assert_not_called()
+        for order in orders:
+            assert self.order_gateway.get_by_id(order.id).order_status.status == OrderStatusEnum.ORDER_PAID.status
+        assert all(row.processed_at is not None for row in self.inbox_rows().values())
+        assert self.inbox_gateway.fetch_pending(10) == []
+
+    def test_redelivery_for_a_paid_order_is_a_no_op(self):
+        order = self.create_order("pay-1")
+        self.inbox_gateway.enqueue(build_dto(payment_id="pay-1", transaction_id="txn-1"))
+        self.inbox_gateway.enqueue(build_dto(payment_id="pay-1", transaction_id="txn-2"))
+
+        self.usecase.execute(limit=10)
+
+        history = self.order_gateway.get_by_id(order.id).status_history
+        assert [movement.new_status for movement in history].count(OrderStatusEnum.ORDER_PAID.status) == 1
+        rows = self.inbox_rows()
+        assert rows["txn-1"].processed_at is not None and rows["txn-2"].processed_at is not None
+
+    def test_unknown_orders_are_retried_and_failed_payments_discarded(self):
+        self.create_order("pay-1")
+        self.inbox_gateway.enqueue(build_dto(payment_id="pay-unknown", transaction_id="txn-1"))
+        self.inbox_gateway.enqueue(
+            build_dto(payment_id="pay-1", transaction_id="txn-2", status=PaymentStatusEnum.PAYMENT_FAILED.status)
+        )
+
+        self.usecase.execute(limit=10)
+
+        rows = self.inbox_rows()
+        assert rows["txn-1"].processed_at is None
+        assert rows["txn-1"].attempts == 1
+        assert "not found" in rows["txn-1"].last_error
+        assert rows["txn-2"].processed_at is not None
+        assert "not completed" in rows["txn-2"].last_error
+
+    def simulate_concurrent_write_after_load(self, mocker, payment_id):
+        get_by_payment_ids = self.order_gateway.get_by_payment_ids
+
+        def load_then_write(*args, **kwargs):
+            orders = get_by_payment_ids(*args, **kwargs)
+            self.db_session.query(OrderModel).filter_by(payment_id=payment_id).update(
+                {"version": OrderModel.version + 1}
+            )
+            self.db_session.commit()
+            return orders
+
+        mocker.patch.object(self.order_gateway, "get_by_payment_ids", side_effect=load_then_write)
+
+    def test_batch_conflict_redoes_each_order_alone_without_counting_an_attempt(self, mocker):
+        orders = [self.create_order(f"pay-{index}") for index in range(2)]
+        for index in range(2):
+            self.inbox_gateway.enqueue(build_dto(payment_id=f"pay-{index}", transaction_id=f"txn-{index}"))
+        self.simulate_concurrent_write_after_load(mocker, "pay-0")
+        update = mocker.spy(self.order_gateway, "update")
+
+        self.usecase.execute(limit=10)
+
+        assert update.call_count == 2
+        for order in orders:
+            assert self.order_gateway.get_by_id(order.id).order_status.status == OrderStatusEnum.ORDER_PAID.status
+        rows = self.inbox_rows()
+        assert all(row.processed_at is not None and row.last_error is None for row in rows.values())
+
+    def test_order_that_conflicts_again_goes_back_to_the_inbox_untouched(self, mocker):
+        order = self.create_order("pay-0")
+        self.create_order("pay-1")
+        for index in range(2):
+            self.inbox_gateway.enqueue(build_dto(payment_id=f"pay-{index}", transaction_id=f"txn-{index}"))
+        self.simulate_concurrent_write_after_load(mocker, "pay-0")
+        update = self.order_gateway.update
+
+        def conflict_on_first_order(retried_order):
+            if retried_order.id == order.id:
+                raise ConcurrentUpdateException("Order", order.id)
+            return update(retried_order)
+
+        mocker.patch.object(self.order_gateway, "update", side_effect=conflict_on_first_order)
+
+        self.usecase.execute(limit=10)
+
+        rows = self.inbox_rows()
+        assert rows["txn-0"].processed_at is None
+        assert rows["txn-0"].attempts == 0
+        assert rows["txn-0"].last_error is None
+        assert rows["txn-1"].processed_at is not None
+        assert [event.transaction_id for event in self.inbox_gateway.fetch_pending(10)] == ["txn-0"]
@@ -0,0 +1,81 @@
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi import status
+
+from src.constants.permissions import OrderPermissions
+from src.core.auth.verified_token_cache import VerifiedTokenCache, verified_token_cache
+from src.core.exceptions.invalid_token_exception import InvalidTokenException
+from src.core.shared.ttl_cache import TTLCache
+from src.core.utils.jwt_util import JWTUtil
+from tests.factories.order_factory import OrderFactory
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestVerifiedTokenCache:
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.clock.now = time.time()
+        self.cache = VerifiedTokenCache(cache=TTLCache(max_entries=2, ttl=60, clock=self.clock), ttl=60, clock=self.clock)
+        self.token = JWTUtil.create_token({"person": {"id": "1"}})
+
+    def test_verifies_signature_only_on_miss(self):
+        with patch.object(JWTUtil, "decode_token", wraps=JWTUtil.decode_token) as decode_token:
+            first = self.cache.verify(self.token)
+            second = self.cache.verify(self.token)
+
+        assert decode_token.call_count == 1
+        assert first == second
+        assert first is not second
+
+    def test_entry_never_outlives_token_exp(self):
+        payload = self.cache.verify(self.token)
+        self.clock.now = payload["exp"] + 1
+
+        with patch.object(JWTUtil, "decode_token", side_effect=InvalidTokenException(message="Token has expired.")):
+            with pytest.raises(InvalidTokenException):
+                self.cache.verify(self.token)
+
+    def test_keys_are_token_hashes(self):
+        self.cache.verify(self.token)
+
+        assert self.token not in self.cache._cache._entries
+        assert len(self.cache._cache) == 1
+
+    def test_cache_is_bounded(self):
+        for person_id in range(3):
+            self.cache.verify(JWTUtil.create_token({"person": {"id": str(person_id)}}))
+
+        assert self.cache.stats()["entries"] == 2
+        assert self.cache.stats()["evictions"] == 1
+
+    def test_invalid_token_is_not_cached(self):
+        with pytest.raises(InvalidTokenException):
+            self.cache.verify("invalid")
+
+        assert self.cache.stats()["entries"] == 0
+
+
+def test_token_is_decoded_once_per_request(client):
+    order = OrderFactory(id_customer='1')
+    verified_token_cache.clear()
+
+    with patch.object(JWTUtil, "decode_token", wraps=JWTUtil.decode_token) as decode_token:
+        response = client.get(
+            f"/api/v1/orders/{order.id}",
+            permissions=[OrderPermissions.CAN_VIEW_ORDER],
+            profile_name="customer",
+            person={"id": order.id_customer},
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert decode_token.call_count == 1
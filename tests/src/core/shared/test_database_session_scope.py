@@ -0,0 +1,35 @@
+from unittest.mock import MagicMock
+
+from src.core.shared.database_session_scope import DatabaseSessionScope
+
+
+class TestDatabaseSessionScope:
+
+    def setup_method(self):
+        self.session_factory = MagicMock(side_effect=lambda: MagicMock())
+        self.scope = DatabaseSessionScope(self.session_factory)
+
+    def test_session_is_opened_on_first_use_only(self):
+        assert self.scope.is_open is False
+        self.session_factory.assert_not_called()
+
+        first = self.scope.session
+        second = self.scope.session
+
+        assert first is second
+        assert self.scope.is_open is True
+        self.session_factory.assert_called_once()
+
+    def test_close_returns_session_and_allows_reopening(self):
+        session = self.scope.session
+
+        self.scope.close()
+
+        session.close.assert_called_once()
+        assert self.scope.is_open is False
+        assert self.scope.session is not session
+
+    def test_close_without_session_does_nothing(self):
+        self.scope.close()
+
+        self.session_factory.assert_not_called()
@@ -0,0 +1,42 @@
+import asyncio
+import contextvars
+
+import pytest
+
+from src.core.containers import Container
+from src.core.domain.entities.order_status import OrderStatus
+from src.core.shared.identity_map import IdentityMap
+
+
+class TestIdentityMap:
+
+    def test_get_instance_returns_same_map_within_context(self):
+        assert IdentityMap.get_instance() is IdentityMap.get_instance()
+
+    def test_contexts_do_not_share_entities(self):
+        order_status = OrderStatus(id=1, status="PENDING", description="Order is pending")
+
+        def register_in_new_context():
+            Container.identity_map.reset()
+            identity_map = IdentityMap.get_instance()
+            identity_map.add(order_status)
+            return identity_map
+
+        other_map = contextvars.copy_context().run(register_in_new_context)
+
+        assert other_map is not IdentityMap.get_instance()
+        assert other_map.get(OrderStatus, 1) is order_status
+        assert IdentityMap.get_instance().get(OrderStatus, 1) is None
+
+    @pytest.mark.anyio
+    async def test_concurrent_tasks_keep_their_own_map(self):
+        async def request(entity_id: int):
+            Container.identity_map.reset()
+            identity_map = IdentityMap.get_instance()
+            identity_map.add(OrderStatus(id=entity_id, status=f"STATUS_{entity_id}", description="status"))
+            await asyncio.sleep(0)
+            return [key[1] for key in identity_map._entities]
+
+        results = await asyncio.gather(*(request(entity_id) for entity_id in range(5)))
+
+        assert results == [[entity_id] for entity_id in range(5)]
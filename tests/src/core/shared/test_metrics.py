@@ -0,0 +1,83 @@
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from src.core.shared.metrics import (
+    DatabasePoolCollector,
+    instrument_database,
+    observe_gateway_call,
+    track_request_metrics,
+)
+
+
+def _gateway_calls(gateway, operation, outcome):
+    return REGISTRY.get_sample_value(
+        "gateway_call_duration_seconds_count",
+        {"gateway": gateway, "operation": operation, "outcome": outcome},
+    ) or 0
+
+
+class FakeGateway:
+
+    @observe_gateway_call("fake")
+    def get_sync(self):
+        return "sync"
+
+    @observe_gateway_call("fake")
+    async def get_async(self):
+        return "async"
+
+    @observe_gateway_call("fake")
+    async def fail_async(self):
+        raise ValueError("boom")
+
+
+def test_observe_gateway_call_records_sync_call():
+    before = _gateway_calls("fake", "get_sync", "success")
+
+    assert FakeGateway().get_sync() == "sync"
+    assert _gateway_calls("fake", "get_sync", "success") == before + 1
+
+
+@pytest.mark.anyio
+async def test_observe_gateway_call_records_async_calls_and_errors():
+    success_before = _gateway_calls("fake", "get_async", "success")
+    error_before = _gateway_calls("fake", "fail_async", "error")
+
+    assert await FakeGateway().get_async() == "async"
+    with pytest.raises(ValueError):
+        await FakeGateway().fail_async()
+
+    assert _gateway_calls("fake", "get_async", "success") == success_before + 1
+    assert _gateway_calls("fake", "fail_async", "error") == error_before + 1
+
+
+def test_track_request_metrics_counts_queries_of_the_current_context():
+    instrument_database()
+    engine = create_engine("sqlite://")
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+        with track_request_metrics() as request_metrics:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+    assert request_metrics.queries == 2
+    assert request_metrics.query_seconds > 0
+
+
+def test_database_pool_collector_reports_saturation():
+    engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=2, max_overflow=2)
+    collector = DatabasePoolCollector()
+    collector.register("test", engine)
+
+    with engine.connect():
+        samples = {
+            metric.name: metric.samples[0].value for metric in collector.collect()
+        }
+
+    assert samples["db_pool_size"] == 2
+    assert samples["db_pool_checked_out"] == 1
+    assert samples["db_pool_saturation"] == 0.25
@@ -0,0 +1,53 @@
+import pytest
+
+from src.core.exceptions.concurrent_update_exception import ConcurrentUpdateException
+from src.core.shared.optimistic_concurrency import retry_on_conflict
+
+
+class FlakyWork:
+    def __init__(self, conflicts: int, retryable: bool = True):
+        self.conflicts = conflicts
+        self.retryable = retryable
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.conflicts:
+            exc = ConcurrentUpdateException("Pedido", 1, expected_version=self.calls)
+            exc.retryable = self.retryable
+            raise exc
+        return "saved"
+
+
+class TestRetryOnConflict:
+
+    def test_runs_again_until_the_write_succeeds(self):
+        work = FlakyWork(conflicts=2)
+
+        assert retry_on_conflict(attempts=3)(work)() == "saved"
+        assert work.calls == 3
+
+    def test_raises_after_the_last_attempt(self):
+        work = FlakyWork(conflicts=5)
+
+        with pytest.raises(ConcurrentUpdateException):
+            retry_on_conflict(attempts=3)(work)()
+        assert work.calls == 3
+
+    def test_does_not_retry_conflicts_marked_as_not_retryable(self):
+        work = FlakyWork(conflicts=1, retryable=False)
+
+        with pytest.raises(ConcurrentUpdateException):
+            retry_on_conflict(attempts=3)(work)()
+        assert work.calls == 1
+
+    @pytest.mark.anyio
+    async def test_retries_coroutine_functions(self):
+        work = FlakyWork(conflicts=1)
+
+        @retry_on_conflict(attempts=2)
+        async def execute():
+            return work()
+
+        assert await execute() == "saved"
+        assert work.calls == 2
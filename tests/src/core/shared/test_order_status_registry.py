@@ -0,0 +1,39 @@
+from src.core.domain.entities.order_status import OrderStatus
+from src.core.shared.identity_map import IdentityMap
+from src.core.shared.order_status_registry import OrderStatusRegistry
+
+
+class TestOrderStatusRegistry:
+
+    def setup_method(self):
+        self.registry = OrderStatusRegistry()
+        self.registry.load([
+            OrderStatus(id=1, status="order_pending", description="The order is pending."),
+            OrderStatus(id=2, status="order_paid", description="The customer has paid the order."),
+        ])
+        IdentityMap.get_instance().clear()
+
+    def teardown_method(self):
+        IdentityMap.get_instance().clear()
+
+    def test_lookup_by_status_and_id(self):
+        assert self.registry.is_warm is True
+        assert self.registry.get_by_status("order_paid").id == 2
+        assert self.registry.get_by_id(1).status == "order_pending"
+        assert self.registry.get_by_status("unknown") is None
+
+    def test_entities_are_shared_within_identity_map(self):
+        assert self.registry.get_by_status("order_pending") is self.registry.get_by_id(1)
+
+    def test_mutating_entity_does_not_change_registry(self):
+        order_status = self.registry.get_by_id(1)
+        order_status.description = "changed"
+        IdentityMap.get_instance().clear()
+
+        assert self.registry.get_by_id(1).description == "The order is pending."
+
+    def test_invalidate_clears_registry(self):
+        self.registry.invalidate()
+
+        assert self.registry.is_warm is False
+        assert self.registry.get_by_status("order_pending") is None
@@ -0,0 +1,60 @@
+import logging
+
+from sqlalchemy import create_engine, text
+
+from src.core.shared.query_logger import QueryLogger, install_query_logger
+
+
+class TestQueryLogger:
+
+    def setup_method(self):
+        self.engine = create_engine("sqlite://")
+        self.logger = logging.getLogger("tests.sql.query")
+        # O fileConfig do Alembic (rodado pelas fixtures de banco) desativa os loggers já existentes
+        self.logger.disabled = False
+
+    def teardown_method(self):
+        self.engine.dispose()
+
+    def _execute(self, statements: int = 1) -> None:
+        with self.engine.connect() as connection:
+            for _ in range(statements):
+                connection.execute(text("SELECT   1"))
+
+    def test_logs_sampled_statements_with_duration(self, caplog):
+        QueryLogger(level=logging.INFO, sample_rate=1.0, logger=self.logger).install(self.engine)
+
+        with caplog.at_level(logging.INFO, logger="tests.sql.query"):
+            self._execute()
+
+        assert len(caplog.records) == 1
+        assert caplog.records[0].getMessage().endswith("ms | SELECT 1")
+
+    def test_only_the_sampled_fraction_is_logged(self, caplog):
+        draws = iter([0.1, 0.6, 0.3, 0.9])
+        QueryLogger(
+            level=logging.INFO, sample_rate=0.5, logger=self.logger, random_source=lambda: next(draws)
+        ).install(self.engine)
+
+        with caplog.at_level(logging.INFO, logger="tests.sql.query"):
+            self._execute(statements=4)
+
+        assert len(caplog.records) == 2
+
+    def test_nothing_is_sampled_when_the_level_is_disabled(self, caplog):
+        draws = []
+        query_logger = QueryLogger(
+            level=logging.DEBUG, sample_rate=1.0, logger=self.logger, random_source=lambda: draws.append(1) or 0.0
+        )
+        query_logger.install(self.engine)
+
+        with caplog.at_level(logging.WARNING, logger="tests.sql.query"):
+            self._execute()
+
+        assert caplog.records == []
+        assert draws == []
+
+    def test_install_is_skipped_when_off(self):
+        assert install_query_logger(self.engine, "OFF", 1.0) is None
+        assert install_query_logger(self.engine, "INFO", 0.0) is None
+        assert isinstance(install_query_logger(self.engine, "info", 0.5), QueryLogger)
@@ -0,0 +1,136 @@
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from src.core.shared.replica_routing import (
+    LAST_WRITE_AT,
+    ReplicaRouter,
+    RoutingSession,
+    bind_request_state,
+    read_only,
+    read_write_marker,
+    sign_write_marker,
+)
+
+Base = declarative_base()
+
+
+class Note(Base):
+    __tablename__ = "notes"
+
+    id = Column(Integer, primary_key=True)
+    source = Column(String(20))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@read_only
+def read_source(session) -> str:
+    return session.execute(select(Note.source).where(Note.id == 1)).scalar_one()
+
+
+class TestRoutingSession:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.primary = create_engine(f"sqlite:///{tmp_path / 'primary.sqlite'}")
+        self.replica = create_engine(f"sqlite:///{tmp_path / 'replica.sqlite'}")
+        for engine, source in ((self.primary, "primary"), (self.replica, "replica")):
+            Base.metadata.create_all(engine)
+            with engine.begin() as connection:
+                connection.execute(Note.__table__.insert(), {"id": 1, "source": source})
+
+        self.clock = FakeClock()
+        self.router = ReplicaRouter([self.replica], sticky_seconds=5, clock=self.clock)
+        self.session_factory = sessionmaker(class_=RoutingSession, router=self.router, bind=self.primary)
+
+        yield
+        self.primary.dispose()
+        self.replica.dispose()
+
+    def test_only_read_only_work_goes_to_the_replica(self):
+        with self.session_factory() as session:
+            assert session.execute(select(Note.source)).scalar_one() == "primary"
+            assert read_source(session) == "replica"
+
+    def test_locking_reads_stay_on_the_primary(self):
+        with self.session_factory() as session:
+            statement = select(Note.source).with_for_update()
+            assert read_only(lambda: session.execute(statement).scalar_one())() == "primary"
+
+    def test_session_that_wrote_reads_from_the_primary(self):
+        with self.session_factory() as session:
+            session.add(Note(id=2, source="new"))
+            session.flush()
+
+            assert read_source.__wrapped__(session) == "primary"
+            assert read_only(lambda: session.execute(select(Note.source).where(Note.id == 2)).scalar_one())() == "new"
+
+    def test_writer_reads_from_the_primary_during_the_sticky_window(self):
+        with bind_request_state({}):
+            with self.session_factory() as session:
+                session.add(Note(id=2, source="new"))
+                session.commit()
+
+            with self.session_factory() as session:
+                assert read_source(session) == "primary"
+
+            self.clock.now = 6
+            with self.session_factory() as session:
+                assert read_source(session) == "replica"
+
+        # Outro cliente (sem a marca de escrita) continua lendo da réplica
+        with bind_request_state({}):
+            self.clock.now = 0
+            with self.session_factory() as session:
+                assert read_source(session) == "replica"
+
+    def test_write_marker_is_honoured_by_another_router_instance(self):
+        state = {}
+        with bind_request_state(state):
+            with self.session_factory() as session:
+                session.add(Note(id=2, source="new"))
+                session.commit()
+        marker = sign_write_marker(state[LAST_WRITE_AT], "secret")
+
+        # A leitura seguinte chega a outro processo, com o seu próprio roteador
+        other_router = ReplicaRouter([self.replica], sticky_seconds=5, clock=self.clock)
+        other_session_factory = sessionmaker(class_=RoutingSession, router=other_router, bind=self.primary)
+        with bind_request_state({LAST_WRITE_AT: read_write_marker(marker, "secret")}):
+            with other_session_factory() as session:
+                assert read_source(session) == "primary"
+
+        assert read_write_marker(marker, "other-secret") is None
+        assert read_write_marker(marker.replace("0.000", "9.000"), "secret") is None
+
+    @pytest.mark.anyio
+    async def test_async_read_only_work_goes_to_the_replica(self, tmp_path):
+        primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.sqlite'}")
+        replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.sqlite'}")
+        router = ReplicaRouter([replica.sync_engine], sticky_seconds=5, clock=self.clock)
+        session_factory = async_sessionmaker(sync_session_class=RoutingSession, router=router, bind=primary)
+
+        @read_only
+        async def read_source_async(session) -> str:
+            return (await session.execute(select(Note.source).where(Note.id == 1))).scalar_one()
+
+        try:
+            async with session_factory() as session:
+                assert (await session.execute(select(Note.source))).scalar_one() == "primary"
+                assert await read_source_async(session) == "replica"
+        finally:
+            await primary.dispose()
+            await replica.dispose()
+
+    def test_without_replicas_everything_goes_to_the_primary(self):
+        session_factory = sessionmaker(class_=RoutingSession, router=ReplicaRouter([]), bind=self.primary)
+
+        with session_factory() as session:
+            assert read_source(session) == "primary"
@@ -0,0 +1,176 @@
+import pytest
+
+from src.constants.circuit_state import CircuitStateEnum
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.exceptions.service_unavailable_exception import ServiceUnavailableException
+from src.core.shared.resilience import Bulkhead, CircuitBreaker, ResiliencePolicy, RetryBudget
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class DependencyDown(Exception):
+    pass
+
+
+class TestCircuitBreaker:
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker("stock", failure_threshold=2, recovery_timeout=10, clock=self.clock)
+
+    def test_opens_after_consecutive_failures(self):
+        self.breaker.record_failure()
+        assert self.breaker.state is CircuitStateEnum.CLOSED
+
+        self.breaker.record_failure()
+        assert self.breaker.state is CircuitStateEnum.OPEN
+
+        with pytest.raises(ServiceUnavailableException) as exc_info:
+            self.breaker.acquire()
+        assert exc_info.value.retry_after == 10
+
+    def test_success_resets_failure_count(self):
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+
+        assert self.breaker.state is CircuitStateEnum.CLOSED
+
+    def test_half_open_probe_closes_circuit_on_success(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now = 10
+
+        self.breaker.acquire()
+        assert self.breaker.state is CircuitStateEnum.HALF_OPEN
+        with pytest.raises(ServiceUnavailableException):
+            self.breaker.acquire()
+
+        self.breaker.record_success()
+        assert self.breaker.state is CircuitStateEnum.CLOSED
+
+    def test_half_open_probe_failure_reopens_circuit(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now = 10
+
+        self.breaker.acquire()
+        self.breaker.record_failure()
+
+        assert self.breaker.state is CircuitStateEnum.OPEN
+        assert self.breaker.retry_after == 10
+
+
+class TestBulkhead:
+
+    def test_rejects_calls_beyond_the_limit(self):
+        bulkhead = Bulkhead("payment", max_concurrent=1)
+        bulkhead.acquire()
+
+        with pytest.raises(ServiceUnavailableException):
+            bulkhead.acquire()
+
+        bulkhead.release()
+        bulkhead.acquire()
+        assert bulkhead.in_flight == 1
+
+
+class TestRetryBudget:
+
+    def test_retries_are_limited_by_the_deposited_tokens(self):
+        clock = FakeClock()
+        budget = RetryBudget(ratio=0.5, min_per_second=1, max_tokens=1, clock=clock)
+
+        assert budget.try_withdraw() is True
+        assert budget.try_withdraw() is False
+
+        budget.deposit()
+        budget.deposit()
+        assert budget.try_withdraw() is True
+
+        clock.now = 1
+        assert budget.try_withdraw() is True
+
+
+class TestResiliencePolicy:
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker("stock", failure_threshold=3, recovery_timeout=30, clock=self.clock)
+        self.policy = ResiliencePolicy(
+            "stock",
+            breaker=self.breaker,
+            bulkhead=Bulkhead("stock", max_concurrent=5),
+            retry_budget=RetryBudget(ratio=0.2, min_per_second=0, max_tokens=10, clock=self.clock),
+            is_failure=lambda exc: isinstance(exc, DependencyDown),
+            max_retries=2,
+            random_source=lambda: 0.0,
+        )
+
+    def test_retries_failures_until_success(self):
+        outcomes = [DependencyDown(), "ok"]
+
+        def call():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        assert self.policy.call(call) == "ok"
+        assert self.breaker.state is CircuitStateEnum.CLOSED
+
+    def test_exhausted_retries_raise_service_unavailable_and_open_circuit(self):
+        calls = []
+
+        def call():
+            calls.append(1)
+            raise DependencyDown()
+
+        with pytest.raises(ServiceUnavailableException):
+            self.policy.call(call)
+
+        assert len(calls) == 3
+        assert self.breaker.state is CircuitStateEnum.OPEN
+
+    def test_non_failures_are_reraised_without_retry(self):
+        calls = []
+
+        def call():
+            calls.append(1)
+            raise EntityNotFoundException(entity_name="Product")
+
+        with pytest.raises(EntityNotFoundException):
+            self.policy.call(call)
+
+        assert len(calls) == 1
+
+    def test_calls_marked_as_not_retryable_fail_on_first_error(self):
+        calls = []
+
+        def call():
+            calls.append(1)
+            raise DependencyDown()
+
+        with pytest.raises(ServiceUnavailableException):
+            self.policy.call(call, retry=False)
+
+        assert len(calls) == 1
+
+    @pytest.mark.anyio
+    async def test_async_calls_share_the_same_policy(self):
+        async def call():
+            raise DependencyDown()
+
+        with pytest.raises(ServiceUnavailableException):
+            await self.policy.call_async(call)
+
+        with pytest.raises(ServiceUnavailableException) as exc_info:
+            await self.policy.call_async(call)
+        assert exc_info.value.dependency == "stock"
+        assert self.breaker.state is CircuitStateEnum.OPEN
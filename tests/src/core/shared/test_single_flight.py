@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from src.core.shared.single_flight import SingleFlight
+
+
+@pytest.mark.anyio
+class TestSingleFlight:
+
+    async def test_concurrent_calls_for_the_same_key_share_one_call(self):
+        single_flight = SingleFlight("test")
+        calls = []
+        release = asyncio.Event()
+
+        async def load():
+            calls.append(1)
+            await release.wait()
+            return {"id": 1}
+
+        waiters = [asyncio.create_task(single_flight.do("product:1", load)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == [{"id": 1}] * 5
+        assert len(calls) == 1
+        assert single_flight.shared == 4
+        assert single_flight.in_flight == 0
+
+    async def test_different_keys_are_not_coalesced(self):
+        single_flight = SingleFlight("test")
+        calls = []
+
+        async def load(key):
+            calls.append(key)
+            await asyncio.sleep(0)
+            return key
+
+        results = await asyncio.gather(
+            single_flight.do("a", lambda: load("a")),
+            single_flight.do("b", lambda: load("b")),
+        )
+
+        assert results == ["a", "b"]
+        assert sorted(calls) == ["a", "b"]
+
+    async def test_exception_is_raised_to_every_caller_and_not_kept(self):
+        single_flight = SingleFlight("test")
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise RuntimeError("stock down")
+
+        results = await asyncio.gather(
+            single_flight.do("a", fail), single_flight.do("a", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert await single_flight.do("a", lambda: asyncio.sleep(0, result="ok")) == "ok"
+
+    async def test_cancelled_caller_does_not_cancel_the_shared_call(self):
+        single_flight = SingleFlight("test")
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            return "ok"
+
+        first = asyncio.create_task(single_flight.do("a", load))
+        second = asyncio.create_task(single_flight.do("a", load))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+
+        assert await second == "ok"
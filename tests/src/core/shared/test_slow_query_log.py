@@ -0,0 +1,80 @@
+import logging
+
+from sqlalchemy import create_engine, text
+
+from src.core.shared.slow_query_log import SlowQueryRecorder, normalize_statement
+
+
+def test_normalize_statement_replaces_values_and_collapses_in_lists():
+    first = normalize_statement("SELECT *\n  FROM orders WHERE id IN (?, ?, ?) AND status = 'paid' LIMIT 20")
+    second = normalize_statement("SELECT * FROM orders WHERE id IN (%s, %s) AND status = 'placed' LIMIT 50")
+
+    assert first == second == "SELECT * FROM orders WHERE id IN (?+) AND status = ? LIMIT ?"
+    assert normalize_statement("SELECT order_items_1.id FROM order_items AS order_items_1") == (
+        "SELECT order_items_1.id FROM order_items AS order_items_1"
+    )
+
+
+class TestSlowQueryRecorder:
+
+    def setup_method(self):
+        self.logger = logging.getLogger("tests.sql.slow")
+        # O fileConfig do Alembic (rodado pelas fixtures de banco) desativa os loggers já existentes
+        self.logger.disabled = False
+        self.recorder = SlowQueryRecorder(threshold=0.1, max_fingerprints=2, sample_size=100, logger=self.logger)
+
+    def test_aggregates_count_total_and_p95_by_fingerprint(self):
+        for elapsed in range(1, 21):
+            self.recorder.record(f"SELECT * FROM orders WHERE id = {elapsed}", elapsed / 1000)
+
+        [stats] = self.recorder.top()
+
+        assert stats["count"] == 20
+        assert stats["total_ms"] == 210.0
+        assert stats["p95_ms"] == 19.0
+        assert stats["max_ms"] == 20.0
+        assert stats["slow_count"] == 0
+
+    def test_slow_statements_are_counted_and_logged(self, caplog):
+        with caplog.at_level(logging.WARNING, logger="tests.sql.slow"):
+            self.recorder.record("SELECT * FROM orders", 0.05)
+            self.recorder.record("SELECT * FROM orders", 0.25)
+
+        [stats] = self.recorder.top()
+        assert stats["slow_count"] == 1
+        assert len(caplog.records) == 1
+        assert stats["fingerprint"] in caplog.records[0].getMessage()
+
+    def test_orders_fingerprints_and_drops_beyond_the_limit(self):
+        self.recorder.record("SELECT * FROM orders", 0.01)
+        self.recorder.record("SELECT * FROM order_items", 0.03)
+        self.recorder.record("SELECT * FROM order_status", 0.50)
+
+        assert [stats["statement"] for stats in self.recorder.top(order_by="total")] == [
+            "SELECT * FROM order_items",
+            "SELECT * FROM orders",
+        ]
+        assert self.recorder.dropped == 1
+
+        self.recorder.reset()
+        assert self.recorder.top() == []
+        assert self.recorder.dropped == 0
+
+    def test_records_engine_statements_and_captures_explain(self):
+        recorder = SlowQueryRecorder(threshold=10, explain_threshold=0, logger=self.logger)
+        engine = create_engine("sqlite://")
+        recorder.install(engine)
+
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("CREATE TABLE orders (id INTEGER PRIMARY KEY)"))
+                for order_id in (1, 2):
+                    connection.execute(text("SELECT id FROM orders WHERE id = :id"), {"id": order_id})
+        finally:
+            engine.dispose()
+
+        select_stats = next(
+            stats for stats in recorder.top(limit=10) if stats["statement"].startswith("SELECT id FROM orders")
+        )
+        assert select_stats["count"] == 2
+        assert select_stats["explain"]
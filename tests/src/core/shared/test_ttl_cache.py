@@ -0,0 +1,61 @@
+from src.core.shared.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.cache = TTLCache(max_entries=2, ttl=10, stale_ttl=5, clock=self.clock)
+
+    def test_returns_fresh_value_and_counts_hit(self):
+        self.cache.set("a", 1)
+
+        assert self.cache.get("a") == 1
+        assert self.cache.stats()["hits"] == 1
+
+    def test_missing_key_counts_miss(self):
+        assert self.cache.get("a") is None
+        assert self.cache.stats()["misses"] == 1
+
+    def test_expired_entry_is_stale_within_grace_period(self):
+        self.cache.set("a", 1)
+        self.clock.now = 12
+
+        entry = self.cache.get_entry("a")
+
+        assert entry.stale is True
+        assert entry.value == 1
+        assert self.cache.get("a") is None
+        assert self.cache.stats()["stale_hits"] == 2
+
+    def test_entry_is_dropped_after_grace_period(self):
+        self.cache.set("a", 1)
+        self.clock.now = 15
+
+        assert self.cache.get_entry("a") is None
+        assert len(self.cache) == 0
+
+    def test_custom_ttl_per_entry(self):
+        self.cache.set("a", 1, ttl=1)
+        self.clock.now = 2
+
+        assert self.cache.get_entry("a").stale is True
+
+    def test_evicts_least_recently_used(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+        self.cache.set("c", 3)
+
+        assert self.cache.get("b") is None
+        assert self.cache.get("a") == 1
+        assert self.cache.get("c") == 3
+        assert self.cache.stats()["evictions"] == 1
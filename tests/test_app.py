@@ -34,3 +34,11 @@ def test_prefix_api_v1():
     response = client.get("/api/v1/health")
     assert response.status_code == HTTPStatus.OK
     assert "status" in response.json()
+
+def test_lifespan_opens_and_closes_stock_http_client():
+    with TestClient(app):
+        http_client = app.container.stock_http_client()
+        assert not http_client.is_closed
+        assert app.container.stock_microservice_gateway()._http_client is http_client
+
+    assert http_client.is_closed